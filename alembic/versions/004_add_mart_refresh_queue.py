@@ -0,0 +1,42 @@
+"""Add mart refresh queue for event-driven incremental mart refreshes
+
+Ingestion records which (company, metric type) pairs it wrote to
+financial_metrics; the mart refresher (src/services/mart_refresh.py) drains
+this table and recomputes only the affected rows of the dbt models.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, Sequence[str], None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create mart_refresh_queue."""
+    op.create_table(
+        'mart_refresh_queue',
+        sa.Column('company_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('metric_type', sa.String(length=50), nullable=False),
+        sa.Column('enqueued_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('company_id', 'metric_type'),
+    )
+    op.create_index('idx_mart_refresh_enqueued', 'mart_refresh_queue', ['enqueued_at'])
+
+
+def downgrade() -> None:
+    """Drop mart_refresh_queue."""
+    op.drop_index('idx_mart_refresh_enqueued', table_name='mart_refresh_queue')
+    op.drop_table('mart_refresh_queue')
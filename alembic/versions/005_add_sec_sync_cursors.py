@@ -0,0 +1,39 @@
+"""Add SEC sync cursors for incremental filing ingestion
+
+The SEC ingestion flow keeps a high-water mark per (CIK, form type) so a
+steady-state run only downloads filings it has not stored yet (see
+src/pipeline/sec/sync.py).
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, Sequence[str], None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create sec_sync_cursors."""
+    op.create_table(
+        'sec_sync_cursors',
+        sa.Column('cik', sa.String(length=10), nullable=False),
+        sa.Column('filing_type', sa.String(length=20), nullable=False),
+        sa.Column('last_filing_date', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_accession_number', sa.String(length=25), nullable=True),
+        sa.Column('last_synced_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('cik', 'filing_type'),
+    )
+
+
+def downgrade() -> None:
+    """Drop sec_sync_cursors."""
+    op.drop_table('sec_sync_cursors')
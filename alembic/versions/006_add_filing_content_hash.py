@@ -0,0 +1,37 @@
+"""Add content hash for filing text kept in the filing content store
+
+Filing text moves out of sec_filings.raw_text into a compressed,
+content-addressed store (see src/pipeline/sec/content_store.py); rows keep
+only the SHA-256 of their text. Existing inline text stays readable and is
+moved with `python -m src.pipeline.sec.content_store`.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, Sequence[str], None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add sec_filings.content_hash."""
+    op.add_column('sec_filings', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_sec_filings_content_hash', 'sec_filings', ['content_hash'])
+
+
+def downgrade() -> None:
+    """Drop sec_filings.content_hash.
+
+    Text already moved to the content store is not copied back.
+    """
+    op.drop_index('ix_sec_filings_content_hash', table_name='sec_filings')
+    op.drop_column('sec_filings', 'content_hash')
@@ -0,0 +1,31 @@
+"""Add claim timestamp to the mart refresh queue
+
+The mart refresher (src/services/mart_refresh.py) now marks the entries it
+is refreshing instead of deleting them up front, and deletes them only once
+the refresh succeeds, so a worker that dies mid-refresh loses nothing.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, Sequence[str], None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add mart_refresh_queue.claimed_at."""
+    op.add_column('mart_refresh_queue', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop mart_refresh_queue.claimed_at."""
+    op.drop_column('mart_refresh_queue', 'claimed_at')
@@ -0,0 +1,33 @@
+{#
+    Helpers for event-driven incremental refreshes.
+
+    The mart refresher (src/services/mart_refresh.py) runs the affected models
+    with --vars '{"refresh_company_ids": [...]}'. On such an incremental run
+    only those companies' rows are recomputed; without the var (scheduled or
+    --full-refresh runs) every row is rebuilt as before.
+#}
+
+{% macro refresh_company_ids() -%}
+    {{ return(var('refresh_company_ids', [])) }}
+{%- endmacro %}
+
+
+{% macro is_targeted_refresh() -%}
+    {{ return(is_incremental() and refresh_company_ids() | length > 0) }}
+{%- endmacro %}
+
+
+{# Comma-separated uuid literals of the companies being refreshed #}
+{% macro refresh_company_list() -%}
+    {%- for company_id in refresh_company_ids() -%}
+        '{{ company_id }}'::uuid{{ ", " if not loop.last }}
+    {%- endfor -%}
+{%- endmacro %}
+
+
+{# Renders "AND <column> IN (...)" on a targeted refresh, nothing otherwise #}
+{% macro refresh_company_filter(column) -%}
+    {%- if is_targeted_refresh() %}
+    AND {{ column }} IN ({{ refresh_company_list() }})
+    {%- endif %}
+{%- endmacro %}
@@ -1,5 +1,8 @@
 {{ config(
-    materialized='table',
+    materialized='incremental',
+    unique_key='company_id',
+    incremental_strategy='delete+insert',
+    on_schema_change='sync_all_columns',
     indexes=[
         {'columns': ['company_id'], 'unique': False},
         {'columns': ['ticker'], 'unique': False}
@@ -9,15 +12,20 @@
 
 -- Simplified intermediate model for competitive intelligence
 -- Focus: Latest metrics per company for comparison, not time-series analysis
+-- Incremental: a targeted refresh (var refresh_company_ids) recomputes only
+-- those companies' rows; see macros/incremental_refresh.sql
 
 WITH companies AS (
     SELECT * FROM {{ ref('stg_companies') }}
+    WHERE 1 = 1
+    {{ refresh_company_filter('company_id') }}
 ),
 
 metrics AS (
     SELECT * FROM {{ ref('stg_financial_metrics') }}
     WHERE is_high_confidence = 1
     AND is_valid_range = 1
+    {{ refresh_company_filter('company_id') }}
 ),
 
 -- Get latest metrics for each company and metric type
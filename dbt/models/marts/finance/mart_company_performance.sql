@@ -1,5 +1,8 @@
 {{ config(
-    materialized='table',
+    materialized='incremental',
+    unique_key='company_id',
+    incremental_strategy='delete+insert',
+    on_schema_change='sync_all_columns',
     indexes=[
         {'columns': ['ticker'], 'unique': True},
         {'columns': ['edtech_category'], 'unique': False}
@@ -9,6 +12,9 @@
 
 -- Simplified mart for competitive intelligence
 -- Focus: Latest company metrics for comparison
+-- Incremental: rankings span companies, so they are always computed over every
+-- row, but a targeted refresh only writes the refreshed companies plus rows
+-- whose rank moved as a result
 
 WITH company_metrics AS (
     SELECT * FROM {{ ref('int_company_metrics_quarterly') }}
@@ -120,5 +126,14 @@ final AS (
     FROM company_rankings
 )
 
-SELECT * FROM final
-ORDER BY overall_score DESC
+SELECT final.* FROM final
+{% if is_targeted_refresh() %}
+LEFT JOIN {{ this }} AS existing ON existing.company_id = final.company_id
+WHERE existing.company_id IS NULL
+    OR final.company_id IN ({{ refresh_company_list() }})
+    OR existing.revenue_rank_in_category IS DISTINCT FROM final.revenue_rank_in_category
+    OR existing.growth_rank_in_category IS DISTINCT FROM final.growth_rank_in_category
+    OR existing.revenue_rank_overall IS DISTINCT FROM final.revenue_rank_overall
+    OR existing.growth_rank_overall IS DISTINCT FROM final.growth_rank_overall
+{% endif %}
+ORDER BY final.overall_score DESC
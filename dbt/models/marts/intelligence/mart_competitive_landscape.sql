@@ -1,5 +1,8 @@
 {{ config(
-    materialized='table',
+    materialized='incremental',
+    unique_key='edtech_category',
+    incremental_strategy='delete+insert',
+    on_schema_change='sync_all_columns',
     indexes=[
         {'columns': ['edtech_category'], 'unique': False}
     ],
@@ -8,9 +11,18 @@
 
 -- Simplified mart for market segment analysis
 -- Focus: Category-level competitive dynamics
+-- Incremental: a targeted refresh recomputes only the segments the refreshed
+-- companies belong to (each segment is aggregated independently)
 
 WITH company_performance AS (
     SELECT * FROM {{ ref('mart_company_performance') }}
+    {% if is_targeted_refresh() %}
+    WHERE edtech_category IN (
+        SELECT edtech_category FROM {{ ref('mart_company_performance') }}
+        WHERE 1 = 1
+        {{ refresh_company_filter('company_id') }}
+    )
+    {% endif %}
 ),
 
 -- Add competitive_position field first
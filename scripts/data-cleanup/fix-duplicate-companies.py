@@ -12,6 +12,7 @@ Author: Corporate Intel Data Team
 Date: 2025-10-17
 """
 
+import asyncio
 import json
 import logging
 import sys
@@ -20,9 +21,14 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import psycopg2
-import requests
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
+# Add project root to path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from src.pipeline.sec.client import close_sec_client, get_sec_client
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -55,14 +61,6 @@ DUPLICATE_CIKS = [
     '0001651562',  # Likely Coursera
 ]
 
-# SEC mappings URL
-SEC_TICKER_URL = 'https://www.sec.gov/files/company_tickers.json'
-
-# User agent for SEC requests
-SEC_HEADERS = {
-    'User-Agent': 'Corporate Intel Data Cleanup Script admin@corporateintel.com'
-}
-
 
 class DuplicateCompanyFixer:
     """Fix duplicate company records and reassign SEC filings."""
@@ -93,27 +91,36 @@ class DuplicateCompanyFixer:
 
     def fetch_sec_mappings(self) -> Dict[str, Dict[str, str]]:
         """
-        Fetch SEC ticker mappings from official SEC source.
+        Fetch SEC ticker mappings from the shared SEC company directory.
+
+        Uses the on-disk directory snapshot when it is fresh, so repeated
+        runs do not re-download the SEC ticker file.
 
         Returns:
             Dictionary mapping CIK (normalized) to company info
         """
         logger.info("Fetching SEC ticker mappings...")
 
+        async def load_directory():
+            client = get_sec_client()
+            try:
+                return await client.directory.ensure_fresh(client)
+            finally:
+                await close_sec_client()
+
         try:
-            response = requests.get(SEC_TICKER_URL, headers=SEC_HEADERS, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            directory = asyncio.run(load_directory())
+            if not directory.loaded:
+                raise RuntimeError("SEC company directory is unavailable")
 
-            # Normalize CIK numbers and create mapping
+            # CIK numbers are zero-padded to 10 digits; use each CIK's primary ticker
             mappings = {}
-            for item in data.values():
-                cik = str(item['cik_str']).zfill(10)  # Normalize to 10 digits
-                mappings[cik] = {
-                    'ticker': item['ticker'],
-                    'title': item['title'],
-                    'cik': cik
-                }
+            for entry in directory:
+                mappings.setdefault(entry.cik, {
+                    'ticker': entry.ticker,
+                    'title': entry.title,
+                    'cik': entry.cik
+                })
 
             logger.info(f"Fetched {len(mappings)} company mappings from SEC")
             return mappings
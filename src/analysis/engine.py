@@ -9,6 +9,7 @@ import numpy as np
 from loguru import logger
 
 from src.core.config import get_settings
+from src.repositories.metric_series import MetricSeries
 
 
 @dataclass
@@ -443,16 +444,34 @@ class AnalysisEngine:
             for strategy in self.strategies.values()
         ]
     
+    @staticmethod
+    def _prepare_input(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a columnar metrics input into the per-ticker dict strategies use."""
+        series = data.get("metrics")
+        if not isinstance(series, MetricSeries):
+            return data
+        
+        prepared = {**data, "metrics": series.latest()}
+        if "companies" not in prepared:
+            prepared["companies"] = [{"ticker": ticker} for ticker in prepared["metrics"]]
+        return prepared
+    
     def analyze(
         self,
         strategy_name: str,
         data: Dict[str, Any]
     ) -> AnalysisResult:
-        """Execute analysis using specified strategy."""
+        """Execute analysis using specified strategy.
+
+        ``data["metrics"]`` may be a MetricSeries from
+        MetricsRepository.get_time_series_batch; it is reduced to the latest
+        value and growth of every series before the strategy sees it.
+        """
         if strategy_name not in self.strategies:
             raise ValueError(f"Unknown strategy: {strategy_name}")
         
         strategy = self.strategies[strategy_name]
+        data = self._prepare_input(data)
         
         # Validate input
         if not strategy.validate_input(data):
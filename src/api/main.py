@@ -21,6 +21,7 @@ from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 from src.api.v1 import companies, filings, health, intelligence, metrics, reports
 from src.auth.routes import router as auth_router
 from src.core.cache_manager import check_cache_health, close_cache, init_cache
+from src.core.local_cache import get_local_cache
 from src.core.config import get_settings
 from src.core.exceptions import CorporateIntelException
 from src.core.security_middleware import (
@@ -59,15 +60,23 @@ async def lifespan(app: FastAPI):
 
     # Initialize Redis cache
     try:
-        await init_cache()
+        redis_client = await init_cache()
     except Exception as e:
         logger.warning(f"Redis cache initialization failed: {e}. Continuing without cache.")
+    else:
+        # Keep this process's L1 cache coherent with writes made elsewhere
+        local_cache = get_local_cache()
+        if local_cache is not None:
+            local_cache.ensure_listener(redis_client)
 
     yield
 
     # Shutdown
     logger.info("Shutting down Corporate Intelligence Platform API")
     await close_db_connections()
+    local_cache = get_local_cache()
+    if local_cache is not None:
+        await local_cache.stop_listener()
     await close_cache()
 
 
@@ -147,6 +156,7 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
     
     # Exception handlers
@@ -186,6 +196,9 @@ def create_application() -> FastAPI:
     async def cache_health_check() -> Dict[str, Any]:
         """Redis cache health check."""
         health = await check_cache_health()
+        local_cache = get_local_cache()
+        if local_cache is not None:
+            health["l1_cache"] = local_cache.stats()
         return health
     
     # Mount Prometheus metrics
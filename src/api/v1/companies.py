@@ -3,16 +3,17 @@
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from loguru import logger
 from pydantic import BaseModel, Field, ConfigDict
 from sqlalchemy import text
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.cache import cache_key_wrapper, get_cache
+from src.core.cache import cache_key_wrapper, get_response_cache
 from src.core.dependencies import get_current_user
-from src.db.base import get_db
-from src.db.models import Company
+from src.db.session import get_db
+from src.dto.pagination import InvalidCursorError, next_cursor_from_items
+from src.repositories import CompanyRepository, DuplicateRecordError, MetricsRepository
 from src.auth.models import User
 
 router = APIRouter()
@@ -70,67 +71,91 @@ class CompanyMetrics(BaseModel):
 
 
 @router.get("/", response_model=List[CompanyResponse])
-@cache_key_wrapper(prefix="companies", expire=3600)
 async def list_companies(
+    response: Response,
     category: Optional[str] = Query(None, description="Filter by EdTech category"),
     sector: Optional[str] = Query(None, description="Filter by sector"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_db),
 ) -> List[CompanyResponse]:
-    """List all companies with optional filtering."""
+    """List all companies with optional filtering.
+
+    Pages are ordered by ticker; pass a page's X-Next-Cursor header back
+    as `cursor` to fetch the next one.
+    """
     logger.info(f"Listing companies: category={category}, sector={sector}, limit={limit}, offset={offset}")
     
-    # Build query with eager loading to prevent N+1 queries
-    query = db.query(Company).options(
-        selectinload(Company.filings),
-        selectinload(Company.metrics)
+    companies = await _fetch_companies(
+        category=category,
+        sector=sector,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        db=db,
     )
 
-    if category:
-        query = query.filter(Company.category == category)
-    if sector:
-        query = query.filter(Company.sector == sector)
-
-    # Execute with pagination
-    companies = query.offset(offset).limit(limit).all()
+    next_cursor = next_cursor_from_items(companies, limit, "ticker")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return companies
 
 
+@cache_key_wrapper(prefix="companies", expire=3600, tags=["companies"])
+async def _fetch_companies(
+    category: Optional[str],
+    sector: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    db: AsyncSession,
+) -> List[Dict[str, Any]]:
+    """Fetch one page of companies (cached per filter set and position).
+
+    Rows are returned as CompanyResponse dicts: ORM objects are not cacheable.
+    """
+    try:
+        # CompanyResponse has no relationship fields, so nothing is eager loaded
+        companies = await CompanyRepository(db).get_all(
+            limit=limit,
+            offset=offset,
+            order_by="ticker",
+            cursor=cursor,
+            category=category or None,
+            sector=sector or None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return [CompanyResponse.model_validate(company).model_dump() for company in companies]
+
+
 @router.get("/watchlist", response_model=List[CompanyResponse])
-@cache_key_wrapper(prefix="watchlist", expire=1800)
+@cache_key_wrapper(prefix="watchlist", expire=1800, tags=["companies"])
 async def get_watchlist(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[CompanyResponse]:
+) -> List[Dict[str, Any]]:
     """Get companies on the EdTech watchlist."""
     from src.core.config import get_settings
     
     settings = get_settings()
     tickers = settings.EDTECH_COMPANIES_WATCHLIST
 
-    # Eager load relationships to prevent N+1 queries
-    companies = db.query(Company).options(
-        selectinload(Company.filings),
-        selectinload(Company.metrics)
-    ).filter(Company.ticker.in_(tickers)).all()
+    companies = await CompanyRepository(db).find_by_tickers(tickers)
     
-    return companies
+    return [CompanyResponse.model_validate(company).model_dump() for company in companies]
 
 
 @router.get("/{company_id}", response_model=CompanyResponse)
-@cache_key_wrapper(prefix="company", expire=3600)
+@cache_key_wrapper(prefix="company", expire=3600, tags=["company:{company_id}"])
 async def get_company(
     company_id: UUID,
-    db: Session = Depends(get_db),
-) -> CompanyResponse:
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
     """Get a specific company by ID."""
-    # Eager load relationships to prevent N+1 queries
-    company = db.query(Company).options(
-        selectinload(Company.filings),
-        selectinload(Company.metrics)
-    ).filter(Company.id == company_id).first()
+    company = await CompanyRepository(db).get_by_id(company_id)
     
     if not company:
         raise HTTPException(
@@ -138,19 +163,19 @@ async def get_company(
             detail=f"Company with ID {company_id} not found",
         )
     
-    return company
+    return CompanyResponse.model_validate(company).model_dump()
 
 
 @router.get("/{company_id}/metrics", response_model=CompanyMetrics)
-@cache_key_wrapper(prefix="company_metrics", expire=900)
+@cache_key_wrapper(prefix="company_metrics", expire=900, tags=["company:{company_id}"])
 async def get_company_metrics(
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> CompanyMetrics:
     """Get latest metrics for a company."""
     from datetime import datetime
     
-    company = db.query(Company).filter(Company.id == company_id).first()
+    company = await CompanyRepository(db).get_by_id(company_id)
     
     if not company:
         raise HTTPException(
@@ -158,30 +183,8 @@ async def get_company_metrics(
             detail=f"Company with ID {company_id} not found",
         )
     
-    # Fetch latest metrics from TimescaleDB
-    metrics_query = """
-    WITH latest_metrics AS (
-        SELECT 
-            company_id,
-            metric_type,
-            value,
-            metric_date,
-            ROW_NUMBER() OVER (PARTITION BY metric_type ORDER BY metric_date DESC) as rn
-        FROM financial_metrics
-        WHERE company_id = :company_id
-    )
-    SELECT 
-        metric_type,
-        value,
-        metric_date
-    FROM latest_metrics
-    WHERE rn = 1
-    """
-    
-    metrics_result = db.execute(metrics_query, {"company_id": company_id}).fetchall()
-    
-    # Build metrics response
-    metrics_dict = {row.metric_type: row.value for row in metrics_result}
+    # Latest value of each metric type from TimescaleDB
+    metrics_dict = await MetricsRepository(db).get_latest_values(company_id)
     
     return CompanyMetrics(
         company_id=company_id,
@@ -199,32 +202,34 @@ async def get_company_metrics(
 @router.post("/", response_model=CompanyResponse, status_code=status.HTTP_201_CREATED)
 async def create_company(
     company: CompanyCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> CompanyResponse:
     """Create a new company."""
+    repo = CompanyRepository(db)
+
     # Check if company already exists
-    existing = db.query(Company).filter(
-        (Company.ticker == company.ticker) | (Company.cik == company.cik)
-    ).first()
-    
-    if existing:
+    if await repo.ticker_or_cik_exists(company.ticker, company.cik):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Company with ticker {company.ticker} or CIK {company.cik} already exists",
         )
     
-    # Create new company
-    db_company = Company(**company.model_dump())
-    db.add(db_company)
-    db.commit()
-    db.refresh(db_company)
+    # Create new company; commit before invalidating so readers cannot re-cache stale data
+    try:
+        db_company = await repo.create(**company.model_dump())
+    except DuplicateRecordError:
+        # Created concurrently between the check and the insert
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Company with ticker {company.ticker} or CIK {company.cik} already exists",
+        )
+    await db.commit()
     
     logger.info(f"Created new company: {db_company.ticker} (ID: {db_company.id})")
     
-    # Invalidate cache
-    cache = get_cache()
-    await cache.delete("companies:*")
+    # Invalidate cached company listings
+    await get_response_cache().invalidate_tags("companies")
     
     return db_company
 
@@ -233,31 +238,26 @@ async def create_company(
 async def update_company(
     company_id: UUID,
     company_update: CompanyCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> CompanyResponse:
     """Update company information."""
-    company = db.query(Company).filter(Company.id == company_id).first()
-    
-    if not company:
+    repo = CompanyRepository(db)
+
+    if not await repo.get_by_id(company_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Company with ID {company_id} not found",
         )
     
     # Update fields
-    for field, value in company_update.model_dump(exclude_unset=True).items():
-        setattr(company, field, value)
-    
-    db.commit()
-    db.refresh(company)
+    company = await repo.update(company_id, **company_update.model_dump(exclude_unset=True))
+    await db.commit()
     
     logger.info(f"Updated company: {company.ticker} (ID: {company.id})")
     
-    # Invalidate cache
-    cache = get_cache()
-    await cache.delete(f"company:{company_id}")
-    await cache.delete(f"company_metrics:{company_id}")
+    # Invalidate cache entries for this company and listings that include it
+    await get_response_cache().invalidate_tags(f"company:{company_id}", "companies")
     
     return company
 
@@ -265,11 +265,11 @@ async def update_company(
 @router.delete("/{company_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_company(
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> None:
     """Delete a company."""
-    company = db.query(Company).filter(Company.id == company_id).first()
+    company = await CompanyRepository(db).get_by_id(company_id)
     
     if not company:
         raise HTTPException(
@@ -277,15 +277,14 @@ async def delete_company(
             detail=f"Company with ID {company_id} not found",
         )
     
-    db.delete(company)
-    db.commit()
+    # ORM delete (not a bulk DELETE) so filings, metrics and documents cascade
+    await db.delete(company)
+    await db.commit()
     
     logger.info(f"Deleted company: {company.ticker} (ID: {company_id})")
     
-    # Invalidate cache
-    cache = get_cache()
-    await cache.delete(f"company:{company_id}")
-    await cache.delete("companies:*")
+    # Invalidate cache entries for this company and listings that include it
+    await get_response_cache().invalidate_tags(f"company:{company_id}", "companies")
 
 
 class TrendingCompanyResponse(BaseModel):
@@ -304,7 +303,7 @@ class TrendingCompanyResponse(BaseModel):
 
 
 @router.get("/trending/top-performers", response_model=List[TrendingCompanyResponse])
-@cache_key_wrapper(prefix="trending_top", expire=900)
+@cache_key_wrapper(prefix="trending_top", expire=900, tags=["companies"])
 async def get_top_performers(
     metric: str = Query(
         "growth",
@@ -312,7 +311,7 @@ async def get_top_performers(
     ),
     category: Optional[str] = Query(None, description="Filter by EdTech category"),
     limit: int = Query(10, ge=1, le=50, description="Number of companies to return"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> List[TrendingCompanyResponse]:
     """Get top performing companies based on selected metric.
 
@@ -362,7 +361,7 @@ async def get_top_performers(
             LIMIT :limit
         """)
 
-        result = db.execute(
+        result = await db.execute(
             query,
             {
                 "category": category,
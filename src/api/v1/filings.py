@@ -4,15 +4,16 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from loguru import logger
 from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.cache import cache_key_wrapper
 from src.core.dependencies import get_current_user
-from src.db.base import get_db
-from src.db.models import SECFiling, Company
+from src.db.session import get_db
+from src.dto.pagination import InvalidCursorError, next_cursor_from_items
+from src.repositories import FilingRepository
 from src.auth.models import User
 
 router = APIRouter()
@@ -33,35 +34,72 @@ class FilingResponse(BaseModel):
 
 
 @router.get("/", response_model=List[FilingResponse])
-@cache_key_wrapper(prefix="filings", expire=3600)
 async def list_filings(
+    response: Response,
     company_id: Optional[UUID] = Query(None, description="Filter by company ID"),
     filing_type: Optional[str] = Query(None, description="Filter by filing type"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_db),
 ) -> List[FilingResponse]:
-    """List SEC filings with optional filtering."""
-    query = db.query(SECFiling)
+    """List SEC filings with optional filtering.
+
+    Pages are ordered by (filing_date, id) descending; pass a page's
+    X-Next-Cursor header back as `cursor` to fetch the next one.
+    """
+    filings = await _fetch_filings(
+        company_id=company_id,
+        filing_type=filing_type,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        db=db,
+    )
+
+    next_cursor = next_cursor_from_items(filings, limit, "filing_date")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
-    if company_id:
-        query = query.filter(SECFiling.company_id == company_id)
-    if filing_type:
-        query = query.filter(SECFiling.filing_type == filing_type)
+    return filings
 
-    filings = query.order_by(SECFiling.filing_date.desc()).offset(offset).limit(limit).all()
 
-    return filings
+@cache_key_wrapper(prefix="filings", expire=3600)
+async def _fetch_filings(
+    company_id: Optional[UUID],
+    filing_type: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    db: AsyncSession,
+) -> List[Dict[str, Any]]:
+    """Fetch one page of filings (cached per filter set and position).
+
+    Rows are returned as FilingResponse dicts: ORM objects are not cacheable.
+    """
+    try:
+        filings = await FilingRepository(db).get_all(
+            limit=limit,
+            offset=offset,
+            order_by="filing_date",
+            descending=True,
+            cursor=cursor,
+            company_id=company_id,
+            filing_type=filing_type or None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return [FilingResponse.model_validate(filing).model_dump() for filing in filings]
 
 
 @router.get("/{filing_id}", response_model=FilingResponse)
 @cache_key_wrapper(prefix="filing", expire=3600)
 async def get_filing(
     filing_id: UUID,
-    db: Session = Depends(get_db),
-) -> FilingResponse:
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
     """Get a specific SEC filing by ID."""
-    filing = db.query(SECFiling).filter(SECFiling.id == filing_id).first()
+    filing = await FilingRepository(db).get_by_id(filing_id)
 
     if not filing:
         raise HTTPException(
@@ -69,4 +107,4 @@ async def get_filing(
             detail=f"Filing with ID {filing_id} not found",
         )
 
-    return filing
+    return FilingResponse.model_validate(filing).model_dump()
@@ -1,18 +1,19 @@
 """Market intelligence API endpoints."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from loguru import logger
 from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.cache import cache_key_wrapper
 from src.core.dependencies import get_current_user
-from src.db.base import get_db
-from src.db.models import MarketIntelligence
+from src.db.session import get_db
+from src.dto.pagination import InvalidCursorError, next_cursor_from_items
+from src.repositories import IntelligenceRepository
 from src.auth.models import User
 
 router = APIRouter()
@@ -33,22 +34,60 @@ class IntelligenceResponse(BaseModel):
 
 
 @router.get("/", response_model=List[IntelligenceResponse])
-@cache_key_wrapper(prefix="intelligence", expire=1800)
 async def list_intelligence(
+    response: Response,
     intel_type: Optional[str] = Query(None, description="Filter by intelligence type"),
     category: Optional[str] = Query(None, description="Filter by category"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_db),
 ) -> List[IntelligenceResponse]:
-    """List market intelligence items with optional filtering."""
-    query = db.query(MarketIntelligence)
+    """List market intelligence items with optional filtering.
 
-    if intel_type:
-        query = query.filter(MarketIntelligence.intel_type == intel_type)
-    if category:
-        query = query.filter(MarketIntelligence.category == category)
+    Pages are ordered by (event_date, id) descending with undated items
+    last; pass a page's X-Next-Cursor header back as `cursor` to fetch the
+    next one.
+    """
+    intelligence = await _fetch_intelligence(
+        intel_type=intel_type,
+        category=category,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        db=db,
+    )
 
-    intelligence = query.order_by(MarketIntelligence.event_date.desc()).offset(offset).limit(limit).all()
+    next_cursor = next_cursor_from_items(intelligence, limit, "event_date")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return intelligence
+
+
+@cache_key_wrapper(prefix="intelligence", expire=1800)
+async def _fetch_intelligence(
+    intel_type: Optional[str],
+    category: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    db: AsyncSession,
+) -> List[Dict[str, Any]]:
+    """Fetch one page of intelligence items (cached per filter set and position).
+
+    Rows are returned as IntelligenceResponse dicts: ORM objects are not cacheable.
+    """
+    try:
+        items = await IntelligenceRepository(db).get_all(
+            limit=limit,
+            offset=offset,
+            order_by="event_date",
+            descending=True,
+            cursor=cursor,
+            intel_type=intel_type or None,
+            category=category or None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return [IntelligenceResponse.model_validate(item).model_dump() for item in items]
@@ -1,18 +1,22 @@
 """Financial metrics API endpoints."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.cache import cache_key_wrapper
+from src.core.config import get_settings
 from src.core.dependencies import get_current_user
-from src.db.base import get_db
-from src.db.models import FinancialMetric, Company
+from src.db.session import get_db, get_session_factory
+from src.dto.pagination import InvalidCursorError, next_cursor_from_items
+from src.repositories import MetricsRepository
+from src.services.metrics_export import ExportFormat, encode_metrics
 from src.auth.models import User
 
 router = APIRouter()
@@ -34,28 +38,124 @@ class MetricResponse(BaseModel):
 
 
 @router.get("/", response_model=List[MetricResponse])
-@cache_key_wrapper(prefix="metrics", expire=900)
 async def list_metrics(
+    response: Response,
     company_id: Optional[UUID] = Query(None, description="Filter by company ID"),
     metric_type: Optional[str] = Query(None, description="Filter by metric type"),
     period_type: Optional[str] = Query(None, description="Filter by period type"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_db),
 ) -> List[MetricResponse]:
-    """List financial metrics with optional filtering."""
-    # Eager load company relationship to prevent N+1 queries
-    query = db.query(FinancialMetric).options(
-        selectinload(FinancialMetric.company)
-    )
+    """List financial metrics with optional filtering.
 
-    if company_id:
-        query = query.filter(FinancialMetric.company_id == company_id)
-    if metric_type:
-        query = query.filter(FinancialMetric.metric_type == metric_type)
-    if period_type:
-        query = query.filter(FinancialMetric.period_type == period_type)
+    Pages are ordered by (metric_date, id) descending. Pass a page's
+    X-Next-Cursor header back as `cursor` to fetch the next one; unlike
+    `offset`, a cursor costs the same at any depth of the hypertable.
+    """
+    metrics = await _fetch_metrics(
+        company_id=company_id,
+        metric_type=metric_type,
+        period_type=period_type,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        db=db,
+    )
 
-    metrics = query.order_by(FinancialMetric.metric_date.desc()).offset(offset).limit(limit).all()
+    next_cursor = next_cursor_from_items(metrics, limit, "metric_date")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return metrics
+
+
+@cache_key_wrapper(prefix="metrics", expire=900)
+async def _fetch_metrics(
+    company_id: Optional[UUID],
+    metric_type: Optional[str],
+    period_type: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    db: AsyncSession,
+) -> List[Dict[str, Any]]:
+    """Fetch one page of metrics (cached per filter set and position).
+
+    Rows are returned as MetricResponse dicts: ORM objects are not cacheable.
+    """
+    try:
+        # MetricResponse has no relationship fields, so the company is not loaded
+        metrics = await MetricsRepository(db).get_all(
+            limit=limit,
+            offset=offset,
+            order_by="metric_date",
+            descending=True,
+            cursor=cursor,
+            company_id=company_id,
+            metric_type=metric_type or None,
+            period_type=period_type or None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return [MetricResponse.model_validate(metric).model_dump() for metric in metrics]
+
+
+@router.get("/export")
+async def export_metrics(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="ndjson, arrow or parquet"),
+    company_ids: Optional[List[UUID]] = Query(None, alias="company_id", description="Company IDs (repeatable)"),
+    tickers: Optional[List[str]] = Query(None, alias="ticker", description="Tickers (repeatable)"),
+    metric_types: Optional[List[str]] = Query(None, alias="metric_type", description="Metric types (repeatable)"),
+    period_type: Optional[str] = Query(None, description="Filter by period type"),
+    start_date: Optional[datetime] = Query(None, description="Earliest metric date (inclusive)"),
+    end_date: Optional[datetime] = Query(None, description="Latest metric date (inclusive)"),
+    pivot: bool = Query(False, description="One row per company and date, one column per metric type"),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream full metric histories as NDJSON, Arrow IPC or Parquet.
+
+    Rows are read through a server-side cursor and encoded chunk by chunk,
+    so there is no page cap and no ORM objects are built. With `pivot` the
+    long-to-wide reshape happens in SQL.
+    """
+    if not export_format.available:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"{export_format.value} export requires pyarrow on the server",
+        )
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date",
+        )
+
+    settings = get_settings()
+    logger.info(
+        f"Exporting metrics as {export_format.value}: companies={company_ids}, tickers={tickers}, "
+        f"metric_types={metric_types}, pivot={pivot}"
+    )
+
+    async def chunks():
+        # Own session: the response body is produced after the request's
+        # dependencies may already have been torn down
+        async with session_factory() as session:
+            async for chunk in MetricsRepository(session).stream_metrics(
+                company_ids=company_ids,
+                tickers=tickers,
+                metric_types=metric_types,
+                period_type=period_type,
+                start_date=start_date,
+                end_date=end_date,
+                pivot=pivot,
+                chunk_size=settings.METRICS_EXPORT_CHUNK_ROWS,
+            ):
+                yield chunk
+
+    filename = f"financial_metrics.{export_format.extension}"
+    return StreamingResponse(
+        encode_metrics(chunks(), export_format, pivot=pivot),
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
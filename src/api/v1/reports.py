@@ -4,16 +4,17 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from loguru import logger
 from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.cache import cache_key_wrapper
 from src.core.dependencies import get_current_user
-from src.db.base import get_db
-from src.db.models import AnalysisReport
+from src.db.session import get_db
+from src.dto.pagination import InvalidCursorError, next_cursor_from_items
+from src.repositories import ReportRepository
 from src.auth.models import User
 
 router = APIRouter()
@@ -30,37 +31,74 @@ class ReportResponse(BaseModel):
     date_range_end: Optional[datetime] = None
     format: Optional[str] = None
     report_url: Optional[str] = None
+    created_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
 @router.get("/", response_model=List[ReportResponse])
-@cache_key_wrapper(prefix="reports", expire=1800)
 async def list_reports(
+    response: Response,
     report_type: Optional[str] = Query(None, description="Filter by report type"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_db),
 ) -> List[ReportResponse]:
-    """List analysis reports with optional filtering."""
-    query = db.query(AnalysisReport)
-
-    if report_type:
-        query = query.filter(AnalysisReport.report_type == report_type)
+    """List analysis reports with optional filtering.
 
-    reports = query.order_by(AnalysisReport.created_at.desc()).offset(offset).limit(limit).all()
+    Pages are ordered by (created_at, id) descending; pass a page's
+    X-Next-Cursor header back as `cursor` to fetch the next one.
+    """
+    reports = await _fetch_reports(
+        report_type=report_type,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        db=db,
+    )
+
+    next_cursor = next_cursor_from_items(reports, limit, "created_at")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return reports
 
 
+@cache_key_wrapper(prefix="reports", expire=1800)
+async def _fetch_reports(
+    report_type: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    db: AsyncSession,
+) -> List[Dict[str, Any]]:
+    """Fetch one page of reports (cached per filter set and position).
+
+    Rows are returned as ReportResponse dicts: ORM objects are not cacheable.
+    """
+    try:
+        reports = await ReportRepository(db).get_all(
+            limit=limit,
+            offset=offset,
+            order_by="created_at",
+            descending=True,
+            cursor=cursor,
+            report_type=report_type or None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return [ReportResponse.model_validate(report).model_dump() for report in reports]
+
+
 @router.get("/{report_id}", response_model=ReportResponse)
 @cache_key_wrapper(prefix="report", expire=1800)
 async def get_report(
     report_id: UUID,
-    db: Session = Depends(get_db),
-) -> ReportResponse:
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
     """Get a specific analysis report by ID."""
-    report = db.query(AnalysisReport).filter(AnalysisReport.id == report_id).first()
+    report = await ReportRepository(db).get_by_id(report_id)
 
     if not report:
         raise HTTPException(
@@ -68,7 +106,7 @@ async def get_report(
             detail=f"Report with ID {report_id} not found",
         )
 
-    return report
+    return ReportResponse.model_validate(report).model_dump()
 
 
 class ReportGenerationRequest(BaseModel):
@@ -111,7 +149,7 @@ class ReportGenerationResponse(BaseModel):
 @router.post("/generate", response_model=ReportGenerationResponse, status_code=status.HTTP_201_CREATED)
 async def generate_report(
     request: ReportGenerationRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> ReportGenerationResponse:
     """Generate a new analysis report based on current data.
@@ -141,7 +179,7 @@ async def generate_report(
         )
 
         # Create report record
-        report = AnalysisReport(
+        report = await ReportRepository(db).create(
             report_type=request.report_type,
             title=request.title,
             description=request.description or f"Auto-generated {request.report_type} report",
@@ -151,10 +189,7 @@ async def generate_report(
             report_url=None,  # Could be S3/MinIO URL in production
             metadata_=analysis_data.get("metadata", {}),
         )
-
-        db.add(report)
-        db.commit()
-        db.refresh(report)
+        await db.commit()
 
         logger.info(f"Report generated successfully: {report.id}")
 
@@ -171,7 +206,7 @@ async def generate_report(
 
     except Exception as e:
         logger.error(f"Error generating report: {str(e)}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate report: {str(e)}",
@@ -179,7 +214,7 @@ async def generate_report(
 
 
 async def _analyze_market_data(
-    db: Session,
+    db: AsyncSession,
     report_type: str,
     category_filter: Optional[str],
     start_date: datetime,
@@ -206,7 +241,7 @@ async def _analyze_market_data(
                 AND latest_data_date <= :end_date
         """)
 
-        result = db.execute(
+        result = await db.execute(
             query,
             {
                 "category": category_filter,
@@ -241,6 +276,8 @@ async def _analyze_market_data(
 
     except Exception as e:
         logger.error(f"Error analyzing market data: {str(e)}", exc_info=True)
+        # A failed statement aborts the transaction; reset it so the report can still be saved
+        await db.rollback()
         return {
             "companies_count": 0,
             "metrics_count": 0,
@@ -1,8 +1,34 @@
-"""Redis caching implementation with aiocache."""
+"""Redis caching implementation with aiocache.
 
+Endpoint responses are cached through ``ResponseCache`` (see
+``cache_key_wrapper``), which adds on top of plain GET/SET:
+
+- request coalescing: concurrent misses for one key share a single
+  computation, within a process (shared future) and across processes
+  (a short-lived Redis lock that other workers wait on)
+- probabilistic early refresh (XFetch): a hot key is recomputed by one
+  caller slightly before it expires instead of by everyone after
+- binary serialization with orjson or msgpack
+- tag-based invalidation: entries register in Redis sorted sets per tag
+  (scored by expiry, so members of expired entries are pruned on write) and
+  writes can evict exactly the affected keys
+- hit/miss/coalesce/early-refresh counters
+- an optional process-local L1 (``src.core.local_cache``) in front of Redis,
+  kept coherent across processes by pub/sub invalidation
+"""
+
+import asyncio
+import dataclasses
+import inspect
 import json
+import math
+import random
+import time
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence
 
 import redis.asyncio as redis
 from aiocache import Cache
@@ -10,6 +36,30 @@ from aiocache.serializers import JsonSerializer
 from loguru import logger
 
 from src.core.config import get_settings
+from src.core.local_cache import LocalCache, get_local_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+NAMESPACE = "corporate_intel"
+
+# Delete the lock only if it still holds our token: after lock_timeout it may
+# have expired and been taken by another worker
+_RELEASE_LOCK = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
 # Global cache instance
 _cache: Optional[Cache] = None
@@ -29,7 +79,7 @@ def get_cache() -> Cache:
             password=settings.REDIS_PASSWORD.get_secret_value() if settings.REDIS_PASSWORD else None,
             db=settings.REDIS_DB,
             serializer=JsonSerializer(),
-            namespace="corporate_intel",
+            namespace=NAMESPACE,
         )
         
         logger.info("Redis cache initialized")
@@ -52,20 +102,445 @@ async def get_redis_client() -> redis.Redis:
     return client
 
 
+def _to_primitive(obj: Any) -> Any:
+    """Fallback encoder for types the binary serializers do not handle."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Type is not cacheable: {type(obj).__name__}")
+
+
+class CacheSerializer:
+    """Encode cache entries to bytes with orjson, msgpack or stdlib json."""
+
+    def __init__(self, name: str = "orjson"):
+        if name == "orjson" and not ORJSON_AVAILABLE:
+            logger.warning("orjson not installed, falling back to json cache serializer")
+            name = "json"
+        if name == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed, falling back to json cache serializer")
+            name = "json"
+        self.name = name
+
+    def dumps(self, value: Any) -> bytes:
+        if self.name == "orjson":
+            return orjson.dumps(value, default=_to_primitive, option=orjson.OPT_NON_STR_KEYS)
+        if self.name == "msgpack":
+            return msgpack.packb(value, default=_to_primitive, use_bin_type=True)
+        return json.dumps(value, default=_to_primitive).encode()
+
+    def loads(self, data: bytes) -> Any:
+        if self.name == "orjson":
+            return orjson.loads(data)
+        if self.name == "msgpack":
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
+        return json.loads(data)
+
+
+class ResponseCache:
+    """Redis cache with request coalescing, early refresh and tag invalidation.
+
+    Each entry is stored as ``[value, compute_seconds, expires_at]`` so that
+    readers can decide to refresh early: with probability rising as expiry
+    approaches (and faster for expensive values), one reader recomputes while
+    the others keep being served the current value.
+
+    Example:
+        ```python
+        cache = get_response_cache()
+        companies = await cache.get_or_compute(
+            "companies:all", load_companies, ttl=3600, tags=["companies"]
+        )
+        await cache.invalidate_tags("companies")  # after a write
+        ```
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        namespace: str = NAMESPACE,
+        serializer: Optional[CacheSerializer] = None,
+        beta: float = 1.0,
+        lock_timeout: float = 10.0,
+        tag_ttl: int = 86400,
+        retry_after: float = 5.0,
+        local: Optional[LocalCache] = None,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            client: Redis client returning bytes (``decode_responses=False``)
+            namespace: Prefix for every key written
+            serializer: Entry serializer (defaults to orjson)
+            beta: Early refresh aggressiveness; 0 disables early refresh
+            lock_timeout: Seconds a recompute holds the key lock; waiters
+                give up and compute themselves after this long
+            tag_ttl: Minimum lifetime of tag sets
+            retry_after: Seconds to bypass Redis after a connection error
+            local: Process-local L1 consulted before Redis
+        """
+        self.client = client
+        self.namespace = namespace
+        self.serializer = serializer or CacheSerializer()
+        self.beta = beta
+        self.lock_timeout = lock_timeout
+        self.tag_ttl = tag_ttl
+        self.retry_after = retry_after
+        self.local = local
+
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._unavailable_until = 0.0
+        self.counters = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "early_refreshes": 0,
+            "sets": 0,
+            "invalidations": 0,
+            "errors": 0,
+        }
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}:tags:{tag}"
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.namespace}:lock:{key}"
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        self.counters["errors"] += 1
+        logger.warning(f"Cache {operation} error: {error}")
+        if isinstance(error, (redis.ConnectionError, ConnectionError, OSError)):
+            self._unavailable_until = time.monotonic() + self.retry_after
+
+    def _should_refresh_early(self, compute_seconds: float, expires_at: float) -> bool:
+        if self.beta <= 0:
+            return False
+        # XFetch: now - delta * beta * ln(U) >= expiry, U in (0, 1]
+        jitter = -compute_seconds * self.beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= expires_at
+
+    async def get(self, key: str) -> Any:
+        """Return the cached value for ``key`` or None (no coalescing)."""
+        entry = await self._read(key)
+        return entry[0] if entry is not None else None
+
+    async def _read(self, key: str, record: bool = True) -> Optional[list]:
+        full_key = self._key(key)
+        if self.local is not None and record:
+            # L1 keeps serving through a Redis outage until its entries expire
+            entry = self.local.get(full_key)
+            if entry is not None:
+                return entry
+        if not self._available():
+            return None
+        try:
+            raw = await self.client.get(full_key)
+        except Exception as e:
+            self._record_error("get", e)
+            return None
+        if self.local is not None and record:
+            self.local.record_l2(raw is not None)
+        if raw is None:
+            return None
+        try:
+            entry = self.serializer.loads(raw)
+        except Exception as e:
+            self._record_error("decode", e)
+            return None
+        if self.local is not None:
+            self.local.set(full_key, entry, size=len(raw), ttl=entry[2] - time.time())
+        return entry
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        tags: Iterable[str] = (),
+        compute_seconds: float = 0.0,
+    ) -> bool:
+        """Store ``value`` under ``key`` and register it with ``tags``."""
+        if not self._available():
+            return False
+        try:
+            payload = self.serializer.dumps([value, compute_seconds, time.time() + ttl])
+        except TypeError as e:
+            logger.warning(f"Cache set skipped for {key}: {e}")
+            return False
+
+        full_key = self._key(key)
+        now = time.time()
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(full_key, payload, ex=ttl)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.zadd(tag_key, {full_key: now + ttl})
+                # Drop members whose entries have expired so the set stays bounded
+                pipe.zremrangebyscore(tag_key, "-inf", now)
+                pipe.expire(tag_key, max(self.tag_ttl, ttl))
+            await pipe.execute()
+        except Exception as e:
+            self._record_error("set", e)
+            return False
+
+        if self.local is not None:
+            # Store the decoded form so L1 hits match what Redis would return
+            self.local.set(full_key, self.serializer.loads(payload), size=len(payload), ttl=ttl)
+        self.counters["sets"] += 1
+        logger.debug(f"Cache set: {key} (TTL: {ttl}s, tags: {list(tags)})")
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        """Delete exact keys."""
+        if not keys or not self._available():
+            return 0
+        full_keys = [self._key(key) for key in keys]
+        try:
+            removed = await self.client.delete(*full_keys)
+        except Exception as e:
+            self._record_error("delete", e)
+            return 0
+        if self.local is not None:
+            await self.local.publish_invalidation(self.client, full_keys)
+        return removed
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every entry registered under any of ``tags``.
+
+        Returns:
+            Number of cache entries removed
+        """
+        if not tags or not self._available():
+            return 0
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.zrange(self._tag_key(tag), 0, -1)
+            members = set()
+            for tag_members in await pipe.execute():
+                members.update(tag_members)
+
+            removed = 0
+            if members:
+                removed = await self.client.delete(*members)
+            await self.client.delete(*(self._tag_key(tag) for tag in tags))
+        except Exception as e:
+            self._record_error("invalidate", e)
+            return 0
+
+        if self.local is not None:
+            await self.local.publish_invalidation(self.client, members)
+
+        self.counters["invalidations"] += removed
+        logger.info(f"Invalidated {removed} cache entries for tags: {', '.join(tags)}")
+        return removed
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        tags: Sequence[str] = (),
+    ) -> Any:
+        """Return the cached value for ``key``, computing it at most once on a miss."""
+        entry = await self._read(key)
+        if entry is not None:
+            value, compute_seconds, expires_at = entry
+            if not self._should_refresh_early(compute_seconds, expires_at):
+                self.counters["hits"] += 1
+                logger.debug(f"Cache hit: {key}")
+                return value
+
+            # One caller refreshes; everyone else keeps the current value
+            if key in self._inflight:
+                self.counters["hits"] += 1
+                return value
+            token = await self._acquire_lock(key)
+            if token is None:
+                self.counters["hits"] += 1
+                return value
+            self.counters["early_refreshes"] += 1
+            return await self._compute_shared(key, compute, ttl, tags, token=token)
+
+        self.counters["misses"] += 1
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.counters["coalesced"] += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The computing request was cancelled, not this one
+        return await self._compute_shared(key, compute, ttl, tags)
+
+    async def _compute_shared(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        tags: Sequence[str],
+        token: Optional[str] = None,
+    ) -> Any:
+        """Compute under an in-process future other callers can await.
+
+        ``token`` is the lock token when the caller already holds the key lock.
+        """
+        future = asyncio.get_running_loop().create_future()
+        # Avoid "exception never retrieved" warnings when nobody was waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            if token is None:
+                token = await self._acquire_lock(key)
+                if token is None:
+                    # Another process is computing this key; wait for its result
+                    entry = await self._wait_for_entry(key)
+                    if entry is not None:
+                        self.counters["coalesced"] += 1
+                        future.set_result(entry[0])
+                        return entry[0]
+
+            started = time.perf_counter()
+            value = await compute()
+            await self.set(key, value, ttl, tags, compute_seconds=time.perf_counter() - started)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            if token is not None:
+                await self._release_lock(key, token)
+
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """Take the key lock; returns its token, or None if another worker holds it."""
+        token = uuid.uuid4().hex
+        if not self._available():
+            return token  # Redis is down: nothing to coordinate with
+        try:
+            acquired = await self.client.set(
+                self._lock_key(key), token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+            return token if acquired else None
+        except Exception as e:
+            self._record_error("lock", e)
+            return token
+
+    async def _release_lock(self, key: str, token: str) -> None:
+        if not self._available():
+            return
+        try:
+            await self.client.eval(_RELEASE_LOCK, 1, self._lock_key(key), token)
+        except Exception as e:
+            self._record_error("unlock", e)
+
+    async def _wait_for_entry(self, key: str) -> Optional[list]:
+        """Poll for a value another process is computing, up to lock_timeout."""
+        deadline = time.monotonic() + self.lock_timeout
+        delay = 0.01
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            entry = await self._read(key, record=False)
+            if entry is not None:
+                return entry
+            if not self._available():
+                return None
+            try:
+                if not await self.client.exists(self._lock_key(key)):
+                    # Holder finished (or failed) without storing a value
+                    return await self._read(key, record=False)
+            except Exception as e:
+                self._record_error("lock", e)
+                return None
+            delay = min(delay * 2, 0.2)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this process, plus hit rate (L1 or Redis) and L1 stats."""
+        lookups = self.counters["hits"] + self.counters["misses"]
+        stats = {
+            **self.counters,
+            "hit_rate": round(self.counters["hits"] / lookups * 100, 2) if lookups else 0.0,
+            "serializer": self.serializer.name,
+        }
+        if self.local is not None:
+            stats["l1"] = self.local.stats()
+        return stats
+
+
+# Global response cache instance
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the response cache used by ``cache_key_wrapper``."""
+    global _response_cache
+
+    if _response_cache is None:
+        settings = get_settings()
+
+        client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            password=settings.REDIS_PASSWORD.get_secret_value() if settings.REDIS_PASSWORD else None,
+            db=settings.REDIS_DB,
+            socket_connect_timeout=1,
+        )
+        _response_cache = ResponseCache(
+            client,
+            serializer=CacheSerializer(settings.CACHE_SERIALIZER),
+            beta=settings.CACHE_EARLY_REFRESH_BETA,
+            lock_timeout=settings.CACHE_LOCK_TIMEOUT,
+            local=get_local_cache(),
+        )
+
+        logger.info(f"Response cache initialized ({_response_cache.serializer.name} serializer)")
+
+    return _response_cache
+
+
 def cache_key_wrapper(
     prefix: str = "",
     expire: int = 3600,
     key_builder: Optional[Callable] = None,
+    tags: Sequence[str] = (),
 ):
     """
     Decorator for caching function results.
     
     Args:
-        prefix: Cache key prefix
+        prefix: Cache key prefix (also applied as a tag)
         expire: TTL in seconds
         key_builder: Custom function to build cache key from arguments
+        tags: Invalidation tags; ``str.format`` templates over the
+            function's arguments, e.g. ``"company:{company_id}"``
     """
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Build cache key
@@ -91,29 +566,17 @@ def cache_key_wrapper(
                 
                 cache_key = ":".join(key_parts)
             
-            # Get cache
-            cache = get_cache()
-            
-            # Try to get from cache
-            try:
-                cached_value = await cache.get(cache_key)
-                if cached_value is not None:
-                    logger.debug(f"Cache hit: {cache_key}")
-                    return cached_value
-            except Exception as e:
-                logger.warning(f"Cache get error: {e}")
-            
-            # Execute function
-            result = await func(*args, **kwargs)
-            
-            # Store in cache
-            try:
-                await cache.set(cache_key, result, ttl=expire)
-                logger.debug(f"Cache set: {cache_key} (TTL: {expire}s)")
-            except Exception as e:
-                logger.warning(f"Cache set error: {e}")
+            entry_tags = [prefix] if prefix else []
+            if tags:
+                arguments = signature.bind_partial(*args, **kwargs).arguments
+                entry_tags.extend(tag.format(**arguments) for tag in tags)
             
-            return result
+            return await get_response_cache().get_or_compute(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl=expire,
+                tags=entry_tags,
+            )
         
         return wrapper
     return decorator
@@ -131,12 +594,15 @@ class CacheManager:
         
         # Find all keys matching pattern
         keys = []
-        async for key in client.scan_iter(match=f"corporate_intel:{pattern}"):
+        async for key in client.scan_iter(match=f"{NAMESPACE}:{pattern}"):
             keys.append(key)
         
         # Delete keys
         if keys:
             await client.delete(*keys)
+            local = get_local_cache()
+            if local is not None:
+                await local.publish_invalidation(client, keys)
             logger.info(f"Invalidated {len(keys)} cache keys matching pattern: {pattern}")
     
     async def get_metrics(self) -> dict:
@@ -157,6 +623,8 @@ class CacheManager:
                 info.get("keyspace_hits", 0),
                 info.get("keyspace_misses", 0)
             ),
+            "response_cache": get_response_cache().stats(),
+            "l1_cache": local.stats() if (local := get_local_cache()) is not None else None,
         }
     
     @staticmethod
@@ -178,6 +646,9 @@ class CacheManager:
         """Clear all cache entries."""
         client = await get_redis_client()
         await client.flushdb()
+        local = get_local_cache()
+        if local is not None:
+            await local.publish_clear(client)
         logger.warning("Cleared all cache entries")
 
 
@@ -24,6 +24,8 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     API_V1_PREFIX: str = "/api/v1"
     ENVIRONMENT: str = Field(default="development", pattern="^(development|staging|production)$")
+    # Local data (caches, snapshots); relative data path settings resolve under it
+    DATA_DIR: str = str(Path(__file__).resolve().parents[2] / "data")
     
     # Database
     POSTGRES_HOST: str = "localhost"
@@ -31,6 +33,12 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "intel_user"
     POSTGRES_PASSWORD: SecretStr
     POSTGRES_DB: str = "corporate_intel"
+
+    # Async connection pool (API); None = 5 in DEBUG, 20 otherwise
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds a request waits for a free connection
+    METRICS_EXPORT_CHUNK_ROWS: int = Field(default=10_000, ge=100)  # rows per server-side fetch
     
     # TimescaleDB specific
     TIMESCALE_COMPRESSION_AFTER_DAYS: int = 30
@@ -40,6 +48,12 @@ class Settings(BaseSettings):
     VECTOR_DIMENSION: int = 1536  # OpenAI embeddings dimension
     VECTOR_INDEX_TYPE: str = "ivfflat"
     VECTOR_LISTS: int = 100
+
+    # Embedding cache (shared on-disk cache of computed embeddings)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_DIR: str = "embedding_cache"  # under DATA_DIR unless absolute
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 1_000_000
+    EMBEDDING_CACHE_DTYPE: str = Field(default="float16", pattern="^(float16|float32)$")
     
     # Redis
     REDIS_HOST: str = "localhost"
@@ -47,6 +61,22 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[SecretStr] = None
     REDIS_DB: int = 0
     REDIS_CACHE_TTL: int = 3600  # 1 hour default
+    CACHE_SERIALIZER: str = Field(default="orjson", pattern="^(orjson|msgpack|json)$")
+    CACHE_EARLY_REFRESH_BETA: float = 1.0  # 0 disables probabilistic early refresh
+    CACHE_LOCK_TIMEOUT: float = 10.0  # seconds a recompute may hold a key's lock
+    L1_CACHE_ENABLED: bool = True  # process-local cache in front of Redis
+    L1_CACHE_MAX_ENTRIES: int = 1024
+    L1_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    L1_CACHE_TTL: float = 30.0  # upper bound on staleness if an invalidation is lost
+    
+    # dbt marts and event-driven incremental refresh
+    DBT_PROJECT_DIR: str = "dbt"
+    DBT_PROFILES_DIR: str = "dbt"
+    DBT_EXECUTABLE: str = "dbt"
+    MART_REFRESH_DEBOUNCE_SECONDS: float = 5.0  # coalesce bursts of ingestion commits
+    MART_REFRESH_POLL_SECONDS: float = 300.0  # fallback if a NOTIFY is missed
+    MART_REFRESH_TIMEOUT: float = 900.0  # seconds a dbt run may take
+    MART_REFRESH_CLAIM_TIMEOUT: float = 1800.0  # retake claims of a worker that died
     
     # MinIO
     MINIO_ENDPOINT: str = "localhost:9000"
@@ -64,16 +94,30 @@ class Settings(BaseSettings):
     RAY_HEAD_ADDRESS: str = "ray://localhost:10001"
     RAY_NUM_CPUS: Optional[int] = None
     RAY_NUM_GPUS: Optional[int] = None
+
+    # PDF extraction (page-range process pool; None = CPU count)
+    PDF_EXTRACT_WORKERS: Optional[int] = None
+    PDF_PAGES_PER_TASK: int = 16
     
     # SEC EDGAR API
     SEC_USER_AGENT: str = Field(
         default="Corporate Intel Bot/1.0 (brandon.lambert87@gmail.com)"
     )
     SEC_RATE_LIMIT: int = 10  # requests per second
+    # Ticker/CIK directory snapshot for cold starts ("" disables it) and its refresh TTL
+    SEC_COMPANY_DIRECTORY_PATH: str = "sec/company_tickers.json.gz"  # under DATA_DIR unless absolute; "" disables
+    SEC_COMPANY_DIRECTORY_TTL: int = 86400  # seconds
+    
+    # Raw filing text store (content-addressed, zstd-compressed)
+    FILING_CONTENT_BACKEND: str = "local"  # local or s3 (bucket on MINIO_ENDPOINT)
+    FILING_CONTENT_DIR: str = "filings"  # under DATA_DIR unless absolute
+    FILING_CONTENT_BUCKET: str = "sec-filings"
+    FILING_CONTENT_COMPRESSION_LEVEL: int = 10
     
     # Financial APIs
     ALPHA_VANTAGE_API_KEY: Optional[SecretStr] = None
     YAHOO_FINANCE_ENABLED: bool = True
+    YAHOO_FINANCE_MAX_WORKERS: int = 4  # threads running blocking yfinance calls
     
     # OpenTelemetry
     OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://localhost:4317"
@@ -209,6 +253,10 @@ class Settings(BaseSettings):
             raise ValueError("Please set proper secret values for production")
         return v
     
+    def data_path(self, path: str) -> Path:
+        """Resolve a data path setting; relative paths are taken under DATA_DIR."""
+        return Path(self.DATA_DIR) / path
+    
     @property
     def database_url(self) -> str:
         """Build PostgreSQL connection URL."""
@@ -95,7 +95,7 @@ class DatabaseException(CorporateIntelException):
         super().__init__(
             detail=detail,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            error_code="DATABASE_ERROR",
+            error_code=kwargs.pop("error_code", "DATABASE_ERROR"),
             **kwargs
         )
 
@@ -164,7 +164,7 @@ class DataSourceException(CorporateIntelException):
         super().__init__(
             detail=detail,
             status_code=status.HTTP_502_BAD_GATEWAY,
-            error_code="DATA_SOURCE_ERROR",
+            error_code=kwargs.pop("error_code", "DATA_SOURCE_ERROR"),
             **kwargs
         )
 
@@ -188,7 +188,7 @@ class APIException(DataSourceException):
             kwargs['response_body'] = response_body
         super().__init__(
             detail=detail,
-            error_code="EXTERNAL_API_ERROR",
+            error_code=kwargs.pop("error_code", "EXTERNAL_API_ERROR"),
             **kwargs
         )
 
@@ -279,7 +279,7 @@ class PipelineException(CorporateIntelException):
         super().__init__(
             detail=detail,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            error_code="PIPELINE_ERROR",
+            error_code=kwargs.pop("error_code", "PIPELINE_ERROR"),
             **kwargs
         )
 
@@ -339,7 +339,7 @@ class RepositoryException(CorporateIntelException):
         super().__init__(
             detail=detail,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            error_code="REPOSITORY_ERROR",
+            error_code=kwargs.pop("error_code", "REPOSITORY_ERROR"),
             **kwargs
         )
 
@@ -0,0 +1,286 @@
+"""Process-local L1 cache in front of Redis.
+
+Dashboard reads and cached endpoints hit the same few keys over and over
+(the Dash UI auto-refreshes), so each process keeps recently read values in
+memory and only goes to Redis (L2) when its copy is missing or stale:
+
+- bounded by entry count and by an approximate byte budget, evicting the
+  least recently used entry first
+- per-entry TTL, never longer than the L2 entry's remaining lifetime and
+  capped by ``L1_CACHE_TTL`` so a lost invalidation is only briefly visible
+- invalidation across processes through a Redis pub/sub channel: whoever
+  deletes a key publishes it and every subscribed process drops its copy
+- L1/L2 hit and miss counters plus entry count and byte footprint
+
+Values are stored decoded and shared between callers; treat them as
+read-only. A process serving cached reads subscribes to invalidations with
+``get_local_cache().ensure_listener(client)`` at startup (the API does this
+in its lifespan).
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import redis.asyncio as redis
+from loguru import logger
+
+from src.core.config import get_settings
+
+# Pub/sub channel carrying JSON lists of invalidated keys ("*" clears all)
+INVALIDATION_CHANNEL = "corporate_intel:l1:invalidate"
+
+# Message payload that clears every L1 entry
+INVALIDATE_ALL = "*"
+
+
+class LocalCache:
+    """Bounded in-memory LRU cache with per-entry TTL.
+
+    Example:
+        ```python
+        local = get_local_cache()
+        value = local.get("dashboard:market_summary")
+        if value is None:
+            raw = await redis_client.get("dashboard:market_summary")
+            local.record_l2(raw is not None)
+            if raw is not None:
+                value = json.loads(raw)
+                local.set("dashboard:market_summary", value, size=len(raw))
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 30.0,
+        channel: str = INVALIDATION_CHANNEL,
+    ):
+        """
+        Initialize local cache.
+
+        Args:
+            max_entries: Maximum number of entries held
+            max_bytes: Approximate memory budget; entry sizes are the length
+                of their serialized form
+            ttl: Upper bound on any entry's lifetime in seconds
+            channel: Redis pub/sub channel for invalidations
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.channel = channel
+
+        # key -> (value, expires_at monotonic, size)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._listener: Optional[asyncio.Task] = None
+        self.counters = {
+            "l1_hits": 0,
+            "l1_misses": 0,
+            "l2_hits": 0,
+            "l2_misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    def get(self, key: str) -> Any:
+        """Return the value for ``key`` or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.counters["l1_misses"] += 1
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.counters["expirations"] += 1
+            self.counters["l1_misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.counters["l1_hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> bool:
+        """Store ``value`` for at most ``ttl`` seconds (capped by the cache TTL).
+
+        Args:
+            key: Cache key
+            value: Decoded value
+            size: Approximate size in bytes, usually the serialized length
+            ttl: Remaining lifetime of the value in L2
+
+        Returns:
+            False if the value was not stored (expired or larger than the budget)
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or size > self.max_bytes:
+            self._remove(key)
+            return False
+
+        self._remove(key)
+        self._entries[key] = (value, time.monotonic() + ttl, size)
+        self._bytes += size
+        self.counters["sets"] += 1
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.counters["evictions"] += 1
+        return True
+
+    def delete(self, *keys: str) -> int:
+        """Drop ``keys`` from this process only; returns entries removed."""
+        removed = sum(self._remove(key) for key in keys)
+        self.counters["invalidations"] += removed
+        return removed
+
+    def clear(self) -> None:
+        """Drop every entry from this process."""
+        self.counters["invalidations"] += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    def record_l2(self, hit: bool) -> None:
+        """Count the outcome of a Redis lookup made after an L1 miss."""
+        self.counters["l2_hits" if hit else "l2_misses"] += 1
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    async def publish_invalidation(self, client: redis.Redis, keys: Iterable[str]) -> None:
+        """Drop ``keys`` here and tell every other process to drop them too."""
+        keys = [key.decode() if isinstance(key, bytes) else key for key in keys]
+        if not keys:
+            return
+        self.delete(*keys)
+        try:
+            await client.publish(self.channel, json.dumps(keys))
+        except Exception as e:
+            logger.warning(f"L1 invalidation publish failed: {e}")
+
+    async def publish_clear(self, client: redis.Redis) -> None:
+        """Clear this process's entries and tell every other process to do the same."""
+        self.clear()
+        try:
+            await client.publish(self.channel, json.dumps(INVALIDATE_ALL))
+        except Exception as e:
+            logger.warning(f"L1 invalidation publish failed: {e}")
+
+    def handle_message(self, data: Any) -> None:
+        """Apply one invalidation message from the pub/sub channel."""
+        if isinstance(data, bytes):
+            data = data.decode()
+        try:
+            keys = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed L1 invalidation message: {data!r}")
+            return
+
+        if keys == INVALIDATE_ALL:
+            self.clear()
+        elif isinstance(keys, list):
+            self.delete(*keys)
+
+    def ensure_listener(self, client: redis.Redis) -> None:
+        """Subscribe to invalidations in the background if not already doing so.
+
+        Must be called from a running event loop.
+        """
+        if self._listener is not None and not self._listener.done():
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen(client))
+
+    async def stop_listener(self) -> None:
+        """Cancel the invalidation subscriber."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    async def _listen(self, client: redis.Redis) -> None:
+        delay = 0.5
+        while True:
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Invalidations may have been missed while unsubscribed
+                self.clear()
+                delay = 0.5
+                logger.info(f"L1 cache subscribed to {self.channel}")
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"L1 invalidation listener error: {e}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, hit rates per tier and memory footprint."""
+        l1_lookups = self.counters["l1_hits"] + self.counters["l1_misses"]
+        l2_lookups = self.counters["l2_hits"] + self.counters["l2_misses"]
+        return {
+            **self.counters,
+            "l1_hit_rate": round(self.counters["l1_hits"] / l1_lookups * 100, 2) if l1_lookups else 0.0,
+            "l2_hit_rate": round(self.counters["l2_hits"] / l2_lookups * 100, 2) if l2_lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "listening": self._listener is not None and not self._listener.done(),
+        }
+
+
+# Global local cache instance
+_local_cache: Optional[LocalCache] = None
+
+
+def get_local_cache() -> Optional[LocalCache]:
+    """Get or create this process's L1 cache (None when disabled in settings)."""
+    global _local_cache
+
+    settings = get_settings()
+    if not settings.L1_CACHE_ENABLED:
+        return None
+
+    if _local_cache is None:
+        _local_cache = LocalCache(
+            max_entries=settings.L1_CACHE_MAX_ENTRIES,
+            max_bytes=settings.L1_CACHE_MAX_BYTES,
+            ttl=settings.L1_CACHE_TTL,
+        )
+        logger.info(
+            f"L1 cache initialized ({settings.L1_CACHE_MAX_ENTRIES} entries, "
+            f"{settings.L1_CACHE_MAX_BYTES} bytes, {settings.L1_CACHE_TTL}s TTL)"
+        )
+
+    return _local_cache
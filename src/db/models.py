@@ -20,7 +20,8 @@ from sqlalchemy import (
     func,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, relationship, mapped_column
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import DeclarativeBase, Mapped, deferred, relationship, mapped_column
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import RelationshipProperty
@@ -72,8 +73,14 @@ class Company(Base, TimestampMixin):
     )
 
 
-class SECFiling(Base, TimestampMixin):
-    """SEC filing documents."""
+class SECFiling(AsyncAttrs, Base, TimestampMixin):
+    """SEC filing documents.
+
+    The full text lives in the filing content store under content_hash (see
+    src/pipeline/sec/content_store.py); read it with ``await load_text()``.
+    parsed_sections indexes the Item sections of 10-K and 10-Q filings (see
+    src/pipeline/sec/sections.py); read one with ``await load_section()``.
+    """
     
     __tablename__ = "sec_filings"
     
@@ -87,8 +94,9 @@ class SECFiling(Base, TimestampMixin):
     filing_url = Column(Text)
     
     # Content
-    raw_text = Column(Text)
-    parsed_sections = Column(JSON)  # Structured sections
+    content_hash = Column(String(64), index=True)  # SHA-256 of the text in the content store
+    raw_text = deferred(Column(Text))  # Legacy inline text, only loaded on access
+    parsed_sections = Column(JSON)  # Item section offsets into the text
     
     # Processing status
     processing_status = Column(String(20), default="pending")
@@ -104,6 +112,32 @@ class SECFiling(Base, TimestampMixin):
         UniqueConstraint("company_id", "accession_number", name="uq_company_filing"),
     )
 
+    async def load_text(self, store: Optional[Any] = None) -> Optional[str]:
+        """Load the filing text from the content store (or inline legacy text).
+
+        Args:
+            store: FilingContentStore to read from (default: process-wide store)
+        """
+        if self.content_hash:
+            from src.pipeline.sec.content_store import get_filing_content_store
+
+            return await (store or get_filing_content_store()).get(self.content_hash)
+        return await self.awaitable_attrs.raw_text
+
+    async def load_section(self, name: str, store: Optional[Any] = None) -> Optional[str]:
+        """Load one indexed section of the filing as plain text.
+
+        Args:
+            name: Section key such as "item_7", or an alias such as "mdna"
+            store: FilingContentStore to read from (default: process-wide store)
+        """
+        from src.pipeline.sec.sections import resolve_section, section_text
+
+        if not self.parsed_sections or resolve_section(self.parsed_sections, name) is None:
+            return None
+        text = await self.load_text(store)
+        return section_text(text, self.parsed_sections, name) if text else None
+
 
 class FinancialMetric(Base, TimestampMixin):
     """Time-series financial and operational metrics."""
@@ -281,4 +315,49 @@ class MarketIntelligence(Base, TimestampMixin):
     __table_args__ = (
         Index("idx_intel_type_date", "intel_type", "event_date"),
         Index("idx_intel_company", "primary_company_id", "event_date"),
-    )
\ No newline at end of file
+    )
+
+
+class MartRefreshQueue(Base):
+    """Companies and metric types changed since the marts were last refreshed.
+
+    Ingestion records every (company, metric type) pair it writes to
+    financial_metrics in the same transaction; the mart refresher drains the
+    queue and recomputes only the affected mart rows.
+    """
+    
+    __tablename__ = "mart_refresh_queue"
+    
+    company_id = Column(
+        PGUUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    metric_type = Column(String(50), primary_key=True)
+    
+    # First change not yet refreshed, and the most recent one
+    enqueued_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Set while a refresh run holds the entry; deleted once that run succeeds
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        Index("idx_mart_refresh_enqueued", "enqueued_at"),
+    )
+
+
+class SECSyncCursor(Base):
+    """High-water mark of the SEC filings synced per company and form type.
+
+    The SEC ingestion flow skips filings dated before ``last_filing_date``
+    without downloading them; filings on or after it are checked against
+    sec_filings by accession number. The mark only advances past filings
+    that were stored, already known, or permanently invalid.
+    """
+    
+    __tablename__ = "sec_sync_cursors"
+    
+    cik = Column(String(10), primary_key=True)  # Zero-padded
+    filing_type = Column(String(20), primary_key=True)
+    
+    last_filing_date = Column(DateTime(timezone=True), nullable=False)
+    last_accession_number = Column(String(25))
+    last_synced_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -25,8 +25,9 @@ def get_async_engine() -> AsyncEngine:
         AsyncEngine: SQLAlchemy async engine instance
 
     Configuration:
-        - Pool size: 5-20 connections
-        - Max overflow: 10 additional connections
+        - Pool size: DB_POOL_SIZE (default 5 in DEBUG, 20 otherwise)
+        - Max overflow: DB_MAX_OVERFLOW additional connections
+        - Pool timeout: DB_POOL_TIMEOUT seconds to wait for a connection
         - Pool recycle: 3600 seconds (1 hour)
         - Pool pre-ping: True (validates connections)
         - Echo: True in DEBUG mode
@@ -37,8 +38,8 @@ def get_async_engine() -> AsyncEngine:
         settings = get_settings()
 
         # Connection pool configuration
-        pool_size = 5 if settings.DEBUG else 20
-        max_overflow = 10
+        pool_size = settings.DB_POOL_SIZE or (5 if settings.DEBUG else 20)
+        max_overflow = settings.DB_MAX_OVERFLOW
         pool_recycle = 3600  # Recycle connections after 1 hour
         pool_pre_ping = True  # Test connections before using
 
@@ -48,6 +49,7 @@ def get_async_engine() -> AsyncEngine:
             # Async engines use AsyncAdaptedQueuePool by default - don't specify poolclass
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
             pool_recycle=pool_recycle,
             pool_pre_ping=pool_pre_ping,
             # Connection arguments
@@ -33,9 +33,12 @@ Example:
 from src.dto.base import BaseDTO, TimestampMixin, UUIDMixin, from_orm_list
 from src.dto.errors import ErrorDetail, ErrorResponseDTO, ValidationErrorDTO
 from src.dto.pagination import (
+    InvalidCursorError,
     PageMetadata,
     PaginatedResponseDTO,
     PaginationParams,
+    decode_cursor,
+    encode_cursor,
 )
 from src.dto.responses import ResponseDTO, ResponseMetadata, success_response
 from src.dto.validators import (
@@ -60,9 +63,12 @@ __all__ = [
     "PaginatedResponseDTO",
     "PageMetadata",
     "PaginationParams",
+    "InvalidCursorError",
     # Utility functions
     "success_response",
     "from_orm_list",
+    "encode_cursor",
+    "decode_cursor",
     "validate_ticker",
     "validate_uuid",
     "validate_date_range",
@@ -63,7 +63,7 @@ class FilingCreateDTO(FilingBaseDTO):
     )
     parsed_sections: Optional[Dict[str, Any]] = Field(
         None,
-        description="Structured sections extracted from filing (e.g., Item 1, Item 7, etc.)"
+        description="Item section index: document offsets of Item 1, Item 7, etc."
     )
 
     model_config = {
@@ -75,8 +75,18 @@ class FilingCreateDTO(FilingBaseDTO):
                 "accession_number": "0001193125-25-123456",
                 "filing_url": "https://www.sec.gov/Archives/edgar/data/1318605/000119312525123456/d12345d10k.htm",
                 "parsed_sections": {
-                    "item_1": "Business description...",
-                    "item_7": "Management's Discussion and Analysis..."
+                    "version": 1,
+                    "form": "10-K",
+                    "format": "html",
+                    "text_length": 412345,
+                    "sections": {
+                        "item_7": {
+                            "title": "Management's Discussion and Analysis of Financial Condition and Results of Operations",
+                            "start": 1804211,
+                            "end": 2391533,
+                            "length": 98211
+                        }
+                    }
                 }
             }
         }
@@ -116,7 +126,7 @@ class FilingDTO(FilingBaseDTO, IDMixin, TimestampedDTO):
     )
     parsed_sections: Optional[Dict[str, Any]] = Field(
         None,
-        description="Structured sections extracted from filing"
+        description="Item section index (document offsets per section)"
     )
 
     model_config = {
@@ -133,8 +143,18 @@ class FilingDTO(FilingBaseDTO, IDMixin, TimestampedDTO):
                 "processed_at": "2025-04-01T12:00:00Z",
                 "error_message": None,
                 "parsed_sections": {
-                    "item_1": "Business overview...",
-                    "item_7": "MD&A..."
+                    "version": 1,
+                    "form": "10-K",
+                    "format": "html",
+                    "text_length": 412345,
+                    "sections": {
+                        "item_7": {
+                            "title": "Management's Discussion and Analysis of Financial Condition and Results of Operations",
+                            "start": 1804211,
+                            "end": 2391533,
+                            "length": 98211
+                        }
+                    }
                 },
                 "created_at": "2025-04-01T10:00:00Z",
                 "updated_at": "2025-04-01T12:00:00Z"
@@ -201,6 +221,10 @@ class FilingListDTO(BaseDTO):
         ge=0,
         description="Number of items skipped"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Keyset cursor for the next page (None on the last page)"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -255,6 +255,10 @@ class IntelligenceListDTO(BaseDTO):
         ge=0,
         description="Number of items skipped"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Keyset cursor for the next page (None on the last page)"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -218,6 +218,10 @@ class MetricsListDTO(BaseDTO):
         ge=0,
         description="Number of items skipped"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Keyset cursor for the next page (None on the last page)"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -310,6 +310,10 @@ class ReportListDTO(BaseDTO):
         ge=0,
         description="Number of items skipped"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Keyset cursor for the next page (None on the last page)"
+    )
 
     model_config = {
         "json_schema_extra": {
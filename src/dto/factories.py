@@ -393,7 +393,8 @@ def paginated_response(
     total: int,
     limit: int,
     offset: int,
-    list_dto_class: Type[Any]
+    list_dto_class: Type[Any],
+    next_cursor: Optional[str] = None
 ) -> Any:
     """Generic factory for creating paginated list responses.
 
@@ -401,8 +402,9 @@ def paginated_response(
         items: List of DTO items
         total: Total count matching query
         limit: Page size limit
-        offset: Number of items skipped
+        offset: Number of items skipped (0 for keyset pages)
         list_dto_class: Target list DTO class
+        next_cursor: Keyset cursor for the next page, from BaseRepository.get_page
 
     Returns:
         Instance of list_dto_class with paginated data
@@ -434,5 +436,6 @@ def paginated_response(
         field_name: items,
         "total": total,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor
     })
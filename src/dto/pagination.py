@@ -2,10 +2,21 @@
 
 This module provides standardized pagination support for list endpoints,
 including cursor-based and offset-based pagination strategies.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the sort key
+name and the last row's (sort value, primary key) pair. Repositories turn
+them into a keyset predicate, so every page costs one index range scan
+regardless of depth.
 """
 
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
 from urllib.parse import urlencode
+from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -15,6 +26,103 @@ from src.dto.responses import ResponseMetadata
 T = TypeVar("T")
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or was issued for another sort."""
+    pass
+
+
+def _cursor_value(value: Any) -> Any:
+    """Reduce a sort key value to a JSON primitive."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(sort_key: str, sort_value: Any, row_id: Any) -> str:
+    """Encode the position after a row as an opaque cursor.
+
+    Args:
+        sort_key: Name of the column the listing is ordered by
+        sort_value: The row's value of that column
+        row_id: The row's primary key (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+
+    Example:
+        >>> cursor = encode_cursor("metric_date", metric.metric_date, metric.id)
+    """
+    payload = {"k": sort_key, "v": [_cursor_value(sort_value), _cursor_value(row_id)]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> Tuple[Any, Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Values come back as JSON primitives (dates as ISO strings); repositories
+    coerce them to the column types.
+
+    Args:
+        cursor: Cursor string from a previous page
+        sort_key: Sort key of the current request
+
+    Returns:
+        Tuple of (sort value, row id)
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded or belongs to a
+            listing ordered by a different key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, (sort_value, row_id) = payload["k"], payload["v"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Malformed pagination cursor: {cursor!r}") from e
+
+    if key != sort_key:
+        raise InvalidCursorError(
+            f"Cursor was issued for ordering by '{key}', not '{sort_key}'"
+        )
+
+    return sort_value, row_id
+
+
+def next_cursor_from_items(
+    items: Sequence[Any],
+    limit: int,
+    sort_key: str,
+    id_key: str = "id",
+) -> Optional[str]:
+    """Build the cursor for the page after `items`.
+
+    Works on ORM objects and on their cached dictionary form alike. A full
+    page is assumed to have a successor; the final request may then return
+    an empty page.
+
+    Args:
+        items: Rows of the current page, in listing order
+        limit: Requested page size
+        sort_key: Column the listing is ordered by
+        id_key: Primary key attribute
+
+    Returns:
+        Cursor string, or None if this was the last page
+    """
+    if not items or len(items) < limit:
+        return None
+
+    last = items[-1]
+    if isinstance(last, dict):
+        return encode_cursor(sort_key, last.get(sort_key), last.get(id_key))
+    return encode_cursor(sort_key, getattr(last, sort_key), getattr(last, id_key))
+
+
 class PaginationParams(BaseModel):
     """Query parameters for pagination.
 
@@ -253,8 +361,12 @@ class PageLinks(BaseModel):
         Returns:
             PageLinks instance
         """
-        def build_url(limit: int, offset: int) -> str:
-            params = {"limit": limit, "offset": offset}
+        def build_url(limit: int, offset: int, cursor: Optional[str] = None) -> str:
+            params: Dict[str, Any] = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
+            else:
+                params["offset"] = offset
             if additional_params:
                 params.update(additional_params)
             return f"{base_url}?{urlencode(params)}"
@@ -263,7 +375,7 @@ class PageLinks(BaseModel):
         offset = current_params.offset
 
         # Self link
-        self_link = build_url(limit, offset)
+        self_link = build_url(limit, offset, current_params.cursor)
 
         # First page link
         first_link = build_url(limit, 0)
@@ -272,14 +384,18 @@ class PageLinks(BaseModel):
         last_offset = max(0, (page_metadata.total_pages - 1) * limit)
         last_link = build_url(limit, last_offset)
 
-        # Next page link
+        # Next page link (keyset pages link forward by cursor)
         next_link = None
-        if page_metadata.has_next:
+        if page_metadata.next_cursor:
+            next_link = build_url(limit, 0, page_metadata.next_cursor)
+        elif page_metadata.has_next and not current_params.cursor:
             next_link = build_url(limit, offset + limit)
 
         # Previous page link
         previous_link = None
-        if page_metadata.has_previous:
+        if page_metadata.previous_cursor:
+            previous_link = build_url(limit, 0, page_metadata.previous_cursor)
+        elif page_metadata.has_previous and not current_params.cursor:
             previous_offset = max(0, offset - limit)
             previous_link = build_url(limit, previous_offset)
 
@@ -299,14 +415,19 @@ def paginated_response(
     total_items: int,
     pagination_params: PaginationParams,
     message: Optional[str] = None,
+    next_cursor: Optional[str] = None,
 ) -> PaginatedResponseDTO[T]:
     """Create a paginated response using offset-based pagination.
 
+    When the request carried a cursor, or the repository returned one, the
+    page is described by cursor instead: has_next follows next_cursor.
+
     Args:
         data: List of items for current page
         total_items: Total number of items across all pages
         pagination_params: Pagination parameters from request
         message: Optional message
+        next_cursor: Keyset cursor for the following page, if any
 
     Returns:
         PaginatedResponseDTO instance
@@ -323,11 +444,21 @@ def paginated_response(
             pagination_params=params
         )
     """
-    pagination = PageMetadata.from_offset(
-        total_items=total_items,
-        limit=pagination_params.limit,
-        offset=pagination_params.offset,
-    )
+    if pagination_params.cursor or next_cursor:
+        pagination = PageMetadata.from_offset(
+            total_items=total_items,
+            limit=pagination_params.limit,
+            offset=0,
+        )
+        pagination.has_next = next_cursor is not None
+        pagination.has_previous = pagination_params.cursor is not None
+        pagination.next_cursor = next_cursor
+    else:
+        pagination = PageMetadata.from_offset(
+            total_items=total_items,
+            limit=pagination_params.limit,
+            offset=pagination_params.offset,
+        )
 
     return PaginatedResponseDTO(
         success=True,
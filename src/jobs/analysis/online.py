@@ -0,0 +1,221 @@
+"""
+Online Statistics
+
+Mergeable summaries for inputs processed in chunks: exact running moments
+(Welford's algorithm, with Chan's formula to merge whole chunks at once) and
+a t-digest for approximate quantiles. Each summary stays a fixed size
+however many values it has seen.
+"""
+
+from typing import Any, Optional
+import math
+import re
+
+import numpy as np
+
+_PERCENTILE_PATTERN = re.compile(r"^p(\d+(?:\.\d+)?)$")
+
+
+def parse_percentile(metric: str) -> Optional[float]:
+    """
+    Parse a percentile metric name
+
+    Args:
+        metric: Metric name such as "p95" or "p99.9"
+
+    Returns:
+        Percentile in [0, 100], or None if metric is not a percentile
+    """
+    match = _PERCENTILE_PATTERN.match(metric)
+    if not match:
+        return None
+    percentile = float(match.group(1))
+    if percentile > 100:
+        raise ValueError(f"Percentile out of range: {metric}")
+    return percentile
+
+
+class RunningStats:
+    """
+    Running count, sum, mean, variance, min and max
+
+    Usage:
+        stats = RunningStats()
+        for chunk in chunks:
+            stats.update(chunk["value"].to_numpy())
+        stats.mean, stats.std()
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max", "total")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.total = 0.0
+
+    @classmethod
+    def from_moments(
+        cls,
+        count: int,
+        total: float,
+        m2: float,
+        low: float,
+        high: float
+    ) -> "RunningStats":
+        """Build from moments already computed for a batch"""
+        stats = cls()
+        if count:
+            stats.count = int(count)
+            stats.total = float(total)
+            stats.mean = stats.total / stats.count
+            stats.m2 = float(m2)
+            stats.min = float(low)
+            stats.max = float(high)
+        return stats
+
+    def update(self, values: Any) -> None:
+        """Add an array of values, ignoring NaN"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+
+        mean = values.mean()
+        self.merge(RunningStats.from_moments(
+            values.size,
+            values.sum(),
+            np.square(values - mean).sum(),
+            values.min(),
+            values.max()
+        ))
+
+    def merge(self, other: "RunningStats") -> None:
+        """Combine with another summary (Chan et al. parallel update)"""
+        if not other.count:
+            return
+        if not self.count:
+            for attribute in self.__slots__:
+                setattr(self, attribute, getattr(other, attribute))
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self, ddof: int = 0) -> Optional[float]:
+        if self.count <= ddof:
+            return None
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> Optional[float]:
+        variance = self.variance(ddof)
+        return math.sqrt(variance) if variance is not None else None
+
+
+class TDigest:
+    """
+    Approximate quantiles in bounded memory
+
+    A merging t-digest: values are buffered, then sorted together with the
+    existing centroids and merged so that each centroid spans at most one
+    unit of the k1 scale function. Centroids are small near the tails,
+    which keeps extreme percentiles accurate. The digest holds about
+    ``compression / 2`` centroids (about 4 KB at the default).
+
+    Parameters:
+        compression: Accuracy/size trade-off (delta)
+        buffer_size: Values buffered before merging
+    """
+
+    def __init__(self, compression: float = 500.0, buffer_size: int = 5_000):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer_values = []
+        self._buffer_weights = []
+        self._buffered = 0
+
+    def update(self, values: Any) -> None:
+        """Add an array of values, ignoring NaN"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size:
+            self._add(values, np.ones(values.size), values.min(), values.max())
+
+    def merge(self, other: "TDigest") -> None:
+        """Add another digest's centroids"""
+        other._compress()
+        if other.count:
+            self._add(other._means, other._weights, other.min, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimate, or None if no values were added
+        """
+        self._compress()
+        if not self.count:
+            return None
+
+        # Interpolate between centroid centres, anchored at the exact extremes
+        centres = np.cumsum(self._weights) - self._weights / 2
+        return float(np.interp(
+            q * self.count,
+            np.concatenate(([0.0], centres, [float(self.count)])),
+            np.concatenate(([self.min], self._means, [self.max]))
+        ))
+
+    def _add(self, means: np.ndarray, weights: np.ndarray, low: float, high: float) -> None:
+        self._buffer_values.append(means)
+        self._buffer_weights.append(weights)
+        self._buffered += means.size
+        self.count += int(weights.sum())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+        if self._buffered >= self.buffer_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        if not self._buffered:
+            return
+
+        means = np.concatenate([self._means, *self._buffer_values])
+        weights = np.concatenate([self._weights, *self._buffer_weights])
+        self._buffer_values, self._buffer_weights, self._buffered = [], [], 0
+
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+
+        # Assign each point to a cluster by the k1 scale at the quantile
+        # where it starts; a cluster covers one unit of k
+        total = weights.sum()
+        q_start = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_start - 1)
+        clusters = np.floor(k - k[0]).astype(np.int64)
+
+        cluster_weights = np.bincount(clusters, weights=weights)
+        occupied = cluster_weights > 0
+        self._weights = cluster_weights[occupied]
+        self._means = np.bincount(clusters, weights=weights * means)[occupied] / self._weights
+
+    def __len__(self) -> int:
+        self._compress()
+        return self._means.size
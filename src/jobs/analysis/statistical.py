@@ -2,25 +2,39 @@
 Statistical Analysis Job
 
 Performs statistical analysis on datasets.
+
+Records are converted to columnar NumPy arrays once and every metric is
+computed on those arrays. Files too large for memory are analyzed in
+chunks with running moments and t-digest quantile estimates.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Tuple
 import logging
 
+from src.jobs.analysis.online import RunningStats, TDigest, parse_percentile
 from src.jobs.base import BaseJob, JobRegistry, JobResult
+from src.jobs.ingestion.file_ingestion import DEFAULT_STREAM_CHUNKSIZE, iter_file_chunks
 
 logger = logging.getLogger(__name__)
 
+METRICS = ("count", "mean", "median", "std", "var", "min", "max", "sum")
+
 
 @JobRegistry.register("statistical_analysis")
 class StatisticalAnalysisJob(BaseJob):
     """
     Perform statistical analysis on data
 
+    Metrics: count, mean, median, std, var, min, max, sum and percentiles
+    such as p95 or p99.9. std and var are population statistics.
+
     Parameters:
         data: List of records to analyze
         metrics: List of metrics to calculate
         groupby: Optional grouping field
+        file_path: Analyze this file in chunks instead of data (see
+            FileIngestionJob for file_type, chunksize, read_options, etc.).
+            Median and percentiles are then t-digest estimates.
     """
 
     max_retries = 2
@@ -30,91 +44,180 @@ class StatisticalAnalysisJob(BaseJob):
     def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute statistical analysis"""
         data = kwargs.get("data", [])
+        file_path = kwargs.get("file_path")
         metrics = kwargs.get("metrics", ["mean", "median", "std", "min", "max"])
         groupby = kwargs.get("groupby")
 
-        if not data:
-            raise ValueError("data is required")
+        if not data and not file_path:
+            raise ValueError("data or file_path is required")
 
-        logger.info(f"Starting statistical analysis on {len(data)} records")
+        unknown = [
+            metric for metric in metrics
+            if metric not in METRICS and parse_percentile(metric) is None
+        ]
+        if unknown:
+            raise ValueError(f"Unknown metrics: {unknown}. Choose from: {list(METRICS)} or pNN")
 
-        # Import numpy for calculations
         try:
             import numpy as np
+            import pandas as pd
         except ImportError:
-            logger.warning("numpy not available, using basic statistics")
-            np = None
-
-        # Extract numeric fields
-        numeric_fields = self._get_numeric_fields(data)
+            raise ImportError("pandas required. Install with: pip install pandas")
+
+        if file_path:
+            logger.info(f"Starting streaming statistical analysis from {file_path}")
+            statistics, numeric_fields, total_records = self._analyze_stream(
+                np, pd, kwargs, metrics
+            )
+            approximate = any(
+                metric == "median" or parse_percentile(metric) is not None for metric in metrics
+            )
+        else:
+            logger.info(f"Starting statistical analysis on {len(data)} records")
+            frame = pd.DataFrame.from_records(data)
+            numeric_fields = self._get_numeric_fields(pd, frame)
+            statistics = {}
+            for field in numeric_fields:
+                values = frame[field].to_numpy(dtype=float, na_value=np.nan)
+                values = values[~np.isnan(values)]
+                if values.size:
+                    statistics[field] = self._array_statistics(np, values, metrics)
+            total_records = len(data)
+            approximate = False
 
         if not numeric_fields:
             raise ValueError("No numeric fields found in data")
 
-        # Calculate statistics
-        statistics = {}
-
-        for field in numeric_fields:
-            values = [r[field] for r in data if field in r and r[field] is not None]
-
-            if not values:
-                continue
-
-            field_stats = {}
-
-            if "count" in metrics:
-                field_stats["count"] = len(values)
+        logger.info(f"Statistical analysis completed for {len(numeric_fields)} fields")
 
-            if "mean" in metrics:
-                field_stats["mean"] = sum(values) / len(values) if values else 0
+        return {
+            "statistics": statistics,
+            "fields_analyzed": numeric_fields,
+            "total_records": total_records,
+            "metrics": metrics,
+            "approximate": approximate
+        }
 
-            if "median" in metrics:
-                sorted_values = sorted(values)
-                mid = len(sorted_values) // 2
-                if len(sorted_values) % 2 == 0:
-                    field_stats["median"] = (sorted_values[mid - 1] + sorted_values[mid]) / 2
-                else:
-                    field_stats["median"] = sorted_values[mid]
+    @staticmethod
+    def _array_statistics(np: Any, values: Any, metrics: List[str]) -> Dict[str, Any]:
+        """Compute metrics on a NaN-free float array"""
+        field_stats = {}
 
-            if "min" in metrics:
-                field_stats["min"] = min(values)
+        if "count" in metrics:
+            field_stats["count"] = int(values.size)
 
-            if "max" in metrics:
-                field_stats["max"] = max(values)
+        if "mean" in metrics:
+            field_stats["mean"] = float(values.mean())
 
-            if "sum" in metrics:
-                field_stats["sum"] = sum(values)
+        # Median and percentiles share one partition of the array
+        percentiles = {
+            metric: 50.0 if metric == "median" else parse_percentile(metric)
+            for metric in metrics
+            if metric == "median" or parse_percentile(metric) is not None
+        }
+        if percentiles:
+            results = np.percentile(values, list(percentiles.values()))
+            for metric, result in zip(percentiles, results):
+                field_stats[metric] = float(result)
+
+        if "min" in metrics:
+            field_stats["min"] = float(values.min())
+
+        if "max" in metrics:
+            field_stats["max"] = float(values.max())
+
+        if "sum" in metrics:
+            field_stats["sum"] = float(values.sum())
+
+        if "std" in metrics:
+            field_stats["std"] = float(values.std())
+
+        if "var" in metrics:
+            field_stats["var"] = float(values.var())
+
+        return field_stats
+
+    def _analyze_stream(
+        self,
+        np: Any,
+        pd: Any,
+        params: Dict[str, Any],
+        metrics: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str], int]:
+        """Analyze a file chunk by chunk with running moments and t-digests"""
+        chunksize = params.get("chunksize") or DEFAULT_STREAM_CHUNKSIZE
+        track_quantiles = any(
+            metric == "median" or parse_percentile(metric) is not None for metric in metrics
+        )
 
-            if "std" in metrics and np:
-                field_stats["std"] = float(np.std(values))
+        numeric_fields: List[str] = []
+        moments: Dict[str, RunningStats] = {}
+        digests: Dict[str, TDigest] = {}
+        total_records = 0
+        chunks_processed = 0
+
+        for chunk in iter_file_chunks(pd, params, chunksize):
+            # A field numeric in an earlier chunk stays numeric; values that
+            # do not parse in later chunks count as missing
+            for field in self._get_numeric_fields(pd, chunk):
+                if field not in moments:
+                    numeric_fields.append(field)
+                    moments[field] = RunningStats()
+                    digests[field] = TDigest()
+
+            for field in numeric_fields:
+                if field not in chunk.columns:
+                    continue
+                values = pd.to_numeric(chunk[field], errors="coerce").to_numpy(
+                    dtype=float, na_value=np.nan
+                )
+                moments[field].update(values)
+                if track_quantiles:
+                    digests[field].update(values)
+
+            total_records += len(chunk)
+            chunks_processed += 1
+            self.set_metadata("chunks_processed", chunks_processed)
+            self.set_metadata("records_processed", total_records)
 
-            if "var" in metrics and np:
-                field_stats["var"] = float(np.var(values))
+        statistics = {}
+        for field in numeric_fields:
+            stats = moments[field]
+            if not stats.count:
+                continue
 
+            field_stats = {}
+            for metric in metrics:
+                if metric == "count":
+                    field_stats["count"] = stats.count
+                elif metric == "mean":
+                    field_stats["mean"] = stats.mean
+                elif metric == "median":
+                    field_stats["median"] = digests[field].quantile(0.5)
+                elif metric == "min":
+                    field_stats["min"] = stats.min
+                elif metric == "max":
+                    field_stats["max"] = stats.max
+                elif metric == "sum":
+                    field_stats["sum"] = stats.total
+                elif metric == "std":
+                    field_stats["std"] = stats.std()
+                elif metric == "var":
+                    field_stats["var"] = stats.variance()
+                else:
+                    field_stats[metric] = digests[field].quantile(parse_percentile(metric) / 100)
             statistics[field] = field_stats
 
-        logger.info(f"Statistical analysis completed for {len(numeric_fields)} fields")
-
-        return {
-            "statistics": statistics,
-            "fields_analyzed": numeric_fields,
-            "total_records": len(data),
-            "metrics": metrics
-        }
-
-    def _get_numeric_fields(self, data: List[Dict[str, Any]]) -> List[str]:
-        """Identify numeric fields in data"""
-        if not data:
-            return []
-
-        numeric_fields = []
-        sample = data[0]
-
-        for field, value in sample.items():
-            if isinstance(value, (int, float)) and not isinstance(value, bool):
-                numeric_fields.append(field)
+        return statistics, numeric_fields, total_records
 
-        return numeric_fields
+    @staticmethod
+    def _get_numeric_fields(pd: Any, frame: Any) -> List[str]:
+        """Identify numeric fields from column dtypes across all records"""
+        return [
+            column for column in frame.columns
+            if pd.api.types.is_numeric_dtype(frame[column])
+            and not pd.api.types.is_bool_dtype(frame[column])
+        ]
 
     def on_start(self) -> None:
         """Called when job starts"""
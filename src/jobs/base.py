@@ -5,6 +5,12 @@ Provides the core job abstraction with lifecycle hooks, state management,
 and job registry for all data pipeline jobs.
 """
 
+import asyncio
+import ctypes
+import inspect
+import logging
+import multiprocessing
+import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
@@ -13,6 +19,8 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Type
 from uuid import uuid4
 
+logger = logging.getLogger(__name__)
+
 
 class JobState(Enum):
     """Job execution states"""
@@ -61,6 +69,42 @@ class JobResult:
         }
 
 
+def _interrupt_thread(thread: threading.Thread) -> None:
+    """
+    Raise TimeoutError inside ``thread`` (CPython only, best effort)
+
+    The exception is delivered at the thread's next bytecode boundary, which
+    may be inside a library's ``finally`` block or while it holds a lock, and
+    is never delivered while the thread is blocked in C code (socket reads,
+    database drivers). The thread can therefore keep running after the job
+    has timed out, or stop half way through cleanup.
+    """
+    try:
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(
+            ctypes.c_ulong(thread.ident), ctypes.py_object(TimeoutError)
+        )
+    except Exception:
+        pass
+
+
+def _execute_in_child(job: "BaseJob", conn: Any) -> None:
+    """Child process entry point for ``timeout_mode = "process"``"""
+    try:
+        conn.send((True, job.execute(**job.params)))
+    except Exception as e:
+        try:
+            conn.send((False, e))
+        except Exception:
+            # Unpicklable exception
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+    finally:
+        conn.close()
+
+
+# Called as retry_handler(job, delay) to schedule a retry; may return a task ID
+RetryHandler = Callable[["BaseJob", float], Optional[str]]
+
+
 class BaseJob(ABC):
     """
     Base class for all jobs in the orchestration system.
@@ -68,7 +112,10 @@ class BaseJob(ABC):
     Provides:
     - Lifecycle hooks (on_start, on_success, on_failure, on_retry)
     - State management
-    - Retry logic with exponential backoff
+    - Retry logic with exponential backoff, optionally re-enqueued instead
+      of sleeping in the worker
+    - Timeouts enforced while execute runs
+    - Synchronous or coroutine ``execute``
     - Result storage
     - Metrics collection
     """
@@ -78,6 +125,15 @@ class BaseJob(ABC):
     retry_delay: float = 1.0  # seconds
     retry_backoff: float = 2.0  # exponential multiplier
     timeout: Optional[float] = None  # seconds
+    # "thread": abandon (and interrupt) the call on timeout, state changes
+    # made by execute are kept; "process": run execute in a child process
+    # that is killed on timeout, for calls stuck in C code. Process mode
+    # needs picklable results and discards changes execute makes to the job.
+    # An abandoned thread is asked to stop (see check_timeout) and
+    # interrupted (see _interrupt_thread); if it is still running after
+    # timeout_grace seconds the job fails instead of retrying next to it.
+    timeout_mode: str = "thread"
+    timeout_grace: float = 5.0  # seconds
 
     def __init__(self, job_id: Optional[str] = None, **kwargs):
         """
@@ -95,13 +151,17 @@ class BaseJob(ABC):
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
         self._metadata: Dict[str, Any] = {}
+        self._last_error: Optional[str] = None
+        self._timed_out = threading.Event()
+        self._abandoned: Optional[threading.Thread] = None
 
     @abstractmethod
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
         Execute the job's main logic.
 
-        This method must be implemented by all job subclasses.
+        This method must be implemented by all job subclasses. It may be
+        defined as ``async def``; run() and run_async() handle both.
 
         Args:
             **kwargs: Job execution parameters
@@ -114,74 +174,255 @@ class BaseJob(ABC):
         """
         pass
 
-    def run(self) -> JobResult:
+    def run(self, retry_handler: Optional[RetryHandler] = None) -> JobResult:
         """
         Run the job with full lifecycle management.
 
+        ``timeout`` is enforced while ``execute`` runs: the call is made in a
+        separate thread (or process, see ``timeout_mode``) and abandoned with
+        a TimeoutError once the limit passes. ``execute`` may also be a
+        coroutine function, which is run on its own event loop and cancelled
+        on timeout.
+
+        Args:
+            retry_handler: Called as ``retry_handler(job, delay)`` to schedule a
+                retry elsewhere (e.g. re-enqueue with a countdown) instead of
+                sleeping in this worker; may return the new task ID. If it
+                raises, the retry happens in this worker after all
+
+        Returns:
+            JobResult: Job execution result (status RETRYING if a retry was
+            handed to ``retry_handler``)
+        """
+        while True:
+            start_time = time.perf_counter()
+            try:
+                self._begin()
+                data = self._execute_sync()
+                return self._complete(data, time.perf_counter() - start_time)
+            except Exception as e:
+                delay = self._handle_failure(e, time.perf_counter() - start_time)
+
+            if delay is None:
+                return self.result
+            if retry_handler is not None:
+                result = self._hand_off_retry(retry_handler, delay)
+                if result is not None:
+                    return result
+            time.sleep(delay)
+
+    async def run_async(self, retry_handler: Optional[RetryHandler] = None) -> JobResult:
+        """
+        Run the job from a running event loop.
+
+        Coroutine ``execute`` implementations are awaited directly (and
+        cancelled on timeout); synchronous ones run in the loop's default
+        executor. Retry delays are awaited without blocking the loop.
+
+        Args:
+            retry_handler: See run()
+
         Returns:
             JobResult: Job execution result
         """
-        try:
-            # Start job
-            self.state = JobState.RUNNING
-            self.started_at = datetime.utcnow()
-            self.on_start()
-
-            # Execute job with timeout if configured
-            start_time = time.time()
-            data = self.execute(**self.params)
-            duration = time.time() - start_time
-
-            # Check timeout
-            if self.timeout and duration > self.timeout:
-                raise TimeoutError(f"Job exceeded timeout of {self.timeout}s")
+        while True:
+            start_time = time.perf_counter()
+            try:
+                self._begin()
+                if inspect.iscoroutinefunction(self.execute):
+                    data = await self._execute_coroutine()
+                else:
+                    loop = asyncio.get_running_loop()
+                    data = await loop.run_in_executor(None, self._execute_sync)
+                return self._complete(data, time.perf_counter() - start_time)
+            except Exception as e:
+                delay = self._handle_failure(e, time.perf_counter() - start_time)
+
+            if delay is None:
+                return self.result
+            if retry_handler is not None:
+                result = self._hand_off_retry(retry_handler, delay)
+                if result is not None:
+                    return result
+            await asyncio.sleep(delay)
+
+    def _begin(self) -> None:
+        self.state = JobState.RUNNING
+        self.started_at = datetime.utcnow()
+        self.on_start()
+
+    def _complete(self, data: Dict[str, Any], duration: float) -> JobResult:
+        self.state = JobState.COMPLETED
+        self.completed_at = datetime.utcnow()
+        self.result = JobResult(
+            job_id=self.job_id,
+            status=JobState.COMPLETED,
+            data=data,
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+            duration=duration,
+            metadata=self._metadata
+        )
+        self.on_success(self.result)
+        return self.result
+
+    def _handle_failure(self, error: Exception, duration: float) -> Optional[float]:
+        """
+        Record a failed attempt.
 
-            # Job succeeded
-            self.state = JobState.COMPLETED
-            self.completed_at = datetime.utcnow()
-            self.result = JobResult(
-                job_id=self.job_id,
-                status=JobState.COMPLETED,
-                data=data,
-                started_at=self.started_at,
-                completed_at=self.completed_at,
-                duration=duration,
-                metadata=self._metadata
+        Must be called from the ``except`` block handling ``error``.
+
+        Returns:
+            Delay before the next attempt, or None if the job has failed for good
+        """
+        if self._abandoned is not None and self._abandoned.is_alive():
+            logger.warning(
+                f"Not retrying job {self.job_id}: its timed out attempt is still running"
             )
-            self.on_success(self.result)
-            return self.result
+        elif self.retry_count < self.max_retries:
+            self.state = JobState.RETRYING
+            self.retry_count += 1
+            delay = self.retry_delay * (self.retry_backoff ** (self.retry_count - 1))
+            self._last_error = f"{type(error).__name__}: {str(error)}"
+            self.on_retry(error, self.retry_count, delay)
+            return delay
+
+        # Max retries exceeded
+        self.state = JobState.FAILED
+        self.completed_at = datetime.utcnow()
+        self.result = JobResult(
+            job_id=self.job_id,
+            status=JobState.FAILED,
+            error=f"{type(error).__name__}: {str(error)}",
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+            duration=duration,
+            metadata={**self._metadata, "error_trace": traceback.format_exc()}
+        )
+        self.on_failure(error, self.result)
+        return None
+
+    def _hand_off_retry(self, retry_handler: RetryHandler, delay: float) -> Optional[JobResult]:
+        """
+        Schedule the next attempt elsewhere and report this run as retrying
 
+        Returns:
+            The RETRYING result, or None if ``retry_handler`` failed and the
+            caller should retry in place
+        """
+        try:
+            retry_task_id = retry_handler(self, delay)
         except Exception as e:
-            # Job failed
-            error_msg = f"{type(e).__name__}: {str(e)}"
-            error_trace = traceback.format_exc()
+            logger.warning(
+                f"Could not schedule retry of job {self.job_id} ({type(e).__name__}: {e}); "
+                f"retrying in this worker in {delay}s"
+            )
+            return None
+        self.completed_at = datetime.utcnow()
+        self.result = JobResult(
+            job_id=self.job_id,
+            status=JobState.RETRYING,
+            error=self._last_error,
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+            metadata={
+                **self._metadata,
+                "retry_count": self.retry_count,
+                "retry_delay": delay,
+                "retry_task_id": retry_task_id,
+            }
+        )
+        return self.result
+
+    def _execute_sync(self) -> Dict[str, Any]:
+        """Call execute in this thread, enforcing the timeout if one is set"""
+        if inspect.iscoroutinefunction(self.execute):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._execute_coroutine())
+            # Called from inside an event loop: give the coroutine its own
+            return self._call_in_thread(lambda: asyncio.run(self._execute_coroutine()), None)
+
+        if not self.timeout:
+            return self.execute(**self.params)
+        if self.timeout_mode == "process":
+            return self._call_in_process()
+        return self._call_in_thread(lambda: self.execute(**self.params), self.timeout)
+
+    async def _execute_coroutine(self) -> Dict[str, Any]:
+        try:
+            return await asyncio.wait_for(self.execute(**self.params), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Job exceeded timeout of {self.timeout}s")
+
+    def check_timeout(self) -> None:
+        """
+        Raise TimeoutError if the running attempt has been abandoned
 
-            # Check if we should retry
+        Long running ``execute`` implementations call this between units of
+        work (e.g. chunks) so that, in thread mode, a timed out attempt stops
+        at a safe point instead of waiting for the interrupt.
+        """
+        if self._timed_out.is_set():
+            raise TimeoutError(f"Job exceeded timeout of {self.timeout}s")
+
+    def _call_in_thread(self, func: Callable[[], Any], timeout: Optional[float]) -> Any:
+        """Run ``func`` in a worker thread and give up on it after ``timeout``"""
+        outcome: Dict[str, Any] = {}
+        self._timed_out = threading.Event()
+
+        def target() -> None:
+            try:
+                outcome["data"] = func()
+            except BaseException as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=target, name=f"job-{self.job_id}", daemon=True)
+        thread.start()
+        thread.join(timeout)
+
+        if thread.is_alive():
+            # Ask the abandoned call to stop and interrupt it at its next
+            # bytecode boundary so it stops working on behalf of a failed job
+            self._timed_out.set()
+            _interrupt_thread(thread)
             if self.retry_count < self.max_retries:
-                self.state = JobState.RETRYING
-                self.retry_count += 1
-                delay = self.retry_delay * (self.retry_backoff ** (self.retry_count - 1))
-
-                self.on_retry(e, self.retry_count, delay)
-                time.sleep(delay)
-                return self.run()  # Retry
-
-            # Max retries exceeded
-            self.state = JobState.FAILED
-            self.completed_at = datetime.utcnow()
-            duration = time.time() - start_time if 'start_time' in locals() else None
-
-            self.result = JobResult(
-                job_id=self.job_id,
-                status=JobState.FAILED,
-                error=error_msg,
-                started_at=self.started_at,
-                completed_at=self.completed_at,
-                duration=duration,
-                metadata={**self._metadata, "error_trace": error_trace}
-            )
-            self.on_failure(e, self.result)
-            return self.result
+                # A retry must not start while this attempt may still be writing
+                thread.join(self.timeout_grace)
+                if thread.is_alive():
+                    self._abandoned = thread
+            raise TimeoutError(f"Job exceeded timeout of {self.timeout}s")
+
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("data")
+
+    def _call_in_process(self) -> Dict[str, Any]:
+        """Run execute in a child process and kill it after the timeout"""
+        context = multiprocessing.get_context(
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        )
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_execute_in_child, args=(self, sender), daemon=True)
+        process.start()
+        sender.close()
+
+        try:
+            if not receiver.poll(self.timeout):
+                process.kill()
+                raise TimeoutError(f"Job exceeded timeout of {self.timeout}s")
+            try:
+                succeeded, payload = receiver.recv()
+            except EOFError:
+                raise RuntimeError(f"Job process exited with code {process.exitcode}")
+        finally:
+            process.join()
+            receiver.close()
+
+        if not succeeded:
+            raise payload
+        return payload
 
     # Lifecycle hooks (can be overridden by subclasses)
 
@@ -7,9 +7,14 @@ Provides specialized jobs for data ingestion from various sources.
 from src.jobs.ingestion.api_ingestion import APIIngestionJob
 from src.jobs.ingestion.database_ingestion import DatabaseIngestionJob
 from src.jobs.ingestion.file_ingestion import FileIngestionJob
+from src.jobs.ingestion.sinks import MetricsBulkSink, ParquetStagingSink, RecordSink, create_sink
 
 __all__ = [
     "APIIngestionJob",
     "DatabaseIngestionJob",
     "FileIngestionJob",
+    "RecordSink",
+    "MetricsBulkSink",
+    "ParquetStagingSink",
+    "create_sink",
 ]
@@ -0,0 +1,276 @@
+"""
+Ingestion Sinks
+
+Destinations that streaming ingestion jobs write chunks to as they are read,
+so only one chunk is ever held in memory and job results carry summaries
+instead of the data itself.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Type
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Columns MetricsBulkSink takes from a chunk; anything else is ignored
+METRIC_COLUMNS = (
+    "company_id",
+    "ticker",
+    "metric_date",
+    "period_type",
+    "metric_type",
+    "metric_category",
+    "value",
+    "unit",
+    "source",
+    "confidence_score",
+)
+
+# Rows missing any of these (after ticker lookup) are skipped
+REQUIRED_METRIC_COLUMNS = ("company_id", "metric_type", "metric_date", "value")
+
+
+class RecordSink(ABC):
+    """
+    Destination for chunks of ingested records
+
+    Usage:
+        with ParquetStagingSink(directory="data/staging/metrics") as sink:
+            for chunk in chunks:
+                sink.write(chunk)
+        summary = sink.summary()
+    """
+
+    def __init__(self):
+        self.chunks_written = 0
+        self.records_written = 0
+
+    def open(self) -> None:
+        """Acquire resources before the first chunk"""
+        pass
+
+    @abstractmethod
+    def write(self, chunk: Any) -> int:
+        """
+        Write one chunk
+
+        Args:
+            chunk: pandas DataFrame
+
+        Returns:
+            Number of records written
+        """
+        pass
+
+    def close(self) -> None:
+        """Release resources after the last chunk"""
+        pass
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-serializable summary of what was written"""
+        return {
+            "sink": self.name,
+            "chunks_written": self.chunks_written,
+            "records_written": self.records_written
+        }
+
+    @property
+    def name(self) -> str:
+        return next(
+            (name for name, sink_class in SINKS.items() if sink_class is type(self)),
+            type(self).__name__
+        )
+
+    def __enter__(self) -> "RecordSink":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class ParquetStagingSink(RecordSink):
+    """
+    Write each chunk as a Parquet part file in a staging directory
+
+    Parameters:
+        directory: Staging directory (created if missing)
+        prefix: Part file name prefix
+        compression: Parquet compression codec
+    """
+
+    def __init__(self, directory: str, prefix: str = "part", compression: str = "snappy"):
+        super().__init__()
+        self.directory = directory
+        self.prefix = prefix
+        self.compression = compression
+        self.files: List[str] = []
+
+    def open(self) -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("pyarrow required. Install with: pip install pyarrow")
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def write(self, chunk: Any) -> int:
+        # One file per chunk: CSV chunks can infer different dtypes, which a
+        # single ParquetWriter would reject
+        path = os.path.join(self.directory, f"{self.prefix}-{self.chunks_written:05d}.parquet")
+        chunk.to_parquet(path, index=False, compression=self.compression)
+
+        self.files.append(path)
+        self.chunks_written += 1
+        self.records_written += len(chunk)
+        return len(chunk)
+
+    def summary(self) -> Dict[str, Any]:
+        return {**super().summary(), "directory": self.directory, "files": len(self.files)}
+
+
+class MetricsBulkSink(RecordSink):
+    """
+    Upsert chunks into financial_metrics through the bulk loader
+
+    Each chunk is committed in its own transaction. Rows need metric_type,
+    metric_date, value and either company_id or ticker; tickers are resolved
+    to company IDs, and incomplete rows or rows for unknown tickers are
+    skipped and counted.
+
+    Parameters:
+        period_type: Default period type for rows without one
+        source: Default source for rows without one
+        use_copy: Load through COPY (see bulk_upsert_financial_metrics)
+        database_url: Database to write to (default: settings)
+    """
+
+    def __init__(
+        self,
+        period_type: str = "quarterly",
+        source: str = "file_ingestion",
+        use_copy: bool = True,
+        database_url: Optional[str] = None
+    ):
+        super().__init__()
+        self.defaults = {"period_type": period_type, "source": source}
+        self.use_copy = use_copy
+        self.database_url = database_url
+        self.records_skipped = 0
+        self._company_ids: Dict[str, Any] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._engine = None
+        self._session_factory = None
+
+    def open(self) -> None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import NullPool
+
+        from src.core.config import get_settings
+
+        # The job runs in its own thread and event loop, so it gets its own
+        # engine rather than the app's pooled one
+        self._loop = asyncio.new_event_loop()
+        self._engine = create_async_engine(
+            self.database_url or get_settings().database_url,
+            poolclass=NullPool
+        )
+        self._session_factory = async_sessionmaker(
+            self._engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+    def write(self, chunk: Any) -> int:
+        import pandas as pd
+
+        columns = [column for column in chunk.columns if column in METRIC_COLUMNS]
+        chunk = chunk[columns]
+        if "metric_date" in columns:
+            chunk = chunk.assign(metric_date=pd.to_datetime(chunk["metric_date"], utc=True))
+
+        # Only this chunk is converted to Python objects
+        rows = chunk.astype(object).where(chunk.notna(), None).to_dict("records")
+        written = self._loop.run_until_complete(self._write(rows))
+
+        self.chunks_written += 1
+        self.records_written += written
+        return written
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> int:
+        from src.pipeline.common.utilities import bulk_upsert_financial_metrics
+
+        async with self._session_factory() as session:
+            await self._resolve_tickers(session, rows)
+
+            metrics = []
+            for row in rows:
+                if any(row.get(column) is None for column in REQUIRED_METRIC_COLUMNS):
+                    self.records_skipped += 1
+                    continue
+                row.pop("ticker", None)
+                metrics.append({**self.defaults, **{k: v for k, v in row.items() if v is not None}})
+
+            count = await bulk_upsert_financial_metrics(session, metrics, use_copy=self.use_copy)
+            await session.commit()
+            return count
+
+    async def _resolve_tickers(self, session: Any, rows: List[Dict[str, Any]]) -> None:
+        """Fill company_id from ticker, looking up each ticker once per job"""
+        from sqlalchemy import select
+
+        from src.db.models import Company
+
+        unknown = {
+            row["ticker"] for row in rows
+            if row.get("company_id") is None and row.get("ticker") and row["ticker"] not in self._company_ids
+        }
+        if unknown:
+            result = await session.execute(
+                select(Company.ticker, Company.id).where(Company.ticker.in_(unknown))
+            )
+            found = dict(result.all())
+            for ticker in unknown:
+                self._company_ids[ticker] = found.get(ticker)
+                if ticker not in found:
+                    logger.warning(f"Skipping metrics for unknown ticker {ticker}")
+
+        for row in rows:
+            if row.get("company_id") is None and row.get("ticker"):
+                row["company_id"] = self._company_ids.get(row["ticker"])
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        try:
+            if self._engine is not None:
+                self._loop.run_until_complete(self._engine.dispose())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    def summary(self) -> Dict[str, Any]:
+        return {**super().summary(), "records_skipped": self.records_skipped}
+
+
+# Sinks selectable by name in job parameters
+SINKS: Dict[str, Type[RecordSink]] = {
+    "parquet": ParquetStagingSink,
+    "metrics": MetricsBulkSink,
+}
+
+
+def create_sink(name: str, **options) -> RecordSink:
+    """
+    Create a sink by name
+
+    Args:
+        name: Key in SINKS
+        **options: Sink constructor arguments
+
+    Returns:
+        Sink instance
+    """
+    if name not in SINKS:
+        raise ValueError(f"Unknown sink: {name}. Choose from: {list(SINKS.keys())}")
+    return SINKS[name](**options)
@@ -2,26 +2,72 @@
 Data Aggregation Job
 
 Aggregates and summarizes data.
+
+Records are loaded into a DataFrame once and aggregated with pandas
+groupby reductions. Inputs too large for memory can be aggregated from a
+file instead: it is read in chunks, and each group keeps running moments
+and a t-digest, so memory grows with the number of groups rather than the
+number of records.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Tuple
 from collections import defaultdict
 import logging
 
+from src.jobs.analysis.online import RunningStats, TDigest, parse_percentile
 from src.jobs.base import BaseJob, JobRegistry, JobResult
+from src.jobs.ingestion.file_ingestion import DEFAULT_STREAM_CHUNKSIZE, iter_file_chunks
 
 logger = logging.getLogger(__name__)
 
+# Aggregation name -> pandas groupby reduction ("pNN" percentiles also accepted)
+AGGREGATIONS = {
+    "count": "count",
+    "sum": "sum",
+    "avg": "mean",
+    "min": "min",
+    "max": "max",
+    "distinct": "nunique",
+    "median": "median",
+    "std": "std",
+    "var": "var",
+}
+
+# Aggregations computed from running moments when streaming
+_MOMENT_AGGREGATIONS = {"sum", "avg", "min", "max", "std", "var"}
+
+
+class _GroupState:
+    """Per-group accumulators for streaming aggregation"""
+
+    __slots__ = ("size", "counts", "moments", "digests", "distinct")
+
+    def __init__(self):
+        self.size = 0
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.moments: Dict[str, RunningStats] = defaultdict(RunningStats)
+        self.digests: Dict[str, TDigest] = defaultdict(TDigest)
+        self.distinct: Dict[str, set] = defaultdict(set)
+
 
 @JobRegistry.register("data_aggregation")
 class DataAggregationJob(BaseJob):
     """
     Aggregate data records
 
+    Aggregations per field are one or a list of: count, sum, avg, min, max,
+    distinct, median, std, var and percentiles such as p95 or p99.9. std
+    and var are population statistics. count excludes missing values; the
+    "_count" column counts records per group.
+
     Parameters:
         data: List of records to aggregate
         group_by: Fields to group by
-        aggregations: Aggregation operations
+        aggregations: Aggregation operations, e.g. {"value": ["sum", "p95"]}
+        file_path: Aggregate this file in chunks instead of data (see
+            FileIngestionJob for file_type, chunksize, read_options, etc.).
+            Median and percentiles are then t-digest estimates, and
+            moment aggregations require numeric fields.
     """
 
     max_retries = 2
@@ -31,72 +77,227 @@ class DataAggregationJob(BaseJob):
     def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute data aggregation"""
         data = kwargs.get("data", [])
-        group_by = kwargs.get("group_by", [])
+        file_path = kwargs.get("file_path")
+        group_by = list(kwargs.get("group_by") or [])
         aggregations = kwargs.get("aggregations", {})
 
-        if not data:
-            raise ValueError("data is required")
+        if not data and not file_path:
+            raise ValueError("data or file_path is required")
 
-        logger.info(f"Starting data aggregation on {len(data)} records")
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas required. Install with: pip install pandas")
 
-        # Group data
-        groups = defaultdict(list)
+        functions = self._parse_aggregations(aggregations)
 
-        for record in data:
-            # Create group key
-            if group_by:
-                key = tuple(record.get(field) for field in group_by)
-            else:
-                key = "all"
-
-            groups[key].append(record)
-
-        # Aggregate each group
-        aggregated = []
-
-        for key, group_records in groups.items():
-            agg_record = {}
-
-            # Add group by fields
-            if group_by and key != "all":
-                for i, field in enumerate(group_by):
-                    agg_record[field] = key[i]
-
-            # Apply aggregations
-            for field, agg_func in aggregations.items():
-                values = [r.get(field) for r in group_records if field in r]
-
-                if agg_func == "count":
-                    agg_record[f"{field}_count"] = len(values)
-                elif agg_func == "sum":
-                    agg_record[f"{field}_sum"] = sum(values) if values else 0
-                elif agg_func == "avg":
-                    agg_record[f"{field}_avg"] = sum(values) / len(values) if values else 0
-                elif agg_func == "min":
-                    agg_record[f"{field}_min"] = min(values) if values else None
-                elif agg_func == "max":
-                    agg_record[f"{field}_max"] = max(values) if values else None
-                elif agg_func == "distinct":
-                    agg_record[f"{field}_distinct"] = len(set(values))
-
-            # Add record count
-            agg_record["_count"] = len(group_records)
-
-            aggregated.append(agg_record)
+        if file_path:
+            logger.info(f"Starting streaming data aggregation from {file_path}")
+            aggregated, original_count = self._aggregate_stream(
+                np, pd, kwargs, group_by, functions
+            )
+            approximate = any(
+                func == "median" or parse_percentile(func) is not None
+                for funcs in functions.values() for func in funcs
+            )
+        else:
+            logger.info(f"Starting data aggregation on {len(data)} records")
+            aggregated = self._aggregate_frame(
+                np, pd, pd.DataFrame.from_records(data), group_by, functions
+            )
+            original_count = len(data)
+            approximate = False
 
         logger.info(
-            f"Data aggregation completed: {len(data)} records -> "
+            f"Data aggregation completed: {original_count} records -> "
             f"{len(aggregated)} groups"
         )
 
         return {
             "records": aggregated,
             "total_groups": len(aggregated),
-            "original_count": len(data),
+            "original_count": original_count,
             "group_by": group_by,
-            "aggregations": aggregations
+            "aggregations": aggregations,
+            "approximate": approximate
         }
 
+    @staticmethod
+    def _parse_aggregations(aggregations: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Normalize to field -> list of aggregation names, rejecting unknown ones"""
+        functions = {}
+        for field, funcs in aggregations.items():
+            funcs = [funcs] if isinstance(funcs, str) else list(funcs)
+            for func in funcs:
+                if func not in AGGREGATIONS and parse_percentile(func) is None:
+                    raise ValueError(
+                        f"Unknown aggregation: {func}. Choose from: "
+                        f"{list(AGGREGATIONS.keys())} or a percentile such as p95"
+                    )
+            functions[field] = funcs
+        return functions
+
+    @staticmethod
+    def _with_columns(np: Any, frame: Any, group_by: List[str], fields: List[str]) -> Any:
+        """Add group and value columns missing from every record"""
+        missing = [field for field in group_by if field not in frame.columns]
+        missing_values = [field for field in fields if field not in frame.columns]
+        if missing or missing_values:
+            frame = frame.assign(
+                **{field: None for field in missing},
+                **{field: np.nan for field in missing_values}
+            )
+        return frame
+
+    @staticmethod
+    def _group(np: Any, frame: Any, group_by: List[str]) -> Any:
+        # A constant key puts every record in one group
+        keys = group_by or np.zeros(len(frame), dtype=np.int8)
+        return frame.groupby(keys, sort=False, dropna=False)
+
+    def _aggregate_frame(
+        self,
+        np: Any,
+        pd: Any,
+        frame: Any,
+        group_by: List[str],
+        functions: Dict[str, List[str]]
+    ) -> List[Dict[str, Any]]:
+        """Aggregate an in-memory DataFrame with groupby reductions"""
+        frame = self._with_columns(np, frame, group_by, list(functions))
+        grouped = self._group(np, frame, group_by)
+
+        columns = {}
+        for field, funcs in functions.items():
+            series = grouped[field]
+            for func in funcs:
+                percentile = parse_percentile(func)
+                if percentile is not None:
+                    columns[f"{field}_{func}"] = series.quantile(percentile / 100)
+                elif func in ("std", "var"):
+                    columns[f"{field}_{func}"] = getattr(series, func)(ddof=0)
+                else:
+                    columns[f"{field}_{func}"] = getattr(series, AGGREGATIONS[func])()
+        columns["_count"] = grouped.size()
+
+        result = pd.concat(list(columns.values()), axis=1, keys=list(columns.keys()))
+        result = result.reset_index() if group_by else result.reset_index(drop=True)
+
+        # Python scalars, with None for missing values
+        return result.astype(object).where(result.notna(), None).to_dict("records")
+
+    def _aggregate_stream(
+        self,
+        np: Any,
+        pd: Any,
+        params: Dict[str, Any],
+        group_by: List[str],
+        functions: Dict[str, List[str]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Aggregate a file chunk by chunk into per-group accumulators"""
+        chunksize = params.get("chunksize") or DEFAULT_STREAM_CHUNKSIZE
+        fields = list(functions)
+        moment_fields = [f for f in fields if _MOMENT_AGGREGATIONS.intersection(functions[f])]
+        digest_fields = [
+            f for f in fields
+            if any(func == "median" or parse_percentile(func) is not None for func in functions[f])
+        ]
+        distinct_fields = [f for f in fields if "distinct" in functions[f]]
+
+        groups: Dict[Tuple, _GroupState] = {}
+        original_count = 0
+        chunks_processed = 0
+
+        for chunk in iter_file_chunks(pd, params, chunksize):
+            if not len(chunk):
+                continue
+            chunk = self._with_columns(np, chunk, group_by, fields)
+            chunk = chunk.assign(**{
+                field: pd.to_numeric(chunk[field], errors="coerce")
+                for field in moment_fields + digest_fields
+            })
+            grouped = self._group(np, chunk, group_by)
+
+            sizes = grouped.size()
+            keys = [self._group_key(pd, key) for key in sizes.index]
+            states = [groups.setdefault(key, _GroupState()) for key in keys]
+            for state, size in zip(states, sizes.to_numpy()):
+                state.size += int(size)
+
+            counts = grouped[fields].count()
+            for field in fields:
+                for state, count in zip(states, counts[field].to_numpy()):
+                    state.counts[field] += int(count)
+
+            if moment_fields:
+                moments = grouped[moment_fields].agg(["count", "sum", "min", "max", "var"])
+                for field in moment_fields:
+                    stats = moments[field]
+                    # var is the sample variance; m2 = var * (n - 1)
+                    m2 = stats["var"].fillna(0.0) * (stats["count"] - 1).clip(lower=0)
+                    columns = zip(
+                        stats["count"].to_numpy(), stats["sum"].to_numpy(), m2.to_numpy(),
+                        stats["min"].to_numpy(), stats["max"].to_numpy()
+                    )
+                    for state, batch in zip(states, columns):
+                        state.moments[field].merge(RunningStats.from_moments(*batch))
+
+            for field in digest_fields:
+                for key, values in grouped[field]:
+                    groups[self._group_key(pd, key)].digests[field].update(values.to_numpy())
+
+            for field in distinct_fields:
+                for key, values in grouped[field].unique().items():
+                    groups[self._group_key(pd, key)].distinct[field].update(
+                        value for value in values if pd.notna(value)
+                    )
+
+            original_count += len(chunk)
+            chunks_processed += 1
+            self.set_metadata("chunks_processed", chunks_processed)
+            self.set_metadata("records_processed", original_count)
+
+        aggregated = []
+        for key, state in groups.items():
+            record = dict(zip(group_by, key)) if group_by else {}
+            for field, funcs in functions.items():
+                for func in funcs:
+                    record[f"{field}_{func}"] = self._streamed_value(state, field, func)
+            record["_count"] = state.size
+            aggregated.append(record)
+
+        return aggregated, original_count
+
+    @staticmethod
+    def _group_key(pd: Any, key: Any) -> Tuple:
+        """Normalize a pandas group key to a hashable tuple with None for NaN"""
+        key = key if isinstance(key, tuple) else (key,)
+        return tuple(None if pd.isna(part) else part for part in key)
+
+    @staticmethod
+    def _streamed_value(state: _GroupState, field: str, func: str) -> Any:
+        moments = state.moments[field]
+        if func == "count":
+            return state.counts[field]
+        if func == "sum":
+            return moments.total
+        if func == "avg":
+            return moments.mean if moments.count else None
+        if func == "min":
+            return moments.min
+        if func == "max":
+            return moments.max
+        if func == "std":
+            return moments.std()
+        if func == "var":
+            return moments.variance()
+        if func == "distinct":
+            return len(state.distinct[field])
+        if func == "median":
+            return state.digests[field].quantile(0.5)
+        return state.digests[field].quantile(parse_percentile(func) / 100)
+
     def on_start(self) -> None:
         """Called when job starts"""
         logger.info(f"Starting data aggregation job {self.job_id}")
@@ -15,6 +15,30 @@ from src.jobs.base import BaseJob, JobResult, JobState
 logger = logging.getLogger(__name__)
 
 
+def _job_payload(job: BaseJob, queue: str) -> Dict[str, Any]:
+    """Serialize a job for a queue backend"""
+    return {
+        "name": job.get_name(),
+        "params": job.params,
+        "job_id": job.job_id,
+        "queue": queue,
+        "retry_count": job.retry_count
+    }
+
+
+def _job_from_payload(job_dict: Dict[str, Any]) -> BaseJob:
+    """Recreate a job from its payload, keeping retries already used"""
+    from src.jobs.base import JobRegistry
+
+    job_name = job_dict["name"]
+    job = JobRegistry.create(job_name, job_id=job_dict["job_id"], **job_dict["params"])
+    if not job:
+        raise ValueError(f"Unknown job type: {job_name}")
+
+    job.retry_count = job_dict.get("retry_count", 0)
+    return job
+
+
 class QueueBackend(ABC):
     """Abstract base class for queue backends"""
 
@@ -86,17 +110,16 @@ class CeleryQueue(QueueBackend):
             @self.app.task(bind=True)
             def execute_job(task_self, job_dict: Dict[str, Any]):
                 """Execute a job from serialized data"""
-                from src.jobs.base import JobRegistry
-
-                job_name = job_dict["name"]
-                job_params = job_dict["params"]
-                job_id = job_dict["job_id"]
-
-                job = JobRegistry.create(job_name, job_id=job_id, **job_params)
-                if not job:
-                    raise ValueError(f"Unknown job type: {job_name}")
-
-                result = job.run()
+                job = _job_from_payload(job_dict)
+                queue = job_dict.get("queue", "default")
+
+                # Retries go back on the queue with a countdown instead of
+                # sleeping in this worker
+                result = job.run(
+                    retry_handler=lambda retry_job, delay: self.enqueue(
+                        retry_job, queue=queue, countdown=delay
+                    )
+                )
                 return result.to_dict()
 
             self._execute_job = execute_job
@@ -109,11 +132,7 @@ class CeleryQueue(QueueBackend):
 
     def enqueue(self, job: BaseJob, queue: str = "default", **kwargs) -> str:
         """Enqueue job for Celery execution"""
-        job_dict = {
-            "name": job.get_name(),
-            "params": job.params,
-            "job_id": job.job_id
-        }
+        job_dict = _job_payload(job, queue)
 
         task = self._execute_job.apply_async(
             args=[job_dict],
@@ -226,33 +245,34 @@ class RQQueue(QueueBackend):
 
     def _execute_job(self, job_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Execute job function for RQ"""
-        from src.jobs.base import JobRegistry
-
-        job_name = job_dict["name"]
-        job_params = job_dict["params"]
-        job_id = job_dict["job_id"]
-
-        job = JobRegistry.create(job_name, job_id=job_id, **job_params)
-        if not job:
-            raise ValueError(f"Unknown job type: {job_name}")
+        job = _job_from_payload(job_dict)
+        queue = job_dict.get("queue", "default")
 
-        result = job.run()
+        # Retries are scheduled with enqueue_in (needs a worker started with
+        # --with-scheduler) instead of sleeping in this worker
+        result = job.run(
+            retry_handler=lambda retry_job, delay: self.enqueue_in(retry_job, delay, queue=queue)
+        )
         return result.to_dict()
 
     def enqueue(self, job: BaseJob, queue: str = "default", **kwargs) -> str:
         """Enqueue job for RQ execution"""
         q = self._get_queue(queue)
 
-        job_dict = {
-            "name": job.get_name(),
-            "params": job.params,
-            "job_id": job.job_id
-        }
+        job_dict = _job_payload(job, queue)
 
         rq_job = q.enqueue(self._execute_job, job_dict, **kwargs)
         logger.info(f"Enqueued job {job.job_id} to queue '{queue}' (task: {rq_job.id})")
         return rq_job.id
 
+    def enqueue_in(self, job: BaseJob, delay: float, queue: str = "default", **kwargs) -> str:
+        """Enqueue job for RQ execution after ``delay`` seconds"""
+        q = self._get_queue(queue)
+
+        rq_job = q.enqueue_in(timedelta(seconds=delay), self._execute_job, _job_payload(job, queue), **kwargs)
+        logger.info(f"Scheduled job {job.job_id} on queue '{queue}' in {delay:.1f}s (task: {rq_job.id})")
+        return rq_job.id
+
     def get_status(self, task_id: str) -> JobState:
         """Get RQ job status"""
         from rq.job import Job
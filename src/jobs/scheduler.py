@@ -2,12 +2,27 @@
 Job Scheduler
 
 Provides job scheduling with cron support, recurring jobs, and schedule management.
+
+Schedules are kept in a min-heap ordered by next run time, so the scheduler
+thread sleeps exactly until the next schedule is due (or until a schedule is
+added or changed) instead of scanning every schedule on a fixed interval.
+Schedules due together are enqueued highest priority first, optionally
+spread over a per-schedule jitter window, and late runs are handled by a
+misfire policy. Schedule state can be persisted to a JSON file so restarts
+pick up where they left off.
 """
 
+import heapq
+import itertools
+import json
 import logging
+import math
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
-from threading import Thread, Event
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from threading import Thread, Condition
 import time
 
 from src.jobs.base import BaseJob, JobRegistry
@@ -15,6 +30,19 @@ from src.jobs.queue import QueueManager
 
 logger = logging.getLogger(__name__)
 
+# Misfire policies: what to do with a run that comes due late
+MISFIRE_RUN_ONCE = "run_once"  # run it once, skip any further missed runs
+MISFIRE_SKIP = "skip"  # skip it if later than the grace time
+MISFIRE_RUN_ALL = "run_all"  # run every missed occurrence
+MISFIRE_POLICIES = (MISFIRE_RUN_ONCE, MISFIRE_SKIP, MISFIRE_RUN_ALL)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp(value: datetime) -> float:
+    """Seconds since the epoch for a naive UTC datetime"""
+    return (value - _EPOCH).total_seconds()
+
 
 class Schedule:
     """Represents a job schedule"""
@@ -27,7 +55,11 @@ class Schedule:
         interval: Optional[timedelta] = None,
         at_time: Optional[str] = None,
         queue: str = "default",
-        enabled: bool = True
+        enabled: bool = True,
+        priority: int = 5,
+        misfire_policy: str = MISFIRE_RUN_ONCE,
+        misfire_grace_time: float = 60.0,
+        jitter: float = 0.0
     ):
         """
         Create a job schedule
@@ -40,7 +72,14 @@ class Schedule:
             at_time: Specific time to run (HH:MM format)
             queue: Queue to enqueue job in
             enabled: Whether schedule is enabled
+            priority: 1-10, 10 is highest; decides order among schedules due together
+            misfire_policy: One of MISFIRE_POLICIES
+            misfire_grace_time: Seconds a run may be late before it counts as missed
+            jitter: Seconds over which runs due at the same instant are spread
         """
+        if misfire_policy not in MISFIRE_POLICIES:
+            raise ValueError(f"Invalid misfire policy: {misfire_policy}")
+
         self.job_name = job_name
         self.job_params = job_params
         self.cron = cron
@@ -48,9 +87,14 @@ class Schedule:
         self.at_time = at_time
         self.queue = queue
         self.enabled = enabled
+        self.priority = priority
+        self.misfire_policy = misfire_policy
+        self.misfire_grace_time = misfire_grace_time
+        self.jitter = jitter
         self.last_run: Optional[datetime] = None
         self.next_run: Optional[datetime] = None
         self.run_count = 0
+        self._croniter = None
 
         self._calculate_next_run()
 
@@ -79,8 +123,12 @@ class Schedule:
         try:
             from croniter import croniter
 
-            cron = croniter(self.cron, from_time)
-            return cron.get_next(datetime)
+            # Parse the expression once and reuse the iterator
+            if self._croniter is None:
+                self._croniter = croniter(self.cron, from_time)
+            else:
+                self._croniter.set_current(from_time)
+            return self._croniter.get_next(datetime)
         except ImportError:
             logger.warning("croniter not installed, using interval fallback")
             return from_time + timedelta(hours=1)
@@ -99,6 +147,54 @@ class Schedule:
 
         return next_run
 
+    def _period(self) -> Optional[timedelta]:
+        """Fixed spacing between runs, if the schedule has one"""
+        if self.interval:
+            return self.interval
+        if self.at_time and not self.cron:
+            return timedelta(days=1)
+        return None
+
+    def _next_after(self, occurrence: datetime, now: datetime) -> datetime:
+        """Occurrence following ``occurrence``, skipping past ``now`` unless running all misfires"""
+        period = self._period()
+        if period is None:
+            next_run = self._calculate_cron_next_run(occurrence)
+            if next_run <= now and self.misfire_policy != MISFIRE_RUN_ALL:
+                next_run = self._calculate_cron_next_run(now)
+            return next_run
+
+        next_run = occurrence + period
+        if next_run <= now and self.misfire_policy != MISFIRE_RUN_ALL:
+            next_run += period * (math.floor((now - next_run) / period) + 1)
+        return next_run
+
+    def advance(self, now: Optional[datetime] = None) -> bool:
+        """
+        Move next_run past the occurrence that came due
+
+        Args:
+            now: Current time (default: utcnow)
+
+        Returns:
+            Whether the occurrence should run under the misfire policy
+        """
+        now = now or datetime.utcnow()
+        occurrence = self.next_run
+        if occurrence is None:
+            return False
+
+        late = (now - occurrence).total_seconds()
+        should_fire = not (self.misfire_policy == MISFIRE_SKIP and late > self.misfire_grace_time)
+
+        if self.cron or self._period() is not None:
+            self.next_run = self._next_after(occurrence, now)
+        else:
+            # One-time execution
+            self.next_run = None
+
+        return should_fire
+
     def should_run(self) -> bool:
         """Check if schedule should run now"""
         if not self.enabled or not self.next_run:
@@ -108,9 +204,15 @@ class Schedule:
 
     def mark_run(self) -> None:
         """Mark schedule as run and calculate next run"""
-        self.last_run = datetime.utcnow()
+        now = datetime.utcnow()
+        self.record_run(now)
+        if self.next_run is not None and self.next_run <= now:
+            self.advance(now)
+
+    def record_run(self, run_at: datetime) -> None:
+        """Record a run without moving next_run"""
+        self.last_run = run_at
         self.run_count += 1
-        self._calculate_next_run()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert schedule to dictionary"""
@@ -122,6 +224,9 @@ class Schedule:
             "at_time": self.at_time,
             "queue": self.queue,
             "enabled": self.enabled,
+            "priority": self.priority,
+            "misfire_policy": self.misfire_policy,
+            "jitter": self.jitter,
             "last_run": self.last_run.isoformat() if self.last_run else None,
             "next_run": self.next_run.isoformat() if self.next_run else None,
             "run_count": self.run_count
@@ -133,7 +238,7 @@ class JobScheduler:
     Job scheduler with cron support and recurring jobs
 
     Usage:
-        scheduler = JobScheduler(queue_manager)
+        scheduler = JobScheduler(queue_manager, state_path="data/schedules.json")
 
         # Schedule job to run every hour
         scheduler.add_schedule(
@@ -142,37 +247,72 @@ class JobScheduler:
             cron="0 * * * *"
         )
 
-        # Schedule job with interval
+        # Schedule job with interval, spread over a minute and ahead of
+        # lower-priority schedules due at the same time
         scheduler.add_schedule(
             "another_job",
             {},
-            interval=timedelta(minutes=30)
+            interval=timedelta(minutes=30),
+            priority=8,
+            jitter=60.0
         )
 
-        # Schedule job at specific time
+        # Schedule job at specific time, skipped if more than 10 minutes late
         scheduler.add_schedule(
             "daily_job",
             {},
-            at_time="03:00"
+            at_time="03:00",
+            misfire_policy="skip",
+            misfire_grace_time=600
         )
 
         # Start scheduler
         scheduler.start()
     """
 
-    def __init__(self, queue_manager: QueueManager):
+    def __init__(
+        self,
+        queue_manager: QueueManager,
+        state_path: Optional[str] = None,
+        dispatch_workers: int = 4,
+        max_sleep: float = 60.0,
+        state_save_interval: float = 30.0
+    ):
         """
         Initialize job scheduler
 
         Args:
             queue_manager: Queue manager for job execution
+            state_path: JSON file to persist schedule state in (None disables it)
+            dispatch_workers: Threads enqueueing jobs that come due together
+            max_sleep: Longest the scheduler sleeps between checks, bounding
+                the effect of wall clock changes
+            state_save_interval: Minimum seconds between state saves while running
         """
         self.queue_manager = queue_manager
         self.schedules: Dict[str, Schedule] = {}
+        self.state_path = state_path
+        self.dispatch_workers = dispatch_workers
+        self.max_sleep = max_sleep
+        self.state_save_interval = state_save_interval
         self._running = False
         self._thread: Optional[Thread] = None
-        self._stop_event = Event()
-        self._check_interval = 1.0  # seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Heap of (due timestamp, -priority, sequence, schedule_id, version);
+        # entries whose version is stale are dropped when they reach the top.
+        # Versions come from one counter that never restarts, so a schedule
+        # removed and added again under the same id cannot revive old entries
+        self._heap: List[Tuple[float, int, int, str, int]] = []
+        self._versions: Dict[str, int] = {}
+        self._version_counter = itertools.count(1)
+        self._sequence = itertools.count()
+        self._condition = Condition()
+        self._changed = False
+
+        self._saved_state: Dict[str, Dict[str, Any]] = self._load_state()
+        self._last_save = 0.0
+        self.stats: Dict[str, Any] = {"fired": 0, "misfires_skipped": 0, "enqueue_errors": 0, "max_lag": 0.0}
 
     def add_schedule(
         self,
@@ -183,7 +323,11 @@ class JobScheduler:
         interval: Optional[timedelta] = None,
         at_time: Optional[str] = None,
         queue: str = "default",
-        enabled: bool = True
+        enabled: bool = True,
+        priority: int = 5,
+        misfire_policy: str = MISFIRE_RUN_ONCE,
+        misfire_grace_time: float = 60.0,
+        jitter: float = 0.0
     ) -> Schedule:
         """
         Add a job schedule
@@ -197,6 +341,10 @@ class JobScheduler:
             at_time: Specific time (HH:MM)
             queue: Queue name
             enabled: Whether enabled
+            priority: 1-10, 10 is highest
+            misfire_policy: One of MISFIRE_POLICIES
+            misfire_grace_time: Seconds a run may be late before it counts as missed
+            jitter: Seconds over which runs due at the same instant are spread
 
         Returns:
             Created schedule
@@ -208,35 +356,50 @@ class JobScheduler:
             interval=interval,
             at_time=at_time,
             queue=queue,
-            enabled=enabled
+            enabled=enabled,
+            priority=priority,
+            misfire_policy=misfire_policy,
+            misfire_grace_time=misfire_grace_time,
+            jitter=jitter
         )
+        self._restore(schedule_id, schedule)
 
-        self.schedules[schedule_id] = schedule
+        with self._condition:
+            self.schedules[schedule_id] = schedule
+            self._push(schedule_id, schedule)
         logger.info(f"Added schedule '{schedule_id}' for job '{job_name}'")
         return schedule
 
     def remove_schedule(self, schedule_id: str) -> bool:
         """Remove a schedule"""
-        if schedule_id in self.schedules:
-            del self.schedules[schedule_id]
-            logger.info(f"Removed schedule '{schedule_id}'")
-            return True
+        with self._condition:
+            if schedule_id in self.schedules:
+                del self.schedules[schedule_id]
+                self._versions.pop(schedule_id, None)
+                logger.info(f"Removed schedule '{schedule_id}'")
+                return True
         return False
 
     def enable_schedule(self, schedule_id: str) -> bool:
         """Enable a schedule"""
-        if schedule_id in self.schedules:
-            self.schedules[schedule_id].enabled = True
-            logger.info(f"Enabled schedule '{schedule_id}'")
-            return True
+        with self._condition:
+            if schedule_id in self.schedules:
+                schedule = self.schedules[schedule_id]
+                schedule.enabled = True
+                self._push(schedule_id, schedule)
+                logger.info(f"Enabled schedule '{schedule_id}'")
+                return True
         return False
 
     def disable_schedule(self, schedule_id: str) -> bool:
         """Disable a schedule"""
-        if schedule_id in self.schedules:
-            self.schedules[schedule_id].enabled = False
-            logger.info(f"Disabled schedule '{schedule_id}'")
-            return True
+        with self._condition:
+            if schedule_id in self.schedules:
+                schedule = self.schedules[schedule_id]
+                schedule.enabled = False
+                self._push(schedule_id, schedule)
+                logger.info(f"Disabled schedule '{schedule_id}'")
+                return True
         return False
 
     def get_schedule(self, schedule_id: str) -> Optional[Schedule]:
@@ -245,7 +408,7 @@ class JobScheduler:
 
     def list_schedules(self) -> List[Dict[str, Any]]:
         """List all schedules"""
-        return [s.to_dict() for s in self.schedules.values()]
+        return [s.to_dict() for s in list(self.schedules.values())]
 
     def start(self) -> None:
         """Start the scheduler"""
@@ -254,7 +417,6 @@ class JobScheduler:
             return
 
         self._running = True
-        self._stop_event.clear()
         self._thread = Thread(target=self._run_loop, daemon=True)
         self._thread.start()
         logger.info("Job scheduler started")
@@ -264,14 +426,59 @@ class JobScheduler:
         if not self._running:
             return
 
-        self._running = False
-        self._stop_event.set()
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
 
         if self._thread:
             self._thread.join(timeout=5.0)
 
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        self.save_state()
         logger.info("Job scheduler stopped")
 
+    def _push(self, schedule_id: str, schedule: Schedule) -> None:
+        """(Re)insert a schedule into the heap; call with the condition held"""
+        version = next(self._version_counter)
+        self._versions[schedule_id] = version
+
+        if schedule.enabled and schedule.next_run is not None:
+            due = _timestamp(schedule.next_run) + self._jitter_offset(schedule_id, schedule)
+            heapq.heappush(
+                self._heap,
+                (due, -schedule.priority, next(self._sequence), schedule_id, version)
+            )
+
+        # Stale entries are dropped lazily; rebuild once they dominate the heap
+        if len(self._heap) > 2 * len(self.schedules) + 64:
+            self._heap = [entry for entry in self._heap if self._is_current(entry)]
+            heapq.heapify(self._heap)
+
+        self._changed = True
+        self._condition.notify_all()
+
+    @staticmethod
+    def _jitter_offset(schedule_id: str, schedule: Schedule) -> float:
+        """Stable per-schedule delay within the jitter window"""
+        if schedule.jitter <= 0:
+            return 0.0
+        return (zlib.crc32(schedule_id.encode()) % 10000) / 10000 * schedule.jitter
+
+    def _is_current(self, entry: Tuple[float, int, int, str, int]) -> bool:
+        return self._versions.get(entry[3]) == entry[4]
+
+    def _seconds_until_next(self) -> float:
+        """Time until the next due schedule, capped at max_sleep"""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return self.max_sleep
+        delay = self._heap[0][0] - _timestamp(datetime.utcnow())
+        return min(max(delay, 0.0), self.max_sleep)
+
     def _run_loop(self) -> None:
         """Main scheduler loop"""
         while self._running:
@@ -280,37 +487,120 @@ class JobScheduler:
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}", exc_info=True)
 
-            # Wait for check interval or stop event
-            self._stop_event.wait(self._check_interval)
+            with self._condition:
+                if not self._running:
+                    break
+                # Sleep until the next schedule is due unless something changed
+                # while due schedules were being enqueued
+                if not self._changed:
+                    self._condition.wait(self._seconds_until_next())
+                self._changed = False
+
+            if self.state_path and time.monotonic() - self._last_save >= self.state_save_interval:
+                self.save_state()
 
     def _check_schedules(self) -> None:
-        """Check and execute due schedules"""
-        for schedule_id, schedule in self.schedules.items():
-            if schedule.should_run():
-                try:
-                    self._execute_schedule(schedule_id, schedule)
-                except Exception as e:
-                    logger.error(f"Error executing schedule '{schedule_id}': {e}", exc_info=True)
-
-    def _execute_schedule(self, schedule_id: str, schedule: Schedule) -> None:
-        """Execute a scheduled job"""
-        # Create job instance
-        job = JobRegistry.create(schedule.job_name, **schedule.job_params)
-        if not job:
-            logger.error(f"Cannot create job '{schedule.job_name}' for schedule '{schedule_id}'")
+        """Enqueue every schedule that is due"""
+        now = datetime.utcnow()
+        due = self._pop_due(now)
+        if not due:
             return
 
-        # Enqueue job
-        task_id = self.queue_manager.enqueue(job, queue=schedule.queue)
+        # Highest priority first among schedules due together
+        due.sort(key=lambda item: (-item[1].priority, item[2]))
+        results = self._dispatch([(schedule_id, schedule) for schedule_id, schedule, _ in due])
+
+        with self._condition:
+            for (schedule_id, schedule, _), task_id in zip(due, results):
+                if task_id is not None:
+                    schedule.record_run(now)
+                    self.stats["fired"] += 1
+
+    def _pop_due(self, now: datetime) -> List[Tuple[str, Schedule, datetime]]:
+        """Take due schedules off the heap and reschedule them"""
+        now_ts = _timestamp(now)
+        due: List[Tuple[str, Schedule, datetime]] = []
+
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now_ts:
+                entry = heapq.heappop(self._heap)
+                if not self._is_current(entry):
+                    continue
+
+                schedule_id = entry[3]
+                schedule = self.schedules[schedule_id]
+                occurrence = schedule.next_run
+                lag = now_ts - _timestamp(occurrence)
+                self.stats["max_lag"] = max(self.stats["max_lag"], lag)
+
+                if schedule.advance(now):
+                    due.append((schedule_id, schedule, occurrence))
+                else:
+                    self.stats["misfires_skipped"] += 1
+                    logger.warning(f"Skipped run of schedule '{schedule_id}' late by {lag:.1f}s")
+
+                # Run-all misfires may put next_run in the past; those come
+                # straight back out of the heap in this loop
+                self._push(schedule_id, schedule)
+
+            # The loop works out its sleep after this; only later changes
+            # need to cut it short
+            self._changed = False
+
+        return due
+
+    def _dispatch(self, due: List[Tuple[str, Schedule]]) -> List[Optional[str]]:
+        """
+        Enqueue due schedules, given highest priority first
 
-        # Mark as run
-        schedule.mark_run()
+        Each priority level is enqueued only after the level above it, so
+        priority order is kept. Schedules of the same priority are enqueued
+        concurrently and therefore in no particular order.
+        """
+        if len(due) == 1 or self.dispatch_workers <= 1:
+            return [self._execute_schedule(schedule_id, schedule) for schedule_id, schedule in due]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.dispatch_workers,
+                thread_name_prefix="scheduler-dispatch"
+            )
+
+        results: List[Optional[str]] = []
+        for _, level in itertools.groupby(due, key=lambda item: item[1].priority):
+            level = list(level)
+            if len(level) == 1:
+                results.append(self._execute_schedule(*level[0]))
+                continue
+            futures = [
+                self._executor.submit(self._execute_schedule, schedule_id, schedule)
+                for schedule_id, schedule in level
+            ]
+            results.extend(future.result() for future in futures)
+        return results
+
+    def _execute_schedule(self, schedule_id: str, schedule: Schedule) -> Optional[str]:
+        """Execute a scheduled job"""
+        try:
+            # Create job instance
+            job = JobRegistry.create(schedule.job_name, **schedule.job_params)
+            if not job:
+                logger.error(f"Cannot create job '{schedule.job_name}' for schedule '{schedule_id}'")
+                return None
+
+            # Enqueue job
+            task_id = self.queue_manager.enqueue(job, queue=schedule.queue)
+        except Exception as e:
+            self.stats["enqueue_errors"] += 1
+            logger.error(f"Error executing schedule '{schedule_id}': {e}", exc_info=True)
+            return None
 
         logger.info(
             f"Executed schedule '{schedule_id}' "
             f"(job: {schedule.job_name}, task: {task_id}, "
-            f"run_count: {schedule.run_count})"
+            f"run_count: {schedule.run_count + 1})"
         )
+        return task_id
 
     def run_once(self, schedule_id: str) -> Optional[str]:
         """
@@ -339,3 +629,58 @@ class JobScheduler:
     def is_running(self) -> bool:
         """Check if scheduler is running"""
         return self._running
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Read persisted schedule state, if any"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable schedule state '{self.state_path}': {e}")
+            return {}
+
+    def _restore(self, schedule_id: str, schedule: Schedule) -> None:
+        """Apply persisted state to a schedule with the same job"""
+        state = self._saved_state.get(schedule_id)
+        if not state or state.get("job_name") != schedule.job_name:
+            return
+
+        schedule.run_count = state.get("run_count", 0)
+        if state.get("last_run"):
+            schedule.last_run = datetime.fromisoformat(state["last_run"])
+        # A persisted next_run in the past is a misfire, handled on the first check
+        if state.get("next_run"):
+            schedule.next_run = datetime.fromisoformat(state["next_run"])
+        elif state.get("last_run"):
+            schedule.next_run = None
+
+    def save_state(self) -> None:
+        """Persist last/next run and run count of every schedule"""
+        if not self.state_path:
+            return
+
+        with self._condition:
+            state = {
+                schedule_id: {
+                    "job_name": schedule.job_name,
+                    "last_run": schedule.last_run.isoformat() if schedule.last_run else None,
+                    "next_run": schedule.next_run.isoformat() if schedule.next_run else None,
+                    "run_count": schedule.run_count,
+                }
+                for schedule_id, schedule in self.schedules.items()
+            }
+
+        # Write to a temporary file first so a crash never leaves partial state
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+            self._last_save = time.monotonic()
+        except OSError as e:
+            logger.error(f"Failed to save schedule state to '{self.state_path}': {e}")
@@ -40,7 +40,7 @@ from src.db.models import Company
 from src.db.session import get_session_factory
 from src.pipeline.common import (
     get_or_create_company,
-    upsert_financial_metric,
+    bulk_upsert_financial_metrics,
     run_coordination_hook,
 )
 
@@ -144,8 +144,8 @@ async def store_financial_metrics(
 ) -> int:
     """Store financial metrics from Alpha Vantage data.
 
-    Uses upsert logic (INSERT ... ON CONFLICT DO UPDATE) to avoid duplicates
-    while updating existing metrics if data changes.
+    Uses a single multi-row upsert (INSERT ... ON CONFLICT DO UPDATE) to avoid
+    duplicates while updating existing metrics if data changes.
 
     Args:
         session: Database session
@@ -176,9 +176,9 @@ async def store_financial_metrics(
 
     metric_date = quarter_end
 
-    metrics_stored = 0
+    metric_rows = []
 
-    # Process each metric mapping using common utility
+    # Collect each metric mapping, then store them in one bulk upsert
     for metric_type, config in METRIC_MAPPINGS.items():
         av_field = config['av_field']
         value = av_data.get(av_field)
@@ -191,20 +191,19 @@ async def store_financial_metrics(
         if config['unit'] == 'percent' and isinstance(value, float):
             value = value * 100  # Convert 0.15 -> 15.0
 
-        # Use common utility for upsert
-        await upsert_financial_metric(
-            session,
-            company_id=company_id,
-            metric_date=metric_date,
-            period_type='quarterly',
-            metric_type=metric_type,
-            value=float(value),
-            unit=config['unit'],
-            metric_category=config['category'],
-            source='alpha_vantage',
-            confidence_score=0.95,
-        )
-        metrics_stored += 1
+        metric_rows.append({
+            'company_id': company_id,
+            'metric_date': metric_date,
+            'period_type': 'quarterly',
+            'metric_type': metric_type,
+            'value': float(value),
+            'unit': config['unit'],
+            'metric_category': config['category'],
+            'source': 'alpha_vantage',
+            'confidence_score': 0.95,
+        })
+
+    metrics_stored = await bulk_upsert_financial_metrics(session, metric_rows)
 
     if metrics_stored == 0:
         logger.warning(f"{ticker}: No valid metrics to store")
@@ -6,6 +6,7 @@ data ingestion pipelines (Yahoo Finance, Alpha Vantage, SEC).
 Exports:
     - get_or_create_company: Get existing or create new company record
     - upsert_financial_metric: Insert or update financial metric with conflict resolution
+    - bulk_upsert_financial_metrics: Set-based upsert of many metrics in few statements
     - retry_with_backoff: Retry decorator with exponential backoff
     - run_coordination_hook: Execute coordination hooks with error handling
     - notify_progress: Send progress notifications
@@ -14,6 +15,7 @@ Exports:
 from .utilities import (
     get_or_create_company,
     upsert_financial_metric,
+    bulk_upsert_financial_metrics,
     retry_with_backoff,
     run_coordination_hook,
     notify_progress,
@@ -22,6 +24,7 @@ from .utilities import (
 __all__ = [
     "get_or_create_company",
     "upsert_financial_metric",
+    "bulk_upsert_financial_metrics",
     "retry_with_backoff",
     "run_coordination_hook",
     "notify_progress",
@@ -2,7 +2,7 @@
 
 This module provides reusable functions for common pipeline operations:
 - Company record management (get or create)
-- Financial metric upsert with conflict resolution
+- Financial metric upsert with conflict resolution (single-row and bulk)
 - Retry logic with exponential backoff
 - Coordination hook execution and progress notifications
 
@@ -10,6 +10,7 @@ Usage:
     from src.pipeline.common import (
         get_or_create_company,
         upsert_financial_metric,
+        bulk_upsert_financial_metrics,
         retry_with_backoff,
     )
 """
@@ -17,17 +18,15 @@ Usage:
 import asyncio
 import functools
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar, Union
 from uuid import UUID
 
 import pandas as pd
 import pytz
 from loguru import logger
-from sqlalchemy import select, and_
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models import Company, FinancialMetric
+from src.db.models import Company
 
 
 # Type variables for generic retry decorator
@@ -115,6 +114,102 @@ async def get_or_create_company(
         return None
 
 
+def _normalize_metric_date(metric_date: Union[datetime, pd.Timestamp]) -> datetime:
+    """Return a timezone-aware datetime (PostgreSQL requirement).
+
+    Args:
+        metric_date: Naive or aware datetime / pandas Timestamp
+
+    Returns:
+        Timezone-aware datetime (naive values are assumed to be UTC)
+    """
+    if isinstance(metric_date, pd.Timestamp):
+        # Convert pandas Timestamp to timezone-aware datetime
+        if metric_date.tzinfo is None:
+            return metric_date.tz_localize('UTC').to_pydatetime()
+        return metric_date.to_pydatetime()
+
+    if isinstance(metric_date, datetime) and metric_date.tzinfo is None:
+        # Convert naive datetime to timezone-aware
+        return metric_date.replace(tzinfo=pytz.UTC)
+
+    return metric_date
+
+
+async def bulk_upsert_financial_metrics(
+    session: AsyncSession,
+    metrics: Iterable[Dict[str, Any]],
+    use_copy: bool = False,
+    record_changes: bool = True,
+) -> int:
+    """Insert or update many financial metrics in as few statements as possible.
+
+    Normalizes company IDs and metric dates like upsert_financial_metric, then
+    hands the rows to MetricsRepository's set-based bulk path (multi-row
+    INSERT ... ON CONFLICT DO UPDATE, or COPY into a staging table followed by
+    a single merge when use_copy is True). Prefer this over calling
+    upsert_financial_metric in a loop.
+
+    The (company, metric type) pairs written are queued for the incremental
+    mart refresh in the same transaction (see src.services.mart_refresh).
+
+    Args:
+        session: Database session
+        metrics: Metric dictionaries with company_id, metric_date, period_type,
+            metric_type, value and optional unit, metric_category, source,
+            confidence_score
+        use_copy: Stream rows through COPY (best for large backfills)
+        record_changes: Queue the written pairs for the mart refresh
+
+    Returns:
+        Number of metrics upserted
+
+    Example:
+        count = await bulk_upsert_financial_metrics(
+            session,
+            [
+                {
+                    "company_id": company.id,
+                    "metric_date": datetime(2024, 3, 31),
+                    "period_type": "quarterly",
+                    "metric_type": "revenue",
+                    "value": 150000000.0,
+                    "unit": "USD",
+                    "metric_category": "financial",
+                    "source": "yahoo_finance",
+                },
+                ...
+            ]
+        )
+    """
+    from src.repositories import MetricsRepository
+    from src.services.mart_refresh import MetricChangeSet, record_metric_changes
+
+    rows = []
+    for metric in metrics:
+        row = dict(metric)
+
+        # Convert company_id to UUID if string
+        if isinstance(row.get("company_id"), str):
+            row["company_id"] = UUID(row["company_id"])
+
+        row["metric_date"] = _normalize_metric_date(row["metric_date"])
+        rows.append(row)
+
+    if not rows:
+        return 0
+
+    repo = MetricsRepository(session)
+    if use_copy:
+        count = await repo.copy_upsert_metrics(rows)
+    else:
+        count = await repo.bulk_upsert_metrics(rows)
+
+    if record_changes:
+        await record_metric_changes(session, MetricChangeSet.from_rows(rows))
+    return count
+
+
 async def upsert_financial_metric(
     session: AsyncSession,
     company_id: Union[UUID, str],
@@ -130,7 +225,9 @@ async def upsert_financial_metric(
     """Insert or update a financial metric with conflict resolution.
 
     Uses PostgreSQL's INSERT ... ON CONFLICT DO UPDATE for atomic upserts.
-    Handles timezone-aware datetime conversion automatically.
+    Handles timezone-aware datetime conversion automatically. This is a
+    single-row wrapper around bulk_upsert_financial_metrics; pipelines that
+    store more than one metric should collect rows and call that instead.
 
     Args:
         session: Database session
@@ -157,50 +254,21 @@ async def upsert_financial_metric(
             source="yahoo_finance"
         )
     """
-    # Convert company_id to UUID if string
-    if isinstance(company_id, str):
-        from uuid import UUID as UUIDType
-        company_id = UUIDType(company_id)
-
-    # Ensure metric_date is timezone-aware (PostgreSQL requirement)
-    if isinstance(metric_date, pd.Timestamp):
-        # Convert pandas Timestamp to timezone-aware datetime
-        if metric_date.tzinfo is None:
-            metric_date = metric_date.tz_localize('UTC').to_pydatetime()
-        else:
-            metric_date = metric_date.to_pydatetime()
-    elif isinstance(metric_date, datetime):
-        # Convert naive datetime to timezone-aware
-        if metric_date.tzinfo is None:
-            metric_date = metric_date.replace(tzinfo=pytz.UTC)
-
-    # Create insert statement with ON CONFLICT DO UPDATE
-    stmt = insert(FinancialMetric).values(
-        company_id=company_id,
-        metric_date=metric_date,
-        period_type=period_type,
-        metric_type=metric_type,
-        metric_category=metric_category,
-        value=value,
-        unit=unit,
-        source=source,
-        confidence_score=confidence_score,
+    await bulk_upsert_financial_metrics(
+        session,
+        [{
+            "company_id": company_id,
+            "metric_date": metric_date,
+            "period_type": period_type,
+            "metric_type": metric_type,
+            "metric_category": metric_category,
+            "value": value,
+            "unit": unit,
+            "source": source,
+            "confidence_score": confidence_score,
+        }],
     )
 
-    # On conflict, update the value and metadata
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["company_id", "metric_type", "metric_date", "period_type"],
-        set_={
-            "value": stmt.excluded.value,
-            "unit": stmt.excluded.unit,
-            "source": stmt.excluded.source,
-            "confidence_score": stmt.excluded.confidence_score,
-            "updated_at": datetime.utcnow(),
-        }
-    )
-
-    await session.execute(stmt)
-
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -4,33 +4,82 @@ This module provides a clean interface for SEC data ingestion while maintaining
 backward compatibility with the monolithic sec_ingestion.py module.
 """
 
-from src.pipeline.sec.client import SECAPIClient, RateLimiter
-from src.pipeline.sec.parser import validate_filing_data, classify_edtech_company
+from src.pipeline.sec.client import (
+    SECAPIClient,
+    RateLimiter,
+    get_sec_client,
+    close_sec_client,
+    get_sec_rate_limiter,
+)
+from src.pipeline.sec.content_store import (
+    FilingContentStore,
+    LocalFilingContentStore,
+    S3FilingContentStore,
+    get_filing_content_store,
+)
+from src.pipeline.sec.directory import (
+    CompanyDirectory,
+    CompanyEntry,
+    get_company_directory,
+)
+from src.pipeline.sec.parser import (
+    validate_filing_data,
+    validate_filings_batch,
+    audit_filing_data,
+    classify_edtech_company,
+)
 from src.pipeline.sec.processor import get_or_create_company, store_filing
+from src.pipeline.sec.sections import html_to_text, parse_filing_sections, section_text
 from src.pipeline.sec.orchestrator import (
     FilingRequest,
     fetch_company_data,
     fetch_filings,
     download_filing,
+    plan_filing_sync,
+    record_filing_sync,
     sec_ingestion_flow,
     batch_sec_ingestion_flow,
 )
+from src.pipeline.sec.sync import FilingSync, SyncPlan
 
 __all__ = [
     # Client
     "SECAPIClient",
     "RateLimiter",
+    "get_sec_client",
+    "close_sec_client",
+    "get_sec_rate_limiter",
+    # Company directory
+    "CompanyDirectory",
+    "CompanyEntry",
+    "get_company_directory",
+    # Filing content store
+    "FilingContentStore",
+    "LocalFilingContentStore",
+    "S3FilingContentStore",
+    "get_filing_content_store",
     # Parser
     "validate_filing_data",
+    "validate_filings_batch",
+    "audit_filing_data",
     "classify_edtech_company",
     # Processor
     "get_or_create_company",
     "store_filing",
+    # Section index
+    "parse_filing_sections",
+    "section_text",
+    "html_to_text",
     # Orchestrator
     "FilingRequest",
     "fetch_company_data",
     "fetch_filings",
     "download_filing",
+    "plan_filing_sync",
+    "record_filing_sync",
     "sec_ingestion_flow",
     "batch_sec_ingestion_flow",
+    # Incremental sync
+    "FilingSync",
+    "SyncPlan",
 ]
@@ -1,4 +1,4 @@
-"""SEC EDGAR API client with rate limiting."""
+"""SEC EDGAR API client with rate limiting and a pooled HTTP connection."""
 
 import asyncio
 import time
@@ -10,88 +10,194 @@ from loguru import logger
 
 from src.core.config import get_settings
 from src.core.circuit_breaker import sec_breaker, sec_fallback
+from src.pipeline.sec.directory import CompanyDirectory, get_company_directory
+
+# HTTP/2 needs h2 (installed with httpx[http2]); fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls."""
+    """Token-bucket rate limiter that can be shared by concurrent coroutines.
+
+    Tokens refill continuously at ``calls_per_second`` up to ``burst``. Waiters
+    queue on an asyncio.Lock (FIFO), so any number of coroutines can share one
+    limiter and together issue at most ``calls_per_second`` requests per second
+    while keeping the limiter saturated.
+    """
 
-    def __init__(self, calls_per_second: int):
+    def __init__(self, calls_per_second: int, burst: int = 1):
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
+        self.burst = burst
         self.last_call = 0.0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop (locks are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
 
     async def acquire(self):
-        """Wait if necessary to respect rate limit."""
-        current = time.time()
-        time_since_last = current - self.last_call
+        """Wait until a token is available, then consume it."""
+        async with self._get_lock():
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._updated) * self.calls_per_second
+            )
+            self._updated = now
+
+            if self._tokens < 1.0:
+                # Sleep while holding the lock so later waiters stay queued in order
+                await asyncio.sleep((1.0 - self._tokens) / self.calls_per_second)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+
+            self._tokens -= 1.0
+            self.last_call = time.time()
+
+
+_sec_rate_limiter: Optional[RateLimiter] = None
+
 
-        if time_since_last < self.min_interval:
-            await asyncio.sleep(self.min_interval - time_since_last)
+def get_sec_rate_limiter() -> RateLimiter:
+    """Get the process-wide SEC rate limiter.
 
-        self.last_call = time.time()
+    SEC enforces its request limit per client, not per connection, so every
+    SECAPIClient in the process shares one limiter pinned to SEC_RATE_LIMIT.
+    """
+    global _sec_rate_limiter
+
+    if _sec_rate_limiter is None:
+        _sec_rate_limiter = RateLimiter(get_settings().SEC_RATE_LIMIT)
+
+    return _sec_rate_limiter
 
 
 class SECAPIClient:
-    """Client for SEC EDGAR API with rate limiting."""
+    """Client for SEC EDGAR API with rate limiting.
+
+    A single httpx.AsyncClient is created lazily and reused for every request,
+    so connections to data.sec.gov and www.sec.gov are kept alive (HTTP/2 when
+    available) instead of paying TCP and TLS setup per call. Use
+    get_sec_client() to share one instance across a whole ingestion run.
+
+    Ticker/CIK lookups go through a CompanyDirectory: the process-wide one
+    (with its disk snapshot) for get_sec_client(), otherwise the one passed
+    in, or a private in-memory directory per client.
+    """
 
     BASE_URL = "https://data.sec.gov"
     ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data"
     TICKER_CIK_MAPPING_URL = "https://www.sec.gov/files/company_tickers.json"
 
-    def __init__(self):
+    # Connection pool sizing (SEC_RATE_LIMIT caps throughput, not the pool)
+    MAX_CONNECTIONS = 20
+    MAX_KEEPALIVE_CONNECTIONS = 10
+    KEEPALIVE_EXPIRY = 30.0
+    REQUEST_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        directory: Optional[CompanyDirectory] = None,
+    ):
         self.settings = get_settings()
         self.headers = {
             "User-Agent": self.settings.SEC_USER_AGENT,
             "Accept": "application/json",
         }
-        self.rate_limiter = RateLimiter(self.settings.SEC_RATE_LIMIT)
+        self.rate_limiter = rate_limiter or get_sec_rate_limiter()
+        # An empty directory is falsy, so test for None explicitly
+        self.directory = directory if directory is not None else CompanyDirectory(snapshot_path="")
+        # Fixed ticker-to-CIK mapping that bypasses the directory when set
         self._ticker_cik_cache: Optional[Dict[str, str]] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it for the running loop."""
+        loop = asyncio.get_running_loop()
+
+        if (
+            self._http_client is None
+            or self._http_client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            self._client_loop = loop
+
+        return self._http_client
+
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Rate-limited GET through the pooled client and the SEC circuit breaker."""
+        await self.rate_limiter.acquire()
+
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        client = self._get_http_client()
+        response = sec_breaker.call(client.get, url, headers=headers, **kwargs)
+        # Await if coroutine
+        if asyncio.iscoroutine(response):
+            response = await response
+
+        return response
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._client_loop = None
+
+    async def __aenter__(self) -> "SECAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def get_company_tickers(self, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """Fetch SEC's company_tickers.json.
+
+        Args:
+            headers: Extra request headers, e.g. If-None-Match for a
+                conditional GET
+
+        Returns:
+            The raw response (a 304 carries no body)
+        """
+        return await self._get(self.TICKER_CIK_MAPPING_URL, headers=headers or {})
 
     async def get_ticker_to_cik_mapping(self) -> Dict[str, str]:
-        """Fetch the official SEC ticker-to-CIK mapping.
+        """Get the official SEC ticker-to-CIK mapping.
 
-        Returns a dictionary mapping ticker symbols to CIK numbers.
-        Caches the result to avoid repeated API calls.
-        Protected by circuit breaker to prevent cascading failures.
+        Returns a dictionary mapping ticker symbols to zero-padded CIK numbers,
+        served from the client's company directory, which is refreshed
+        with a conditional GET once its TTL has passed. Returns an empty dict
+        if the directory has never been loaded and SEC is unavailable.
         """
         if self._ticker_cik_cache is not None:
             return self._ticker_cik_cache
 
-        await self.rate_limiter.acquire()
-
-        try:
-            async with httpx.AsyncClient() as client:
-                # Wrap API call with circuit breaker
-                response = sec_breaker.call(
-                    client.get,
-                    self.TICKER_CIK_MAPPING_URL,
-                    headers=self.headers
-                )
-                # Await if coroutine
-                if asyncio.iscoroutine(response):
-                    response = await response
-
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch ticker mapping: {response.status_code}")
-                    return {}
-
-                data = response.json()
-
-                # Convert to ticker -> CIK mapping (data is indexed by integers)
-                mapping = {}
-                for entry in data.values():
-                    if isinstance(entry, dict) and "ticker" in entry and "cik_str" in entry:
-                        ticker = entry["ticker"].upper()
-                        cik = str(entry["cik_str"]).zfill(10)  # Zero-pad to 10 digits
-                        mapping[ticker] = cik
-
-                self._ticker_cik_cache = mapping
-                logger.info(f"Loaded {len(mapping)} ticker-to-CIK mappings from SEC")
-                return mapping
-
-        except Exception as e:
-            logger.error(f"Error fetching ticker-to-CIK mapping: {e}")
-            return await sec_fallback()
+        directory = await self.directory.ensure_fresh(self)
+        return directory.ticker_to_cik()
 
     async def get_company_info(self, ticker: str) -> Dict[str, Any]:
         """Fetch company information from SEC.
@@ -109,28 +215,36 @@ class SECAPIClient:
 
         logger.info(f"Found CIK {cik} for ticker {ticker}")
 
-        await self.rate_limiter.acquire()
-
         try:
-            async with httpx.AsyncClient() as client:
-                # Fetch company submissions using CIK
-                submissions_url = f"{self.BASE_URL}/submissions/CIK{cik}.json"
-                # Wrap API call with circuit breaker
-                response = sec_breaker.call(client.get, submissions_url, headers=self.headers)
-                # Await if coroutine
-                if asyncio.iscoroutine(response):
-                    response = await response
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Failed to fetch company info for CIK {cik} (ticker {ticker}): {response.status_code}")
-                    return {}
+            # Fetch company submissions using CIK
+            submissions_url = f"{self.BASE_URL}/submissions/CIK{cik}.json"
+            response = await self._get(submissions_url)
+
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Failed to fetch company info for CIK {cik} (ticker {ticker}): {response.status_code}")
+                return {}
 
         except Exception as e:
             logger.error(f"Error fetching company info for {ticker}: {e}")
             return await sec_fallback(ticker)
 
+    async def get_company_submissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        """Fetch a company's submissions document (name, tickers, recent filings).
+
+        Returns None if SEC answers with an error status; transport errors
+        and an open circuit breaker propagate to the caller.
+        """
+        padded_cik = cik.zfill(10)
+        response = await self._get(f"{self.BASE_URL}/submissions/CIK{padded_cik}.json")
+
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch submissions for CIK {cik}: {response.status_code}")
+            return None
+
+        return response.json()
+
     async def get_filings(
         self,
         cik: str,
@@ -141,48 +255,41 @@ class SECAPIClient:
 
         Protected by circuit breaker to prevent cascading failures.
         """
-        await self.rate_limiter.acquire()
-
         try:
-            async with httpx.AsyncClient() as client:
-                # Pad CIK to 10 digits
-                padded_cik = cik.zfill(10)
-                url = f"{self.BASE_URL}/submissions/CIK{padded_cik}.json"
+            # Pad CIK to 10 digits
+            padded_cik = cik.zfill(10)
+            url = f"{self.BASE_URL}/submissions/CIK{padded_cik}.json"
 
-                # Wrap API call with circuit breaker
-                response = sec_breaker.call(client.get, url, headers=self.headers)
-                # Await if coroutine
-                if asyncio.iscoroutine(response):
-                    response = await response
+            response = await self._get(url)
 
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch filings for CIK {cik}: {response.status_code}")
-                    return []
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch filings for CIK {cik}: {response.status_code}")
+                return []
 
-                data = response.json()
-                filings = []
+            data = response.json()
+            filings = []
 
-                # Process recent filings
-                recent = data.get("filings", {}).get("recent", {})
+            # Process recent filings
+            recent = data.get("filings", {}).get("recent", {})
 
-                for i in range(len(recent.get("form", []))):
-                    form_type = recent["form"][i]
+            for i in range(len(recent.get("form", []))):
+                form_type = recent["form"][i]
 
-                    if form_type in filing_types:
-                        filing_date = datetime.strptime(recent["filingDate"][i], "%Y-%m-%d")
+                if form_type in filing_types:
+                    filing_date = datetime.strptime(recent["filingDate"][i], "%Y-%m-%d")
 
-                        if start_date and filing_date < start_date:
-                            continue
+                    if start_date and filing_date < start_date:
+                        continue
 
-                        filings.append({
-                            "form": form_type,
-                            "filingDate": recent["filingDate"][i],
-                            "accessionNumber": recent["accessionNumber"][i],
-                            "primaryDocument": recent["primaryDocument"][i],
-                            "cik": cik,
-                        })
+                    filings.append({
+                        "form": form_type,
+                        "filingDate": recent["filingDate"][i],
+                        "accessionNumber": recent["accessionNumber"][i],
+                        "primaryDocument": recent["primaryDocument"][i],
+                        "cik": cik,
+                    })
 
-                return filings
+            return filings
 
         except Exception as e:
             logger.error(f"Error fetching filings for CIK {cik}: {e}")
@@ -193,8 +300,6 @@ class SECAPIClient:
 
         Protected by circuit breaker to prevent cascading failures.
         """
-        await self.rate_limiter.acquire()
-
         cik = filing["cik"].zfill(10)
         accession = filing["accessionNumber"].replace("-", "")
         document = filing["primaryDocument"]
@@ -202,24 +307,37 @@ class SECAPIClient:
         url = f"{self.ARCHIVES_URL}/{cik}/{accession}/{document}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Wrap API call with circuit breaker
-                response = sec_breaker.call(
-                    client.get,
-                    url,
-                    headers=self.headers,
-                    follow_redirects=True
-                )
-                # Await if coroutine
-                if asyncio.iscoroutine(response):
-                    response = await response
-
-                if response.status_code == 200:
-                    return response.text
-                else:
-                    logger.error(f"Failed to download filing: {url}")
-                    return ""
+            response = await self._get(url, follow_redirects=True)
+
+            if response.status_code == 200:
+                return response.text
+            else:
+                logger.error(f"Failed to download filing: {url}")
+                return ""
 
         except Exception as e:
             logger.error(f"Error downloading filing content: {e}")
             return ""
+
+
+_sec_client: Optional[SECAPIClient] = None
+
+
+def get_sec_client() -> SECAPIClient:
+    """Get the process-wide SEC client.
+
+    Sharing one client keeps a single connection pool for the whole run
+    instead of one per task invocation.
+    """
+    global _sec_client
+
+    if _sec_client is None:
+        _sec_client = SECAPIClient(directory=get_company_directory())
+
+    return _sec_client
+
+
+async def close_sec_client() -> None:
+    """Close the process-wide SEC client's connections (safe to call twice)."""
+    if _sec_client is not None:
+        await _sec_client.aclose()
@@ -0,0 +1,304 @@
+"""Compressed, content-addressed storage for raw filing text.
+
+Full filing documents run to several MB each. Kept inline in
+sec_filings.raw_text they bloated the table, and every query that loaded
+whole rows paid TOAST I/O for text it never used. Bodies now live outside
+the database:
+
+- keyed by the SHA-256 of the UTF-8 text (the content_hash download_filing
+  already computes), so identical documents are stored once
+- zstd-compressed; zlib is used when the zstandard package is missing, and
+  blobs are told apart by their magic bytes so either codec stays readable
+- on the local filesystem (FILING_CONTENT_DIR) or in an S3-compatible bucket
+  on MinIO (FILING_CONTENT_BUCKET)
+
+sec_filings rows keep only content_hash; SECFiling.load_text() reads the body
+on demand. Running this module moves text still stored inline into the store.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import tempfile
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+from src.core.config import get_settings
+
+# zstd is optional; zlib is the fallback codec
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of the UTF-8 encoded text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress(data: bytes, level: int) -> bytes:
+    """Compress with zstd, or zlib when zstandard is not installed."""
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return zlib.compress(data, min(level, 9))
+
+
+def decompress(blob: bytes) -> bytes:
+    """Decompress a blob written by ``compress`` with either codec."""
+    if blob[:4] == ZSTD_MAGIC:
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard required to read this blob. Install with: pip install zstandard")
+        # Frames written by compress() always record their content size
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return zlib.decompress(blob)
+
+
+class FilingContentStore(ABC):
+    """Content-addressed filing text store.
+
+    Subclasses implement blocking ``_exists``/``_read``/``_write`` on blob
+    keys; the async API runs them in a worker thread together with hashing
+    and compression, so multi-MB documents do not stall the event loop.
+
+    Usage:
+        store = get_filing_content_store()
+        digest = await store.put(text)
+        text = await store.get(digest)
+    """
+
+    def __init__(self, compression_level: Optional[int] = None):
+        if compression_level is None:
+            compression_level = get_settings().FILING_CONTENT_COMPRESSION_LEVEL
+        self.compression_level = compression_level
+
+    @staticmethod
+    def key(digest: str) -> str:
+        """Blob key for a digest, fanned out by its first two hex characters."""
+        return f"{digest[:2]}/{digest}"
+
+    @abstractmethod
+    def _exists(self, key: str) -> bool:
+        """Whether a blob is stored under ``key``."""
+        pass
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[bytes]:
+        """Blob stored under ``key``, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def _write(self, key: str, blob: bytes) -> None:
+        """Store ``blob`` under ``key``, replacing it atomically."""
+        pass
+
+    def put_sync(self, text: str) -> str:
+        """Store text unless an identical document is already stored.
+
+        Returns:
+            The text's SHA-256 hex digest
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        key = self.key(digest)
+        if not self._exists(key):
+            blob = compress(data, self.compression_level)
+            self._write(key, blob)
+            logger.debug(f"Stored filing content {digest} ({len(data)} -> {len(blob)} bytes)")
+        return digest
+
+    def get_sync(self, digest: str) -> Optional[str]:
+        """Text stored under a digest, or None if there is none."""
+        blob = self._read(self.key(digest))
+        if blob is None:
+            return None
+        return decompress(blob).decode("utf-8")
+
+    async def put(self, text: str) -> str:
+        return await asyncio.to_thread(self.put_sync, text)
+
+    async def get(self, digest: str) -> Optional[str]:
+        return await asyncio.to_thread(self.get_sync, digest)
+
+    async def exists(self, digest: str) -> bool:
+        return await asyncio.to_thread(self._exists, self.key(digest))
+
+
+class LocalFilingContentStore(FilingContentStore):
+    """Filing content store on the local filesystem."""
+
+    def __init__(self, root: Optional[str] = None, compression_level: Optional[int] = None):
+        super().__init__(compression_level)
+        settings = get_settings()
+        self.root = Path(root) if root else settings.data_path(settings.FILING_CONTENT_DIR)
+
+    def _exists(self, key: str) -> bool:
+        return (self.root / key).exists()
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            return (self.root / key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, blob: bytes) -> None:
+        # Write then rename, so readers never see a partial blob
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class S3FilingContentStore(FilingContentStore):
+    """Filing content store in an S3-compatible bucket (MinIO)."""
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        bucket: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ):
+        super().__init__(compression_level)
+        settings = get_settings()
+        if client is None:
+            try:
+                from minio import Minio
+            except ImportError:
+                raise ImportError("minio required. Install with: pip install minio")
+            client = Minio(
+                settings.MINIO_ENDPOINT,
+                access_key=settings.MINIO_ACCESS_KEY.get_secret_value(),
+                secret_key=settings.MINIO_SECRET_KEY.get_secret_value(),
+                secure=settings.MINIO_SECURE,
+            )
+        self.client = client
+        self.bucket = bucket or settings.FILING_CONTENT_BUCKET
+        self._bucket_ready = False
+
+    @staticmethod
+    def _is_missing(error: Exception) -> bool:
+        return getattr(error, "code", None) in ("NoSuchKey", "NoSuchObject", "NoSuchBucket")
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self.client.stat_object(self.bucket, key)
+            return True
+        except Exception as e:
+            if self._is_missing(e):
+                return False
+            raise
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(self.bucket, key)
+        except Exception as e:
+            if self._is_missing(e):
+                return None
+            raise
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _write(self, key: str, blob: bytes) -> None:
+        if not self._bucket_ready:
+            if not self.client.bucket_exists(self.bucket):
+                self.client.make_bucket(self.bucket)
+            self._bucket_ready = True
+        self.client.put_object(
+            self.bucket, key, io.BytesIO(blob), length=len(blob),
+            content_type="application/octet-stream",
+        )
+
+
+_filing_content_store: Optional[FilingContentStore] = None
+
+
+def get_filing_content_store() -> FilingContentStore:
+    """Get the process-wide filing content store for FILING_CONTENT_BACKEND."""
+    global _filing_content_store
+
+    if _filing_content_store is None:
+        backend = get_settings().FILING_CONTENT_BACKEND
+        if backend == "local":
+            _filing_content_store = LocalFilingContentStore()
+        elif backend == "s3":
+            _filing_content_store = S3FilingContentStore()
+        else:
+            raise ValueError(f"Unknown FILING_CONTENT_BACKEND: {backend}. Choose from: local, s3")
+
+    return _filing_content_store
+
+
+async def offload_inline_text(
+    session_factory: Optional[Any] = None,
+    store: Optional[FilingContentStore] = None,
+    batch_size: int = 100,
+) -> int:
+    """Move filing text still stored in sec_filings.raw_text into the store.
+
+    Works in batches, committing each, so it can be interrupted and rerun.
+
+    Returns:
+        Number of filings moved
+    """
+    from sqlalchemy import select, update
+
+    from src.db.models import SECFiling
+
+    if session_factory is None:
+        from src.db.session import get_session_factory
+
+        session_factory = get_session_factory()
+    if store is None:
+        store = get_filing_content_store()
+
+    moved = 0
+    while True:
+        async with session_factory() as session:
+            result = await session.execute(
+                select(SECFiling.id, SECFiling.raw_text)
+                .where(SECFiling.content_hash.is_(None), SECFiling.raw_text.is_not(None))
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            for filing_id, text in rows:
+                digest = await store.put(text)
+                await session.execute(
+                    update(SECFiling)
+                    .where(SECFiling.id == filing_id)
+                    .values(content_hash=digest, raw_text=None)
+                )
+            await session.commit()
+
+        moved += len(rows)
+        logger.info(f"Moved {moved} filing texts into the content store")
+
+    return moved
+
+
+def main():
+    """Move inline filing text into the content store when executed as a script."""
+    asyncio.run(offload_inline_text())
+
+
+if __name__ == "__main__":
+    main()
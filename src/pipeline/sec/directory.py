@@ -0,0 +1,317 @@
+"""Process-wide SEC company directory (ticker <-> CIK).
+
+SEC publishes every registrant's tickers in one company_tickers.json file
+(about 10k entries). Downloading and inverting it per lookup made each stored
+filing cost a full directory fetch, so the directory is held once per process:
+
+- lookups in either direction are dict hits on indexes built once per refresh
+- a gzip snapshot on disk (SEC_COMPANY_DIRECTORY_PATH) serves cold starts
+  without a request
+- after SEC_COMPANY_DIRECTORY_TTL the file is revalidated with a conditional
+  GET (If-None-Match / If-Modified-Since), so an unchanged directory costs a
+  304 instead of the full body
+- if SEC is unreachable the last good copy keeps being served
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from src.core.config import get_settings
+
+
+@dataclass(frozen=True)
+class CompanyEntry:
+    """One row of the SEC company directory.
+
+    Attributes:
+        cik: Zero-padded 10-digit CIK
+        ticker: Upper-case ticker symbol
+        title: Registrant name as listed by SEC
+    """
+
+    cik: str
+    ticker: str
+    title: str
+
+
+def parse_company_tickers(data: Dict[str, Any]) -> List[CompanyEntry]:
+    """Parse SEC's company_tickers.json (entries keyed by row number)."""
+    entries = []
+    for item in data.values():
+        if isinstance(item, dict) and "ticker" in item and "cik_str" in item:
+            entries.append(CompanyEntry(
+                cik=str(item["cik_str"]).zfill(10),
+                ticker=item["ticker"].upper(),
+                title=item.get("title", ""),
+            ))
+    return entries
+
+
+class CompanyDirectory:
+    """Ticker/CIK directory with O(1) lookups, a disk snapshot and TTL refresh.
+
+    Lookups never do I/O; call ``ensure_fresh`` first to load the snapshot or
+    revalidate with SEC when the TTL has passed. Concurrent callers share one
+    refresh.
+
+    Usage:
+        directory = await get_company_directory().ensure_fresh(get_sec_client())
+        cik = directory.cik_for("DUOL")
+        ticker = directory.ticker_for(cik)
+    """
+
+    SNAPSHOT_VERSION = 1
+    # Wait this long before retrying SEC after a failed refresh
+    RETRY_INTERVAL = 300.0
+
+    def __init__(self, snapshot_path: Optional[str] = None, ttl: Optional[float] = None):
+        settings = get_settings()
+        if snapshot_path is None and settings.SEC_COMPANY_DIRECTORY_PATH:
+            snapshot_path = settings.data_path(settings.SEC_COMPANY_DIRECTORY_PATH)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.ttl = float(settings.SEC_COMPANY_DIRECTORY_TTL if ttl is None else ttl)
+
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at = 0.0  # Unix time of the last successful fetch or 304
+
+        self._entries: Tuple[CompanyEntry, ...] = ()
+        self._by_ticker: Dict[str, CompanyEntry] = {}
+        self._by_cik: Dict[str, Tuple[CompanyEntry, ...]] = {}
+        self._ticker_to_cik: Dict[str, str] = {}
+        self._snapshot_checked = False
+        self._retry_at = 0.0
+        self._attempts = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __len__(self) -> int:
+        return len(self._by_ticker)
+
+    def __iter__(self) -> Iterator[CompanyEntry]:
+        """Entries in SEC's order."""
+        return iter(self._entries)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether any directory data is available."""
+        return bool(self._by_ticker)
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        """Whether the TTL has passed since the last fetch."""
+        return (time.time() if now is None else now) - self.fetched_at >= self.ttl
+
+    # Lookups
+
+    def cik_for(self, ticker: str) -> Optional[str]:
+        """Zero-padded CIK for a ticker, or None."""
+        return self._ticker_to_cik.get(ticker.upper())
+
+    def ticker_for(self, cik: str) -> Optional[str]:
+        """Primary ticker for a CIK (the first SEC lists), or None."""
+        entries = self._by_cik.get(str(cik).zfill(10))
+        return entries[0].ticker if entries else None
+
+    def tickers_for(self, cik: str) -> Tuple[str, ...]:
+        """All tickers of a CIK, primary first."""
+        return tuple(entry.ticker for entry in self._by_cik.get(str(cik).zfill(10), ()))
+
+    def entry_for_ticker(self, ticker: str) -> Optional[CompanyEntry]:
+        return self._by_ticker.get(ticker.upper())
+
+    def entry_for_cik(self, cik: str) -> Optional[CompanyEntry]:
+        """Primary entry for a CIK, or None."""
+        entries = self._by_cik.get(str(cik).zfill(10))
+        return entries[0] if entries else None
+
+    def ticker_to_cik(self) -> Dict[str, str]:
+        """The ticker -> CIK index (shared; do not modify)."""
+        return self._ticker_to_cik
+
+    def _index(self, entries: Iterable[CompanyEntry]) -> None:
+        """Build new indexes and swap them in, so readers never see a partial state."""
+        entries = tuple(entries)
+        by_ticker: Dict[str, CompanyEntry] = {}
+        by_cik: Dict[str, List[CompanyEntry]] = {}
+        for entry in entries:
+            by_ticker.setdefault(entry.ticker, entry)
+            by_cik.setdefault(entry.cik, []).append(entry)
+
+        self._entries = entries
+        self._by_ticker = by_ticker
+        self._by_cik = {cik: tuple(group) for cik, group in by_cik.items()}
+        self._ticker_to_cik = {ticker: entry.cik for ticker, entry in by_ticker.items()}
+
+    # Refresh
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop (locks are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _needs_refresh(self) -> bool:
+        if time.monotonic() < self._retry_at:
+            return False
+        return not self.loaded or self.is_stale()
+
+    async def ensure_fresh(self, client: Any) -> "CompanyDirectory":
+        """Load the snapshot on first use and revalidate once the TTL has passed.
+
+        Args:
+            client: SECAPIClient used for the conditional GET
+
+        Returns:
+            The directory itself, for chaining
+        """
+        if not self._snapshot_checked:
+            self._snapshot_checked = True
+            self.load_snapshot()
+
+        if not self._needs_refresh():
+            return self
+
+        attempts = self._attempts
+        async with self._get_lock():
+            # Waiters share the result of a refresh made while they queued,
+            # failed or not
+            if self._attempts == attempts:
+                await self.refresh(client)
+                self._attempts += 1
+        return self
+
+    async def refresh(self, client: Any) -> bool:
+        """Revalidate the directory with SEC.
+
+        Sends the stored validators, so an unchanged directory answers 304.
+        Errors are logged and the current copy is kept.
+
+        Returns:
+            True if new directory data was loaded
+        """
+        headers = {}
+        if self.loaded:
+            if self.etag:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+
+        try:
+            response = await client.get_company_tickers(headers=headers)
+
+            if response.status_code == 304:
+                logger.debug("SEC company directory unchanged (304)")
+                self.fetched_at = time.time()
+                self.save_snapshot()
+                return False
+
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}")
+
+            entries = parse_company_tickers(response.json())
+
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+            if self.loaded:
+                logger.warning(f"Failed to refresh SEC company directory, serving cached copy: {e}")
+            else:
+                logger.error(f"Failed to fetch SEC company directory: {e}")
+            return False
+
+        self._index(entries)
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.fetched_at = time.time()
+        logger.info(f"Loaded {len(self)} ticker-to-CIK mappings from SEC")
+        self.save_snapshot()
+        return True
+
+    # Snapshot
+
+    def load_snapshot(self) -> bool:
+        """Load the on-disk snapshot if there is a readable one.
+
+        Returns:
+            True if directory data was loaded
+        """
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return False
+
+        try:
+            with gzip.open(self.snapshot_path, "rt", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") != self.SNAPSHOT_VERSION:
+                logger.info(f"Ignoring SEC company directory snapshot with version {snapshot.get('version')}")
+                return False
+            entries = [
+                CompanyEntry(cik=str(cik).zfill(10), ticker=ticker, title=title)
+                for cik, ticker, title in zip(snapshot["ciks"], snapshot["tickers"], snapshot["titles"])
+            ]
+        except Exception as e:
+            logger.warning(f"Could not read SEC company directory snapshot {self.snapshot_path}: {e}")
+            return False
+
+        self._index(entries)
+        self.etag = snapshot.get("etag")
+        self.last_modified = snapshot.get("last_modified")
+        self.fetched_at = float(snapshot.get("fetched_at", 0.0))
+        logger.info(f"Loaded {len(self)} ticker-to-CIK mappings from {self.snapshot_path}")
+        return True
+
+    def save_snapshot(self) -> None:
+        """Write the directory to disk atomically (no-op without a snapshot path).
+
+        Entries are stored column-wise with integer CIKs, in SEC's order so
+        which ticker is primary survives the round trip.
+        """
+        if self.snapshot_path is None or not self.loaded:
+            return
+
+        entries = self._entries
+        snapshot = {
+            "version": self.SNAPSHOT_VERSION,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched_at": self.fetched_at,
+            "ciks": [int(entry.cik) for entry in entries],
+            "tickers": [entry.ticker for entry in entries],
+            "titles": [entry.title for entry in entries],
+        }
+
+        tmp_path = None
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.snapshot_path.parent, prefix=f".{self.snapshot_path.name}."
+            )
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(snapshot, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            logger.warning(f"Could not write SEC company directory snapshot {self.snapshot_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+_company_directory: Optional[CompanyDirectory] = None
+
+
+def get_company_directory() -> CompanyDirectory:
+    """Get the process-wide SEC company directory."""
+    global _company_directory
+
+    if _company_directory is None:
+        _company_directory = CompanyDirectory()
+
+    return _company_directory
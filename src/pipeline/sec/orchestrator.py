@@ -3,7 +3,7 @@
 import asyncio
 import hashlib
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -34,18 +34,27 @@ except ImportError:
     PREFECT_AVAILABLE = False
     logger.warning("Prefect not available - flows will run as regular functions")
 
-from src.pipeline.sec.client import SECAPIClient
-from src.pipeline.sec.parser import classify_edtech_company, validate_filing_data
+from src.pipeline.sec.client import close_sec_client, get_sec_client
+from src.pipeline.sec.parser import classify_edtech_company, validate_filings_batch
 from src.pipeline.sec.processor import store_filing
+from src.pipeline.sec.sync import FilingSync, SyncPlan, newest_first
 
 
 class FilingRequest(BaseModel):
-    """SEC filing request model."""
+    """SEC filing request model.
+
+    With ``incremental`` (the default) only filings not stored yet are
+    downloaded. Either way at most ``max_filings`` are downloaded per run,
+    newest first; with ``incremental`` a backlog larger than that is worked
+    off, newest to oldest, over consecutive runs.
+    """
 
     company_ticker: str
     filing_types: List[str] = Field(default=["10-K", "10-Q", "8-K"])
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+    incremental: bool = True
+    max_filings: Optional[int] = 10
 
 
 @task(
@@ -56,7 +65,7 @@ class FilingRequest(BaseModel):
 )
 async def fetch_company_data(ticker: str) -> Dict[str, Any]:
     """Fetch company data from SEC EDGAR."""
-    client = SECAPIClient()
+    client = get_sec_client()
 
     logger.info(f"Fetching company data for {ticker}")
     company_info = await client.get_company_info(ticker)
@@ -81,7 +90,7 @@ async def fetch_filings(
     start_date: Optional[datetime] = None
 ) -> List[Dict[str, Any]]:
     """Fetch SEC filings for a company."""
-    client = SECAPIClient()
+    client = get_sec_client()
 
     logger.info(f"Fetching filings for CIK {cik}: {filing_types}")
     filings = await client.get_filings(cik, filing_types, start_date)
@@ -90,10 +99,22 @@ async def fetch_filings(
     return filings
 
 
+@task(retries=3, retry_delay_seconds=60)
+async def plan_filing_sync(cik: str, filings: List[Dict[str, Any]]) -> SyncPlan:
+    """Drop filings already stored before anything is downloaded."""
+    return await FilingSync().plan(cik, filings)
+
+
+@task(retries=3, retry_delay_seconds=60)
+async def record_filing_sync(plan: SyncPlan, handled: Set[str]) -> Dict[str, Any]:
+    """Advance the sync cursors past the filings this run handled."""
+    return await FilingSync().record(plan, handled)
+
+
 @task(retries=2, retry_delay_seconds=120)
 async def download_filing(filing: Dict[str, Any]) -> Dict[str, Any]:
     """Download and process a single filing."""
-    client = SECAPIClient()
+    client = get_sec_client()
 
     logger.info(f"Downloading filing: {filing['accessionNumber']}")
     content = await client.download_filing_content(filing)
@@ -136,19 +157,36 @@ async def sec_ingestion_flow(request: FilingRequest):
         request.start_date
     )
 
+    # Skip filings already stored before downloading anything
+    plan = None
+    candidates = filings
+    if request.incremental:
+        plan = await plan_filing_sync(company_data["cik"], filings)
+        candidates = plan.to_download
+    candidates = newest_first(candidates, request.max_filings)
+
     # Download filings in parallel (with concurrency limit)
     download_tasks = []
-    for filing in filings[:10]:  # Limit for testing
+    for filing in candidates:
         download_tasks.append(download_filing(filing))
 
     downloaded_filings = await asyncio.gather(*download_tasks)
 
     # Validate and store filings
     stored_count = 0
-    for filing_data in downloaded_filings:
-        if validate_filing_data(filing_data):
+    handled: Set[str] = set()
+    validity = validate_filings_batch(list(downloaded_filings))
+    for filing_data, is_valid in zip(downloaded_filings, validity):
+        if is_valid:
             await store_filing(filing_data, company_data["cik"])
             stored_count += 1
+            handled.add(filing_data["accessionNumber"])
+        elif filing_data.get("content"):
+            # Downloaded but invalid: fetching it again will not help
+            handled.add(filing_data["accessionNumber"])
+
+    if plan is not None:
+        await record_filing_sync(plan, handled)
 
     logger.info(f"Successfully stored {stored_count} filings for {request.company_ticker}")
 
@@ -156,6 +194,8 @@ async def sec_ingestion_flow(request: FilingRequest):
         "ticker": request.company_ticker,
         "cik": company_data["cik"],
         "filings_found": len(filings),
+        "filings_skipped": plan.skipped if plan is not None else 0,
+        "filings_downloaded": len(candidates),
         "filings_stored": stored_count,
     }
 
@@ -164,9 +204,19 @@ async def sec_ingestion_flow(request: FilingRequest):
     name="batch-sec-ingestion",
     description="Batch ingestion for multiple EdTech companies",
 )
-async def batch_sec_ingestion_flow(tickers: List[str]):
-    """Batch process multiple companies."""
-    logger.info(f"Starting batch SEC ingestion for {len(tickers)} companies")
+async def batch_sec_ingestion_flow(tickers: List[str], max_concurrency: int = 5):
+    """Batch process multiple companies.
+
+    Companies are ingested concurrently, at most ``max_concurrency`` at a time.
+    All of them share one pooled SEC client and one rate limiter, so the run as
+    a whole stays within SEC_RATE_LIMIT no matter how many run in parallel. A
+    failure for one ticker is logged and recorded as None without aborting the
+    rest of the batch.
+    """
+    logger.info(
+        f"Starting batch SEC ingestion for {len(tickers)} companies "
+        f"(max_concurrency={max_concurrency})"
+    )
 
     # Create filing requests
     requests = [
@@ -178,10 +228,27 @@ async def batch_sec_ingestion_flow(tickers: List[str]):
     ]
 
     # Process in parallel with limited concurrency
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run_one(request: FilingRequest):
+        async with semaphore:
+            return await sec_ingestion_flow(request)
+
+    try:
+        outcomes = await asyncio.gather(
+            *(run_one(request) for request in requests),
+            return_exceptions=True,
+        )
+    finally:
+        await close_sec_client()
+
     results = []
-    for request in requests:
-        result = await sec_ingestion_flow(request)
-        results.append(result)
+    for request, outcome in zip(requests, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"SEC ingestion failed for {request.company_ticker}: {outcome}")
+            results.append(None)
+        else:
+            results.append(outcome)
 
     # Summary
     total_filings = sum(r.get("filings_stored", 0) for r in results if r)
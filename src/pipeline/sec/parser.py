@@ -1,6 +1,6 @@
 """SEC filing data validation and parsing."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pandas as pd
 from great_expectations.core.batch import RuntimeBatchRequest
@@ -23,6 +23,18 @@ from great_expectations.data_context.types.base import (
     InMemoryStoreBackendDefaults,
 )
 
+from src.validation.filing_validator import (
+    FILING_DATE_FORMAT,
+    MIN_CONTENT_LENGTH,
+    NOT_NULL_COLUMNS,
+    OPTIONAL_NOT_NULL_COLUMNS,
+    REGEX_RULES,
+    REQUIRED_COLUMNS,
+    STRING_COLUMNS,
+    VALID_FORM_TYPES,
+    get_filing_validator,
+)
+
 # Make Prefect optional for testing environments
 try:
     from prefect import task
@@ -38,8 +50,8 @@ except ImportError:
 
 
 @task
-def validate_filing_data(filing_data: Dict[str, Any]) -> bool:
-    """Validate filing data using Great Expectations.
+def validate_filing_data(filing_data: Dict[str, Any], audit: bool = False) -> bool:
+    """Validate filing data against the SEC filing rule set.
 
     Validates:
     - Required column presence
@@ -48,7 +60,56 @@ def validate_filing_data(filing_data: Dict[str, Any]) -> bool:
     - Value constraints (dates, non-null fields)
     - Content quality checks
 
-    Returns True if validation passes or if GX is not available.
+    Rules are evaluated by the compiled FilingValidator. With ``audit=True``
+    the filing is also run through the equivalent Great Expectations suite
+    and any disagreement is logged; the compiled verdict is returned.
+    """
+    accession_number = filing_data.get("accessionNumber", "unknown")
+    failures = get_filing_validator().check(filing_data)
+
+    if failures:
+        logger.warning(f"Filing validation failed for {accession_number}")
+        for failure in failures:
+            logger.warning(f"Failed expectation: {failure}")
+    else:
+        logger.info(f"Filing validation passed for {accession_number}")
+
+    valid = not failures
+    if audit:
+        audited = audit_filing_data(filing_data)
+        if audited != valid:
+            logger.warning(
+                f"Great Expectations audit disagrees for {accession_number}: "
+                f"compiled={valid}, gx={audited}"
+            )
+    return valid
+
+
+@task
+def validate_filings_batch(filings: List[Dict[str, Any]]) -> List[bool]:
+    """Validate many filings in one DataFrame pass.
+
+    Returns one flag per filing, in input order.
+    """
+    results = get_filing_validator().validate_many(filings)
+
+    failed = [
+        filing.get("accessionNumber", "unknown")
+        for filing, valid in zip(filings, results)
+        if not valid
+    ]
+    if failed:
+        logger.warning(f"Filing validation failed for {len(failed)}/{len(filings)} filings: {failed[:10]}")
+    logger.info(f"Validated {len(filings)} filings, {len(filings) - len(failed)} passed")
+    return results
+
+
+def audit_filing_data(filing_data: Dict[str, Any]) -> bool:
+    """Validate one filing with Great Expectations (slow audit path).
+
+    Builds an in-memory GX context and runs the same rule set as
+    FilingValidator. Returns True if validation passes or if GX is not
+    available.
     """
     try:
         # Convert filing data to DataFrame for GE validation
@@ -80,85 +141,38 @@ def validate_filing_data(filing_data: Dict[str, Any]) -> bool:
         )
 
         # 1. Column Presence Expectations
-        required_columns = [
-            "accessionNumber",
-            "form",
-            "filingDate",
-            "cik",
-            "content",
-            "content_hash",
-            "downloaded_at",
-        ]
-
-        for column in required_columns:
+        for column in REQUIRED_COLUMNS:
             validator.expect_column_to_exist(column=column)
 
         # 2. Data Type Validations
-        validator.expect_column_values_to_be_of_type(
-            column="accessionNumber", type_="str"
-        )
-        validator.expect_column_values_to_be_of_type(column="form", type_="str")
-        validator.expect_column_values_to_be_of_type(column="cik", type_="str")
-        validator.expect_column_values_to_be_of_type(column="content", type_="str")
-        validator.expect_column_values_to_be_of_type(
-            column="content_hash", type_="str"
-        )
+        for column in STRING_COLUMNS:
+            validator.expect_column_values_to_be_of_type(column=column, type_="str")
 
         # 3. Format Validations using Regex
-
-        # CIK format: numeric string, 1-10 digits
-        validator.expect_column_values_to_match_regex(
-            column="cik",
-            regex=r"^\d{1,10}$",
-            meta={"description": "CIK must be 1-10 digit numeric string"},
-        )
-
-        # Accession number format: NNNNNNNNNN-NN-NNNNNN
-        validator.expect_column_values_to_match_regex(
-            column="accessionNumber",
-            regex=r"^\d{10}-\d{2}-\d{6}$",
-            meta={"description": "Accession number format must be NNNNNNNNNN-NN-NNNNNN"},
-        )
+        for column, regex, description in REGEX_RULES:
+            validator.expect_column_values_to_match_regex(
+                column=column,
+                regex=regex,
+                meta={"description": description},
+            )
 
         # Form type validation: Common SEC form types
-        valid_form_types = [
-            "10-K", "10-Q", "8-K", "10-K/A", "10-Q/A", "8-K/A",
-            "S-1", "S-3", "S-4", "S-8", "DEF 14A", "SC 13D", "SC 13G",
-            "4", "3", "5", "144"
-        ]
         validator.expect_column_values_to_be_in_set(
             column="form",
-            value_set=valid_form_types,
+            value_set=sorted(VALID_FORM_TYPES),
             meta={"description": "Form type must be valid SEC form"},
         )
 
-        # Filing date format: YYYY-MM-DD
-        validator.expect_column_values_to_match_regex(
-            column="filingDate",
-            regex=r"^\d{4}-\d{2}-\d{2}$",
-            meta={"description": "Filing date must be in YYYY-MM-DD format"},
-        )
-
-        # Content hash format: SHA-256 hex (64 characters)
-        validator.expect_column_values_to_match_regex(
-            column="content_hash",
-            regex=r"^[a-f0-9]{64}$",
-            meta={"description": "Content hash must be valid SHA-256 hex"},
-        )
-
         # 4. Value Constraints
 
         # Non-null validations for critical fields
-        validator.expect_column_values_to_not_be_null(column="accessionNumber")
-        validator.expect_column_values_to_not_be_null(column="form")
-        validator.expect_column_values_to_not_be_null(column="filingDate")
-        validator.expect_column_values_to_not_be_null(column="cik")
-        validator.expect_column_values_to_not_be_null(column="content")
+        for column in NOT_NULL_COLUMNS:
+            validator.expect_column_values_to_not_be_null(column=column)
 
         # Content length validation: minimum 100 characters
         validator.expect_column_value_lengths_to_be_between(
             column="content",
-            min_value=100,
+            min_value=MIN_CONTENT_LENGTH,
             max_value=None,
             meta={"description": "Filing content must be at least 100 characters"},
         )
@@ -166,12 +180,13 @@ def validate_filing_data(filing_data: Dict[str, Any]) -> bool:
         # Filing date range validation: not in future, not too old (e.g., after 1990)
         validator.expect_column_values_to_match_strftime_format(
             column="filingDate",
-            strftime_format="%Y-%m-%d",
+            strftime_format=FILING_DATE_FORMAT,
         )
 
         # Additional quality checks
-        if "primaryDocument" in filing_data:
-            validator.expect_column_values_to_not_be_null(column="primaryDocument")
+        for column in OPTIONAL_NOT_NULL_COLUMNS:
+            if column in filing_data:
+                validator.expect_column_values_to_not_be_null(column=column)
 
         # 5. Execute validation
         validation_result = validator.validate()
@@ -1,9 +1,9 @@
 """SEC filing data processing and storage."""
 
+import asyncio
 from datetime import datetime
 from typing import Any, Dict
 
-import httpx
 from loguru import logger
 
 # Make Prefect optional for testing environments
@@ -20,7 +20,9 @@ except ImportError:
     PREFECT_AVAILABLE = False
 
 from src.db.models import Company, SECFiling
-from src.pipeline.sec.client import SECAPIClient
+from src.pipeline.sec.client import get_sec_client
+from src.pipeline.sec.content_store import get_filing_content_store
+from src.pipeline.sec.sections import parse_filing_sections
 
 
 async def get_or_create_company(session, company_cik: str, filing_data: Dict[str, Any]) -> Company:
@@ -57,12 +59,11 @@ async def get_or_create_company(session, company_cik: str, filing_data: Dict[str
     ticker = filing_data.get("ticker")
 
     # Try to get SEC company info for proper name and ticker
-    client = SECAPIClient()
-    ticker_mapping = await client.get_ticker_to_cik_mapping()
+    client = get_sec_client()
+    directory = await client.directory.ensure_fresh(client)
 
-    # Reverse lookup: find ticker for this CIK
-    cik_to_ticker = {v: k for k, v in ticker_mapping.items()}
-    mapped_ticker = cik_to_ticker.get(company_cik.zfill(10))
+    # Reverse lookup: find the primary ticker for this CIK
+    mapped_ticker = directory.ticker_for(company_cik)
 
     if mapped_ticker:
         # Check if company exists with this ticker
@@ -87,18 +88,13 @@ async def get_or_create_company(session, company_cik: str, filing_data: Dict[str
     if not company_name or company_name.startswith("Company CIK"):
         try:
             # Fetch company submissions to get proper name
-            company_info_url = f"{client.BASE_URL}/submissions/CIK{company_cik.zfill(10)}.json"
-            await client.rate_limiter.acquire()
-
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.get(company_info_url, headers=client.headers)
-                if response.status_code == 200:
-                    company_info = response.json()
-                    company_name = company_info.get("name", f"Company CIK {company_cik}")
-                    logger.info(f"Retrieved company name from SEC: {company_name}")
-                else:
-                    company_name = f"Company CIK {company_cik}"
-                    logger.warning(f"Could not retrieve company name from SEC for CIK {company_cik}")
+            company_info = await client.get_company_submissions(company_cik)
+            if company_info is not None:
+                company_name = company_info.get("name", f"Company CIK {company_cik}")
+                logger.info(f"Retrieved company name from SEC: {company_name}")
+            else:
+                company_name = f"Company CIK {company_cik}"
+                logger.warning(f"Could not retrieve company name from SEC for CIK {company_cik}")
         except Exception as e:
             logger.warning(f"Error fetching company name from SEC: {e}")
             company_name = f"Company CIK {company_cik}"
@@ -122,6 +118,10 @@ async def get_or_create_company(session, company_cik: str, filing_data: Dict[str
 async def store_filing(filing_data: Dict[str, Any], company_cik: str) -> str:
     """Store filing in database with company lookup/creation and duplicate detection.
 
+    The filing text goes to the filing content store; the row records its
+    content hash. Identical documents are stored once. The Item sections of
+    10-K and 10-Q filings are indexed into parsed_sections.
+
     Args:
         filing_data: Filing information including content and metadata
         company_cik: Company CIK number for lookup/creation
@@ -175,14 +175,27 @@ async def store_filing(filing_data: Dict[str, Any], company_cik: str) -> str:
             else:
                 raise ValueError(f"Invalid filing date format: {filing_date_str}")
 
-            # 4. Create SECFiling record
+            # 4. Store the text (a no-op if an identical document is stored)
+            content_hash = await get_filing_content_store().put(filing_data["content"] or "")
+
+            # 5. Index Item sections once so later stages read only what they need
+            parsed_sections = None
+            try:
+                parsed_sections = await asyncio.to_thread(
+                    parse_filing_sections, filing_data["content"] or "", filing_data["form"]
+                )
+            except Exception as e:
+                logger.warning(f"Could not index sections of filing {accession_number}: {e}")
+
+            # 6. Create SECFiling record
             filing = SECFiling(
                 company_id=company.id,
                 filing_type=filing_data["form"],
                 filing_date=filing_date,
                 accession_number=accession_number,
                 filing_url=filing_data.get("filing_url", ""),
-                raw_text=filing_data.get("content", ""),
+                content_hash=content_hash,
+                parsed_sections=parsed_sections,
                 processing_status="pending",
             )
 
@@ -198,7 +211,7 @@ async def store_filing(filing_data: Dict[str, Any], company_cik: str) -> str:
 
             session.add(filing)
 
-            # 5. Commit transaction
+            # 7. Commit transaction
             await session.commit()
 
             logger.info(
@@ -0,0 +1,398 @@
+"""Item-section index for 10-K and 10-Q filings.
+
+Downstream stages (metric extraction, chunking, embeddings) mostly need one
+or two Items, such as MD&A or Risk Factors, yet used to convert and scan the
+whole multi-MB HTML document. The index is built once at ingestion and
+stored in SECFiling.parsed_sections:
+
+    {
+        "version": 1,
+        "form": "10-K",
+        "format": "html",
+        "text_length": 412345,
+        "sections": {
+            "item_7": {"title": "Management's Discussion ...", "start": 1804211,
+                       "end": 2391533, "length": 98211},
+            ...
+        }
+    }
+
+``start``/``end`` are character offsets into the stored document (the raw
+HTML), so a later stage converts only ``document[start:end]`` with
+``section_text``. ``length`` is the section's plain-text size.
+
+HTML is converted in a single regex pass over tags rather than through a DOM,
+and offsets into the extracted text are mapped back to the document through
+the position of each text run.
+"""
+
+import re
+from bisect import bisect_right
+from html import unescape
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+SECTIONS_VERSION = 1
+
+# 10-K Items by number
+TEN_K_ITEMS = {
+    "1": "Business",
+    "1A": "Risk Factors",
+    "1B": "Unresolved Staff Comments",
+    "1C": "Cybersecurity",
+    "2": "Properties",
+    "3": "Legal Proceedings",
+    "4": "Mine Safety Disclosures",
+    "5": "Market for Registrant's Common Equity, Related Stockholder Matters "
+         "and Issuer Purchases of Equity Securities",
+    "6": "[Reserved]",
+    "7": "Management's Discussion and Analysis of Financial Condition and Results of Operations",
+    "7A": "Quantitative and Qualitative Disclosures About Market Risk",
+    "8": "Financial Statements and Supplementary Data",
+    "9": "Changes in and Disagreements with Accountants on Accounting and Financial Disclosure",
+    "9A": "Controls and Procedures",
+    "9B": "Other Information",
+    "9C": "Disclosure Regarding Foreign Jurisdictions that Prevent Inspections",
+    "10": "Directors, Executive Officers and Corporate Governance",
+    "11": "Executive Compensation",
+    "12": "Security Ownership of Certain Beneficial Owners and Management "
+          "and Related Stockholder Matters",
+    "13": "Certain Relationships and Related Transactions, and Director Independence",
+    "14": "Principal Accountant Fees and Services",
+    "15": "Exhibits and Financial Statement Schedules",
+    "16": "Form 10-K Summary",
+}
+
+# 10-Q Items by (part, number); Item numbers restart in Part II
+TEN_Q_ITEMS = {
+    (1, "1"): "Financial Statements",
+    (1, "2"): "Management's Discussion and Analysis of Financial Condition and Results of Operations",
+    (1, "3"): "Quantitative and Qualitative Disclosures About Market Risk",
+    (1, "4"): "Controls and Procedures",
+    (2, "1"): "Legal Proceedings",
+    (2, "1A"): "Risk Factors",
+    (2, "2"): "Unregistered Sales of Equity Securities and Use of Proceeds",
+    (2, "3"): "Defaults Upon Senior Securities",
+    (2, "4"): "Mine Safety Disclosures",
+    (2, "5"): "Other Information",
+    (2, "6"): "Exhibits",
+}
+
+# Section names that mean the same thing across form types
+SECTION_ALIASES = {
+    "mdna": {"10-K": "item_7", "10-Q": "part1_item_2"},
+    "risk_factors": {"10-K": "item_1a", "10-Q": "part2_item_1a"},
+    "market_risk": {"10-K": "item_7a", "10-Q": "part1_item_3"},
+    "financial_statements": {"10-K": "item_8", "10-Q": "part1_item_1"},
+}
+
+# Headings are short lines; longer lines starting with "Item 7" are
+# cross-references in running text and only used when nothing shorter matches
+MAX_HEADING_LINE = 200
+
+_ROMAN = {"i": 1, "ii": 2, "iii": 3, "iv": 4}
+
+_TOKEN = re.compile(
+    r"<!--.*?-->|<(/?)([A-Za-z][\w:.-]*)[^>]*>|<![^>]*>|<\?[^>]*>",
+    re.S,
+)
+_HTML_HINT = re.compile(r"<(?:html|body|div|p|table|font|span)\b", re.I)
+_SPACES = re.compile(r"[ \t\r\n\f\v\xa0\u200b]+")
+_HEADING = re.compile(
+    r"^[ \t]*(?:"
+    r"part[ \t]+(?P<part>iv|i{1,3})\b(?:[^\w\n]*item[ \t]+(?P<part_item>\d{1,2}[a-c]?)\b)?"
+    r"|item[ \t]+(?P<item>\d{1,2}[a-c]?)\b"
+    r")",
+    re.I | re.M,
+)
+
+_BLOCK_TAGS = frozenset({
+    "p", "div", "br", "tr", "li", "ul", "ol", "table", "title", "section",
+    "article", "header", "footer", "blockquote", "pre", "hr", "dt", "dd",
+    "h1", "h2", "h3", "h4", "h5", "h6", "document", "page",
+})
+_CELL_TAGS = frozenset({"td", "th"})
+# Content of these is never text (ix:header holds hidden inline XBRL facts)
+_SKIP_TAGS = frozenset({"script", "style", "head", "ix:header"})
+
+
+def form_family(form_type: str) -> Optional[str]:
+    """"10-K" or "10-Q" for forms with an Item structure (amendments included)."""
+    form = form_type.upper()
+    if form.startswith("10-K"):
+        return "10-K"
+    if form.startswith("10-Q"):
+        return "10-Q"
+    return None
+
+
+def is_html(document: str) -> bool:
+    return _HTML_HINT.search(document, 0, 10_000) is not None
+
+
+def _convert(document: str) -> Tuple[str, List[int], List[int]]:
+    """Convert HTML to text with one line per block element.
+
+    Returns:
+        Text plus parallel lists of text offsets and document offsets, one
+        pair per text run, for mapping text positions back to the document
+    """
+    pieces: List[str] = []
+    text_offsets: List[int] = []
+    raw_offsets: List[int] = []
+    length = 0
+    at_line_start = True
+    skipping: Optional[str] = None
+    position = 0
+
+    def emit_text(run: str, raw_start: int) -> None:
+        nonlocal length, at_line_start
+        if run.isspace():
+            run = " "
+        else:
+            if "&" in run:
+                run = unescape(run)
+            run = _SPACES.sub(" ", run)
+        if at_line_start:
+            run = run.lstrip(" ")
+        if not run:
+            return
+        text_offsets.append(length)
+        raw_offsets.append(raw_start)
+        pieces.append(run)
+        length += len(run)
+        at_line_start = False
+
+    def emit_break(separator: str) -> None:
+        nonlocal length, at_line_start
+        if at_line_start:
+            return
+        if pieces[-1].endswith(" "):
+            if separator == " ":
+                return
+            stripped = pieces[-1].rstrip(" ")
+            length -= len(pieces[-1]) - len(stripped)
+            pieces[-1] = stripped
+        pieces.append(separator)
+        length += 1
+        at_line_start = separator == "\n"
+
+    for match in _TOKEN.finditer(document):
+        if skipping is None and match.start() > position:
+            emit_text(document[position:match.start()], position)
+        position = match.end()
+
+        name = match.group(2)
+        if name is None:
+            continue
+        name = name.lower()
+        closing = match.group(1) == "/"
+        if skipping is not None:
+            if closing and name == skipping:
+                skipping = None
+            continue
+        if name in _SKIP_TAGS and not closing and not match.group(0).endswith("/>"):
+            skipping = name
+        elif name in _BLOCK_TAGS:
+            emit_break("\n")
+        elif name in _CELL_TAGS and closing:
+            emit_break(" ")
+
+    if skipping is None and position < len(document):
+        emit_text(document[position:], position)
+
+    return "".join(pieces), text_offsets, raw_offsets
+
+
+def html_to_text(document: str) -> str:
+    """Plain text of an HTML document, one line per block element."""
+    return _convert(document)[0]
+
+
+def _document_text(document: str) -> Tuple[str, str, Optional[Tuple[List[int], List[int]]]]:
+    """(format, text, offset map or None when text offsets are document offsets)"""
+    if is_html(document):
+        text, text_offsets, raw_offsets = _convert(document)
+        return "html", text, (text_offsets, raw_offsets)
+    return "text", document, None
+
+
+def _to_document_offset(
+    position: int,
+    offsets: Optional[Tuple[List[int], List[int]]],
+    text_length: int,
+    document_length: int,
+) -> int:
+    """Document offset of the text run containing ``position``."""
+    if offsets is None:
+        return position
+    if position >= text_length:
+        return document_length
+    text_offsets, raw_offsets = offsets
+    index = bisect_right(text_offsets, position) - 1
+    return raw_offsets[index] if index >= 0 else 0
+
+
+def _find_headings(text: str, family: str) -> Tuple[List[Tuple[int, str, bool]], List[int]]:
+    """Candidate Item headings and Part heading positions, in text order.
+
+    Returns:
+        (position, section key, is short line) per Item heading, and the
+        positions of short Part headings
+    """
+    items: List[Tuple[int, str, bool]] = []
+    parts: List[int] = []
+    part = 1
+
+    for match in _HEADING.finditer(text):
+        line_end = text.find("\n", match.start())
+        short = (len(text) if line_end < 0 else line_end) - match.start() <= MAX_HEADING_LINE
+
+        if match.group("part"):
+            part = _ROMAN[match.group("part").lower()]
+            if short:
+                parts.append(match.start())
+        number = (match.group("part_item") or match.group("item") or "").upper()
+        if not number:
+            continue
+
+        if family == "10-K" and number in TEN_K_ITEMS:
+            items.append((match.start(), f"item_{number.lower()}", short))
+        elif family == "10-Q" and (part, number) in TEN_Q_ITEMS:
+            items.append((match.start(), f"part{part}_item_{number.lower()}", short))
+
+    return items, parts
+
+
+def _section_keys(family: str) -> List[str]:
+    """Section keys in the order the form lays them out."""
+    if family == "10-K":
+        return [f"item_{number.lower()}" for number in TEN_K_ITEMS]
+    return [f"part{part}_item_{number.lower()}" for part, number in TEN_Q_ITEMS]
+
+
+def _title(family: str, key: str) -> str:
+    if family == "10-K":
+        return TEN_K_ITEMS[key[len("item_"):].upper()]
+    part, number = key[len("part"):].split("_item_")
+    return TEN_Q_ITEMS[(int(part), number.upper())]
+
+
+def _longest_increasing(values: List[int]) -> List[int]:
+    """Indexes of a longest strictly increasing subsequence."""
+    lengths = [1] * len(values)
+    previous = [-1] * len(values)
+    for i in range(len(values)):
+        for j in range(i):
+            if values[j] < values[i] and lengths[j] + 1 > lengths[i]:
+                lengths[i], previous[i] = lengths[j] + 1, j
+    index = max(range(len(values)), key=lengths.__getitem__, default=-1)
+    chain = []
+    while index >= 0:
+        chain.append(index)
+        index = previous[index]
+    return chain[::-1]
+
+
+def _select_headings(items: List[Tuple[int, str, bool]], family: str) -> Dict[str, int]:
+    """Pick one heading per section.
+
+    The table of contents lists every Item before the body does, so each
+    section starts with its last candidate, short lines preferred over
+    cross-references. Sections whose last candidate is out of form order
+    (a later reference to the Item) take their latest candidate that fits
+    between the neighbouring sections instead, or are left out.
+    """
+    every: Dict[str, List[int]] = {}
+    short_lines: Dict[str, List[int]] = {}
+    for position, key, short in items:
+        every.setdefault(key, []).append(position)
+        if short:
+            short_lines.setdefault(key, []).append(position)
+    candidates = {key: short_lines.get(key, positions) for key, positions in every.items()}
+
+    keys = [key for key in _section_keys(family) if key in candidates]
+    latest = [candidates[key][-1] for key in keys]
+    chosen = {keys[i]: latest[i] for i in _longest_increasing(latest)}
+
+    for index, key in enumerate(keys):
+        if key in chosen:
+            continue
+        low = max((chosen[k] for k in keys[:index] if k in chosen), default=-1)
+        high = min((chosen[k] for k in keys[index + 1:] if k in chosen), default=float("inf"))
+        fitting = [position for position in candidates[key] if low < position < high]
+        if fitting:
+            chosen[key] = fitting[-1]
+
+    return chosen
+
+
+def parse_filing_sections(document: str, form_type: str) -> Optional[Dict[str, Any]]:
+    """Index the Item sections of a 10-K or 10-Q.
+
+    Args:
+        document: Filing document as downloaded (HTML or plain text)
+        form_type: SEC form type, e.g. "10-K" or "10-Q/A"
+
+    Returns:
+        Section index for SECFiling.parsed_sections, or None for form types
+        without Items
+    """
+    family = form_family(form_type)
+    if family is None or not document:
+        return None
+
+    doc_format, text, offsets = _document_text(document)
+    items, parts = _find_headings(text, family)
+    starts = sorted((position, key) for key, position in _select_headings(items, family).items())
+    boundaries = sorted({position for position, _ in starts} | set(parts))
+
+    sections = {}
+    for position, key in starts:
+        index = bisect_right(boundaries, position)
+        text_end = boundaries[index] if index < len(boundaries) else len(text)
+        sections[key] = {
+            "title": _title(family, key),
+            "start": _to_document_offset(position, offsets, len(text), len(document)),
+            "end": _to_document_offset(text_end, offsets, len(text), len(document)),
+            "length": text_end - position,
+        }
+
+    if not sections:
+        logger.warning(f"No Item sections found in {form_type} document")
+
+    return {
+        "version": SECTIONS_VERSION,
+        "form": family,
+        "format": doc_format,
+        "text_length": len(text),
+        "sections": sections,
+    }
+
+
+def resolve_section(parsed_sections: Dict[str, Any], name: str) -> Optional[str]:
+    """Section key for a key or alias such as "mdna", or None if not indexed."""
+    key = SECTION_ALIASES.get(name, {}).get(parsed_sections.get("form"), name)
+    return key if key in parsed_sections.get("sections", {}) else None
+
+
+def section_text(document: str, parsed_sections: Dict[str, Any], name: str) -> Optional[str]:
+    """Plain text of one indexed section, converting only its slice of the document.
+
+    Args:
+        document: The document the index was built from
+        parsed_sections: SECFiling.parsed_sections
+        name: Section key (e.g. "item_7") or alias (e.g. "mdna")
+
+    Returns:
+        Section text, or None if the section was not found
+    """
+    key = resolve_section(parsed_sections, name)
+    if key is None:
+        return None
+    section = parsed_sections["sections"][key]
+    chunk = document[section["start"]:section["end"]]
+    if parsed_sections.get("format") == "html":
+        return html_to_text(chunk).strip()
+    return chunk.strip()
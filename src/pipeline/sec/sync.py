@@ -0,0 +1,271 @@
+"""Incremental sync state for SEC filing ingestion.
+
+EDGAR's submissions feed lists every recent filing of a company, so without
+sync state each nightly run would download years of filings that are already
+stored, only for store_filing to discard them. Before anything is downloaded,
+the ingestion flow plans the run:
+
+1. filings dated before the (CIK, form type) high-water mark kept in
+   sec_sync_cursors are skipped outright
+2. the remaining accession numbers are checked against sec_filings in one
+   batched query and the known ones are skipped
+
+Runs capped at a number of downloads take the newest candidates first, so
+recent filings are never starved by an old backlog; the older ones are worked
+off by later runs.
+
+After the run each mark advances to the newest filing date up to which every
+candidate was stored, already known or permanently invalid. A filing that
+failed to download holds its mark back and is retried on the next run.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from src.db.models import SECFiling, SECSyncCursor
+
+
+@dataclass
+class SyncPlan:
+    """Which of a company's listed filings a run has to download.
+
+    Attributes:
+        cik: Zero-padded company CIK
+        marks: High-water mark per form type at planning time
+        to_download: New filings, oldest first
+        known: Filings on or after the mark that are already stored
+        below_mark: Number of filings skipped by the high-water mark
+    """
+
+    cik: str
+    marks: Dict[str, date] = field(default_factory=dict)
+    to_download: List[Dict[str, Any]] = field(default_factory=list)
+    known: List[Dict[str, Any]] = field(default_factory=list)
+    below_mark: int = 0
+
+    @property
+    def skipped(self) -> int:
+        """Filings the run does not download."""
+        return self.below_mark + len(self.known)
+
+
+def filing_date(filing: Dict[str, Any]) -> date:
+    """Parse a filing's ``filingDate`` (YYYY-MM-DD) as a date."""
+    value = filing["filingDate"]
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _sort_key(filing: Dict[str, Any]) -> Tuple[date, str]:
+    return filing_date(filing), filing["accessionNumber"]
+
+
+def select_new_filings(
+    cik: str,
+    filings: Iterable[Dict[str, Any]],
+    marks: Dict[str, date],
+    known_accessions: Set[str],
+) -> SyncPlan:
+    """Split listed filings into skipped and to-download.
+
+    Filings dated on the mark itself are kept as candidates: other filings of
+    the same day may not have been stored yet, and the accession check
+    catches those that were.
+
+    Args:
+        cik: Company CIK
+        filings: Filings as returned by SECAPIClient.get_filings
+        marks: High-water mark per form type
+        known_accessions: Accession numbers already in sec_filings
+
+    Returns:
+        SyncPlan with new filings ordered oldest first
+    """
+    plan = SyncPlan(cik=cik.zfill(10), marks=dict(marks))
+    for filing in sorted(filings, key=_sort_key):
+        mark = marks.get(filing["form"])
+        if mark is not None and filing_date(filing) < mark:
+            plan.below_mark += 1
+        elif filing["accessionNumber"] in known_accessions:
+            plan.known.append(filing)
+        else:
+            plan.to_download.append(filing)
+    return plan
+
+
+def advance_marks(plan: SyncPlan, handled: Set[str]) -> Dict[str, Tuple[date, str]]:
+    """Work out the new high-water marks after a run.
+
+    Per form type, the mark moves to the newest date before the first filing
+    that was neither known nor handled. Filings on that date are left for the
+    next run.
+
+    Args:
+        plan: The run's plan
+        handled: Accession numbers stored or found permanently invalid
+
+    Returns:
+        New (filing date, accession number) per form type whose mark advances
+    """
+    known = {filing["accessionNumber"] for filing in plan.known}
+    by_form: Dict[str, List[Dict[str, Any]]] = {}
+    for filing in sorted(plan.known + plan.to_download, key=_sort_key):
+        by_form.setdefault(filing["form"], []).append(filing)
+
+    advanced = {}
+    for form, filings in by_form.items():
+        pending = [
+            filing_date(f) for f in filings
+            if f["accessionNumber"] not in known and f["accessionNumber"] not in handled
+        ]
+        first_pending = min(pending) if pending else None
+
+        done = [f for f in filings if first_pending is None or filing_date(f) < first_pending]
+        if not done:
+            continue
+        newest = done[-1]
+        current = plan.marks.get(form)
+        if current is None or filing_date(newest) > current:
+            advanced[form] = (filing_date(newest), newest["accessionNumber"])
+    return advanced
+
+
+def newest_first(
+    filings: Iterable[Dict[str, Any]], limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Order filings newest first and keep at most ``limit`` of them.
+
+    Skipped older filings hold their form's high-water mark back (see
+    advance_marks), so a later run picks them up once the newer ones are
+    stored.
+
+    Args:
+        filings: Candidate filings
+        limit: Maximum number of filings to return, or None for all
+
+    Returns:
+        The newest ``limit`` filings, newest first
+    """
+    ordered = sorted(filings, key=_sort_key, reverse=True)
+    return ordered if limit is None else ordered[:limit]
+
+
+class FilingSync:
+    """Sync cursors and known-filing lookups backed by the database.
+
+    Usage:
+        sync = FilingSync()
+        plan = await sync.plan(cik, filings)
+        ... download and store plan.to_download ...
+        await sync.record(plan, handled_accession_numbers)
+    """
+
+    def __init__(self, session_factory: Optional[Any] = None):
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> Any:
+        if self._session_factory is None:
+            from src.db.session import get_session_factory
+
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    async def plan(self, cik: str, filings: List[Dict[str, Any]]) -> SyncPlan:
+        """Plan a run for ``filings`` of one company.
+
+        Issues two queries regardless of how many filings are listed: one
+        for the cursors and one for the known accession numbers.
+        """
+        from sqlalchemy import select
+
+        padded_cik = cik.zfill(10)
+        if not filings:
+            return SyncPlan(cik=padded_cik)
+        forms = sorted({filing["form"] for filing in filings})
+
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(SECSyncCursor.filing_type, SECSyncCursor.last_filing_date).where(
+                    SECSyncCursor.cik == padded_cik,
+                    SECSyncCursor.filing_type.in_(forms),
+                )
+            )
+            marks = {form: last_date.date() for form, last_date in result.all()}
+
+            # Only filings the marks do not rule out need looking up
+            candidates = [
+                filing["accessionNumber"] for filing in filings
+                if filing["form"] not in marks or filing_date(filing) >= marks[filing["form"]]
+            ]
+            known: Set[str] = set()
+            if candidates:
+                result = await session.execute(
+                    select(SECFiling.accession_number).where(
+                        SECFiling.accession_number.in_(candidates)
+                    )
+                )
+                known = set(result.scalars().all())
+
+        plan = select_new_filings(padded_cik, filings, marks, known)
+        logger.info(
+            f"Sync plan for CIK {padded_cik}: {len(filings)} listed, "
+            f"{plan.below_mark} before high-water mark, {len(plan.known)} already stored, "
+            f"{len(plan.to_download)} to download"
+        )
+        return plan
+
+    async def record(self, plan: SyncPlan, handled: Set[str]) -> Dict[str, date]:
+        """Advance the cursors after a run.
+
+        Concurrent runs for the same company are safe: a cursor never moves
+        backwards.
+
+        Args:
+            plan: The run's plan
+            handled: Accession numbers stored or found permanently invalid
+
+        Returns:
+            New high-water mark per advanced form type
+        """
+        from sqlalchemy.dialects.postgresql import insert
+
+        advanced = advance_marks(plan, handled)
+        if not advanced:
+            return {}
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "cik": plan.cik,
+                "filing_type": form,
+                "last_filing_date": datetime(day.year, day.month, day.day, tzinfo=timezone.utc),
+                "last_accession_number": accession,
+                "last_synced_at": now,
+            }
+            for form, (day, accession) in advanced.items()
+        ]
+        statement = insert(SECSyncCursor).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[SECSyncCursor.cik, SECSyncCursor.filing_type],
+            set_={
+                "last_filing_date": statement.excluded.last_filing_date,
+                "last_accession_number": statement.excluded.last_accession_number,
+                "last_synced_at": statement.excluded.last_synced_at,
+            },
+            where=SECSyncCursor.last_filing_date < statement.excluded.last_filing_date,
+        )
+
+        async with self.session_factory() as session:
+            await session.execute(statement)
+            await session.commit()
+
+        marks = {form: day for form, (day, _) in advanced.items()}
+        logger.info(f"Advanced sync cursors for CIK {plan.cik}: {marks}")
+        return marks
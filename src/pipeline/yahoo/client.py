@@ -1,20 +1,84 @@
 """Yahoo Finance API client with retry logic and circuit breaker protection."""
 
 import asyncio
-from typing import Any, Dict, Optional
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yfinance as yf
 from loguru import logger
 
 from src.core.circuit_breaker import yahoo_finance_breaker, yahoo_finance_fallback
+from src.core.config import get_settings
 
 
 class YahooFinanceClient:
-    """Client for fetching data from Yahoo Finance API."""
+    """Client for fetching data from Yahoo Finance API.
 
-    def __init__(self):
-        """Initialize the Yahoo Finance client."""
-        pass
+    yfinance is synchronous: every property access on a Ticker is a blocking
+    HTTP request. All yfinance work therefore runs in the client's own
+    bounded thread pool (YAHOO_FINANCE_MAX_WORKERS), so callers can fetch
+    many tickers concurrently without stalling the event loop or flooding
+    Yahoo with requests.
+
+    Ticker objects are memoized for the lifetime of the client, and yfinance
+    caches what they fetch, so asking for the same ticker's info or
+    statements twice in one run costs a single request. Use one client per
+    ingestion run and close it when done.
+
+    Usage:
+        async with YahooFinanceClient() as client:
+            info = await client.fetch_stock_info("DUOL")
+            income, balance = await client.fetch_quarterly_statements("DUOL")
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the Yahoo Finance client.
+
+        Args:
+            max_workers: Threads running yfinance calls (default YAHOO_FINANCE_MAX_WORKERS)
+        """
+        self.max_workers = max_workers or get_settings().YAHOO_FINANCE_MAX_WORKERS
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="yfinance")
+        self._tickers: Dict[str, Any] = {}
+        self._tickers_lock = threading.Lock()
+
+    async def __aenter__(self) -> "YahooFinanceClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker threads and forget memoized tickers."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._tickers.clear()
+
+    def _ticker(self, ticker: str) -> Any:
+        """Memoized yfinance Ticker for a symbol."""
+        symbol = ticker.upper()
+        with self._tickers_lock:
+            stock = self._tickers.get(symbol)
+            if stock is None:
+                stock = self._tickers[symbol] = yf.Ticker(symbol)
+            return stock
+
+    def _forget(self, ticker: str) -> None:
+        """Drop a memoized Ticker so the next access fetches fresh data."""
+        with self._tickers_lock:
+            self._tickers.pop(ticker.upper(), None)
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking yfinance call through the circuit breaker in the thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(yahoo_finance_breaker.call, func, *args)
+        )
+
+    async def _ticker_attribute(self, ticker: str, attribute: str) -> Any:
+        """Read a (lazily fetched) attribute of the memoized Ticker off the event loop."""
+        return await self._call(lambda: getattr(self._ticker(ticker), attribute))
 
     async def fetch_stock_info(self, ticker: str, max_retries: int = 3) -> Optional[Dict[str, Any]]:
         """Fetch comprehensive data from Yahoo Finance with retry logic.
@@ -31,18 +95,12 @@ class YahooFinanceClient:
         """
         for attempt in range(max_retries):
             try:
-                # Run synchronous yfinance call in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-
-                # Wrap API call with circuit breaker
-                stock = yahoo_finance_breaker.call(yf.Ticker, ticker)
-                stock_obj = await loop.run_in_executor(None, lambda: stock) if asyncio.iscoroutine(stock) else stock
-
-                info = yahoo_finance_breaker.call(lambda: stock_obj.info)
-                info_data = await loop.run_in_executor(None, lambda: info) if asyncio.iscoroutine(info) else info
+                info_data = await self._ticker_attribute(ticker, "info")
 
                 if not info_data or "regularMarketPrice" not in info_data:
                     logger.warning(f"Incomplete data for {ticker}, attempt {attempt + 1}/{max_retries}")
+                    # The Ticker keeps what it fetched; start over with a new one
+                    self._forget(ticker)
                     if attempt < max_retries - 1:
                         await asyncio.sleep(2 ** attempt)  # Exponential backoff
                         continue
@@ -52,6 +110,7 @@ class YahooFinanceClient:
 
             except Exception as e:
                 logger.error(f"Error fetching data for {ticker} (attempt {attempt + 1}/{max_retries}): {e}")
+                self._forget(ticker)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
                 else:
@@ -72,17 +131,7 @@ class YahooFinanceClient:
             Quarterly financial data or None if failed
         """
         try:
-            loop = asyncio.get_event_loop()
-
-            # Wrap API calls with circuit breaker
-            stock = yahoo_finance_breaker.call(yf.Ticker, ticker)
-            stock_obj = await loop.run_in_executor(None, lambda: stock) if asyncio.iscoroutine(stock) else stock
-
-            # Get quarterly income statement
-            quarterly_income = yahoo_finance_breaker.call(lambda: stock_obj.quarterly_income_stmt)
-            quarterly_income_data = await loop.run_in_executor(None, lambda: quarterly_income) if asyncio.iscoroutine(quarterly_income) else quarterly_income
-
-            return quarterly_income_data
+            return await self._ticker_attribute(ticker, "quarterly_income_stmt")
 
         except Exception as e:
             logger.error(f"Error fetching quarterly financials for {ticker}: {e}")
@@ -100,18 +149,22 @@ class YahooFinanceClient:
             Quarterly balance sheet data or None if failed
         """
         try:
-            loop = asyncio.get_event_loop()
-
-            # Wrap API calls with circuit breaker
-            stock = yahoo_finance_breaker.call(yf.Ticker, ticker)
-            stock_obj = await loop.run_in_executor(None, lambda: stock) if asyncio.iscoroutine(stock) else stock
-
-            # Get quarterly balance sheet
-            quarterly_balance = yahoo_finance_breaker.call(lambda: stock_obj.quarterly_balance_sheet)
-            quarterly_balance_data = await loop.run_in_executor(None, lambda: quarterly_balance) if asyncio.iscoroutine(quarterly_balance) else quarterly_balance
-
-            return quarterly_balance_data
+            return await self._ticker_attribute(ticker, "quarterly_balance_sheet")
 
         except Exception as e:
             logger.error(f"Error fetching quarterly balance sheet for {ticker}: {e}")
             return None
+
+    async def fetch_quarterly_statements(self, ticker: str) -> Tuple[Optional[Any], Optional[Any]]:
+        """Fetch the quarterly income statement and balance sheet concurrently.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Tuple of (income statement, balance sheet); either may be None
+        """
+        return await asyncio.gather(
+            self.fetch_quarterly_financials(ticker),
+            self.fetch_quarterly_balance_sheet(ticker),
+        )
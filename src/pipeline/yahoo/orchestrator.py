@@ -3,11 +3,13 @@
 import asyncio
 import sys
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from loguru import logger
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.models import Company
 from src.db.session import get_session_factory
 from src.pipeline.common import notify_progress, run_coordination_hook
 from src.pipeline.yahoo.constants import EDTECH_COMPANIES
@@ -23,14 +25,15 @@ class YahooFinanceIngestionError(Exception):
 class YahooFinanceIngestionPipeline:
     """Pipeline for ingesting Yahoo Finance data into the database."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, client: Optional[YahooFinanceClient] = None):
         """Initialize the ingestion pipeline.
 
         Args:
             session: Async SQLAlchemy database session
+            client: Yahoo Finance client for this run (a new one if omitted)
         """
         self.session = session
-        self.client = YahooFinanceClient()
+        self.client = client or YahooFinanceClient()
         self.stats = {
             "companies_created": 0,
             "companies_updated": 0,
@@ -42,62 +45,92 @@ class YahooFinanceIngestionPipeline:
     async def run(self) -> Dict[str, Any]:
         """Execute the full ingestion pipeline.
 
+        Companies are processed concurrently: their Yahoo Finance requests
+        overlap in the client's thread pool, while database writes take
+        turns on the shared session.
+
         Returns:
             Dict containing ingestion statistics and results
         """
         logger.info("Starting Yahoo Finance data ingestion pipeline")
         logger.info(f"Target: {len(EDTECH_COMPANIES)} companies, 5 years quarterly data")
 
-        for idx, company_data in enumerate(EDTECH_COMPANIES, 1):
-            ticker = company_data["ticker"]
+        self._completed = 0
+        session_lock = asyncio.Lock()
+        await asyncio.gather(*(
+            self._process_company(idx, company_data, session_lock)
+            for idx, company_data in enumerate(EDTECH_COMPANIES, 1)
+        ))
 
-            try:
-                logger.info(f"[{idx}/{len(EDTECH_COMPANIES)}] Processing {ticker} - {company_data['name']}")
+        await self.session.commit()
+        logger.info("Yahoo Finance ingestion pipeline completed")
 
-                # Fetch data from Yahoo Finance
-                yf_data = await self.client.fetch_stock_info(ticker)
+        return self._generate_report()
 
-                if not yf_data:
-                    logger.warning(f"No data available for {ticker}")
-                    self.stats["errors"].append({
-                        "ticker": ticker,
-                        "error": "No data available from Yahoo Finance"
-                    })
-                    continue
+    async def _process_company(
+        self,
+        idx: int,
+        company_data: Dict[str, Any],
+        session_lock: asyncio.Lock,
+    ) -> None:
+        """Fetch and store one company, recording any error in the stats.
 
-                # Upsert company record
-                company = await upsert_company(self.session, company_data, yf_data)
+        Args:
+            idx: Position of the company in EDTECH_COMPANIES (1-based)
+            company_data: Company metadata from EDTECH_COMPANIES
+            session_lock: Serializes use of the shared database session
+        """
+        ticker = company_data["ticker"]
+
+        try:
+            logger.info(f"[{idx}/{len(EDTECH_COMPANIES)}] Processing {ticker} - {company_data['name']}")
+
+            # Fetch info and statements together; the client memoizes the
+            # Ticker, so ingest_quarterly_financials reuses the statements
+            yf_data, _ = await asyncio.gather(
+                self.client.fetch_stock_info(ticker),
+                self.client.fetch_quarterly_statements(ticker),
+            )
+
+            if not yf_data:
+                logger.warning(f"No data available for {ticker}")
+                self.stats["errors"].append({
+                    "ticker": ticker,
+                    "error": "No data available from Yahoo Finance"
+                })
+                return
 
-                # Track if this was a new company
+            async with session_lock:
+                # Track if this will be a new company
                 result = await self.session.execute(
-                    f"SELECT id FROM companies WHERE ticker = '{ticker}'"
+                    select(Company.id).where(Company.ticker == ticker)
                 )
                 is_new = result.scalar_one_or_none() is None
 
+                # Upsert company record
+                company = await upsert_company(self.session, company_data, yf_data)
+
                 if is_new:
                     self.stats["companies_created"] += 1
                 else:
                     self.stats["companies_updated"] += 1
 
-                # Fetch and insert quarterly financials
-                metrics_count = await ingest_quarterly_financials(self.session, company, ticker)
+                # Insert quarterly financials
+                metrics_count = await ingest_quarterly_financials(
+                    self.session, company, ticker, client=self.client, info_data=yf_data
+                )
                 self.stats["metrics_created"] += metrics_count
 
-                # Update progress via coordination hooks
-                await notify_progress(f"Completed {idx}/{len(EDTECH_COMPANIES)} companies")
-
-            except Exception as e:
-                logger.error(f"Error processing {ticker}: {e}")
-                self.stats["errors"].append({
-                    "ticker": ticker,
-                    "error": str(e)
-                })
-                continue
-
-        await self.session.commit()
-        logger.info("Yahoo Finance ingestion pipeline completed")
+            # Update progress via coordination hooks
+            self._completed += 1
+            await notify_progress(f"Completed {self._completed}/{len(EDTECH_COMPANIES)} companies")
 
-        return self._generate_report()
+        except Exception as e:
+            logger.error(f"Error processing {ticker}: {e}")
+            self.stats["errors"].append({
+                "ticker": ticker,
+                "error": str(e)
+            })
 
     def _generate_report(self) -> Dict[str, Any]:
         """Generate ingestion report.
@@ -136,10 +169,10 @@ async def run_ingestion() -> Dict[str, Any]:
     # Create database session
     session_factory = get_session_factory()
 
-    async with session_factory() as session:
+    async with session_factory() as session, YahooFinanceClient() as client:
         try:
             # Initialize and run pipeline
-            pipeline = YahooFinanceIngestionPipeline(session)
+            pipeline = YahooFinanceIngestionPipeline(session, client)
             report = await pipeline.run()
 
             # Log summary
@@ -1,6 +1,6 @@
 """Yahoo Finance data processing and database operations."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import pandas as pd
@@ -9,7 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Company
-from src.pipeline.common import get_or_create_company, upsert_financial_metric
+from src.pipeline.common import bulk_upsert_financial_metrics, get_or_create_company
 from src.pipeline.yahoo.client import YahooFinanceClient
 from src.pipeline.yahoo.parser import extract_financial_metrics, parse_company_data
 
@@ -64,7 +64,9 @@ async def upsert_company(
 async def ingest_quarterly_financials(
     session: AsyncSession,
     company: Company,
-    ticker: str
+    ticker: str,
+    client: Optional[YahooFinanceClient] = None,
+    info_data: Optional[Dict[str, Any]] = None,
 ) -> int:
     """Fetch and ingest quarterly financial data.
 
@@ -74,31 +76,32 @@ async def ingest_quarterly_financials(
         session: Database session
         company: Company model instance
         ticker: Stock ticker symbol
+        client: Client of the current run; a temporary one is used if omitted
+        info_data: Stock info the caller already fetched; fetched if omitted
 
     Returns:
         Number of metrics created
     """
-    metrics_created = 0
-
-    try:
+    owns_client = client is None
+    if owns_client:
         client = YahooFinanceClient()
 
-        # Get quarterly income statement
-        quarterly_income_data = await client.fetch_quarterly_financials(ticker)
+    try:
+        # Get quarterly income statement and balance sheet side by side
+        quarterly_income_data, quarterly_balance_data = await client.fetch_quarterly_statements(ticker)
         if quarterly_income_data is None or quarterly_income_data.empty:
             logger.warning(f"No quarterly financials available for {ticker}")
             return 0
 
-        # Get quarterly balance sheet
-        quarterly_balance_data = await client.fetch_quarterly_balance_sheet(ticker)
-
-        # Get additional info
-        info_data = await client.fetch_stock_info(ticker)
+        # Get additional info unless the caller already has it
+        if info_data is None:
+            info_data = await client.fetch_stock_info(ticker)
         if not info_data:
             info_data = {}
 
         # Process each quarter (up to 20 quarters = 5 years)
         quarters_to_process = min(20, len(quarterly_income_data.columns))
+        metric_rows = []
 
         for i in range(quarters_to_process):
             quarter_date = quarterly_income_data.columns[i]
@@ -111,18 +114,18 @@ async def ingest_quarterly_financials(
                 quarter_date
             )
 
-            # Insert all metrics for this quarter using common utility
             for metric_data in metrics_to_insert:
-                await upsert_financial_metric(
-                    session,
-                    company_id=company.id,
-                    metric_date=quarter_date,
-                    period_type="quarterly",
-                    source="yahoo_finance",
-                    confidence_score=0.95,
-                    **metric_data
-                )
-                metrics_created += 1
+                metric_rows.append({
+                    "company_id": company.id,
+                    "metric_date": quarter_date,
+                    "period_type": "quarterly",
+                    "source": "yahoo_finance",
+                    "confidence_score": 0.95,
+                    **metric_data,
+                })
+
+        # Store the whole history in one set-based upsert
+        metrics_created = await bulk_upsert_financial_metrics(session, metric_rows)
 
         logger.info(f"Ingested {quarters_to_process} quarters of financial data for {ticker}")
         return metrics_created
@@ -130,3 +133,7 @@ async def ingest_quarterly_financials(
     except Exception as e:
         logger.error(f"Error ingesting quarterly financials for {ticker}: {e}")
         raise
+
+    finally:
+        if owns_client:
+            client.close()
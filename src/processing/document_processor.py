@@ -3,15 +3,14 @@
 import hashlib
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import ray
 from loguru import logger
-from pdfplumber import PDF
-from pypdf import PdfReader
 
 from src.core.config import get_settings
+from src.processing.pdf_extractor import PDFExtractor, PDFPage
 from src.processing.text_chunker import TextChunker
 from src.processing.metrics_extractor import EdTechMetricsExtractor
 
@@ -28,15 +27,16 @@ class DocumentProcessor:
             tokenizer="cl100k_base"  # OpenAI tokenizer
         )
         self.metrics_extractor = EdTechMetricsExtractor()
+        self.pdf_extractor = PDFExtractor(
+            max_workers=self.settings.PDF_EXTRACT_WORKERS,
+            pages_per_task=self.settings.PDF_PAGES_PER_TASK,
+        )
     
     def process_pdf(self, pdf_path: str) -> Dict[str, Any]:
         """Process a PDF document."""
         try:
-            # Extract text
-            text = self._extract_pdf_text(pdf_path)
-            
-            # Extract metadata
-            metadata = self._extract_pdf_metadata(pdf_path)
+            # Extract text and metadata from a single open of the file
+            text, metadata = self._extract_pdf(pdf_path)
             
             # Chunk text for embedding
             chunks = self.text_chunker.chunk_text(text)
@@ -67,52 +67,40 @@ class DocumentProcessor:
                 "pdf_path": pdf_path,
             }
     
+    def process_pdf_pages(self, pdf_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Process a PDF page by page, yielding results as pages are extracted.
+        
+        Chunking and metric extraction run on each page while later pages are
+        still being parsed. Chunk offsets are relative to the page text, and
+        metrics are not deduplicated across pages.
+        """
+        for page in self.iter_pdf_pages(pdf_path):
+            if not page.text:
+                continue
+            yield {
+                "page_number": page.page_number,
+                "text": page.text,
+                "chunks": self.text_chunker.chunk_text(page.text),
+                "metrics": self.metrics_extractor.extract_metrics(page.text),
+            }
+    
+    def iter_pdf_pages(self, pdf_path: str) -> Iterator[PDFPage]:
+        """Yield PDF pages in order as they are extracted."""
+        return self.pdf_extractor.iter_pages(pdf_path)
+    
+    def _extract_pdf(self, pdf_path: str) -> Tuple[str, Dict[str, Any]]:
+        """Extract text and metadata, page-parallel for large documents."""
+        return self.pdf_extractor.extract(pdf_path)
+    
     def _extract_pdf_text(self, pdf_path: str) -> str:
         """Extract text from PDF using multiple methods for robustness."""
-        text = ""
-        
-        # Try pdfplumber first (better for tables)
-        try:
-            with PDF.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            logger.warning(f"pdfplumber failed: {e}, trying pypdf")
-            
-            # Fallback to pypdf
-            try:
-                reader = PdfReader(pdf_path)
-                for page in reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            except Exception as e:
-                logger.error(f"Both PDF extraction methods failed: {e}")
-                raise
-        
+        text, _ = self._extract_pdf(pdf_path)
         return text
     
     def _extract_pdf_metadata(self, pdf_path: str) -> Dict[str, Any]:
         """Extract PDF metadata."""
-        try:
-            reader = PdfReader(pdf_path)
-            metadata = reader.metadata
-            
-            return {
-                "title": str(metadata.title) if metadata.title else None,
-                "author": str(metadata.author) if metadata.author else None,
-                "subject": str(metadata.subject) if metadata.subject else None,
-                "creator": str(metadata.creator) if metadata.creator else None,
-                "producer": str(metadata.producer) if metadata.producer else None,
-                "creation_date": str(metadata.creation_date) if metadata.creation_date else None,
-                "modification_date": str(metadata.modification_date) if metadata.modification_date else None,
-                "num_pages": len(reader.pages),
-            }
-        except Exception as e:
-            logger.warning(f"Failed to extract metadata: {e}")
-            return {}
+        return self.pdf_extractor.read_metadata(pdf_path)
     
     def process_earnings_transcript(self, text: str, company_ticker: str) -> Dict[str, Any]:
         """Process earnings call transcript."""
@@ -0,0 +1,308 @@
+"""Persistent, content-addressed embedding cache shared across processes.
+
+SEC filings repeat most of their legal boilerplate from one quarter to the
+next, so the same chunk text gets embedded again and again. EmbeddingCache
+stores each vector once, keyed by a SHA-256 of (model name, text), in a
+fixed-capacity memory-mapped slot file. An SQLite index maps keys to slots
+and tracks last access for LRU eviction. SQLite's locking makes it safe for
+several worker processes (e.g. Ray DistributedEmbedder actors) to read and
+write the same cache directory at once.
+
+Readers do not lock slots, so a writer in another process may evict a slot
+and overwrite its vector while a reader is copying it. Each slot therefore
+carries a tag derived from its key. A writer clears the tag before rewriting
+the vector and sets the new tag afterwards, and a reader only accepts a
+vector if the slot's tag matches its key both before and after the copy.
+
+Layout of ``<cache_dir>/<model_name>/``:
+
+- ``vectors.bin``: memory-mapped array of shape (max_entries, dimension)
+- ``tags.bin``: memory-mapped uint64 per slot, 0 while a slot is rewritten
+- ``index.sqlite``: key -> slot, last_access
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+PathLike = Union[str, Path]
+
+# SQLite limits the number of host parameters per statement
+_SQL_BATCH = 500
+
+# On-disk layout version kept in meta; caches from before slot tags are emptied on open
+_FORMAT = "2"
+
+
+def embedding_key(model_name: str, text: str) -> str:
+    """Content address of a text embedded with a given model."""
+    return hashlib.sha256(f"{model_name}\x00{text}".encode("utf-8")).hexdigest()
+
+
+def _slot_tag(key: str) -> int:
+    """Non-zero 64-bit tag identifying the key stored in a slot."""
+    return int(key[:16], 16) or 1
+
+
+class EmbeddingCache:
+    """Disk-backed LRU cache of embedding vectors for one model.
+
+    One instance may be shared by several threads; calls are serialized on
+    its SQLite connection.
+
+    Example:
+        ```python
+        cache = EmbeddingCache("data/embedding_cache", "all-MiniLM-L6-v2", 384)
+        hits = cache.get_many(texts)          # {position: vector}
+        cache.put_many(missing_texts, vectors)
+        print(cache.stats())                  # hits, misses, hit_rate, ...
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_dir: PathLike,
+        model_name: str,
+        dimension: int,
+        max_entries: int = 1_000_000,
+        dtype: str = "float16",
+    ):
+        self.model_name = model_name
+        self.dimension = dimension
+        self.max_entries = max_entries
+        self.dtype = np.dtype(dtype)
+
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        self.path = Path(cache_dir) / safe_name
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(
+            self.path / "index.sqlite", timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, slot INTEGER NOT NULL UNIQUE, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self._check_meta()
+
+        self._vectors = self._open_slots("vectors.bin", self.dtype, (max_entries, dimension))
+        self._tags = self._open_slots("tags.bin", np.dtype(np.uint64), (max_entries,))
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _open_slots(self, name: str, dtype: np.dtype, shape: tuple) -> np.memmap:
+        """Memory-map a per-slot file, growing (never truncating) it so concurrent openers agree."""
+        path = self.path / name
+        size = int(np.prod(shape)) * dtype.itemsize
+        with open(path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+        return np.memmap(path, dtype=dtype, mode="r+", shape=shape)
+
+    def _check_meta(self) -> None:
+        """Refuse to reopen a cache directory with an incompatible layout."""
+        expected = {
+            "dimension": str(self.dimension),
+            "max_entries": str(self.max_entries),
+            "dtype": self.dtype.name,
+            "format": _FORMAT,
+        }
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            stored = dict(self._db.execute("SELECT name, value FROM meta").fetchall())
+            if stored and "format" not in stored:
+                # Entries written before slot tags existed cannot be verified
+                logger.info(f"Emptying embedding cache at {self.path} for layout format {_FORMAT}")
+                self._db.execute("DELETE FROM entries")
+                self._db.execute("DELETE FROM meta")
+                stored = {}
+            if not stored:
+                self._db.executemany("INSERT INTO meta VALUES (?, ?)", expected.items())
+            elif stored != expected:
+                raise ValueError(
+                    f"Embedding cache at {self.path} was created with {stored}, not {expected}"
+                )
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached vector for ``text``, or None."""
+        return self.get_many([text]).get(0)
+
+    def get_many(self, texts: Sequence[str]) -> Dict[int, np.ndarray]:
+        """Look up many texts at once.
+
+        Returns:
+            Mapping of position in ``texts`` to float32 vector, hits only
+        """
+        keys = [embedding_key(self.model_name, text) for text in texts]
+        slots: Dict[str, int] = {}
+
+        with self._lock:
+            unique_keys = list(dict.fromkeys(keys))
+            for start in range(0, len(unique_keys), _SQL_BATCH):
+                batch = unique_keys[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                slots.update(self._db.execute(
+                    f"SELECT key, slot FROM entries WHERE key IN ({placeholders})", batch
+                ).fetchall())
+
+            # Copy vectors, keeping only those whose slot still holds the key
+            vectors: Dict[str, np.ndarray] = {}
+            for key, slot in slots.items():
+                tag = _slot_tag(key)
+                if self._tags[slot] != tag:
+                    continue
+                vector = np.array(self._vectors[slot], dtype=np.float32)
+                if self._tags[slot] == tag:
+                    vectors[key] = vector
+
+            if vectors:
+                now = time.time()
+                self._db.execute("BEGIN")
+                self._db.executemany(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in vectors],
+                )
+                self._db.execute("COMMIT")
+
+            found = {
+                position: vectors[key]
+                for position, key in enumerate(keys)
+                if key in vectors
+            }
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, text: str, vector: np.ndarray) -> None:
+        """Store one vector."""
+        self.put_many([text], np.asarray(vector).reshape(1, -1))
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray) -> None:
+        """Store vectors for texts, evicting least recently used entries if full."""
+        vectors = np.asarray(vectors)
+        if vectors.shape != (len(texts), self.dimension):
+            raise ValueError(
+                f"Expected vectors of shape ({len(texts)}, {self.dimension}), got {vectors.shape}"
+            )
+
+        pending: Dict[str, int] = {}
+        for position, text in enumerate(texts):
+            pending.setdefault(embedding_key(self.model_name, text), position)
+
+        with self._lock:
+            self._put_pending(pending, vectors)
+
+    def _put_pending(self, pending: Dict[str, int], vectors: np.ndarray) -> None:
+        """Store vectors for keys not yet cached (key -> row in ``vectors``)."""
+        # One writer at a time across processes; readers are never blocked (WAL)
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            keys = list(pending)
+            for start in range(0, len(keys), _SQL_BATCH):
+                batch = keys[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                for (key,) in self._db.execute(
+                    f"SELECT key FROM entries WHERE key IN ({placeholders})", batch
+                ).fetchall():
+                    pending.pop(key, None)
+
+            if not pending:
+                self._db.execute("COMMIT")
+                return
+            if len(pending) > self.max_entries:
+                # Earlier keys would be evicted by later ones of the same batch
+                pending = dict(list(pending.items())[-self.max_entries:])
+
+            slots = self._allocate_slots(len(pending))
+            positions = list(pending.values())
+
+            # Invalidate the slots' tags while their vectors are rewritten, so
+            # readers still holding an evicted key's slot reject the copy, and
+            # write vectors and tags before publishing their index rows
+            self._tags[slots] = 0
+            self._vectors[slots] = vectors[positions].astype(self.dtype)
+            self._tags[slots] = [_slot_tag(key) for key in pending]
+            self._vectors.flush()
+            self._tags.flush()
+
+            now = time.time()
+            self._db.executemany(
+                "INSERT INTO entries (key, slot, last_access) VALUES (?, ?, ?)",
+                [(key, slot, now) for key, slot in zip(pending, slots)],
+            )
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def _allocate_slots(self, count: int) -> List[int]:
+        """Pick free slots, evicting LRU entries when the cache is full.
+
+        Must be called inside a write transaction.
+        """
+        if count > self.max_entries:
+            raise ValueError(f"Cannot store {count} vectors in a cache of {self.max_entries}")
+
+        used = self._db.execute("SELECT COUNT(*), COALESCE(MAX(slot), -1) FROM entries").fetchone()
+        in_use, max_slot = used
+
+        if in_use == max_slot + 1:
+            # Dense so far: hand out slots after the highest one
+            fresh = list(range(max_slot + 1, min(self.max_entries, max_slot + 1 + count)))
+        else:
+            taken = {row[0] for row in self._db.execute("SELECT slot FROM entries")}
+            fresh = [s for s in range(self.max_entries) if s not in taken][:count]
+
+        shortfall = count - len(fresh)
+        if shortfall > 0:
+            victims = self._db.execute(
+                "SELECT key, slot FROM entries ORDER BY last_access LIMIT ?", (shortfall,)
+            ).fetchall()
+            self._db.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key, _ in victims])
+            fresh.extend(slot for _, slot in victims)
+            self.evictions += len(victims)
+
+        return fresh
+
+    def stats(self) -> Dict[str, float]:
+        """Hit-rate metrics for this process, plus current cache size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+        }
+
+    def close(self) -> None:
+        """Flush vectors and close the index."""
+        with self._lock:
+            self._vectors.flush()
+            self._tags.flush()
+            self._db.close()
+        logger.debug(f"Closed embedding cache at {self.path}")
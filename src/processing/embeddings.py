@@ -9,6 +9,9 @@ from loguru import logger
 from sentence_transformers import SentenceTransformer
 
 from src.core.config import get_settings
+from src.processing.embedding_cache import EmbeddingCache
+from src.processing.keyword_index import BM25Index
+from src.processing.vector_index import FlatIndex, VectorIndex, build_index
 
 
 class EmbeddingPipeline:
@@ -19,7 +22,12 @@ class EmbeddingPipeline:
     3. Support for custom fine-tuned models
     """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache: Optional[EmbeddingCache] = None,
+        use_cache: Optional[bool] = None
+    ):
         """
         Initialize embedding pipeline.
         
@@ -27,18 +35,63 @@ class EmbeddingPipeline:
         - all-MiniLM-L6-v2: 384 dim, fast, good for development
         - all-mpnet-base-v2: 768 dim, better quality
         - all-distilroberta-v1: 768 dim, robust to noise
+        
+        Args:
+            model_name: sentence-transformers model name
+            cache: Shared embedding cache; by default one is opened in
+                EMBEDDING_CACHE_DIR (under DATA_DIR) when EMBEDDING_CACHE_ENABLED is set
+            use_cache: Override EMBEDDING_CACHE_ENABLED
         """
         self.model_name = model_name
         self.model = SentenceTransformer(model_name)
         self.dimension = self.model.get_sentence_embedding_dimension()
+        
+        settings = get_settings()
+        if use_cache is None:
+            use_cache = settings.EMBEDDING_CACHE_ENABLED
+        if cache is None and use_cache:
+            cache = EmbeddingCache(
+                settings.data_path(settings.EMBEDDING_CACHE_DIR),
+                model_name,
+                self.dimension,
+                max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+                dtype=settings.EMBEDDING_CACHE_DTYPE,
+            )
+        self.cache = cache
+        
         logger.info(f"Initialized {model_name} with {self.dimension} dimensions")
     
     def embed_text(self, text: str) -> np.ndarray:
         """Embed a single text."""
+        if self.cache is not None:
+            return self.embed_batch([text])[0]
         return self.model.encode(text, convert_to_numpy=True)
     
     def embed_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
-        """Embed multiple texts efficiently."""
+        """
+        Embed multiple texts efficiently.
+        
+        With a cache attached, only texts not already cached are sent to the
+        model (each distinct text once); results come back in input order.
+        """
+        if self.cache is None or not texts:
+            return self._encode(texts, batch_size)
+        
+        cached = self.cache.get_many(texts)
+        misses = list(dict.fromkeys(text for i, text in enumerate(texts) if i not in cached))
+        
+        computed = {}
+        if misses:
+            vectors = self._encode(misses, batch_size)
+            self.cache.put_many(misses, vectors)
+            computed = dict(zip(misses, vectors))
+        
+        return np.stack([
+            cached[i] if i in cached else computed[text]
+            for i, text in enumerate(texts)
+        ]).astype(np.float32)
+    
+    def _encode(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         return self.model.encode(
             texts,
             batch_size=batch_size,
@@ -46,14 +99,24 @@ class EmbeddingPipeline:
             show_progress_bar=len(texts) > 100
         )
     
-    def embed_with_cache(self, text: str, cache: Dict[str, np.ndarray]) -> np.ndarray:
-        """Embed with caching to avoid recomputation."""
+    def embed_with_cache(self, text: str, cache: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        """Embed with caching to avoid recomputation.
+        
+        Uses the caller-supplied dict when given, otherwise the shared cache.
+        """
+        if cache is None:
+            return self.embed_text(text)
+        
         text_hash = hashlib.md5(text.encode()).hexdigest()
         
         if text_hash not in cache:
             cache[text_hash] = self.embed_text(text)
         
         return cache[text_hash]
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """Embedding cache hit-rate metrics (empty when caching is disabled)."""
+        return self.cache.stats() if self.cache is not None else {}
 
 
 @ray.remote
@@ -61,8 +124,14 @@ class DistributedEmbedder:
     """Ray actor for distributed embedding generation."""
     
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        # Every actor opens the same on-disk cache, so boilerplate sections
+        # embedded by one worker are reused by all of them
         self.pipeline = EmbeddingPipeline(model_name)
     
+    def cache_stats(self) -> Dict[str, float]:
+        """Cache hit-rate metrics for this actor."""
+        return self.pipeline.cache_stats()
+    
     def process_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process documents and add embeddings."""
         results = []
@@ -102,15 +171,52 @@ class DistributedEmbedder:
 
 
 class SemanticSearch:
-    """Semantic search using embeddings."""
+    """Semantic search using embeddings.
+
+    Queries run against a VectorIndex. Build it once with build_index() (or
+    load a saved one with load_index()) so documents are normalized a single
+    time. Embeddings passed to search() take precedence: the attached index
+    is used for them only if it was built from that same array, otherwise a
+    transient exact index is built. Without embeddings the attached index is
+    used, and it must hold one row per document.
+    """
     
-    def __init__(self, embedding_pipeline: EmbeddingPipeline):
+    def __init__(self, embedding_pipeline: EmbeddingPipeline, index: Optional[VectorIndex] = None):
         self.embedding_pipeline = embedding_pipeline
+        self.index = index
+        # Embedding matrix the attached index was built from, if built here
+        self._indexed_embeddings: Optional[np.ndarray] = None
+    
+    def build_index(self, embeddings: np.ndarray, index_type: str = "flat", **kwargs) -> VectorIndex:
+        """
+        Build and attach the vector index used by search().
+        
+        Args:
+            embeddings: Document embedding matrix, rows aligned with the documents list
+            index_type: "flat" for exact search, "ivf" for approximate search
+            **kwargs: Index options such as nlist/nprobe for IVF
+        """
+        self.index = build_index(embeddings, index_type=index_type, **kwargs)
+        self._indexed_embeddings = embeddings
+        logger.info(f"Built {index_type} vector index over {len(self.index)} embeddings")
+        return self.index
+    
+    def save_index(self, path: str) -> None:
+        """Save the attached index to a directory."""
+        if self.index is None:
+            raise ValueError("No vector index to save; call build_index() first")
+        self.index.save(path)
+    
+    def load_index(self, path: str, mmap: bool = True) -> VectorIndex:
+        """Load a saved index, memory-mapping its vectors by default."""
+        self.index = VectorIndex.load(path, mmap=mmap)
+        self._indexed_embeddings = None
+        return self.index
     
     def search(
         self,
         query: str,
-        embeddings: np.ndarray,
+        embeddings: Optional[np.ndarray],
         documents: List[Dict[str, Any]],
         top_k: int = 10,
         similarity_threshold: float = 0.7
@@ -118,26 +224,65 @@ class SemanticSearch:
         """
         Search documents using cosine similarity.
         
+        Args:
+            embeddings: Document embeddings aligned with documents; may be None
+                when an index over the same documents is attached
+        
         Returns:
             List of (similarity_score, document) tuples
         """
-        # Embed query
-        query_embedding = self.embedding_pipeline.embed_text(query)
-        
-        # Calculate cosine similarities
-        similarities = self._cosine_similarity(query_embedding, embeddings)
-        
-        # Get top-k results
-        top_indices = np.argsort(similarities)[-top_k:][::-1]
+        scores, positions = self.search_positions(query, embeddings, len(documents), top_k)
         
         results = []
-        for idx in top_indices:
-            score = similarities[idx]
+        for score, idx in zip(scores, positions):
             if score >= similarity_threshold:
-                results.append((score, documents[idx]))
+                results.append((float(score), documents[idx]))
         
         return results
     
+    def search_positions(
+        self,
+        query: str,
+        embeddings: Optional[np.ndarray],
+        num_documents: int,
+        top_k: int = 10
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (scores, positions) of the top-k documents for a query.
+        
+        Args:
+            embeddings: Document embeddings, or None to use the attached index
+            num_documents: Size of the corpus the positions index into
+        
+        Raises:
+            ValueError: If the embeddings or the attached index do not have one
+                row per document
+        """
+        index = self._index_for(embeddings, num_documents)
+        
+        # Embed query
+        query_embedding = self.embedding_pipeline.embed_text(query)
+        
+        # Get top-k results
+        return index.search(query_embedding, top_k=top_k)
+    
+    def _index_for(self, embeddings: Optional[np.ndarray], num_documents: int) -> VectorIndex:
+        """Pick the index whose positions line up with a corpus of num_documents."""
+        if embeddings is not None:
+            if len(embeddings) != num_documents:
+                raise ValueError(f"Got {len(embeddings)} embeddings for {num_documents} documents")
+            if self.index is not None and embeddings is self._indexed_embeddings:
+                return self.index
+            return FlatIndex.from_embeddings(embeddings)
+        
+        if self.index is None:
+            raise ValueError("Either embeddings or a vector index is required")
+        if len(self.index) != num_documents:
+            raise ValueError(
+                f"Vector index holds {len(self.index)} embeddings but {num_documents} documents were given"
+            )
+        return self.index
+    
     @staticmethod
     def _cosine_similarity(query_embedding: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
         """Calculate cosine similarity between query and all embeddings."""
@@ -174,16 +319,69 @@ class HybridSearch:
     """
     Hybrid search combining semantic and keyword search.
     Better for production as it handles both concept and exact matches.
+    
+    Keyword scores come from a BM25 inverted index. Call index_documents()
+    once per corpus; search() over a different documents list indexes it and
+    makes it the current corpus, so only switching corpora rebuilds the index.
+    Results are fused by document id (the document's "id" field, or its list
+    position when it has none).
     """
     
-    def __init__(self, semantic_search: SemanticSearch):
+    def __init__(self, semantic_search: SemanticSearch, keyword_index: Optional[BM25Index] = None):
         self.semantic_search = semantic_search
+        self.keyword_index = keyword_index
+        self._documents: Optional[List[Dict[str, Any]]] = None
+        self._positions: Dict[Any, int] = {}
+        # Corpus the semantic index was built for by index_documents()
+        self._vector_documents: Optional[List[Dict[str, Any]]] = None
+    
+    @staticmethod
+    def _doc_key(doc: Dict[str, Any], position: int) -> Any:
+        """Stable id used to fuse semantic and keyword results."""
+        doc_id = doc.get("id")
+        return str(doc_id) if doc_id is not None else position
+    
+    @staticmethod
+    def _doc_text(doc: Dict[str, Any]) -> str:
+        return doc.get("content") or doc.get("chunk_text") or ""
+    
+    def _build_keyword_index(self, documents: List[Dict[str, Any]]) -> Tuple[BM25Index, Dict[Any, int]]:
+        positions = {}
+        index = BM25Index()
+        for i, doc in enumerate(documents):
+            key = self._doc_key(doc, i)
+            positions[key] = i
+            index.add(key, self._doc_text(doc))
+        return index, positions
+    
+    def index_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        embeddings: Optional[np.ndarray] = None,
+        index_type: str = "flat",
+        **index_kwargs
+    ) -> None:
+        """
+        Build the keyword index (and the semantic index, if embeddings are given)
+        for a corpus that will be searched repeatedly.
+        
+        Args:
+            documents: Documents with "content" or "chunk_text"
+            embeddings: Embedding matrix aligned with documents
+            index_type: Vector index type passed to SemanticSearch.build_index
+        """
+        self.keyword_index, self._positions = self._build_keyword_index(documents)
+        self._documents = documents
+        
+        if embeddings is not None:
+            self.semantic_search.build_index(embeddings, index_type=index_type, **index_kwargs)
+            self._vector_documents = documents
     
     def search(
         self,
         query: str,
         documents: List[Dict[str, Any]],
-        embeddings: np.ndarray,
+        embeddings: Optional[np.ndarray],
         semantic_weight: float = 0.7,
         keyword_weight: float = 0.3,
         top_k: int = 10
@@ -192,73 +390,50 @@ class HybridSearch:
         Combine semantic and keyword search.
         
         Args:
+            embeddings: Embeddings aligned with documents; may be None when the
+                semantic index was built for these documents
             semantic_weight: Weight for semantic similarity (0-1)
             keyword_weight: Weight for keyword matching (0-1)
+        
+        Raises:
+            ValueError: If embeddings is None and the semantic index belongs
+                to a different corpus
         """
-        # Semantic search
-        semantic_results = self.semantic_search.search(
-            query, embeddings, documents, top_k=top_k * 2
-        )
+        if embeddings is None and self._vector_documents is not None and documents is not self._vector_documents:
+            raise ValueError(
+                "The vector index was built for a different corpus; "
+                "pass embeddings for these documents or call index_documents()"
+            )
         
-        # Keyword search (BM25-like scoring)
-        keyword_scores = self._keyword_score(query, documents)
+        if documents is not self._documents or self.keyword_index is None:
+            logger.debug(f"Indexing {len(documents)} documents for keyword search")
+            self.keyword_index, self._positions = self._build_keyword_index(documents)
+            self._documents = documents
+        keyword_index, positions = self.keyword_index, self._positions
         
-        # Combine scores
-        combined_scores = {}
+        candidates = top_k * 2
+        combined_scores: Dict[Any, float] = {}
         
-        for score, doc in semantic_results:
-            doc_id = id(doc)  # Use object id as key
-            combined_scores[doc_id] = {
-                "doc": doc,
-                "score": score * semantic_weight
-            }
+        # Semantic search
+        scores, semantic_positions = self.semantic_search.search_positions(
+            query, embeddings, len(documents), candidates
+        )
+        for score, idx in zip(scores, semantic_positions):
+            key = self._doc_key(documents[idx], int(idx))
+            combined_scores[key] = float(score) * semantic_weight
         
-        for i, doc in enumerate(documents):
-            doc_id = id(doc)
-            if doc_id in combined_scores:
-                combined_scores[doc_id]["score"] += keyword_scores[i] * keyword_weight
-            else:
-                combined_scores[doc_id] = {
-                    "doc": doc,
-                    "score": keyword_scores[i] * keyword_weight
-                }
+        # Keyword search (BM25), normalized to [0, 1] by the best match
+        keyword_results = keyword_index.search(query, top_k=candidates)
+        max_score = keyword_results[0][1] if keyword_results else 0.0
+        if max_score > 0:
+            for key, score in keyword_results:
+                combined_scores[key] = combined_scores.get(key, 0.0) + score / max_score * keyword_weight
         
         # Sort by combined score
-        results = sorted(
-            [(v["score"], v["doc"]) for v in combined_scores.values()],
-            key=lambda x: x[0],
-            reverse=True
-        )
+        ranked = sorted(combined_scores.items(), key=lambda item: item[1], reverse=True)
         
-        return results[:top_k]
+        return [(score, documents[positions[key]]) for key, score in ranked[:top_k]]
     
-    def _keyword_score(self, query: str, documents: List[Dict[str, Any]]) -> List[float]:
-        """Simple keyword scoring (BM25-inspired)."""
-        query_terms = query.lower().split()
-        scores = []
-        
-        for doc in documents:
-            text = doc.get("content", "").lower()
-            if not text:
-                scores.append(0)
-                continue
-            
-            # Term frequency
-            score = 0
-            for term in query_terms:
-                tf = text.count(term)
-                # Simple TF-IDF-like scoring
-                score += tf / (1 + tf)  # Saturation function
-            
-            scores.append(score / len(query_terms) if query_terms else 0)
-        
-        # Normalize scores
-        max_score = max(scores) if scores else 1
-        if max_score > 0:
-            scores = [s / max_score for s in scores]
-        
-        return scores
-
 
 def migrate_to_openai_embeddings(documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -0,0 +1,319 @@
+"""Inverted-index BM25 keyword search.
+
+BM25Index keeps one posting list (document positions + term frequencies) per
+token, so a query only touches the postings of its own terms instead of
+scanning every document's text. Documents can be added or replaced
+incrementally, and the index can be saved in a compact CSR-style layout
+(one offsets array plus flat doc/tf arrays) that is memory-mapped on load.
+
+Scores follow Okapi BM25:
+
+    idf(t) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(d) / avg_len))
+
+with idf(t) = ln(1 + (N - df + 0.5) / (df + 0.5)).
+"""
+
+import json
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+PathLike = Union[str, Path]
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Term frequencies are stored as uint16; BM25 saturates long before this
+MAX_STORED_TF = np.iinfo(np.uint16).max
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into alphanumeric tokens.
+
+    Whole-token matching means "ai" matches "AI" but not "said".
+    """
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class BM25Index:
+    """Incremental BM25 inverted index.
+
+    Documents are identified by caller-supplied ids (for example a database
+    UUID or a list position). Re-adding an existing id replaces the old text.
+
+    Example:
+        ```python
+        index = BM25Index()
+        index.add_documents(
+            (doc["id"], doc["content"]) for doc in documents
+        )
+        for doc_id, score in index.search("online learning revenue", top_k=10):
+            ...
+        index.save("data/indexes/bm25")
+        index = BM25Index.load("data/indexes/bm25")
+        ```
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+        self.doc_ids: List[Hashable] = []
+        self._positions: Dict[Hashable, int] = {}
+        self._doc_lengths = array("i")
+        self._deleted: set = set()
+        self._total_length = 0
+
+        # Mutable postings for documents added since construction/load
+        self._postings: Dict[str, Tuple[array, array]] = {}
+
+        # Compact postings read by load(); term -> row in _offsets
+        self._frozen_terms: Dict[str, int] = {}
+        self._offsets: Optional[np.ndarray] = None
+        self._frozen_docs: Optional[np.ndarray] = None
+        self._frozen_tfs: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids) - len(self._deleted)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._positions
+
+    @property
+    def average_length(self) -> float:
+        return self._total_length / len(self) if len(self) else 0.0
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """Index one document, replacing any earlier text with the same id."""
+        if doc_id in self._positions:
+            self.remove(doc_id)
+
+        position = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self._positions[doc_id] = position
+
+        tokens = tokenize(text)
+        self._doc_lengths.append(len(tokens))
+        self._total_length += len(tokens)
+
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+
+        for token, tf in counts.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = (array("i"), array("H"))
+            postings[0].append(position)
+            postings[1].append(min(tf, MAX_STORED_TF))
+
+    def add_documents(self, documents: Iterable[Tuple[Hashable, str]]) -> int:
+        """Index (doc_id, text) pairs; returns the number added."""
+        added = 0
+        for doc_id, text in documents:
+            self.add(doc_id, text or "")
+            added += 1
+        return added
+
+    def remove(self, doc_id: Hashable) -> bool:
+        """Drop a document from results. Its postings are purged on save()."""
+        position = self._positions.pop(doc_id, None)
+        if position is None:
+            return False
+
+        self._deleted.add(position)
+        self._total_length -= self._doc_lengths[position]
+        return True
+
+    def _term_postings(self, term: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """All posting segments (docs, tfs) for a term."""
+        segments = []
+
+        row = self._frozen_terms.get(term)
+        if row is not None:
+            start, end = self._offsets[row], self._offsets[row + 1]
+            segments.append((self._frozen_docs[start:end], self._frozen_tfs[start:end]))
+
+        postings = self._postings.get(term)
+        if postings is not None:
+            segments.append((
+                np.frombuffer(postings[0], dtype=np.int32),
+                np.frombuffer(postings[1], dtype=np.uint16),
+            ))
+
+        return segments
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[Hashable, float]]:
+        """Score documents containing any query term and return the best.
+
+        Returns:
+            List of (doc_id, bm25_score), highest score first
+        """
+        if not len(self) or top_k <= 0:
+            return []
+
+        doc_lengths = np.frombuffer(self._doc_lengths, dtype=np.int32)
+        avg_length = self.average_length or 1.0
+        n_docs = len(self)
+
+        all_docs = []
+        all_scores = []
+
+        for term in set(tokenize(query)):
+            segments = self._term_postings(term)
+            if not segments:
+                continue
+
+            docs = np.concatenate([s[0] for s in segments]) if len(segments) > 1 else segments[0][0]
+            tfs = np.concatenate([s[1] for s in segments]) if len(segments) > 1 else segments[0][1]
+
+            if self._deleted:
+                live = ~np.isin(docs, list(self._deleted))
+                docs, tfs = docs[live], tfs[live]
+            if docs.size == 0:
+                continue
+
+            df = docs.size
+            idf = np.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            tfs = tfs.astype(np.float32)
+            norm = self.k1 * (1.0 - self.b + self.b * doc_lengths[docs] / avg_length)
+
+            all_docs.append(docs)
+            all_scores.append(idf * tfs * (self.k1 + 1.0) / (tfs + norm))
+
+        if not all_docs:
+            return []
+
+        docs = np.concatenate(all_docs)
+        scores = np.concatenate(all_scores)
+
+        # Sum per-term contributions for each document
+        unique_docs, inverse = np.unique(docs, return_inverse=True)
+        totals = np.bincount(inverse, weights=scores)
+
+        if top_k < totals.size:
+            best = np.argpartition(totals, -top_k)[-top_k:]
+        else:
+            best = np.arange(totals.size)
+        best = best[np.argsort(totals[best])[::-1]]
+
+        return [(self.doc_ids[unique_docs[i]], float(totals[i])) for i in best]
+
+    def save(self, path: PathLike) -> None:
+        """Write the index in compact form, dropping removed documents.
+
+        Layout: ``meta.json`` (parameters, vocabulary, doc ids) plus
+        ``offsets.npy``, ``docs.npy``, ``tfs.npy`` and ``doc_lengths.npy``.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        # Renumber live documents densely
+        live_positions = [p for p in range(len(self.doc_ids)) if p not in self._deleted]
+        remap = np.full(len(self.doc_ids), -1, dtype=np.int32)
+        remap[live_positions] = np.arange(len(live_positions), dtype=np.int32)
+
+        terms = sorted(set(self._frozen_terms) | set(self._postings))
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        doc_chunks, tf_chunks = [], []
+        kept_terms = []
+
+        for term in terms:
+            segments = self._term_postings(term)
+            docs = remap[np.concatenate([s[0] for s in segments])]
+            tfs = np.concatenate([s[1] for s in segments])
+            live = docs >= 0
+            if not live.any():
+                continue
+
+            doc_chunks.append(docs[live])
+            tf_chunks.append(tfs[live])
+            kept_terms.append(term)
+            offsets[len(kept_terms)] = offsets[len(kept_terms) - 1] + int(live.sum())
+
+        offsets = offsets[:len(kept_terms) + 1]
+        doc_lengths = np.frombuffer(self._doc_lengths, dtype=np.int32)[live_positions]
+
+        np.save(path / "offsets.npy", offsets)
+        np.save(path / "docs.npy", np.concatenate(doc_chunks) if doc_chunks else np.empty(0, dtype=np.int32))
+        np.save(path / "tfs.npy", np.concatenate(tf_chunks) if tf_chunks else np.empty(0, dtype=np.uint16))
+        np.save(path / "doc_lengths.npy", doc_lengths.astype(np.int32))
+
+        meta = {
+            "k1": self.k1,
+            "b": self.b,
+            "terms": kept_terms,
+            "doc_ids": [self.doc_ids[p] for p in live_positions],
+        }
+        (path / "meta.json").write_text(json.dumps(meta, default=str))
+        logger.info(f"Saved BM25 index ({len(live_positions)} documents, {len(kept_terms)} terms) to {path}")
+
+    @classmethod
+    def load(cls, path: PathLike, mmap: bool = True) -> "BM25Index":
+        """Load an index written by save(); more documents can be added afterwards."""
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        mmap_mode = "r" if mmap else None
+
+        index = cls(k1=meta["k1"], b=meta["b"])
+        index.doc_ids = list(meta["doc_ids"])
+        index._positions = {doc_id: i for i, doc_id in enumerate(index.doc_ids)}
+        index._frozen_terms = {term: i for i, term in enumerate(meta["terms"])}
+        index._offsets = np.load(path / "offsets.npy")
+        index._frozen_docs = np.load(path / "docs.npy", mmap_mode=mmap_mode)
+        index._frozen_tfs = np.load(path / "tfs.npy", mmap_mode=mmap_mode)
+
+        doc_lengths = np.load(path / "doc_lengths.npy")
+        index._doc_lengths = array("i", doc_lengths.tobytes())
+        index._total_length = int(doc_lengths.sum())
+        return index
+
+
+async def build_keyword_index_from_db(
+    session,
+    include_documents: bool = True,
+    include_chunks: bool = True,
+    batch_size: int = 1000,
+    index: Optional[BM25Index] = None,
+) -> BM25Index:
+    """Index Document.content and DocumentChunk.chunk_text from the database.
+
+    Rows are streamed in batches so the corpus never has to fit in memory as
+    ORM objects. Ids are ``"document:<uuid>"`` and ``"chunk:<uuid>"``.
+
+    Args:
+        session: Async database session
+        include_documents: Index Document.content
+        include_chunks: Index DocumentChunk.chunk_text
+        batch_size: Rows fetched per round trip
+        index: Existing index to extend (a new one is created if omitted)
+
+    Returns:
+        Populated BM25Index
+    """
+    from sqlalchemy import select
+
+    from src.db.models import Document, DocumentChunk
+
+    if index is None:
+        index = BM25Index()
+    sources: List[Tuple[str, Any, Any]] = []
+    if include_documents:
+        sources.append(("document", Document.id, Document.content))
+    if include_chunks:
+        sources.append(("chunk", DocumentChunk.id, DocumentChunk.chunk_text))
+
+    for prefix, id_column, text_column in sources:
+        stream = await session.stream(
+            select(id_column, text_column)
+            .where(text_column.isnot(None))
+            .execution_options(yield_per=batch_size)
+        )
+        async for row_id, text in stream:
+            index.add(f"{prefix}:{row_id}", text)
+
+    logger.info(f"Indexed {len(index)} documents/chunks for keyword search")
+    return index
@@ -19,135 +19,291 @@ class ExtractedMetric:
     period: Optional[str] = None
 
 
+# Period patterns, compiled once rather than per extracted metric
+QUARTER_PATTERN = re.compile(r"(?i)(Q[1-4]\s*20\d{2}|[1-4]Q\s*20\d{2})")
+YEAR_PATTERN = re.compile(r"(?i)(fiscal year|FY|calendar year|CY)?\s*(20\d{2})")
+MONTH_PATTERN = re.compile(r"(?i)(January|February|March|April|May|June|July|August|September|October|November|December)\s*(20\d{2})")
+
+# Non-space, non-digit characters that can precede a trailing anchor inside a
+# match: separators, "$", "%" and the million/billion/M/B scale words (plus the
+# dotted/dotless capital I that re.IGNORECASE folds onto "i")
+_PREFIX_CHARS = frozenset(",.$%milonbMILONB\u0130\u0131")
+
+
+def _is_prefix_char(char: str) -> bool:
+    """Whether ``char`` can appear before a trailing anchor (mirrors \\s and \\d)."""
+    return char in _PREFIX_CHARS or char.isspace() or char.isdecimal()
+
+# Characters that re.IGNORECASE matches to an anchor letter but str.lower()
+# does not map onto it (dotless/dotted I, long s); their presence switches
+# anchor search from str.find to regex
+_CASE_FOLD_EXCEPTIONS = ("\u0131", "\u0130", "\u017f")
+
+_UNSET = object()
+
+
+@dataclass(frozen=True)
+class MetricRule:
+    """One metric regex plus the literal anchor every match must contain.
+
+    ``anchored_at`` is "start" when a match begins with the anchor and "end"
+    when the anchor (extended by ``tail``) is the last thing in the match.
+    """
+    
+    metric_type: str
+    pattern: re.Pattern
+    unit: str
+    anchor: str
+    anchored_at: str
+    tail: Optional[re.Pattern] = None
+
+
+# (metric_type, regex, unit, anchor, anchored_at, tail regex for "end" anchors)
+METRIC_RULE_SPECS: List[Tuple[str, str, str, str, str, Optional[str]]] = [
+    ("monthly_active_users", r"(?i)(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?\s*(?:monthly active users|MAUs)", "count", "monthly active users", "end", r"(?i)monthly active users"),
+    ("monthly_active_users", r"(?i)(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?\s*(?:monthly active users|MAUs)", "count", "mau", "end", r"(?i)MAUs"),
+    ("monthly_active_users", r"(?i)MAUs?\s*(?:of|:)\s*(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?", "count", "mau", "start", None),
+    ("average_revenue_per_user", r"(?i)ARPU\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", "USD", "arpu", "start", None),
+    ("average_revenue_per_user", r"(?i)average revenue per user\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", "USD", "average revenue per user", "start", None),
+    ("customer_acquisition_cost", r"(?i)CAC\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", "USD", "cac", "start", None),
+    ("customer_acquisition_cost", r"(?i)customer acquisition cost\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", "USD", "customer acquisition cost", "start", None),
+    ("net_revenue_retention", r"(?i)NRR\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", "percent", "nrr", "start", None),
+    ("net_revenue_retention", r"(?i)net revenue retention\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", "percent", "net revenue retention", "start", None),
+    ("course_completion_rate", r"(?i)completion rate\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", "percent", "completion rate", "start", None),
+    ("course_completion_rate", r"(?i)(\d+(?:\.\d+)?)\s*%\s*completion rate", "percent", "completion rate", "end", r"(?i)completion rate"),
+    ("subscriber_count", r"(?i)(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?\s*subscribers?", "count", "subscriber", "end", r"(?i)subscribers?"),
+    ("subscriber_count", r"(?i)subscriber base\s*(?:of|:)?\s*(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?", "count", "subscriber", "start", None),
+    ("revenue", r"(?i)revenue\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|billion|M|B)", "USD", "revenue", "start", None),
+    ("revenue", r"(?i)\$?(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|billion|M|B)\s*in revenue", "USD", "revenue", "end", r"(?i)revenue"),
+    ("gross_margin", r"(?i)gross margin\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", "percent", "gross margin", "start", None),
+    ("gross_margin", r"(?i)(\d+(?:\.\d+)?)\s*%\s*gross margin", "percent", "gross margin", "end", r"(?i)gross margin"),
+    ("churn_rate", r"(?i)churn rate\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", "percent", "churn", "start", None),
+    ("churn_rate", r"(?i)(\d+(?:\.\d+)?)\s*%\s*churn", "percent", "churn", "end", r"(?i)churn"),
+    ("lifetime_value", r"(?i)LTV\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", "USD", "ltv", "start", None),
+    ("lifetime_value", r"(?i)lifetime value\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", "USD", "lifetime value", "start", None),
+]
+
+
+class MetricScanEngine:
+    """Anchor-prefiltered matcher for a set of metric rules.
+
+    Every rule's regex contains a literal anchor ("ARPU", "subscriber", ...).
+    The document is lowercased once and anchor occurrences are located with
+    ``str.find``; each rule's regex then only runs at its own anchors:
+    ``match`` at the anchor for start-anchored rules, or a bounded ``search``
+    over the short run of number/scale characters preceding the anchor for
+    end-anchored rules. Matches are identical to running ``finditer`` for
+    every rule over the whole text (leftmost, non-overlapping per rule).
+    """
+    
+    def __init__(self, rules: List[MetricRule]):
+        self.rules = rules
+        self.rules_by_anchor: Dict[str, List[int]] = {}
+        for i, rule in enumerate(rules):
+            self.rules_by_anchor.setdefault(rule.anchor, []).append(i)
+        
+        # Fallback for text where lower() and re.IGNORECASE disagree
+        self.anchor_patterns = {
+            anchor: re.compile(f"(?={re.escape(anchor)})", re.IGNORECASE)
+            for anchor in self.rules_by_anchor
+        }
+    
+    def _anchor_positions(self, text: str) -> Dict[str, List[int]]:
+        """Start offsets of every (possibly overlapping) anchor occurrence."""
+        lowered = text.lower()
+        
+        if len(lowered) != len(text) or any(char in text for char in _CASE_FOLD_EXCEPTIONS):
+            return {
+                anchor: [m.start() for m in pattern.finditer(text)]
+                for anchor, pattern in self.anchor_patterns.items()
+            }
+        
+        positions = {}
+        for anchor in self.rules_by_anchor:
+            found = []
+            index = lowered.find(anchor)
+            while index != -1:
+                found.append(index)
+                index = lowered.find(anchor, index + 1)
+            positions[anchor] = found
+        return positions
+    
+    def scan(self, text: str) -> List[List[re.Match]]:
+        """Return matches per rule, each list ordered by position."""
+        results: List[List[re.Match]] = [[] for _ in self.rules]
+        
+        for anchor, anchor_starts in self._anchor_positions(text).items():
+            for i in self.rules_by_anchor[anchor]:
+                rule = self.rules[i]
+                matches = results[i]
+                last_end = 0
+                
+                for anchor_start in anchor_starts:
+                    if rule.anchored_at == "start":
+                        if anchor_start < last_end:
+                            continue
+                        match = rule.pattern.match(text, anchor_start)
+                    else:
+                        tail = rule.tail.match(text, anchor_start)
+                        if tail is None or tail.end() <= last_end:
+                            continue
+                        
+                        region_start = anchor_start
+                        while region_start > last_end and _is_prefix_char(text[region_start - 1]):
+                            region_start -= 1
+                        match = rule.pattern.search(text, region_start, tail.end())
+                    
+                    if match is not None:
+                        matches.append(match)
+                        last_end = match.end()
+        
+        return results
+
+
 class EdTechMetricsExtractor:
     """Extract EdTech-specific metrics from text."""
     
     def __init__(self):
+        self.metric_rules = self._build_metric_rules()
         self.metric_patterns = self._build_metric_patterns()
+        self.engine = MetricScanEngine(self.metric_rules)
+    
+    def _build_metric_rules(self) -> List[MetricRule]:
+        """Compile the anchored metric rules."""
+        return [
+            MetricRule(
+                metric_type=metric_type,
+                pattern=re.compile(regex, re.IGNORECASE),
+                unit=unit,
+                anchor=anchor,
+                anchored_at=anchored_at,
+                tail=re.compile(tail) if tail else None,
+            )
+            for metric_type, regex, unit, anchor, anchored_at, tail in METRIC_RULE_SPECS
+        ]
     
     def _build_metric_patterns(self) -> Dict[str, List[Tuple[re.Pattern, str]]]:
         """Build regex patterns for metric extraction."""
-        return {
-            "monthly_active_users": [
-                (re.compile(r"(?i)(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?\s*(?:monthly active users|MAUs)", re.IGNORECASE), "count"),
-                (re.compile(r"(?i)MAUs?\s*(?:of|:)\s*(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?", re.IGNORECASE), "count"),
-            ],
-            "average_revenue_per_user": [
-                (re.compile(r"(?i)ARPU\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", re.IGNORECASE), "USD"),
-                (re.compile(r"(?i)average revenue per user\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", re.IGNORECASE), "USD"),
-            ],
-            "customer_acquisition_cost": [
-                (re.compile(r"(?i)CAC\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", re.IGNORECASE), "USD"),
-                (re.compile(r"(?i)customer acquisition cost\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", re.IGNORECASE), "USD"),
-            ],
-            "net_revenue_retention": [
-                (re.compile(r"(?i)NRR\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", re.IGNORECASE), "percent"),
-                (re.compile(r"(?i)net revenue retention\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", re.IGNORECASE), "percent"),
-            ],
-            "course_completion_rate": [
-                (re.compile(r"(?i)completion rate\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", re.IGNORECASE), "percent"),
-                (re.compile(r"(?i)(\d+(?:\.\d+)?)\s*%\s*completion rate", re.IGNORECASE), "percent"),
-            ],
-            "subscriber_count": [
-                (re.compile(r"(?i)(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?\s*subscribers?", re.IGNORECASE), "count"),
-                (re.compile(r"(?i)subscriber base\s*(?:of|:)?\s*(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|M)?", re.IGNORECASE), "count"),
-            ],
-            "revenue": [
-                (re.compile(r"(?i)revenue\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|billion|M|B)", re.IGNORECASE), "USD"),
-                (re.compile(r"(?i)\$?(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:million|billion|M|B)\s*in revenue", re.IGNORECASE), "USD"),
-            ],
-            "gross_margin": [
-                (re.compile(r"(?i)gross margin\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", re.IGNORECASE), "percent"),
-                (re.compile(r"(?i)(\d+(?:\.\d+)?)\s*%\s*gross margin", re.IGNORECASE), "percent"),
-            ],
-            "churn_rate": [
-                (re.compile(r"(?i)churn rate\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%", re.IGNORECASE), "percent"),
-                (re.compile(r"(?i)(\d+(?:\.\d+)?)\s*%\s*churn", re.IGNORECASE), "percent"),
-            ],
-            "lifetime_value": [
-                (re.compile(r"(?i)LTV\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", re.IGNORECASE), "USD"),
-                (re.compile(r"(?i)lifetime value\s*(?:of|:)?\s*\$?(\d+(?:,\d{3})*(?:\.\d+)?)", re.IGNORECASE), "USD"),
-            ],
-        }
+        patterns: Dict[str, List[Tuple[re.Pattern, str]]] = {}
+        for rule in self.metric_rules:
+            entries = patterns.setdefault(rule.metric_type, [])
+            if all(existing.pattern != rule.pattern.pattern for existing, _ in entries):
+                entries.append((rule.pattern, rule.unit))
+        return patterns
     
     def extract_metrics(self, text: str) -> List[ExtractedMetric]:
-        """Extract all metrics from text."""
+        """Extract all metrics from text with one anchor scan."""
         metrics = []
+        matches_by_rule = self.engine.scan(text)
+        # Boilerplate repeats, so identical contexts are common
+        periods: Dict[str, Optional[str]] = {}
         
-        for metric_type, patterns in self.metric_patterns.items():
-            for pattern, unit in patterns:
-                matches = pattern.finditer(text)
+        for rule, matches in self._ordered_matches(matches_by_rule):
+            for match in matches:
+                # Extract value
+                value_str = match.group(1).replace(",", "")
                 
-                for match in matches:
-                    # Extract value
-                    value_str = match.group(1).replace(",", "")
+                try:
+                    value = float(value_str)
                     
-                    try:
-                        value = float(value_str)
-                        
-                        # Handle millions/billions notation
-                        if "million" in match.group(0).lower() or " M" in match.group(0):
-                            value *= 1e6
-                        elif "billion" in match.group(0).lower() or " B" in match.group(0):
-                            value *= 1e9
-                        
-                        # Extract context (surrounding text)
-                        start = max(0, match.start() - 100)
-                        end = min(len(text), match.end() + 100)
-                        context = text[start:end].strip()
-                        
-                        # Extract period if mentioned
-                        period = self._extract_period(context)
-                        
-                        # Calculate confidence based on context clarity
-                        confidence = self._calculate_confidence(metric_type, context)
-                        
-                        metrics.append(ExtractedMetric(
-                            metric_type=metric_type,
-                            value=value,
-                            unit=unit,
-                            context=context,
-                            confidence=confidence,
-                            period=period,
-                        ))
-                        
-                    except ValueError:
-                        logger.warning(f"Could not parse value: {value_str}")
-                        continue
+                    # Handle millions/billions notation
+                    matched = match.group(0)
+                    matched_lower = matched.lower()
+                    if "million" in matched_lower or " M" in matched:
+                        value *= 1e6
+                    elif "billion" in matched_lower or " B" in matched:
+                        value *= 1e9
+                    
+                    # Extract context (surrounding text)
+                    start = max(0, match.start() - 100)
+                    end = min(len(text), match.end() + 100)
+                    context = text[start:end].strip()
+                    
+                    # Extract period if mentioned
+                    if context not in periods:
+                        periods[context] = self._extract_period(context)
+                    period = periods[context]
+                    
+                    # Calculate confidence based on context clarity
+                    confidence = self._calculate_confidence(rule.metric_type, context, period)
+                    
+                    metrics.append(ExtractedMetric(
+                        metric_type=rule.metric_type,
+                        value=value,
+                        unit=rule.unit,
+                        context=context,
+                        confidence=confidence,
+                        period=period,
+                    ))
+                    
+                except ValueError:
+                    logger.warning(f"Could not parse value: {value_str}")
+                    continue
         
         # Deduplicate metrics
         metrics = self._deduplicate_metrics(metrics)
         
         return metrics
     
+    def _ordered_matches(self, matches_by_rule: List[List[re.Match]]):
+        """Yield (rule, matches) in pattern order, merging rules that share a regex.
+        
+        A regex with two anchors (e.g. "monthly active users" or "MAUs") is
+        split into one rule per anchor; its matches are merged back by
+        position so output order matches a single finditer over that regex.
+        """
+        i = 0
+        while i < len(self.metric_rules):
+            rule = self.metric_rules[i]
+            matches = list(matches_by_rule[i])
+            j = i + 1
+            while j < len(self.metric_rules) and self.metric_rules[j].pattern.pattern == rule.pattern.pattern:
+                matches.extend(matches_by_rule[j])
+                j += 1
+            if j > i + 1:
+                matches = self._leftmost_non_overlapping(matches)
+            yield rule, matches
+            i = j
+    
+    @staticmethod
+    def _leftmost_non_overlapping(matches: List[re.Match]) -> List[re.Match]:
+        selected = []
+        last_end = 0
+        for match in sorted(matches, key=lambda m: m.start()):
+            if match.start() >= last_end:
+                selected.append(match)
+                last_end = match.end()
+        return selected
+    
     def _extract_period(self, context: str) -> Optional[str]:
         """Extract time period from context."""
         # Quarter patterns
-        quarter_pattern = re.compile(r"(?i)(Q[1-4]\s*20\d{2}|[1-4]Q\s*20\d{2})")
-        quarter_match = quarter_pattern.search(context)
+        quarter_match = QUARTER_PATTERN.search(context)
         if quarter_match:
             return quarter_match.group(1)
         
         # Year patterns
-        year_pattern = re.compile(r"(?i)(fiscal year|FY|calendar year|CY)?\s*(20\d{2})")
-        year_match = year_pattern.search(context)
+        year_match = YEAR_PATTERN.search(context)
         if year_match:
             return year_match.group(2)
         
         # Month patterns
-        month_pattern = re.compile(r"(?i)(January|February|March|April|May|June|July|August|September|October|November|December)\s*(20\d{2})")
-        month_match = month_pattern.search(context)
+        month_match = MONTH_PATTERN.search(context)
         if month_match:
             return f"{month_match.group(1)} {month_match.group(2)}"
         
         return None
     
-    def _calculate_confidence(self, metric_type: str, context: str) -> float:
-        """Calculate confidence score for extracted metric."""
+    def _calculate_confidence(self, metric_type: str, context: str, period: Any = _UNSET) -> float:
+        """Calculate confidence score for extracted metric.
+        
+        ``period`` may be passed when already extracted from the same context.
+        """
         confidence = 0.5  # Base confidence
+        context_lower = context.lower()
         
         # Boost confidence if metric name is explicitly mentioned
-        if metric_type.replace("_", " ") in context.lower():
+        if metric_type.replace("_", " ") in context_lower:
             confidence += 0.2
         
         # Boost if common abbreviations are used
@@ -166,12 +322,14 @@ class EdTechMetricsExtractor:
                     break
         
         # Boost if period is mentioned
-        if self._extract_period(context):
+        if period is _UNSET:
+            period = self._extract_period(context)
+        if period:
             confidence += 0.1
         
         # Reduce if negative context
         negative_words = ["not", "excluding", "without", "except", "decline", "decrease"]
-        if any(word in context.lower() for word in negative_words):
+        if any(word in context_lower for word in negative_words):
             confidence *= 0.7
         
         return min(confidence, 1.0)
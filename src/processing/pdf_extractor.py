@@ -0,0 +1,185 @@
+"""Page-parallel, streaming PDF text extraction.
+
+Annual-report PDFs run to hundreds of pages, and pdfplumber layout analysis
+costs tens of milliseconds per page. PDFExtractor splits a document into page
+ranges and extracts them in a process pool, yielding pages in order as soon
+as each range finishes so that chunking and metric extraction can start
+before the last page is parsed. Small documents are read serially, where
+pool start-up would cost more than it saves.
+
+Each process opens the file once: the parent reads metadata with pypdf and
+then hands the same handle to pdfplumber; each pool worker opens the file
+once for its page range.
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import pdfplumber
+from loguru import logger
+from pypdf import PdfReader
+
+
+@dataclass
+class PDFPage:
+    """Text of one PDF page."""
+
+    page_number: int  # zero-based
+    text: str
+
+
+def extract_page_range(pdf_path: str, start: int, end: int) -> List[Tuple[int, str]]:
+    """Extract pages [start, end) of a PDF.
+
+    Runs in pool workers, so it is a module-level function returning plain
+    tuples. Falls back to pypdf for the range if pdfplumber fails.
+    """
+    try:
+        with pdfplumber.open(pdf_path, pages=list(range(start + 1, end + 1))) as pdf:
+            return [(start + i, page.extract_text() or "") for i, page in enumerate(pdf.pages)]
+    except Exception as e:
+        logger.warning(f"pdfplumber failed on pages {start}-{end} of {pdf_path}: {e}, trying pypdf")
+        reader = PdfReader(pdf_path)
+        return [(i, reader.pages[i].extract_text() or "") for i in range(start, end)]
+
+
+def read_pdf_metadata(reader: PdfReader) -> Dict[str, Any]:
+    """Document information dictionary and page count from an open reader."""
+    try:
+        metadata = reader.metadata
+        fields = {
+            "title": None,
+            "author": None,
+            "subject": None,
+            "creator": None,
+            "producer": None,
+            "creation_date": None,
+            "modification_date": None,
+        }
+        if metadata:
+            for name in fields:
+                value = getattr(metadata, name)
+                fields[name] = str(value) if value else None
+        fields["num_pages"] = len(reader.pages)
+        return fields
+    except Exception as e:
+        logger.warning(f"Failed to extract metadata: {e}")
+        return {}
+
+
+class PDFExtractor:
+    """Extract PDF text page by page, in parallel for large documents.
+
+    Example:
+        ```python
+        extractor = PDFExtractor(max_workers=8)
+        metadata, pages = extractor.open("annual_report.pdf")
+        for page in pages:             # in page order, as ranges complete
+            handle(page.page_number, page.text)
+
+        text, metadata = extractor.extract("annual_report.pdf")
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pages_per_task: int = 16,
+        min_parallel_pages: int = 32,
+    ):
+        """
+        Initialize extractor.
+
+        Args:
+            max_workers: Pool size (defaults to the CPU count)
+            pages_per_task: Minimum pages extracted per pool task
+            min_parallel_pages: Documents shorter than this are read serially
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pages_per_task = max(1, pages_per_task)
+        self.min_parallel_pages = min_parallel_pages
+
+    def open(self, pdf_path: str) -> Tuple[Dict[str, Any], Iterator[PDFPage]]:
+        """Read metadata and return a lazy iterator over the document's pages.
+
+        Pages are not extracted until the iterator is consumed.
+        """
+        handle = open(pdf_path, "rb")
+        try:
+            reader = PdfReader(handle)
+            metadata = read_pdf_metadata(reader)
+        except Exception as e:
+            # pdfplumber may still manage files pypdf cannot parse
+            logger.warning(f"Failed to extract metadata: {e}")
+            reader, metadata = None, {}
+
+        num_pages = metadata.get("num_pages", 0)
+        if self.max_workers > 1 and num_pages >= self.min_parallel_pages:
+            handle.close()
+            return metadata, self._iter_parallel(pdf_path, num_pages)
+        return metadata, self._iter_serial(handle, reader)
+
+    def read_metadata(self, pdf_path: str) -> Dict[str, Any]:
+        """Read only the document metadata, closing the file before returning."""
+        with open(pdf_path, "rb") as handle:
+            try:
+                return read_pdf_metadata(PdfReader(handle))
+            except Exception as e:
+                logger.warning(f"Failed to extract metadata: {e}")
+                return {}
+
+    def iter_pages(self, pdf_path: str) -> Iterator[PDFPage]:
+        """Yield pages in order, extracting them lazily."""
+        _, pages = self.open(pdf_path)
+        yield from pages
+
+    def extract(self, pdf_path: str) -> Tuple[str, Dict[str, Any]]:
+        """Extract the full text (one line-terminated block per non-empty page) and metadata."""
+        metadata, pages = self.open(pdf_path)
+        text = "".join(page.text + "\n" for page in pages if page.text)
+        return text, metadata
+
+    def _iter_serial(self, handle: BinaryIO, reader: Optional[PdfReader]) -> Iterator[PDFPage]:
+        """Extract from the already-open handle, falling back to the pypdf reader."""
+        with handle:
+            done = 0
+            try:
+                handle.seek(0)
+                with pdfplumber.open(handle) as pdf:
+                    for page in pdf.pages:
+                        yield PDFPage(done, page.extract_text() or "")
+                        done += 1
+                        # Release cached layout objects of finished pages
+                        page.close()
+                return
+            except Exception as e:
+                if reader is None:
+                    logger.error(f"Both PDF extraction methods failed: {e}")
+                    raise
+                logger.warning(f"pdfplumber failed: {e}, trying pypdf")
+
+            for number in range(done, len(reader.pages)):
+                yield PDFPage(number, reader.pages[number].extract_text() or "")
+
+    def _iter_parallel(self, pdf_path: str, num_pages: int) -> Iterator[PDFPage]:
+        """Extract page ranges in a process pool, yielding pages in order."""
+        # Every task re-opens the document, so use at most two ranges per worker
+        size = max(self.pages_per_task, -(-num_pages // (2 * self.max_workers)))
+        ranges = [(start, min(start + size, num_pages)) for start in range(0, num_pages, size)]
+        workers = min(self.max_workers, len(ranges))
+        logger.debug(f"Extracting {num_pages} pages of {pdf_path} in {len(ranges)} tasks on {workers} workers")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures: List[Future] = [
+                pool.submit(extract_page_range, pdf_path, start, end) for start, end in ranges
+            ]
+            try:
+                for future in futures:
+                    for number, text in future.result():
+                        yield PDFPage(number, text)
+            finally:
+                # Consumer stopped early or a range failed: drop queued work
+                for future in futures:
+                    future.cancel()
@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
+import numpy as np
 import tiktoken
 from loguru import logger
 
+SENTENCE_ENDINGS = re.compile(r'[.!?]+')
+ABBREVIATIONS = {'Dr.', 'Mr.', 'Mrs.', 'Ms.', 'Prof.', 'Sr.', 'Jr.', 'Inc.', 'Corp.', 'Ltd.'}
+MAX_ABBREVIATION_LENGTH = max(len(a) for a in ABBREVIATIONS)
+LEADING_SPACE = re.compile(r'\s*')
+
 
 @dataclass
 class TextChunk:
-    """Represents a chunk of text with metadata."""
+    """Represents a chunk of text with metadata.
+    
+    For token-aware chunking, ``text == source[start_index:end_index]``.
+    """
     
     text: str
     start_index: int
@@ -65,110 +75,139 @@ class TextChunker:
             return []
         
         if self.tokenizer:
-            return self._chunk_with_tokens(text)
+            return list(self.iter_chunks(text))
         else:
             return self._chunk_simple(text)
     
-    def _chunk_with_tokens(self, text: str) -> List[TextChunk]:
-        """Chunk using token counting."""
-        chunks = []
+    def iter_chunks(self, text: str) -> Iterator[TextChunk]:
+        """
+        Yield chunks one at a time.
+        
+        Only the document's token ids are held in memory, so very large
+        filings can be chunked and embedded without materializing every chunk.
+        """
+        if not text:
+            return
+        
+        if self.tokenizer:
+            yield from self._chunk_with_tokens(text)
+        else:
+            yield from self._chunk_simple(text)
+    
+    def _chunk_with_tokens(self, text: str) -> Iterator[TextChunk]:
+        """
+        Chunk using token counting in linear time.
         
-        # Split into sentences if requested
+        The document is encoded once. Sentence (or paragraph) boundaries are
+        mapped onto token positions, giving a prefix-sum array where the token
+        count of any run of sentences is a subtraction. Chunks pack whole
+        sentences greedily up to ``chunk_size`` tokens, and each following
+        chunk re-starts at the earliest trailing sentences that fit within
+        ``chunk_overlap``. Chunk text is sliced from the source, so
+        ``start_index``/``end_index`` are exact character offsets.
+        """
         if self.respect_sentences:
-            sentences = self._split_sentences(text)
+            spans = self._sentence_spans(text)
         else:
             # Split by paragraphs as fallback
-            sentences = text.split('\n\n')
+            spans = self._paragraph_spans(text)
+        
+        if not spans:
+            return
+        
+        tokens = self.tokenizer.encode(text, disallowed_special=())
+        token_starts = self._token_char_offsets(text, tokens)
+        
+        # bounds[k] = token holding sentence k's first character (BPE tokens
+        # carry leading whitespace); bounds[-1] = total tokens
+        bounds = [0]
+        bounds.extend(bisect_right(token_starts, start) - 1 for start, _ in spans[1:])
+        bounds.append(len(tokens))
         
-        current_chunk = []
-        current_tokens = 0
-        chunk_start_idx = 0
         chunk_index = 0
+        i = 0
         
-        for sentence in sentences:
-            sentence_tokens = len(self.tokenizer.encode(sentence))
-            
-            # If single sentence exceeds chunk size, split it
-            if sentence_tokens > self.chunk_size:
-                # Save current chunk if it exists
-                if current_chunk:
-                    chunk_text = ' '.join(current_chunk)
-                    chunks.append(TextChunk(
-                        text=chunk_text,
-                        start_index=chunk_start_idx,
-                        end_index=chunk_start_idx + len(chunk_text),
-                        chunk_index=chunk_index,
-                        token_count=current_tokens
-                    ))
-                    chunk_index += 1
-                    current_chunk = []
-                    current_tokens = 0
-                
-                # Split large sentence
-                sub_chunks = self._split_large_text(sentence)
-                for sub_chunk in sub_chunks:
-                    chunks.append(TextChunk(
-                        text=sub_chunk,
-                        start_index=chunk_start_idx,
-                        end_index=chunk_start_idx + len(sub_chunk),
-                        chunk_index=chunk_index,
-                        token_count=len(self.tokenizer.encode(sub_chunk))
-                    ))
+        while i < len(spans):
+            # Single sentence larger than a chunk: split it on token windows
+            if bounds[i + 1] - bounds[i] > self.chunk_size:
+                for chunk in self._split_span_by_tokens(text, spans[i], bounds[i], bounds[i + 1], token_starts, chunk_index):
+                    yield chunk
                     chunk_index += 1
-                    chunk_start_idx += len(sub_chunk) + 1
-                
+                i += 1
                 continue
             
-            # Check if adding sentence exceeds chunk size
-            if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
-                # Save current chunk
-                chunk_text = ' '.join(current_chunk)
-                chunks.append(TextChunk(
-                    text=chunk_text,
-                    start_index=chunk_start_idx,
-                    end_index=chunk_start_idx + len(chunk_text),
+            # Greedily extend while the next sentence still fits
+            j = i + 1
+            while j < len(spans) and bounds[j + 1] - bounds[i] <= self.chunk_size:
+                j += 1
+            
+            start_char, end_char = spans[i][0], spans[j - 1][1]
+            yield TextChunk(
+                text=text[start_char:end_char],
+                start_index=start_char,
+                end_index=end_char,
+                chunk_index=chunk_index,
+                token_count=bounds[j] - bounds[i]
+            )
+            chunk_index += 1
+            
+            if j >= len(spans):
+                break
+            
+            # Next chunk starts with the trailing sentences that fit the overlap
+            # and still leave room for the next new sentence
+            next_start = j
+            if self.chunk_overlap > 0 and bounds[j + 1] - bounds[j] <= self.chunk_size:
+                overlap_start = bisect_left(bounds, bounds[j] - self.chunk_overlap, i + 1, j)
+                fit_start = bisect_left(bounds, bounds[j + 1] - self.chunk_size, i + 1, j)
+                next_start = max(overlap_start, fit_start)
+            i = next_start
+    
+    def _split_span_by_tokens(
+        self,
+        text: str,
+        span: Tuple[int, int],
+        first_token: int,
+        end_token: int,
+        token_starts: List[int],
+        chunk_index: int
+    ) -> Iterator[TextChunk]:
+        """Split one over-long sentence into overlapping token windows."""
+        step = max(1, self.chunk_size - self.chunk_overlap)
+        
+        for t in range(first_token, end_token, step):
+            t_end = min(t + self.chunk_size, end_token)
+            start_char = max(span[0], token_starts[t])
+            end_char = span[1] if t_end == end_token else min(span[1], token_starts[t_end])
+            
+            if start_char < end_char:
+                yield TextChunk(
+                    text=text[start_char:end_char],
+                    start_index=start_char,
+                    end_index=end_char,
                     chunk_index=chunk_index,
-                    token_count=current_tokens
-                ))
+                    token_count=t_end - t
+                )
                 chunk_index += 1
-                
-                # Start new chunk with overlap
-                if self.chunk_overlap > 0 and len(current_chunk) > 0:
-                    # Calculate overlap
-                    overlap_sentences = []
-                    overlap_tokens = 0
-                    
-                    for sent in reversed(current_chunk):
-                        sent_tokens = len(self.tokenizer.encode(sent))
-                        if overlap_tokens + sent_tokens <= self.chunk_overlap:
-                            overlap_sentences.insert(0, sent)
-                            overlap_tokens += sent_tokens
-                        else:
-                            break
-                    
-                    current_chunk = overlap_sentences
-                    current_tokens = overlap_tokens
-                else:
-                    current_chunk = []
-                    current_tokens = 0
-                    chunk_start_idx = chunk_start_idx + len(chunk_text) + 1
             
-            # Add sentence to current chunk
-            current_chunk.append(sentence)
-            current_tokens += sentence_tokens
+            if t_end == end_token:
+                break
+    
+    def _token_char_offsets(self, text: str, tokens: List[int]) -> List[int]:
+        """Character offset in ``text`` at which each token starts."""
+        token_bytes = self.tokenizer.decode_tokens_bytes(tokens)
+        byte_starts = np.zeros(len(token_bytes), dtype=np.int64)
+        if len(token_bytes) > 1:
+            np.cumsum([len(b) for b in token_bytes[:-1]], out=byte_starts[1:])
         
-        # Add final chunk if exists
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
-            chunks.append(TextChunk(
-                text=chunk_text,
-                start_index=chunk_start_idx,
-                end_index=chunk_start_idx + len(chunk_text),
-                chunk_index=chunk_index,
-                token_count=current_tokens
-            ))
+        if text.isascii():
+            return byte_starts.tolist()
         
-        return chunks
+        # Map byte offsets to character offsets via per-character UTF-8 widths
+        code_points = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        widths = 1 + (code_points >= 0x80) + (code_points >= 0x800) + (code_points >= 0x10000)
+        char_byte_starts = np.concatenate([[0], np.cumsum(widths)[:-1]])
+        return (np.searchsorted(char_byte_starts, byte_starts, side="right") - 1).tolist()
     
     def _chunk_simple(self, text: str) -> List[TextChunk]:
         """Simple character-based chunking when tokenizer unavailable."""
@@ -198,43 +237,60 @@ class TextChunker:
     
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
-        # Enhanced sentence splitting pattern
-        sentence_endings = r'[.!?]+'
-        abbreviations = {'Dr.', 'Mr.', 'Mrs.', 'Ms.', 'Prof.', 'Sr.', 'Jr.', 'Inc.', 'Corp.', 'Ltd.'}
-        
-        # Basic split
-        potential_sentences = re.split(f'({sentence_endings})', text)
+        return [text[start:end] for start, end in self._sentence_spans(text)]
+    
+    def _sentence_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Character spans of sentences, whitespace-trimmed.
         
-        sentences = []
-        current = ""
+        A run of [.!?] ends a sentence when the next non-space text before the
+        following run starts with a capital letter and the word it closes is
+        not a known abbreviation.
+        """
+        endings = list(SENTENCE_ENDINGS.finditer(text))
+        spans = []
+        start = 0
         
-        for i, part in enumerate(potential_sentences):
-            current += part
+        for k, ending in enumerate(endings):
+            end = ending.end()
+            next_ending = endings[k + 1].start() if k + 1 < len(endings) else len(text)
             
-            # Check if this is a real sentence ending
-            if re.match(sentence_endings, part):
-                # Look ahead to see if next part starts with capital
-                if i + 1 < len(potential_sentences):
-                    next_part = potential_sentences[i + 1].strip()
-                    
-                    # Check for abbreviations
-                    last_word = current.split()[-1] if current.split() else ""
-                    if last_word in abbreviations:
-                        continue
-                    
-                    # Check for capital letter or end of text
-                    if next_part and next_part[0].isupper():
-                        sentences.append(current.strip())
-                        current = ""
-                else:
-                    sentences.append(current.strip())
-                    current = ""
+            # Check for abbreviations (word closed by this ending)
+            word_start = end
+            floor = max(start, end - MAX_ABBREVIATION_LENGTH - 1)
+            while word_start > floor and not text[word_start - 1].isspace():
+                word_start -= 1
+            if end - word_start <= MAX_ABBREVIATION_LENGTH and text[word_start:end] in ABBREVIATIONS:
+                continue
+            
+            # Check for capital letter starting the next sentence
+            next_char = LEADING_SPACE.match(text, end, next_ending).end()
+            if next_char < next_ending and text[next_char].isupper():
+                self._append_span(text, start, end, spans)
+                start = end
         
         # Add remaining text
-        if current.strip():
-            sentences.append(current.strip())
-        
-        return [s for s in sentences if s]
+        self._append_span(text, start, len(text), spans)
+        return spans
+    
+    def _paragraph_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Character spans of blank-line separated paragraphs, whitespace-trimmed."""
+        spans = []
+        start = 0
+        for separator in re.finditer(r'\n\n', text):
+            self._append_span(text, start, separator.start(), spans)
+            start = separator.end()
+        self._append_span(text, start, len(text), spans)
+        return spans
+    
+    @staticmethod
+    def _append_span(text: str, start: int, end: int, spans: List[Tuple[int, int]]) -> None:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.append((start, end))
     
     def _split_large_text(self, text: str) -> List[str]:
         """Split text that exceeds chunk size."""
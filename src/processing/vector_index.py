@@ -0,0 +1,359 @@
+"""Vector indexes for semantic search over document embeddings.
+
+Two interchangeable index types share one small interface (add / search /
+save / load):
+
+- FlatIndex: exact search. Rows are L2-normalized once at build time and
+  stored as float32, so a query is one matrix-vector product plus an
+  O(N) argpartition top-k instead of re-normalizing and fully sorting the
+  whole matrix on every call.
+- IVFIndex: approximate search. Vectors are clustered with k-means into
+  ``nlist`` inverted lists; a query only scores the rows in the ``nprobe``
+  closest lists. Rows are stored contiguously per list so the index can be
+  saved to disk and memory-mapped on load.
+
+Both indexes score by cosine similarity (inner product of unit vectors) and
+return positions into the order in which vectors were added, so callers can
+keep using their own ``documents`` list for lookups.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Type, Union
+
+import numpy as np
+from loguru import logger
+
+PathLike = Union[str, Path]
+
+_META_FILE = "index.json"
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Return float32 copies of ``vectors`` scaled to unit L2 norm.
+
+    Zero rows are left as zeros (they score 0 against every query).
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(1, -1)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0  # Avoid division by zero
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Positions of the ``top_k`` highest scores, best first, in O(N + k log k)."""
+    if top_k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.int64)
+
+    if top_k < scores.size:
+        candidates = np.argpartition(scores, -top_k)[-top_k:]
+    else:
+        candidates = np.arange(scores.size)
+
+    return candidates[np.argsort(scores[candidates])[::-1]]
+
+
+class VectorIndex(ABC):
+    """Base class for cosine-similarity vector indexes."""
+
+    index_type = "base"
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of indexed rows."""
+        pass
+
+    @abstractmethod
+    def add(self, embeddings: np.ndarray) -> None:
+        """Add embeddings; they are assigned positions after existing rows."""
+        pass
+
+    @abstractmethod
+    def search(self, query: np.ndarray, top_k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``top_k`` most similar rows to ``query``.
+
+        Returns:
+            Tuple of (scores, positions), both ordered best first
+        """
+        pass
+
+    @abstractmethod
+    def save(self, path: PathLike) -> None:
+        """Persist the index to directory ``path``."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def _load(cls, path: Path, meta: Dict, mmap: bool) -> "VectorIndex":
+        """Rebuild an index of this type from a saved directory."""
+        pass
+
+    @classmethod
+    def load(cls, path: PathLike, mmap: bool = True) -> "VectorIndex":
+        """Load an index saved with :meth:`save`.
+
+        Args:
+            path: Directory the index was saved to
+            mmap: Memory-map the vector arrays instead of reading them into RAM
+
+        Returns:
+            FlatIndex or IVFIndex, depending on what was saved
+        """
+        path = Path(path)
+        meta = json.loads((path / _META_FILE).read_text())
+
+        index_cls = INDEX_TYPES.get(meta.get("index_type"))
+        if index_cls is None:
+            raise ValueError(f"Unknown vector index type in {path}: {meta.get('index_type')}")
+
+        return index_cls._load(path, meta, mmap)
+
+    def _prepare_query(self, query: np.ndarray) -> np.ndarray:
+        query = normalize_rows(query)[0]
+        if query.shape[0] != self.dimension:
+            raise ValueError(
+                f"Query dimension {query.shape[0]} does not match index dimension {self.dimension}"
+            )
+        return query
+
+    def _write_meta(self, path: Path, **extra) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        meta = {"index_type": self.index_type, "dimension": self.dimension, "size": len(self), **extra}
+        (path / _META_FILE).write_text(json.dumps(meta))
+
+
+class FlatIndex(VectorIndex):
+    """Exact cosine-similarity index over pre-normalized float32 rows."""
+
+    index_type = "flat"
+
+    def __init__(self, dimension: int, vectors: Optional[np.ndarray] = None):
+        super().__init__(dimension)
+        self.vectors = (
+            vectors if vectors is not None else np.empty((0, dimension), dtype=np.float32)
+        )
+
+    @classmethod
+    def from_embeddings(cls, embeddings: np.ndarray) -> "FlatIndex":
+        """Build a flat index from a 2-D embedding matrix."""
+        embeddings = np.asarray(embeddings)
+        index = cls(embeddings.shape[1])
+        index.add(embeddings)
+        return index
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def add(self, embeddings: np.ndarray) -> None:
+        rows = normalize_rows(embeddings)
+        if rows.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {rows.shape[1]} does not match index dimension {self.dimension}"
+            )
+        self.vectors = np.vstack([self.vectors, rows]) if len(self) else rows
+
+    def search(self, query: np.ndarray, top_k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        query = self._prepare_query(query)
+        scores = self.vectors @ query
+        positions = _top_k(scores, top_k)
+        return scores[positions], positions
+
+    def save(self, path: PathLike) -> None:
+        path = Path(path)
+        self._write_meta(path)
+        np.save(path / "vectors.npy", np.ascontiguousarray(self.vectors))
+        logger.info(f"Saved flat index with {len(self)} vectors to {path}")
+
+    @classmethod
+    def _load(cls, path: Path, meta: Dict, mmap: bool) -> "FlatIndex":
+        vectors = np.load(path / "vectors.npy", mmap_mode="r" if mmap else None)
+        return cls(meta["dimension"], vectors)
+
+
+class IVFIndex(VectorIndex):
+    """Approximate cosine-similarity index using an inverted file (IVF).
+
+    Rows are assigned to the nearest of ``nlist`` k-means centroids and stored
+    grouped by list. A query scores the centroids, then only the rows in the
+    ``nprobe`` best lists. Raising ``nprobe`` trades latency for recall; with
+    ``nprobe == nlist`` the search is exact.
+    """
+
+    index_type = "ivf"
+
+    def __init__(self, dimension: int, nlist: int = 100, nprobe: int = 8):
+        super().__init__(dimension)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.centroids: Optional[np.ndarray] = None
+        self.vectors = np.empty((0, dimension), dtype=np.float32)
+        # Original position of each stored row, and list boundaries into vectors
+        self.ids = np.empty(0, dtype=np.int64)
+        self.offsets = np.zeros(nlist + 1, dtype=np.int64)
+
+    @classmethod
+    def from_embeddings(
+        cls,
+        embeddings: np.ndarray,
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        **train_kwargs,
+    ) -> "IVFIndex":
+        """Train and populate an IVF index from a 2-D embedding matrix.
+
+        Args:
+            embeddings: Matrix of shape (N, dimension)
+            nlist: Number of inverted lists (defaults to about sqrt(N))
+            nprobe: Lists scanned per query
+            **train_kwargs: Passed to :meth:`train`
+
+        Returns:
+            Trained IVFIndex containing all rows
+        """
+        embeddings = np.asarray(embeddings)
+        if nlist is None:
+            nlist = max(1, int(np.sqrt(embeddings.shape[0])))
+
+        index = cls(embeddings.shape[1], nlist=nlist, nprobe=nprobe)
+        index.train(embeddings, **train_kwargs)
+        index.add(embeddings)
+        return index
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def train(
+        self,
+        embeddings: np.ndarray,
+        iterations: int = 20,
+        sample_size: int = 100_000,
+        seed: int = 42,
+    ) -> None:
+        """Learn list centroids with spherical k-means on (a sample of) the data."""
+        rows = normalize_rows(embeddings)
+        rng = np.random.default_rng(seed)
+
+        if rows.shape[0] > sample_size:
+            rows = rows[rng.choice(rows.shape[0], sample_size, replace=False)]
+
+        nlist = min(self.nlist, rows.shape[0])
+        if nlist < self.nlist:
+            logger.warning(f"Reducing IVF nlist from {self.nlist} to {nlist} (only {rows.shape[0]} training rows)")
+            self.nlist = nlist
+            self.offsets = np.zeros(nlist + 1, dtype=np.int64)
+
+        centroids = rows[rng.choice(rows.shape[0], nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmax(rows @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, rows)
+            counts = np.bincount(assignments, minlength=nlist)
+
+            empty = counts == 0
+            if empty.any():
+                # Re-seed empty lists with random rows
+                sums[empty] = rows[rng.choice(rows.shape[0], int(empty.sum()))]
+            centroids = normalize_rows(sums)
+
+        self.centroids = centroids
+
+    def add(self, embeddings: np.ndarray) -> None:
+        if not self.is_trained:
+            raise ValueError("IVFIndex must be trained before vectors are added")
+
+        rows = normalize_rows(embeddings)
+        if rows.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {rows.shape[1]} does not match index dimension {self.dimension}"
+            )
+
+        new_ids = np.arange(len(self), len(self) + rows.shape[0], dtype=np.int64)
+        new_lists = np.argmax(rows @ self.centroids.T, axis=1)
+
+        # Rebuild the list-contiguous layout (existing rows keep their list)
+        old_lists = np.repeat(np.arange(self.nlist), np.diff(self.offsets))
+        lists = np.concatenate([old_lists, new_lists])
+        vectors = np.vstack([self.vectors, rows]) if len(self) else rows
+        ids = np.concatenate([self.ids, new_ids])
+
+        order = np.argsort(lists, kind="stable")
+        self.vectors = vectors[order]
+        self.ids = ids[order]
+        self.offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(lists, minlength=self.nlist))]
+        ).astype(np.int64)
+
+    def search(self, query: np.ndarray, top_k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        if not self.is_trained:
+            raise ValueError("IVFIndex must be trained before searching")
+
+        query = self._prepare_query(query)
+        probe_lists = _top_k(self.centroids @ query, min(self.nprobe, self.nlist))
+
+        rows = np.concatenate(
+            [np.arange(self.offsets[i], self.offsets[i + 1]) for i in probe_lists]
+        ) if len(probe_lists) else np.empty(0, dtype=np.int64)
+        if rows.size == 0:
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+
+        scores = self.vectors[rows] @ query
+        best = _top_k(scores, top_k)
+        return scores[best], self.ids[rows[best]]
+
+    def save(self, path: PathLike) -> None:
+        if not self.is_trained:
+            raise ValueError("Cannot save an untrained IVFIndex")
+
+        path = Path(path)
+        self._write_meta(path, nlist=self.nlist, nprobe=self.nprobe)
+        np.save(path / "centroids.npy", self.centroids)
+        np.save(path / "vectors.npy", np.ascontiguousarray(self.vectors))
+        np.save(path / "ids.npy", self.ids)
+        np.save(path / "offsets.npy", self.offsets)
+        logger.info(f"Saved IVF index ({self.nlist} lists, {len(self)} vectors) to {path}")
+
+    @classmethod
+    def _load(cls, path: Path, meta: Dict, mmap: bool) -> "IVFIndex":
+        mmap_mode = "r" if mmap else None
+        index = cls(meta["dimension"], nlist=meta["nlist"], nprobe=meta["nprobe"])
+        index.centroids = np.load(path / "centroids.npy")
+        index.vectors = np.load(path / "vectors.npy", mmap_mode=mmap_mode)
+        index.ids = np.load(path / "ids.npy", mmap_mode=mmap_mode)
+        index.offsets = np.load(path / "offsets.npy")
+        return index
+
+
+INDEX_TYPES: Dict[str, Type[VectorIndex]] = {
+    FlatIndex.index_type: FlatIndex,
+    IVFIndex.index_type: IVFIndex,
+}
+
+
+def build_index(embeddings: np.ndarray, index_type: str = "flat", **kwargs) -> VectorIndex:
+    """Build a vector index of the given type from an embedding matrix.
+
+    Args:
+        embeddings: Matrix of shape (N, dimension)
+        index_type: "flat" (exact) or "ivf" (approximate)
+        **kwargs: Index-specific options, e.g. ``nlist``/``nprobe`` for IVF
+
+    Returns:
+        Populated VectorIndex
+    """
+    index_cls = INDEX_TYPES.get(index_type)
+    if index_cls is None:
+        raise ValueError(f"Unknown vector index type: {index_type}. Use one of {sorted(INDEX_TYPES)}")
+
+    return index_cls.from_embeddings(embeddings, **kwargs)
@@ -7,6 +7,12 @@ Repositories:
     BaseRepository: Abstract base class with common CRUD operations
     CompanyRepository: Company-specific queries and operations
     MetricsRepository: Financial metrics time-series operations
+    FilingRepository: SEC filing lookups
+    ReportRepository: Analysis report storage
+    IntelligenceRepository: Market intelligence items
+
+Containers:
+    MetricSeries: Columnar multi-company metric time series
 
 Exceptions:
     RepositoryError: Base exception for all repository errors
@@ -51,7 +57,11 @@ from src.repositories.base_repository import (
     TransactionError,
 )
 from src.repositories.company_repository import CompanyRepository
+from src.repositories.filing_repository import FilingRepository
+from src.repositories.intelligence_repository import IntelligenceRepository
+from src.repositories.metric_series import MetricSeries
 from src.repositories.metrics_repository import MetricsRepository
+from src.repositories.report_repository import ReportRepository
 
 __all__ = [
     # Base
@@ -64,4 +74,9 @@ __all__ = [
     # Specialized repositories
     "CompanyRepository",
     "MetricsRepository",
+    "FilingRepository",
+    "ReportRepository",
+    "IntelligenceRepository",
+    # Containers
+    "MetricSeries",
 ]
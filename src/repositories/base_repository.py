@@ -6,16 +6,17 @@ transaction management, error handling, and connection pooling support.
 
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import date, datetime
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import delete, select, update
+from sqlalchemy import and_, delete, or_, select, tuple_, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Base
+from src.dto.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 # Generic type for model classes
 ModelType = TypeVar("ModelType", bound=Base)
@@ -164,35 +165,60 @@ class BaseRepository(ABC, Generic[ModelType]):
         self,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        cursor: Optional[str] = None,
+        **filters
     ) -> List[ModelType]:
-        """Get all records with optional pagination.
+        """Get all records with optional filtering and pagination.
+
+        Ordering is always tie-broken by primary key, so pages are stable.
+        With a cursor the offset is ignored and the page starts right after
+        the cursor's (order_by value, id) position, which an index on the
+        sort column serves as a range scan at any depth.
 
         Args:
             limit: Maximum number of records to return
             offset: Number of records to skip
             order_by: Column name to sort by (default: id)
+            descending: Sort in descending order
+            cursor: Keyset cursor from get_page or encode_cursor
+            **filters: Equality filters; filters whose value is None are ignored
 
         Returns:
             List of model instances
 
+        Raises:
+            InvalidCursorError: If the cursor is malformed or for another order_by
+
         Example:
             ```python
             # Get first 100 companies ordered by name
             companies = await repo.get_all(limit=100, order_by="name")
+
+            # Latest 10-K filings of one company
+            filings = await repo.get_all(
+                limit=20, order_by="filing_date", descending=True,
+                company_id=company_id, filing_type="10-K"
+            )
             ```
         """
         try:
             stmt = select(self.model_class)
 
-            # Apply ordering
-            if order_by:
-                order_column = getattr(self.model_class, order_by, None)
-                if order_column is not None:
-                    stmt = stmt.order_by(order_column)
+            # Apply filters
+            for key, value in filters.items():
+                if value is not None and hasattr(self.model_class, key):
+                    stmt = stmt.where(getattr(self.model_class, key) == value)
+
+            # Apply ordering and keyset position
+            if cursor and not order_by:
+                order_by = "id"
+            if order_by and getattr(self.model_class, order_by, None) is not None:
+                stmt = self._apply_keyset(stmt, order_by, descending, cursor)
 
             # Apply pagination
-            if offset:
+            if offset and not cursor:
                 stmt = stmt.offset(offset)
             if limit:
                 stmt = stmt.limit(limit)
@@ -202,7 +228,7 @@ class BaseRepository(ABC, Generic[ModelType]):
 
             logger.debug(
                 f"Fetched {len(records)} {self.model_class.__name__} records "
-                f"(limit={limit}, offset={offset})"
+                f"(limit={limit}, offset={offset}, filters={filters})"
             )
 
             return list(records)
@@ -211,6 +237,129 @@ class BaseRepository(ABC, Generic[ModelType]):
             logger.error(f"Error fetching all {self.model_class.__name__}: {e}")
             raise TransactionError(f"Database error during fetch: {str(e)}") from e
 
+    async def get_page(
+        self,
+        limit: int,
+        order_by: str,
+        descending: bool = False,
+        cursor: Optional[str] = None,
+        **filters
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """Get one keyset page and the cursor of the page after it.
+
+        Fetches one extra row to learn whether another page exists, so the
+        returned cursor is None exactly on the last page.
+
+        Args:
+            limit: Page size
+            order_by: Column name to sort by
+            descending: Sort in descending order
+            cursor: Cursor returned for the previous page (None for the first)
+            **filters: Equality filters; filters whose value is None are ignored
+
+        Returns:
+            Tuple of (records, next cursor or None)
+
+        Example:
+            ```python
+            metrics, cursor = await repo.get_page(
+                limit=100, order_by="metric_date", descending=True,
+                company_id=company_id
+            )
+            while cursor:
+                more, cursor = await repo.get_page(
+                    limit=100, order_by="metric_date", descending=True,
+                    cursor=cursor, company_id=company_id
+                )
+            ```
+        """
+        records = await self.get_all(
+            limit=limit + 1,
+            order_by=order_by,
+            descending=descending,
+            cursor=cursor,
+            **filters
+        )
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_cursor = encode_cursor(order_by, getattr(last, order_by), last.id)
+
+        return records, next_cursor
+
+    def _apply_keyset(self, stmt, order_by: str, descending: bool, cursor: Optional[str]):
+        """Order by (order_by, id) and, given a cursor, start after its position.
+
+        Non-null sort columns use a row-value comparison that maps directly
+        onto a composite index range. Nullable ones sort NULLs last in both
+        directions and spell the predicate out, since a row comparison
+        against NULL is never true.
+        """
+        order_column = getattr(self.model_class, order_by)
+        id_column = self.model_class.id
+        mapped = self.model_class.__mapper__.columns.get(order_by)
+        nullable = mapped is not None and mapped.nullable
+        tie_break = order_by != "id"
+
+        def direction(column):
+            column = column.desc() if descending else column.asc()
+            return column.nullslast() if nullable else column
+
+        stmt = stmt.order_by(direction(order_column))
+        if tie_break:
+            stmt = stmt.order_by(direction(id_column))
+
+        if not cursor:
+            return stmt
+
+        sort_value, row_id = decode_cursor(cursor, order_by)
+        sort_value = self._coerce_cursor_value(order_column, sort_value)
+        row_id = self._coerce_cursor_value(id_column, row_id)
+
+        def after(column, value):
+            return column < value if descending else column > value
+
+        if not tie_break:
+            return stmt.where(after(id_column, row_id))
+        if sort_value is None:
+            # Already inside the trailing block of NULLs
+            return stmt.where(and_(order_column.is_(None), after(id_column, row_id)))
+        if not nullable:
+            return stmt.where(after(tuple_(order_column, id_column), tuple_(sort_value, row_id)))
+
+        return stmt.where(or_(
+            after(order_column, sort_value),
+            and_(order_column == sort_value, after(id_column, row_id)),
+            order_column.is_(None),
+        ))
+
+    @staticmethod
+    def _coerce_cursor_value(column, value: Any) -> Any:
+        """Convert a decoded cursor primitive back to the column's Python type."""
+        if value is None:
+            return None
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+
+        if isinstance(value, python_type):
+            return value
+
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            if python_type is date:
+                return date.fromisoformat(value)
+            return python_type(value)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError(
+                f"Cursor value {value!r} does not fit column {column.key}"
+            ) from e
+
     async def update(self, id: Union[UUID, int, str], **attributes) -> Optional[ModelType]:
         """Update a record by ID.
 
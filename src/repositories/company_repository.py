@@ -4,7 +4,7 @@ This repository provides specialized methods for managing company data,
 including ticker lookups, CIK lookups, and EdTech categorization queries.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from loguru import logger
@@ -340,6 +340,58 @@ class CompanyRepository(BaseRepository[Company]):
 
         return tickers
 
+    async def find_by_tickers(self, tickers: Sequence[str]) -> List[Company]:
+        """Find all companies whose ticker is in a list, in one query.
+
+        Args:
+            tickers: Ticker symbols, matched exactly as stored
+
+        Returns:
+            List of matching companies (unknown tickers are skipped)
+
+        Example:
+            ```python
+            watchlist = await repo.find_by_tickers(["DUOL", "CHGG", "COUR"])
+            ```
+        """
+        if not tickers:
+            return []
+
+        stmt = select(Company).where(Company.ticker.in_(tickers))
+        result = await self.session.execute(stmt)
+        companies = result.scalars().all()
+
+        logger.debug(f"Found {len(companies)} of {len(tickers)} requested tickers")
+
+        return list(companies)
+
+    async def ticker_or_cik_exists(self, ticker: str, cik: Optional[str] = None) -> bool:
+        """Check whether a company already uses a ticker or CIK.
+
+        Unlike find_by_ticker_or_cik, values are compared exactly as stored
+        and a missing CIK matches nothing.
+
+        Args:
+            ticker: Company ticker
+            cik: Optional SEC CIK number
+
+        Returns:
+            True if any company has the ticker or the CIK
+
+        Example:
+            ```python
+            if await repo.ticker_or_cik_exists("DUOL", "0001562088"):
+                raise DuplicateRecordError("DUOL already exists")
+            ```
+        """
+        conditions = [Company.ticker == ticker]
+        if cik:
+            conditions.append(Company.cik == cik)
+
+        stmt = select(Company.id).where(or_(*conditions)).limit(1)
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
     async def get_companies_by_delivery_model(
         self,
         delivery_model: str,
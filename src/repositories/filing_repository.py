@@ -0,0 +1,75 @@
+"""SEC filing repository for filing-specific database operations.
+
+This repository provides lookups of SEC filings by accession number and
+per-company filing listings.
+"""
+
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import SECFiling
+from src.repositories.base_repository import BaseRepository
+
+
+class FilingRepository(BaseRepository[SECFiling]):
+    """Repository for SECFiling model.
+
+    Example:
+        ```python
+        repo = FilingRepository(session)
+
+        # Latest 10-K filings of a company
+        filings = await repo.get_all(
+            limit=20, order_by="filing_date", descending=True,
+            company_id=company_id, filing_type="10-K"
+        )
+        ```
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize filing repository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(SECFiling, session)
+
+    async def find_by_accession_number(self, accession_number: str) -> Optional[SECFiling]:
+        """Find a filing by its SEC accession number.
+
+        Args:
+            accession_number: SEC accession number (e.g. "0001562088-24-000012")
+
+        Returns:
+            Filing if found, None otherwise
+        """
+        stmt = select(SECFiling).where(SECFiling.accession_number == accession_number)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_filings_for_company(
+        self,
+        company_id: UUID,
+        filing_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[SECFiling]:
+        """Get a company's filings, newest first.
+
+        Args:
+            company_id: Company UUID
+            filing_type: Optional filing type filter (10-K, 10-Q, ...)
+            limit: Maximum number of filings to return
+
+        Returns:
+            List of filings ordered by filing date descending
+        """
+        return await self.get_all(
+            limit=limit,
+            order_by="filing_date",
+            descending=True,
+            company_id=company_id,
+            filing_type=filing_type,
+        )
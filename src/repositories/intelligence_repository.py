@@ -0,0 +1,28 @@
+"""Market intelligence repository for intelligence database operations."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import MarketIntelligence
+from src.repositories.base_repository import BaseRepository
+
+
+class IntelligenceRepository(BaseRepository[MarketIntelligence]):
+    """Repository for MarketIntelligence model.
+
+    Example:
+        ```python
+        repo = IntelligenceRepository(session)
+        items = await repo.get_all(
+            limit=100, order_by="event_date", descending=True,
+            intel_type="funding", category="k12"
+        )
+        ```
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize intelligence repository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(MarketIntelligence, session)
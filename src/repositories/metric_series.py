@@ -0,0 +1,250 @@
+"""Columnar, NumPy-backed container for multi-company metric time series.
+
+MetricsRepository.get_time_series_batch returns a MetricSeries holding every
+requested (company, metric type) series from a single query. Each column is a
+NumPy array and rows are sorted by (ticker, metric type, date), so every
+series is one contiguous slice and per-series statistics reduce to
+``np.ufunc.reduceat`` calls instead of Python loops.
+"""
+
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Column order of MetricSeries and of the rows handed to MetricSeries.from_rows
+METRIC_SERIES_COLUMNS = (
+    "company_id",
+    "ticker",
+    "metric_type",
+    "metric_date",
+    "value",
+    "unit",
+    "qoq_growth",
+    "yoy_growth",
+)
+
+_FLOAT_COLUMNS = frozenset({"value", "qoq_growth", "yoy_growth"})
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Drop tzinfo after normalising to UTC (datetime64 has no zones)."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@dataclass(frozen=True)
+class MetricSeries:
+    """Time series for many companies and metric types as parallel arrays.
+
+    Attributes:
+        company_id: Company UUIDs (object array)
+        ticker: Company tickers (object array)
+        metric_type: Metric type names (object array)
+        metric_date: Period end dates (datetime64[us], UTC)
+        value: Metric values (float64, NaN where missing)
+        unit: Value units (object array)
+        qoq_growth: Growth over the previous period in percent, computed in
+            SQL over the full history (NaN for the first period or a zero base)
+        yoy_growth: Growth over the same period a year earlier in percent
+
+    Example:
+        ```python
+        series = await repo.get_time_series_batch(
+            tickers=["DUOL", "CHGG"],
+            metric_types=["revenue", "gross_margin"],
+            periods=8,
+        )
+        stats = series.statistics()
+        revenue = series.select(ticker="DUOL", metric_type="revenue")
+        print(revenue.value, revenue.yoy_growth)
+        ```
+    """
+
+    company_id: np.ndarray
+    ticker: np.ndarray
+    metric_type: np.ndarray
+    metric_date: np.ndarray
+    value: np.ndarray
+    unit: np.ndarray
+    qoq_growth: np.ndarray
+    yoy_growth: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> "MetricSeries":
+        """Build a series from row tuples in METRIC_SERIES_COLUMNS order.
+
+        Rows must already be sorted by (company, metric type, date).
+
+        Args:
+            rows: Result rows of the batched time-series query
+
+        Returns:
+            MetricSeries with one array per column
+        """
+        columns = list(zip(*rows)) if rows else [()] * len(METRIC_SERIES_COLUMNS)
+        arrays = {}
+        for name, column in zip(METRIC_SERIES_COLUMNS, columns):
+            if name in _FLOAT_COLUMNS:
+                # None becomes NaN under a float dtype
+                arrays[name] = np.array(column, dtype=np.float64)
+            elif name == "metric_date":
+                arrays[name] = np.array([_naive_utc(d) for d in column], dtype="datetime64[us]")
+            else:
+                arrays[name] = np.array(column, dtype=object)
+        return cls(**arrays)
+
+    @classmethod
+    def empty(cls) -> "MetricSeries":
+        """Return a series with no rows."""
+        return cls.from_rows([])
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @cached_property
+    def group_starts(self) -> np.ndarray:
+        """Row offsets where each (company, metric type) series begins."""
+        if len(self) == 0:
+            return np.empty(0, dtype=np.intp)
+        boundary = np.ones(len(self), dtype=bool)
+        boundary[1:] = (self.company_id[1:] != self.company_id[:-1]) | (
+            self.metric_type[1:] != self.metric_type[:-1]
+        )
+        return np.flatnonzero(boundary)
+
+    @cached_property
+    def group_ids(self) -> np.ndarray:
+        """Series index of every row (0 .. number of series - 1)."""
+        boundary = np.zeros(len(self), dtype=np.intp)
+        boundary[self.group_starts] = 1
+        return np.cumsum(boundary) - 1
+
+    def groups(self) -> Iterator[Tuple[str, str, slice]]:
+        """Iterate (ticker, metric type, row slice) for every series."""
+        ends = np.append(self.group_starts[1:], len(self))
+        for start, end in zip(self.group_starts, ends):
+            yield self.ticker[start], self.metric_type[start], slice(int(start), int(end))
+
+    def select(
+        self,
+        ticker: Optional[str] = None,
+        metric_type: Optional[str] = None,
+        company_id: Optional[Any] = None,
+    ) -> "MetricSeries":
+        """Return the rows matching every given key, preserving order."""
+        mask = np.ones(len(self), dtype=bool)
+        if ticker is not None:
+            mask &= self.ticker == ticker.upper()
+        if metric_type is not None:
+            mask &= self.metric_type == metric_type
+        if company_id is not None:
+            mask &= self.company_id == company_id
+        return MetricSeries(**{f.name: getattr(self, f.name)[mask] for f in fields(self)})
+
+    def growth(self, periods: int = 1) -> np.ndarray:
+        """Percent change against the value `periods` rows earlier in the same series.
+
+        Unlike qoq_growth/yoy_growth this only sees the rows fetched, so the
+        first `periods` rows of every series are NaN.
+
+        Args:
+            periods: Row offset of the base value
+
+        Returns:
+            float64 array aligned with the rows
+        """
+        result = np.full(len(self), np.nan)
+        if periods < 1 or len(self) <= periods:
+            return result
+
+        base_index = np.arange(len(self)) - periods
+        same_series = base_index >= self.group_starts[self.group_ids]
+        current = self.value[same_series]
+        base = self.value[base_index[same_series]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.where(base != 0, (current - base) / base * 100, np.nan)
+        result[same_series] = change
+        return result
+
+    def statistics(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Per-series summary of the fetched rows, keyed by (ticker, metric type).
+
+        Every statistic is computed for all series at once with reduceat;
+        missing values are ignored. The variance sums squared deviations from
+        each series' mean (two passes), which stays exact for large values
+        with a small spread.
+
+        Returns:
+            Mapping to dictionaries with count, min, max, avg, std, latest
+            and oldest (None where a series has no values)
+        """
+        if len(self) == 0:
+            return {}
+
+        starts = self.group_starts
+        present = ~np.isnan(self.value)
+        filled = np.where(present, self.value, 0.0)
+        counts = np.add.reduceat(present.astype(np.int64), starts)
+        sums = np.add.reduceat(filled, starts)
+        minima = np.minimum.reduceat(np.where(present, self.value, np.inf), starts)
+        maxima = np.maximum.reduceat(np.where(present, self.value, -np.inf), starts)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / counts
+            deviations = np.where(present, self.value - means[self.group_ids], 0.0)
+            variances = np.add.reduceat(deviations * deviations, starts) / counts
+
+        ends = np.append(starts[1:], len(self)) - 1
+
+        def _value(x: float, n: int) -> Optional[float]:
+            return float(x) if n else None
+
+        return {
+            (self.ticker[start], self.metric_type[start]): {
+                "count": int(n),
+                "min": _value(lo, n),
+                "max": _value(hi, n),
+                "avg": _value(mean, n),
+                "std": _value(np.sqrt(var), n),
+                "latest": _value(self.value[end], n) if present[end] else None,
+                "oldest": _value(self.value[start], n) if present[start] else None,
+            }
+            for start, end, n, lo, hi, mean, var in zip(
+                starts, ends, counts, minima, maxima, means, variances
+            )
+        }
+
+    def latest(self) -> Dict[str, Dict[str, float]]:
+        """Latest value and growth of every series, nested by ticker.
+
+        Growth appears as ``<metric>_growth_qoq`` / ``<metric>_growth_yoy``
+        when known, the shape the analysis strategies consume.
+
+        Returns:
+            Mapping of ticker to {metric name: value}
+        """
+        if len(self) == 0:
+            return {}
+
+        ends = np.append(self.group_starts[1:], len(self)) - 1
+        latest: Dict[str, Dict[str, float]] = {}
+        for end in ends:
+            entry = latest.setdefault(self.ticker[end], {})
+            metric_type = self.metric_type[end]
+            for key, column in (
+                (metric_type, self.value),
+                (f"{metric_type}_growth_qoq", self.qoq_growth),
+                (f"{metric_type}_growth_yoy", self.yoy_growth),
+            ):
+                if not np.isnan(column[end]):
+                    entry[key] = float(column[end])
+        return latest
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the series as a long-form DataFrame (one row per observation)."""
+        return pd.DataFrame({name: getattr(self, name) for name in METRIC_SERIES_COLUMNS})
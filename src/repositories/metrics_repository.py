@@ -6,16 +6,79 @@ metric type filtering.
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    MetaData,
+    String,
+    Table,
+    and_,
+    delete,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models import FinancialMetric
+from src.db.models import Company, FinancialMetric
 from src.repositories.base_repository import BaseRepository, TransactionError
+from src.repositories.metric_series import MetricSeries
+
+
+# Columns forming the uq_company_metric_period constraint (never updated on conflict)
+METRIC_CONFLICT_KEYS = ("company_id", "metric_type", "metric_date", "period_type")
+
+# Columns written by the bulk paths, in COPY order
+METRIC_BULK_COLUMNS = METRIC_CONFLICT_KEYS + (
+    "metric_category",
+    "value",
+    "unit",
+    "source",
+    "source_document_id",
+    "confidence_score",
+)
+
+# PostgreSQL wire protocol limit on bind parameters per statement
+MAX_BIND_PARAMS = 32767
+
+# Default rows per multi-row INSERT (clamped by MAX_BIND_PARAMS)
+DEFAULT_BULK_BATCH_SIZE = 5000
+
+# Default rows fetched per server-side cursor round trip when streaming
+DEFAULT_STREAM_CHUNK_SIZE = 10000
+
+# Leading columns of a streamed export; the wide form follows them with one
+# value column per metric type, the long form with METRIC_STREAM_LONG_COLUMNS
+METRIC_STREAM_KEY_COLUMNS = ("ticker", "company_id", "metric_date", "period_type")
+METRIC_STREAM_LONG_COLUMNS = ("metric_type", "value", "unit")
+
+# Rows back to the same period one year earlier, by period type
+YEAR_OVER_YEAR_LAG = {"quarterly": 4, "monthly": 12, "annual": 1}
+
+# Session-local staging table for COPY-based loads; rows vanish at commit
+_staging_metadata = MetaData()
+financial_metrics_staging = Table(
+    "financial_metrics_staging",
+    _staging_metadata,
+    Column("company_id", PGUUID(as_uuid=True)),
+    Column("metric_type", String(50)),
+    Column("metric_date", DateTime(timezone=True)),
+    Column("period_type", String(20)),
+    Column("metric_category", String(50)),
+    Column("value", Float),
+    Column("unit", String(20)),
+    Column("source", String(50)),
+    Column("source_document_id", PGUUID(as_uuid=True)),
+    Column("confidence_score", Float),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DELETE ROWS",
+)
 
 
 class MetricsRepository(BaseRepository[FinancialMetric]):
@@ -74,9 +137,10 @@ class MetricsRepository(BaseRepository[FinancialMetric]):
     ) -> FinancialMetric:
         """Insert or update a financial metric (upsert).
 
-        Uses PostgreSQL INSERT ... ON CONFLICT DO UPDATE to atomically
-        insert or update based on the unique constraint
-        (company_id, metric_type, metric_date, period_type).
+        Uses PostgreSQL INSERT ... ON CONFLICT DO UPDATE ... RETURNING to
+        atomically insert or update based on the unique constraint
+        (company_id, metric_type, metric_date, period_type) in a single
+        round trip. For more than a handful of rows use bulk_upsert_metrics.
 
         Args:
             company_id: Company UUID
@@ -142,23 +206,17 @@ class MetricsRepository(BaseRepository[FinancialMetric]):
             # PostgreSQL upsert statement
             stmt = insert(FinancialMetric).values(**insert_values)
 
-            # ON CONFLICT UPDATE (based on unique constraint)
+            # ON CONFLICT UPDATE (based on unique constraint), returning the
+            # row in the same round trip instead of re-selecting it
             stmt = stmt.on_conflict_do_update(
                 constraint='uq_company_metric_period',
                 set_=update_values
-            )
+            ).returning(FinancialMetric).execution_options(populate_existing=True)
 
-            await self.session.execute(stmt)
+            result = await self.session.execute(stmt)
+            metric = result.scalar_one()
             await self.session.flush()
 
-            # Fetch the upserted record
-            metric = await self.find_one_by(
-                company_id=company_id,
-                metric_type=metric_type,
-                metric_date=metric_date,
-                period_type=period_type
-            )
-
             logger.debug(
                 f"Upserted metric: {metric_type} for company {company_id} "
                 f"at {metric_date} ({period_type})"
@@ -283,6 +341,283 @@ class MetricsRepository(BaseRepository[FinancialMetric]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_latest_values(self, company_id: UUID) -> Dict[str, float]:
+        """Get the most recent value of every metric type for a company.
+
+        One query ranks each metric type's rows by date, so the cost does not
+        grow with the number of metric types.
+
+        Args:
+            company_id: Company UUID
+
+        Returns:
+            Mapping of metric type to its latest value (any period type)
+
+        Example:
+            ```python
+            latest = await repo.get_latest_values(company_id)
+            revenue = latest.get("revenue")
+            ```
+        """
+        ranked = select(
+            FinancialMetric.metric_type,
+            FinancialMetric.value,
+            func.row_number().over(
+                partition_by=FinancialMetric.metric_type,
+                order_by=FinancialMetric.metric_date.desc(),
+            ).label("rn"),
+        ).where(FinancialMetric.company_id == company_id).subquery()
+
+        stmt = select(ranked.c.metric_type, ranked.c.value).where(ranked.c.rn == 1)
+
+        result = await self.session.execute(stmt)
+        return {row.metric_type: row.value for row in result}
+
+    def _metric_filter_clauses(
+        self,
+        company_ids: Optional[Sequence[UUID]] = None,
+        tickers: Optional[Sequence[str]] = None,
+        metric_types: Optional[Sequence[str]] = None,
+        period_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Any]:
+        """Build WHERE clauses shared by the multi-company metric queries."""
+        clauses = []
+        if company_ids:
+            clauses.append(FinancialMetric.company_id.in_(company_ids))
+        if tickers:
+            clauses.append(Company.ticker.in_([t.upper() for t in tickers]))
+        if metric_types:
+            clauses.append(FinancialMetric.metric_type.in_(metric_types))
+        if period_type:
+            clauses.append(FinancialMetric.period_type == period_type)
+        if start_date:
+            clauses.append(FinancialMetric.metric_date >= start_date)
+        if end_date:
+            clauses.append(FinancialMetric.metric_date <= end_date)
+        return clauses
+
+    async def stream_metrics(
+        self,
+        company_ids: Optional[Sequence[UUID]] = None,
+        tickers: Optional[Sequence[str]] = None,
+        metric_types: Optional[Sequence[str]] = None,
+        period_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        pivot: bool = False,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[Tuple[List[str], List[Tuple[Any, ...]]]]:
+        """Stream metric rows through a server-side cursor, chunk by chunk.
+
+        Rows are plain tuples, never ORM objects, so memory stays bounded by
+        chunk_size however long the history is. In the long form each row is
+        one observation; with pivot=True the pivot runs in SQL and each row
+        holds every requested metric type for one (company, date, period).
+
+        Args:
+            company_ids: Restrict to these companies
+            tickers: Restrict to these tickers (case-insensitive)
+            metric_types: Restrict to these metric types; with pivot=True they
+                also name the value columns (default: every type present)
+            period_type: Restrict to one period type
+            start_date: Earliest metric date (inclusive)
+            end_date: Latest metric date (inclusive)
+            pivot: Return one column per metric type instead of one row per value
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Tuples of (column names, rows). At least one chunk is yielded, so
+            an empty result still carries its columns.
+
+        Example:
+            ```python
+            async for columns, rows in repo.stream_metrics(
+                tickers=["DUOL", "CHGG"],
+                metric_types=["revenue", "gross_margin"],
+                pivot=True,
+            ):
+                frame = pd.DataFrame.from_records(rows, columns=columns)
+            ```
+        """
+        clauses = self._metric_filter_clauses(
+            company_ids, tickers, metric_types, period_type, start_date, end_date
+        )
+
+        if pivot:
+            if not metric_types:
+                # Value columns must be known before the pivot query is built
+                types_stmt = (
+                    select(FinancialMetric.metric_type)
+                    .join(Company, Company.id == FinancialMetric.company_id)
+                    .where(*clauses)
+                    .distinct()
+                    .order_by(FinancialMetric.metric_type)
+                )
+                metric_types = list((await self.session.execute(types_stmt)).scalars().all())
+
+            stmt = (
+                select(
+                    Company.ticker,
+                    FinancialMetric.company_id,
+                    FinancialMetric.metric_date,
+                    FinancialMetric.period_type,
+                    *[
+                        func.max(FinancialMetric.value)
+                        .filter(FinancialMetric.metric_type == metric_type)
+                        .label(metric_type)
+                        for metric_type in metric_types
+                    ],
+                )
+                .join(Company, Company.id == FinancialMetric.company_id)
+                .where(*clauses)
+                .group_by(
+                    Company.ticker,
+                    FinancialMetric.company_id,
+                    FinancialMetric.metric_date,
+                    FinancialMetric.period_type,
+                )
+                .order_by(Company.ticker, FinancialMetric.metric_date)
+            )
+            columns = list(METRIC_STREAM_KEY_COLUMNS) + list(metric_types)
+        else:
+            stmt = (
+                select(
+                    Company.ticker,
+                    FinancialMetric.company_id,
+                    FinancialMetric.metric_date,
+                    FinancialMetric.period_type,
+                    FinancialMetric.metric_type,
+                    FinancialMetric.value,
+                    FinancialMetric.unit,
+                )
+                .join(Company, Company.id == FinancialMetric.company_id)
+                .where(*clauses)
+                # Matches idx_company_metric (company_id, metric_type, metric_date)
+                .order_by(
+                    FinancialMetric.company_id,
+                    FinancialMetric.metric_type,
+                    FinancialMetric.metric_date,
+                )
+            )
+            columns = list(METRIC_STREAM_KEY_COLUMNS + METRIC_STREAM_LONG_COLUMNS)
+
+        result = await self.session.stream(stmt.execution_options(yield_per=chunk_size))
+
+        total = 0
+        async for partition in result.partitions(chunk_size):
+            rows = [tuple(row) for row in partition]
+            total += len(rows)
+            yield columns, rows
+
+        if total == 0:
+            yield columns, []
+
+        logger.debug(f"Streamed {total} metric rows ({'wide' if pivot else 'long'} form)")
+
+    async def get_time_series_batch(
+        self,
+        company_ids: Optional[Sequence[UUID]] = None,
+        tickers: Optional[Sequence[str]] = None,
+        metric_types: Optional[Sequence[str]] = None,
+        period_type: str = "quarterly",
+        periods: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> MetricSeries:
+        """Get time series for many companies and metric types in one query.
+
+        Growth is computed in SQL with LAG over each (company, metric type)
+        series before the period and start date cut-offs are applied, so the
+        oldest returned period still has its growth against earlier history.
+        Statistics over the returned rows come from MetricSeries.statistics.
+
+        Args:
+            company_ids: Restrict to these companies
+            tickers: Restrict to these tickers (case-insensitive)
+            metric_types: Restrict to these metric types (default: all)
+            period_type: Period type (quarterly, annual, monthly)
+            periods: Optional number of most recent periods per series
+            start_date: Earliest metric date returned (inclusive)
+            end_date: Latest metric date returned (inclusive)
+
+        Returns:
+            MetricSeries sorted by (ticker, metric type, date), oldest first
+
+        Example:
+            ```python
+            series = await repo.get_time_series_batch(
+                tickers=["DUOL", "CHGG", "COUR"],
+                metric_types=["revenue", "monthly_active_users"],
+                periods=8,
+            )
+            for (ticker, metric_type), stats in series.statistics().items():
+                print(ticker, metric_type, stats["avg"])
+            ```
+        """
+        clauses = self._metric_filter_clauses(
+            company_ids, tickers, metric_types, period_type, end_date=end_date
+        )
+        series_window = {
+            "partition_by": (FinancialMetric.company_id, FinancialMetric.metric_type),
+            "order_by": FinancialMetric.metric_date,
+        }
+        yoy_lag = YEAR_OVER_YEAR_LAG.get(period_type, 1)
+
+        previous = func.lag(FinancialMetric.value, 1).over(**series_window)
+        year_ago = func.lag(FinancialMetric.value, yoy_lag).over(**series_window)
+
+        ranked = (
+            select(
+                FinancialMetric.company_id,
+                Company.ticker,
+                FinancialMetric.metric_type,
+                FinancialMetric.metric_date,
+                FinancialMetric.value,
+                FinancialMetric.unit,
+                ((FinancialMetric.value - previous) / func.nullif(previous, 0) * 100).label(
+                    "qoq_growth"
+                ),
+                ((FinancialMetric.value - year_ago) / func.nullif(year_ago, 0) * 100).label(
+                    "yoy_growth"
+                ),
+                func.row_number().over(
+                    partition_by=series_window["partition_by"],
+                    order_by=FinancialMetric.metric_date.desc(),
+                ).label("recency"),
+            )
+            .join(Company, Company.id == FinancialMetric.company_id)
+            .where(*clauses)
+            .subquery()
+        )
+
+        stmt = select(
+            ranked.c.company_id,
+            ranked.c.ticker,
+            ranked.c.metric_type,
+            ranked.c.metric_date,
+            ranked.c.value,
+            ranked.c.unit,
+            ranked.c.qoq_growth,
+            ranked.c.yoy_growth,
+        )
+        if periods:
+            stmt = stmt.where(ranked.c.recency <= periods)
+        if start_date:
+            stmt = stmt.where(ranked.c.metric_date >= start_date)
+        stmt = stmt.order_by(ranked.c.ticker, ranked.c.metric_type, ranked.c.metric_date)
+
+        result = await self.session.execute(stmt)
+        series = MetricSeries.from_rows([tuple(row) for row in result])
+
+        logger.debug(
+            f"Fetched {len(series)} {period_type} metric rows in "
+            f"{len(series.group_starts)} series"
+        )
+
+        return series
+
     async def get_all_metrics_for_company(
         self,
         company_id: UUID,
@@ -417,9 +752,20 @@ class MetricsRepository(BaseRepository[FinancialMetric]):
 
     async def bulk_upsert_metrics(
         self,
-        metrics_data: List[Dict[str, Any]]
+        metrics_data: Sequence[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE
     ) -> int:
-        """Bulk upsert multiple metrics.
+        """Bulk upsert multiple metrics with multi-row INSERT ... ON CONFLICT.
+
+        Rows are sent thousands at a time in a single statement per batch
+        rather than one statement per metric. Batches are clamped so that a
+        statement never exceeds PostgreSQL's bind parameter limit, and rows
+        repeating the same (company_id, metric_type, metric_date, period_type)
+        key are collapsed (last one wins) since ON CONFLICT cannot touch the
+        same row twice in one statement.
+
+        On conflict, every non-key column supplied in the row is overwritten
+        with the incoming value and updated_at is refreshed.
 
         Args:
             metrics_data: List of metric dictionaries with required fields:
@@ -429,9 +775,10 @@ class MetricsRepository(BaseRepository[FinancialMetric]):
                 - period_type
                 - value
                 Plus optional fields (unit, source, etc.)
+            batch_size: Maximum rows per INSERT statement (default: 5000)
 
         Returns:
-            Number of metrics processed
+            Number of metrics processed (after de-duplication)
 
         Example:
             ```python
@@ -449,42 +796,236 @@ class MetricsRepository(BaseRepository[FinancialMetric]):
             count = await repo.bulk_upsert_metrics(metrics)
             ```
         """
+        rows = self._dedupe_metric_rows(metrics_data)
+        if not rows:
+            return 0
+
         try:
-            for metric_data in metrics_data:
-                # Prepare insert values
-                insert_values = {
-                    **metric_data,
-                    'created_at': func.now(),
-                    'updated_at': func.now(),
-                }
-
-                # Prepare update values
-                update_values = {
-                    k: v for k, v in metric_data.items()
-                    if k not in ['company_id', 'metric_type', 'metric_date', 'period_type']
-                }
-                update_values['updated_at'] = func.now()
-
-                # Upsert statement
-                stmt = insert(FinancialMetric).values(**insert_values)
-                stmt = stmt.on_conflict_do_update(
-                    constraint='uq_company_metric_period',
-                    set_=update_values
-                )
+            statements = 0
+            for batch in self._iter_upsert_batches(rows, batch_size):
+                await self.session.execute(self._build_bulk_upsert(batch))
+                statements += 1
 
-                await self.session.execute(stmt)
+            await self.session.flush()
+
+            logger.info(
+                f"Bulk upserted {len(rows)} metrics in {statements} statement(s)"
+            )
+
+            return len(rows)
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Bulk upsert failed: {e}")
+            raise TransactionError(f"Bulk upsert failed: {str(e)}") from e
+
+    async def bulk_upsert_metrics_returning(
+        self,
+        metrics_data: Sequence[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE
+    ) -> List[FinancialMetric]:
+        """Bulk upsert metrics and return the resulting rows.
+
+        Same semantics as bulk_upsert_metrics, but each batch uses RETURNING
+        so the inserted or updated FinancialMetric instances come back
+        without a follow-up SELECT.
+
+        Args:
+            metrics_data: List of metric dictionaries (see bulk_upsert_metrics)
+            batch_size: Maximum rows per INSERT statement (default: 5000)
+
+        Returns:
+            List of upserted FinancialMetric instances
+
+        Example:
+            ```python
+            metrics = await repo.bulk_upsert_metrics_returning(rows)
+            ids = [m.id for m in metrics]
+            ```
+        """
+        rows = self._dedupe_metric_rows(metrics_data)
+        if not rows:
+            return []
+
+        try:
+            metrics: List[FinancialMetric] = []
+            for batch in self._iter_upsert_batches(rows, batch_size):
+                stmt = self._build_bulk_upsert(batch).returning(
+                    FinancialMetric
+                ).execution_options(populate_existing=True)
+
+                result = await self.session.execute(stmt)
+                metrics.extend(result.scalars().all())
 
             await self.session.flush()
 
-            logger.info(f"Bulk upserted {len(metrics_data)} metrics")
+            logger.info(f"Bulk upserted {len(metrics)} metrics (returning rows)")
 
-            return len(metrics_data)
+            return metrics
 
         except Exception as e:
             await self.session.rollback()
             logger.error(f"Bulk upsert failed: {e}")
             raise TransactionError(f"Bulk upsert failed: {str(e)}") from e
 
+    async def copy_upsert_metrics(
+        self,
+        metrics_data: Sequence[Dict[str, Any]]
+    ) -> int:
+        """Bulk upsert metrics by streaming through COPY into a staging table.
+
+        Rows are written with the binary COPY protocol into a session-local
+        temporary table and then merged into financial_metrics with a single
+        INSERT ... SELECT ... ON CONFLICT. This is the fastest path for very
+        large loads (historical backfills), since it avoids bind parameters
+        entirely.
+
+        Unlike bulk_upsert_metrics, optional columns that are missing or None
+        keep their existing value on conflict.
+
+        Falls back to bulk_upsert_metrics when the driver does not support
+        COPY (anything other than asyncpg).
+
+        Args:
+            metrics_data: List of metric dictionaries (see bulk_upsert_metrics)
+
+        Returns:
+            Number of metrics processed (after de-duplication)
+
+        Example:
+            ```python
+            async with repo.transaction():
+                count = await repo.copy_upsert_metrics(history_rows)
+            ```
+        """
+        rows = self._dedupe_metric_rows(metrics_data)
+        if not rows:
+            return 0
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        if not hasattr(driver_connection, "copy_records_to_table"):
+            logger.debug("Driver does not support COPY, using multi-row upsert")
+            return await self.bulk_upsert_metrics(rows)
+
+        try:
+            await connection.run_sync(
+                lambda sync_conn: financial_metrics_staging.create(
+                    sync_conn, checkfirst=True
+                )
+            )
+            await connection.execute(financial_metrics_staging.delete())
+
+            await driver_connection.copy_records_to_table(
+                financial_metrics_staging.name,
+                records=[
+                    tuple(row.get(column) for column in METRIC_BULK_COLUMNS)
+                    for row in rows
+                ],
+                columns=list(METRIC_BULK_COLUMNS),
+            )
+
+            stmt = insert(FinancialMetric).from_select(
+                list(METRIC_BULK_COLUMNS),
+                select(*[financial_metrics_staging.c[c] for c in METRIC_BULK_COLUMNS])
+            )
+            update_values = {
+                column: func.coalesce(
+                    stmt.excluded[column], getattr(FinancialMetric, column)
+                )
+                for column in METRIC_BULK_COLUMNS
+                if column not in METRIC_CONFLICT_KEYS
+            }
+            update_values['updated_at'] = func.now()
+
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    constraint='uq_company_metric_period',
+                    set_=update_values
+                )
+            )
+            await self.session.flush()
+
+            logger.info(f"COPY upserted {len(rows)} metrics via staging table")
+
+            return len(rows)
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"COPY upsert failed: {e}")
+            raise TransactionError(f"COPY upsert failed: {str(e)}") from e
+
+    @staticmethod
+    def _dedupe_metric_rows(
+        metrics_data: Sequence[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Collapse rows sharing a conflict key, keeping the last occurrence.
+
+        Args:
+            metrics_data: Raw metric dictionaries
+
+        Returns:
+            De-duplicated rows in first-seen key order
+        """
+        unique: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        for row in metrics_data:
+            key = tuple(row.get(column) for column in METRIC_CONFLICT_KEYS)
+            unique[key] = row
+        return list(unique.values())
+
+    @staticmethod
+    def _iter_upsert_batches(
+        rows: List[Dict[str, Any]],
+        batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Split rows into statement-sized batches.
+
+        Rows are grouped by their column set first, because a multi-row
+        VALUES clause needs identical keys in every row, then chunked so
+        that rows * columns stays under MAX_BIND_PARAMS.
+
+        Args:
+            rows: De-duplicated metric dictionaries
+            batch_size: Requested maximum rows per statement
+
+        Yields:
+            Lists of rows that share the same keys
+        """
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        for columns, group in groups.items():
+            size = max(1, min(batch_size, MAX_BIND_PARAMS // max(len(columns), 1)))
+            for start in range(0, len(group), size):
+                yield group[start:start + size]
+
+    @staticmethod
+    def _build_bulk_upsert(batch: List[Dict[str, Any]]):
+        """Build a multi-row INSERT ... ON CONFLICT DO UPDATE statement.
+
+        Args:
+            batch: Rows sharing the same keys
+
+        Returns:
+            PostgreSQL insert statement
+        """
+        stmt = insert(FinancialMetric).values(batch)
+
+        update_values = {
+            column: stmt.excluded[column]
+            for column in batch[0]
+            if column not in METRIC_CONFLICT_KEYS
+        }
+        update_values['updated_at'] = func.now()
+
+        return stmt.on_conflict_do_update(
+            constraint='uq_company_metric_period',
+            set_=update_values
+        )
+
     async def calculate_growth_rate(
         self,
         company_id: UUID,
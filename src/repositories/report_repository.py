@@ -0,0 +1,28 @@
+"""Analysis report repository for report database operations."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import AnalysisReport
+from src.repositories.base_repository import BaseRepository
+
+
+class ReportRepository(BaseRepository[AnalysisReport]):
+    """Repository for AnalysisReport model.
+
+    Example:
+        ```python
+        repo = ReportRepository(session)
+        reports = await repo.get_all(
+            limit=50, order_by="created_at", descending=True,
+            report_type="competitive_landscape"
+        )
+        ```
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize report repository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(AnalysisReport, session)
@@ -1,5 +1,6 @@
 """Services layer for data access and business logic."""
 
 from src.services.dashboard_service import DashboardService
+from src.services.mart_refresh import MartRefresher, MetricChangeSet
 
-__all__ = ["DashboardService"]
+__all__ = ["DashboardService", "MartRefresher", "MetricChangeSet"]
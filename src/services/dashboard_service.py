@@ -2,7 +2,9 @@
 
 This service provides a clean interface between the dashboard and the database,
 querying dbt-transformed mart tables and returning data in formats expected by the
-dashboard components. All queries are cached using Redis for performance.
+dashboard components. All queries are cached using Redis for performance,
+with a process-local L1 cache in front of Redis for the hot keys the
+auto-refreshing dashboard reads over and over.
 """
 
 import json
@@ -15,6 +17,7 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.cache_manager import get_cache
+from src.core.local_cache import LocalCache, get_local_cache
 from src.db.models import Company, FinancialMetric
 from src.repositories import CompanyRepository, MetricsRepository
 
@@ -30,6 +33,7 @@ class DashboardService:
     Attributes:
         session: Async database session for queries
         cache_ttl: Default cache TTL in seconds (default: 300 = 5 minutes)
+        local_cache: Process-local L1 consulted before Redis (None disables it)
 
     Example:
         ```python
@@ -39,16 +43,23 @@ class DashboardService:
         ```
     """
 
-    def __init__(self, session: AsyncSession, cache_ttl: int = 300):
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache_ttl: int = 300,
+        local_cache: Optional[LocalCache] = None,
+    ):
         """Initialize dashboard service.
 
         Args:
             session: Async SQLAlchemy session
             cache_ttl: Cache time-to-live in seconds (default: 300)
+            local_cache: L1 cache to use (default: the process-wide one)
         """
         self.session = session
         self.cache_ttl = cache_ttl
         self.cache = None
+        self.local_cache = local_cache if local_cache is not None else get_local_cache()
 
     async def _init_cache(self):
         """Initialize Redis cache connection if not already initialized."""
@@ -64,14 +75,24 @@ class DashboardService:
         Returns:
             Cached value or None if not found
         """
+        if self.local_cache is not None:
+            value = self.local_cache.get(key)
+            if value is not None:
+                return value
+
         await self._init_cache()
         if self.cache is None:
             return None
 
         try:
             cached_value = await self.cache.get(key)
+            if self.local_cache is not None:
+                self.local_cache.record_l2(bool(cached_value))
             if cached_value:
-                return json.loads(cached_value)
+                value = json.loads(cached_value)
+                if self.local_cache is not None:
+                    self.local_cache.set(key, value, size=len(cached_value))
+                return value
         except Exception as e:
             logger.warning(f"Cache get failed for key {key}: {e}")
 
@@ -96,11 +117,62 @@ class DashboardService:
             ttl = ttl or self.cache_ttl
             serialized = json.dumps(value, default=str)  # default=str handles datetime
             await self.cache.setex(key, ttl, serialized)
+            if self.local_cache is not None:
+                # Decoded form, so L1 hits match what Redis would return
+                self.local_cache.set(key, json.loads(serialized), size=len(serialized), ttl=ttl)
             return True
         except Exception as e:
             logger.warning(f"Cache set failed for key {key}: {e}")
             return False
 
+    async def invalidate(self, *keys: str) -> int:
+        """Delete cache entries in Redis and in every process's L1 cache.
+
+        Args:
+            keys: Cache keys to invalidate
+
+        Returns:
+            Number of Redis keys deleted
+        """
+        await self._init_cache()
+        if self.local_cache is not None:
+            self.local_cache.delete(*keys)
+        if self.cache is None or not keys:
+            return 0
+
+        try:
+            removed = await self.cache.delete(*keys)
+            if self.local_cache is not None:
+                await self.local_cache.publish_invalidation(self.cache, keys)
+            return removed
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for keys {keys}: {e}")
+            return 0
+
+    async def invalidate_matching(self, *patterns: str) -> int:
+        """Delete cache entries matching glob ``patterns`` everywhere.
+
+        Args:
+            patterns: Redis glob patterns, e.g. ``dashboard:company_performance:*``
+
+        Returns:
+            Number of Redis keys deleted
+        """
+        await self._init_cache()
+        if self.cache is None or not patterns:
+            return 0
+
+        try:
+            keys = set()
+            for pattern in patterns:
+                async for key in self.cache.scan_iter(match=pattern):
+                    keys.add(key)
+        except Exception as e:
+            logger.warning(f"Cache scan failed for patterns {patterns}: {e}")
+            return 0
+
+        return await self.invalidate(*sorted(keys)) if keys else 0
+
     async def get_company_performance(
         self,
         category: Optional[str] = None,
@@ -455,44 +527,22 @@ class DashboardService:
             return pd.DataFrame(cached_data)
 
         try:
-            # Use repositories for cleaner data access
-            company_repo = CompanyRepository(self.session)
-            metrics_repo = MetricsRepository(self.session)
-
-            # Get company
-            company = await company_repo.find_by_ticker(ticker)
-
-            if not company:
-                logger.warning(f"Company {ticker} not found")
-                return pd.DataFrame()
-
-            # Get quarterly metrics using repository
-            metrics = await metrics_repo.get_metrics_by_period(
-                company.id,
-                metric_type,
+            series = await MetricsRepository(self.session).get_time_series_batch(
+                tickers=[ticker],
+                metric_types=[metric_type],
                 period_type="quarterly",
-                quarters=quarters
+                periods=quarters,
             )
 
-            if not metrics:
+            if len(series) == 0:
                 logger.info(f"No metrics found for {ticker} - {metric_type}")
                 return pd.DataFrame()
 
-            # Convert to DataFrame
-            df = pd.DataFrame([
-                {
-                    "metric_date": m.metric_date,
-                    "value": m.value,
-                    "unit": m.unit,
-                    "period_type": m.period_type,
-                }
-                for m in metrics
-            ])
-
-            # Calculate growth rates
-            df = df.sort_values("metric_date")
-            df["qoq_growth"] = df["value"].pct_change() * 100
-            df["yoy_growth"] = df["value"].pct_change(periods=4) * 100  # 4 quarters = 1 year
+            # Growth comes from the query, computed against the full history
+            df = series.to_dataframe()[
+                ["metric_date", "value", "unit", "qoq_growth", "yoy_growth"]
+            ]
+            df.insert(3, "period_type", "quarterly")
 
             # Cache the result as dict
             data_dict = df.to_dict(orient="records")
@@ -505,6 +555,70 @@ class DashboardService:
             logger.error(f"Error fetching quarterly metrics: {e}")
             return pd.DataFrame()
 
+    async def get_quarterly_metrics_batch(
+        self,
+        tickers: List[str],
+        metric_types: List[str],
+        quarters: int = 8
+    ) -> pd.DataFrame:
+        """Get quarterly metrics for many companies and metric types at once.
+
+        Issues a single query however many tickers and metric types are
+        requested, instead of one get_quarterly_metrics call per pair.
+
+        Args:
+            tickers: Company stock tickers
+            metric_types: Types of metric (revenue, mau, arpu, nrr, etc.)
+            quarters: Number of quarters per series (default: 8 = 2 years)
+
+        Returns:
+            Long-form DataFrame with columns ticker, metric_type, metric_date,
+            value, unit, qoq_growth and yoy_growth, sorted by ticker, metric
+            type and date
+
+        Example:
+            ```python
+            df = await service.get_quarterly_metrics_batch(
+                ["DUOL", "CHGG"], ["revenue", "monthly_active_users"]
+            )
+            latest = df.groupby(["ticker", "metric_type"]).last()
+            ```
+        """
+        cache_key = (
+            f"dashboard:quarterly_metrics_batch:{','.join(sorted(t.upper() for t in tickers))}:"
+            f"{','.join(sorted(metric_types))}:{quarters}"
+        )
+
+        cached_data = await self._get_cached(cache_key)
+        if cached_data:
+            return pd.DataFrame(cached_data)
+
+        try:
+            series = await MetricsRepository(self.session).get_time_series_batch(
+                tickers=tickers,
+                metric_types=metric_types,
+                period_type="quarterly",
+                periods=quarters,
+            )
+
+            if len(series) == 0:
+                logger.info(f"No quarterly metrics found for {len(tickers)} tickers")
+                return pd.DataFrame()
+
+            df = series.to_dataframe().drop(columns=["company_id"])
+
+            await self._set_cached(cache_key, df.to_dict(orient="records"))
+
+            logger.info(
+                f"Fetched {len(df)} quarterly metrics for {len(tickers)} tickers "
+                f"x {len(metric_types)} metric types"
+            )
+            return df
+
+        except Exception as e:
+            logger.error(f"Error fetching quarterly metrics batch: {e}")
+            return pd.DataFrame()
+
     async def get_market_summary(self) -> Dict[str, Any]:
         """Get high-level market KPIs for dashboard cards.
 
@@ -0,0 +1,504 @@
+"""Event-driven incremental refresh of the dbt marts.
+
+Ingestion records every (company, metric type) pair it writes to
+financial_metrics in the mart_refresh_queue table, inside the same
+transaction, and raises a PostgreSQL NOTIFY that is delivered on commit. The
+refresh worker wakes up on that notification (or on a periodic poll, in case
+one was missed), claims the queued changes and:
+
+1. works out from the dependency graph below which dbt models read the
+   changed metric types, plus everything downstream of them
+2. runs only those models as incremental dbt runs restricted to the changed
+   companies (``--vars refresh_company_ids``, see
+   dbt/macros/incremental_refresh.sql)
+3. invalidates the dashboard and response cache entries built from the
+   refreshed rows
+
+Claimed entries stay in the queue until the refresh succeeds. A failed run
+releases them; a run that dies outright (crash, kill) leaves them claimed,
+and they are taken again once the claim is older than
+``MART_REFRESH_CLAIM_TIMEOUT``.
+
+Run the worker with ``python -m src.services.mart_refresh``.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import delete, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.cache import get_response_cache
+from src.core.config import get_settings
+from src.core.exceptions import TransformationException
+from src.db.models import Company, MartRefreshQueue
+from src.db.session import get_async_engine, get_session_factory
+from src.services.dashboard_service import DashboardService
+
+# PostgreSQL NOTIFY channel raised when the queue gains entries
+MART_REFRESH_CHANNEL = "mart_refresh"
+
+# Metric types int_company_metrics_quarterly pivots out of financial_metrics
+INT_METRIC_TYPES = frozenset({
+    "revenue",
+    "gross_margin",
+    "operating_margin",
+    "profit_margin",
+    "revenue_growth_yoy",
+    "earnings_growth",
+    "pe_ratio",
+    "forward_pe",
+    "market_cap",
+    "eps",
+    "roe",
+})
+
+# Dashboard entries read straight from financial_metrics, so they go stale on
+# any change regardless of the marts
+METRIC_CACHE_PATTERNS = (
+    "dashboard:quarterly_metrics:{ticker}:{metric_type}:*",
+    "dashboard:quarterly_metrics_batch:*",
+)
+
+
+@dataclass(frozen=True)
+class MartModel:
+    """A dbt model and what depends on it.
+
+    Attributes:
+        name: dbt model name
+        depends_on: Upstream models whose refresh requires this one
+        metric_types: financial_metrics types the model reads directly
+        cache_patterns: Dashboard cache key patterns built from the model;
+            ``{ticker}`` expands to each changed company
+        cache_tags: Response cache tags built from the model
+    """
+
+    name: str
+    depends_on: Tuple[str, ...] = ()
+    metric_types: FrozenSet[str] = frozenset()
+    cache_patterns: Tuple[str, ...] = ()
+    cache_tags: Tuple[str, ...] = ()
+
+
+# Refreshable models in dependency order
+MART_MODELS: Tuple[MartModel, ...] = (
+    MartModel(
+        name="int_company_metrics_quarterly",
+        metric_types=INT_METRIC_TYPES,
+    ),
+    MartModel(
+        name="mart_company_performance",
+        depends_on=("int_company_metrics_quarterly",),
+        cache_patterns=(
+            "dashboard:company_performance:*",
+            "dashboard:company_details:{ticker}",
+            "dashboard:market_summary",
+            "dashboard:data_freshness",
+        ),
+        cache_tags=("trending_top",),
+    ),
+    MartModel(
+        name="mart_competitive_landscape",
+        depends_on=("mart_company_performance",),
+        cache_patterns=(
+            "dashboard:competitive_landscape:*",
+            "dashboard:segment_comparison:*",
+            "dashboard:market_summary",
+            "dashboard:data_freshness",
+        ),
+    ),
+)
+
+
+def affected_models(
+    metric_types: Iterable[str],
+    models: Tuple[MartModel, ...] = MART_MODELS,
+) -> List[MartModel]:
+    """Return the models to refresh for changes to ``metric_types``.
+
+    A model is affected if it reads one of the metric types directly or
+    depends on an affected model.
+
+    Args:
+        metric_types: Changed metric types
+        models: Models in dependency order
+
+    Returns:
+        Affected models, upstream first
+    """
+    changed = set(metric_types)
+    affected: List[MartModel] = []
+    names: Set[str] = set()
+    for model in models:
+        if model.metric_types & changed or names.intersection(model.depends_on):
+            affected.append(model)
+            names.add(model.name)
+    return affected
+
+
+@dataclass
+class MetricChangeSet:
+    """Metric types changed per company.
+
+    Example:
+        ```python
+        changes = MetricChangeSet.from_rows(metric_rows)
+        changes.company_ids    # {UUID(...), ...}
+        changes.metric_types   # {"revenue", "gross_margin"}
+        ```
+    """
+
+    changes: Dict[UUID, Set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "MetricChangeSet":
+        """Collect the (company_id, metric_type) pairs of metric rows."""
+        change_set = cls()
+        for row in rows:
+            change_set.add(row["company_id"], row["metric_type"])
+        return change_set
+
+    def add(self, company_id: UUID, metric_type: str) -> None:
+        if isinstance(company_id, str):
+            company_id = UUID(company_id)
+        self.changes.setdefault(company_id, set()).add(metric_type)
+
+    def companies_with(self, metric_types: Iterable[str]) -> Set[UUID]:
+        """Companies with a change to any of ``metric_types``."""
+        wanted = set(metric_types)
+        return {company_id for company_id, changed in self.changes.items() if changed & wanted}
+
+    def pairs(self) -> List[Tuple[UUID, str]]:
+        return [
+            (company_id, metric_type)
+            for company_id, metric_types in self.changes.items()
+            for metric_type in sorted(metric_types)
+        ]
+
+    @property
+    def company_ids(self) -> Set[UUID]:
+        return set(self.changes)
+
+    @property
+    def metric_types(self) -> Set[str]:
+        return set().union(*self.changes.values()) if self.changes else set()
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return sum(len(metric_types) for metric_types in self.changes.values())
+
+
+async def record_metric_changes(session: AsyncSession, changes: MetricChangeSet) -> int:
+    """Queue changed (company, metric type) pairs for the next mart refresh.
+
+    Runs in the caller's transaction, so the queue entries and the NOTIFY
+    that wakes the refresh worker only take effect if the metrics commit.
+
+    Args:
+        session: Session of the transaction that wrote the metrics
+        changes: Pairs written
+
+    Returns:
+        Number of pairs queued
+    """
+    if not changes:
+        return 0
+
+    stmt = insert(MartRefreshQueue).values([
+        {"company_id": company_id, "metric_type": metric_type}
+        for company_id, metric_type in changes.pairs()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MartRefreshQueue.company_id, MartRefreshQueue.metric_type],
+        # A change during a running refresh releases its claim, so the entry
+        # is kept and picked up again by the next run
+        set_={"last_changed_at": func.now(), "claimed_at": None},
+    )
+    await session.execute(stmt)
+    await session.execute(text("SELECT pg_notify(:channel, '')"), {"channel": MART_REFRESH_CHANNEL})
+
+    logger.debug(f"Queued {len(changes)} metric changes for mart refresh")
+    return len(changes)
+
+
+@dataclass
+class RefreshResult:
+    """Outcome of one incremental refresh."""
+
+    companies: int
+    metric_types: List[str]
+    models: List[str]
+    cache_entries_invalidated: int
+    duration_seconds: float
+
+
+class MartRefresher:
+    """Drains the refresh queue and incrementally refreshes affected marts.
+
+    Example:
+        ```python
+        refresher = MartRefresher()
+        result = await refresher.refresh_pending()   # one-off
+        await refresher.run_forever()                 # event-driven worker
+        ```
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        project_dir: Optional[str] = None,
+        profiles_dir: Optional[str] = None,
+        dbt_executable: Optional[str] = None,
+        timeout: Optional[float] = None,
+        claim_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize mart refresher.
+
+        Args:
+            session_factory: Session factory (default: the pooled app factory)
+            project_dir: dbt project directory (default: DBT_PROJECT_DIR)
+            profiles_dir: dbt profiles directory (default: DBT_PROFILES_DIR)
+            dbt_executable: dbt command (default: DBT_EXECUTABLE)
+            timeout: Seconds a dbt run may take (default: MART_REFRESH_TIMEOUT)
+            claim_timeout: Seconds after which claimed changes are taken again
+                (default: MART_REFRESH_CLAIM_TIMEOUT)
+        """
+        settings = get_settings()
+        self.session_factory = session_factory or get_session_factory()
+        self.project_dir = project_dir or settings.DBT_PROJECT_DIR
+        self.profiles_dir = profiles_dir or settings.DBT_PROFILES_DIR
+        self.dbt_executable = dbt_executable or settings.DBT_EXECUTABLE
+        self.timeout = timeout or settings.MART_REFRESH_TIMEOUT
+        self.claim_timeout = claim_timeout or settings.MART_REFRESH_CLAIM_TIMEOUT
+        self.debounce = settings.MART_REFRESH_DEBOUNCE_SECONDS
+        self.poll_interval = settings.MART_REFRESH_POLL_SECONDS
+
+    async def refresh_pending(self) -> Optional[RefreshResult]:
+        """Claim everything queued and refresh it.
+
+        The claimed entries are only deleted once the refresh succeeds. On
+        failure or cancellation the claim is released; if the worker dies
+        the claim goes stale and another run takes it over.
+
+        Returns:
+            RefreshResult, or None when the queue was empty
+        """
+        async with self.session_factory() as session:
+            async with session.begin():
+                changes, claimed_at = await self._claim(session)
+
+        if not changes:
+            return None
+
+        try:
+            result = await self.refresh(changes)
+        except BaseException:
+            # Includes cancellation: leave the changes for the next run
+            async with self.session_factory() as session:
+                async with session.begin():
+                    await self._release(session, claimed_at)
+            raise
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                await self._complete(session, claimed_at)
+        return result
+
+    async def _claim(self, session: AsyncSession) -> Tuple[MetricChangeSet, Optional[datetime]]:
+        """Mark unclaimed and stale entries as claimed by this run.
+
+        Returns:
+            The claimed changes and the claim timestamp identifying them
+        """
+        stale = func.now() - timedelta(seconds=self.claim_timeout)
+        stmt = (
+            update(MartRefreshQueue)
+            .where(or_(MartRefreshQueue.claimed_at.is_(None), MartRefreshQueue.claimed_at < stale))
+            .values(claimed_at=func.now())
+            .returning(
+                MartRefreshQueue.company_id,
+                MartRefreshQueue.metric_type,
+                MartRefreshQueue.claimed_at,
+            )
+        )
+        result = await session.execute(stmt)
+        changes = MetricChangeSet()
+        claimed_at = None
+        for company_id, metric_type, claimed_at in result:
+            changes.add(company_id, metric_type)
+        return changes, claimed_at
+
+    async def _complete(self, session: AsyncSession, claimed_at: datetime) -> None:
+        """Delete the entries of a successful refresh still held by its claim."""
+        await session.execute(
+            delete(MartRefreshQueue).where(MartRefreshQueue.claimed_at == claimed_at)
+        )
+
+    async def _release(self, session: AsyncSession, claimed_at: datetime) -> None:
+        """Return the entries of a failed refresh to the queue."""
+        await session.execute(
+            update(MartRefreshQueue)
+            .where(MartRefreshQueue.claimed_at == claimed_at)
+            .values(claimed_at=None)
+        )
+
+    async def refresh(self, changes: MetricChangeSet) -> RefreshResult:
+        """Refresh the models and caches affected by ``changes``."""
+        started = time.perf_counter()
+        models = affected_models(changes.metric_types)
+
+        if models:
+            # Only companies whose changes reach the marts need recomputing
+            read_directly = set().union(*(model.metric_types for model in models))
+            await self.run_dbt(
+                [model.name for model in models], changes.companies_with(read_directly)
+            )
+
+        invalidated = await self.invalidate_caches(changes, models)
+
+        result = RefreshResult(
+            companies=len(changes.company_ids),
+            metric_types=sorted(changes.metric_types),
+            models=[model.name for model in models],
+            cache_entries_invalidated=invalidated,
+            duration_seconds=round(time.perf_counter() - started, 3),
+        )
+        logger.info(
+            f"Refreshed {result.models or 'no models'} for {result.companies} companies "
+            f"in {result.duration_seconds}s ({invalidated} cache entries invalidated)"
+        )
+        return result
+
+    def dbt_command(self, models: List[str], company_ids: Iterable[UUID]) -> List[str]:
+        """Build the dbt run command for an incremental refresh."""
+        refresh_vars = {"refresh_company_ids": sorted(str(company_id) for company_id in company_ids)}
+        return [
+            self.dbt_executable,
+            "run",
+            "--project-dir", self.project_dir,
+            "--profiles-dir", self.profiles_dir,
+            "--select", *models,
+            "--vars", json.dumps(refresh_vars),
+        ]
+
+    async def run_dbt(self, models: List[str], company_ids: Iterable[UUID]) -> None:
+        """Run ``models`` incrementally for ``company_ids``.
+
+        Raises:
+            TransformationException: If dbt fails or times out
+        """
+        command = self.dbt_command(models, company_ids)
+        logger.info(f"Running dbt for {', '.join(models)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        try:
+            output, _ = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise TransformationException(f"dbt run timed out after {self.timeout}s")
+
+        if process.returncode != 0:
+            tail = output.decode(errors="replace").strip().splitlines()[-20:]
+            raise TransformationException(
+                f"dbt run failed with exit code {process.returncode}",
+                models=models,
+                output=tail,
+            )
+
+    async def invalidate_caches(self, changes: MetricChangeSet, models: List[MartModel]) -> int:
+        """Evict dashboard and response cache entries built from the refreshed rows.
+
+        Returns:
+            Number of cache entries removed
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(Company.id, Company.ticker).where(Company.id.in_(changes.company_ids))
+            )
+            tickers = dict(result.all())
+
+            patterns: Set[str] = set()
+            for company_id, metric_types in changes.changes.items():
+                ticker = tickers.get(company_id)
+                if ticker is None:
+                    continue
+                for metric_type in metric_types:
+                    patterns.update(
+                        pattern.format(ticker=ticker, metric_type=metric_type)
+                        for pattern in METRIC_CACHE_PATTERNS
+                    )
+                for model in models:
+                    patterns.update(pattern.format(ticker=ticker) for pattern in model.cache_patterns)
+
+            removed = await DashboardService(session).invalidate_matching(*sorted(patterns))
+
+        # Endpoints reading financial_metrics are tagged per company
+        tags = {"metrics"} | {f"company:{company_id}" for company_id in changes.company_ids}
+        for model in models:
+            tags.update(model.cache_tags)
+        removed += await get_response_cache().invalidate_tags(*sorted(tags))
+
+        return removed
+
+    async def run_forever(self) -> None:
+        """Refresh whenever ingestion commits changes, until cancelled.
+
+        Wakes on the NOTIFY raised by record_metric_changes, waits
+        ``MART_REFRESH_DEBOUNCE_SECONDS`` so a burst of ingestion commits is
+        refreshed once, and also polls every ``MART_REFRESH_POLL_SECONDS``
+        in case a notification was missed.
+        """
+        changed = asyncio.Event()
+
+        async with get_async_engine().connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            listener = raw_connection.driver_connection
+
+            def on_notify(*args: Any) -> None:
+                changed.set()
+
+            await listener.add_listener(MART_REFRESH_CHANNEL, on_notify)
+            logger.info(f"Mart refresh worker listening on '{MART_REFRESH_CHANNEL}'")
+
+            try:
+                # Drain anything queued while the worker was down
+                changed.set()
+                while True:
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    await asyncio.sleep(self.debounce)
+                    changed.clear()
+
+                    try:
+                        await self.refresh_pending()
+                    except Exception as e:
+                        logger.error(f"Mart refresh failed, changes left queued: {e}")
+            finally:
+                await listener.remove_listener(MART_REFRESH_CHANNEL, on_notify)
+
+
+def main():
+    """Run the mart refresh worker when executed as a script."""
+    asyncio.run(MartRefresher().run_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Streaming encoders for bulk financial metric exports.
+
+Turns the (columns, rows) chunks produced by MetricsRepository.stream_metrics
+into NDJSON, Arrow IPC stream or Parquet bytes, one chunk at a time, so an
+export of any size is served with memory bounded by the chunk size.
+
+Arrow and Parquet need pyarrow; NDJSON always works and uses orjson when
+it is installed.
+"""
+
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, List, Sequence, Tuple
+from uuid import UUID
+
+from loguru import logger
+
+from src.repositories.metrics_repository import METRIC_STREAM_KEY_COLUMNS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+MetricChunks = AsyncIterator[Tuple[List[str], List[Tuple[Any, ...]]]]
+
+
+class ExportFormat(str, Enum):
+    """Supported export encodings."""
+
+    NDJSON = "ndjson"
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+            ExportFormat.PARQUET: "application/vnd.apache.parquet",
+        }[self]
+
+    @property
+    def extension(self) -> str:
+        return {
+            ExportFormat.NDJSON: "ndjson",
+            ExportFormat.ARROW: "arrows",
+            ExportFormat.PARQUET: "parquet",
+        }[self]
+
+    @property
+    def available(self) -> bool:
+        return self is ExportFormat.NDJSON or PYARROW_AVAILABLE
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+async def encode_ndjson(chunks: MetricChunks) -> AsyncIterator[bytes]:
+    """Encode chunks as newline-delimited JSON objects, one per row."""
+    async for columns, rows in chunks:
+        if not rows:
+            continue
+        if ORJSON_AVAILABLE:
+            lines = [
+                orjson.dumps(dict(zip(columns, row)), default=_json_default)
+                for row in rows
+            ]
+        else:
+            lines = [
+                json.dumps(dict(zip(columns, row)), default=_json_default).encode()
+                for row in rows
+            ]
+        yield b"\n".join(lines) + b"\n"
+
+
+def arrow_schema(columns: Sequence[str], pivot: bool = False) -> "pa.Schema":
+    """Arrow schema for the long or wide (``pivot``) export columns.
+
+    The leading key columns have fixed types. In the long form metric_type
+    and unit are strings and value is float64; in the wide form every column
+    after the keys is a float64 value column, whatever its metric is named.
+    """
+    fixed = {
+        "ticker": pa.string(),
+        "company_id": pa.string(),
+        "metric_date": pa.timestamp("us", tz="UTC"),
+        "period_type": pa.string(),
+        "metric_type": pa.string(),
+        "unit": pa.string(),
+    }
+    typed = len(METRIC_STREAM_KEY_COLUMNS) if pivot else len(columns)
+    return pa.schema([
+        (name, fixed.get(name, pa.float64()) if position < typed else pa.float64())
+        for position, name in enumerate(columns)
+    ])
+
+
+def _record_batch(schema: "pa.Schema", rows: List[Tuple[Any, ...]]) -> "pa.RecordBatch":
+    """Transpose row tuples into one Arrow array per column."""
+    columns = list(zip(*rows)) if rows else [() for _ in schema.names]
+    company_id = METRIC_STREAM_KEY_COLUMNS.index("company_id")
+    arrays = []
+    for position, (field, values) in enumerate(zip(schema, columns)):
+        if position == company_id:
+            values = [str(v) if v is not None else None for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    """Take everything written to the buffer so far and reset it."""
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return data
+
+
+async def encode_arrow(chunks: MetricChunks, pivot: bool = False) -> AsyncIterator[bytes]:
+    """Encode chunks as an Arrow IPC stream, one record batch per chunk."""
+    buffer = io.BytesIO()
+    writer = None
+    schema = None
+
+    async for columns, rows in chunks:
+        if writer is None:
+            schema = arrow_schema(columns, pivot)
+            writer = pa.ipc.new_stream(buffer, schema)
+        if rows:
+            writer.write_batch(_record_batch(schema, rows))
+        data = _drain(buffer)
+        if data:
+            yield data
+
+    if writer is not None:
+        writer.close()
+        yield _drain(buffer)
+
+
+async def encode_parquet(chunks: MetricChunks, pivot: bool = False) -> AsyncIterator[bytes]:
+    """Encode chunks as a Parquet file, one row group per chunk.
+
+    Row groups are flushed as they are written; only the footer waits for
+    the last chunk.
+    """
+    buffer = io.BytesIO()
+    writer = None
+    schema = None
+
+    async for columns, rows in chunks:
+        if writer is None:
+            schema = arrow_schema(columns, pivot)
+            writer = pq.ParquetWriter(buffer, schema, compression="zstd")
+        if rows:
+            writer.write_table(pa.Table.from_batches([_record_batch(schema, rows)]))
+        data = _drain(buffer)
+        if data:
+            yield data
+
+    if writer is not None:
+        writer.close()
+        yield _drain(buffer)
+
+
+def encode_metrics(
+    chunks: MetricChunks, export_format: ExportFormat, pivot: bool = False
+) -> AsyncIterator[bytes]:
+    """Pick the encoder for a format.
+
+    ``pivot`` tells the binary encoders that the chunks are in the wide form.
+
+    Raises:
+        RuntimeError: If the format needs pyarrow and it is not installed
+    """
+    if not export_format.available:
+        raise RuntimeError(f"{export_format.value} export requires pyarrow")
+
+    logger.debug(f"Encoding metrics export as {export_format.value}")
+
+    if export_format is ExportFormat.ARROW:
+        return encode_arrow(chunks, pivot)
+    if export_format is ExportFormat.PARQUET:
+        return encode_parquet(chunks, pivot)
+    return encode_ndjson(chunks)
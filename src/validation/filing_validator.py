@@ -0,0 +1,225 @@
+"""Compiled validation rules for downloaded SEC filings.
+
+The SEC ingestion flow checks every downloaded filing against a fixed rule
+set (required fields, string types, identifier formats, form whitelist,
+minimum content length). Running those rules through a Great Expectations
+context costs hundreds of milliseconds per filing for what amounts to a few
+regex matches, so this module evaluates the same rules directly:
+
+- ``FilingValidator.check`` validates one filing dict with precompiled regexes
+- ``FilingValidator.validate_frame`` validates thousands of filings at once
+  as one DataFrame, column by column
+
+The rule constants below are the single source of truth; the Great
+Expectations audit path in ``src.pipeline.sec.parser`` builds its suite from
+them as well.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import pandas as pd
+
+REQUIRED_COLUMNS = (
+    "accessionNumber",
+    "form",
+    "filingDate",
+    "cik",
+    "content",
+    "content_hash",
+    "downloaded_at",
+)
+
+STRING_COLUMNS = ("accessionNumber", "form", "cik", "content", "content_hash")
+
+# (column, regex, description)
+REGEX_RULES = (
+    ("cik", r"^\d{1,10}$", "CIK must be 1-10 digit numeric string"),
+    ("accessionNumber", r"^\d{10}-\d{2}-\d{6}$", "Accession number format must be NNNNNNNNNN-NN-NNNNNN"),
+    ("filingDate", r"^\d{4}-\d{2}-\d{2}$", "Filing date must be in YYYY-MM-DD format"),
+    ("content_hash", r"^[a-f0-9]{64}$", "Content hash must be valid SHA-256 hex"),
+)
+
+VALID_FORM_TYPES = frozenset({
+    "10-K", "10-Q", "8-K", "10-K/A", "10-Q/A", "8-K/A",
+    "S-1", "S-3", "S-4", "S-8", "DEF 14A", "SC 13D", "SC 13G",
+    "4", "3", "5", "144",
+})
+
+NOT_NULL_COLUMNS = ("accessionNumber", "form", "filingDate", "cik", "content")
+
+MIN_CONTENT_LENGTH = 100
+
+FILING_DATE_FORMAT = "%Y-%m-%d"
+
+# Checked for non-null only when the filing carries the field at all
+OPTIONAL_NOT_NULL_COLUMNS = ("primaryDocument",)
+
+
+def _is_null(value: Any) -> bool:
+    """Null as pandas sees it (None, NaN, NaT), for scalar values only."""
+    return pd.api.types.is_scalar(value) and bool(pd.isna(value))
+
+
+@lru_cache(maxsize=4096)
+def _is_filing_date(value: str) -> bool:
+    try:
+        datetime.strptime(value, FILING_DATE_FORMAT)
+        return True
+    except ValueError:
+        return False
+
+
+class FilingValidator:
+    """Evaluate the SEC filing rule set without a Great Expectations context.
+
+    Rules follow expectation semantics: null values are skipped by format,
+    type and length rules and only fail the explicit not-null rules.
+
+    Example:
+        ```python
+        validator = get_filing_validator()
+        failures = validator.check(filing)        # [] when valid
+        valid = validator.validate_many(filings)  # List[bool], one DataFrame pass
+        ```
+    """
+
+    def __init__(self):
+        self.regexes = [(column, re.compile(regex)) for column, regex, _ in REGEX_RULES]
+
+    def check(self, filing: Mapping[str, Any]) -> List[str]:
+        """Validate one filing.
+
+        Returns:
+            Names of failed rules, as ``"<rule>(<column>)"``; empty if valid
+        """
+        failures = [f"column_exists({column})" for column in REQUIRED_COLUMNS if column not in filing]
+
+        for column in STRING_COLUMNS:
+            value = filing.get(column)
+            if not _is_null(value) and not isinstance(value, str):
+                failures.append(f"of_type_str({column})")
+
+        for column, regex in self.regexes:
+            value = filing.get(column)
+            if not _is_null(value) and not regex.search(str(value)):
+                failures.append(f"match_regex({column})")
+
+        form = filing.get("form")
+        if not _is_null(form) and not (isinstance(form, str) and form in VALID_FORM_TYPES):
+            failures.append("in_set(form)")
+
+        for column in NOT_NULL_COLUMNS:
+            if _is_null(filing.get(column)):
+                failures.append(f"not_null({column})")
+
+        content = filing.get("content")
+        if isinstance(content, str) and len(content) < MIN_CONTENT_LENGTH:
+            failures.append("length_at_least(content)")
+
+        filing_date = filing.get("filingDate")
+        if not _is_null(filing_date) and not (
+            isinstance(filing_date, str) and _is_filing_date(filing_date)
+        ):
+            failures.append("strftime_format(filingDate)")
+
+        for column in OPTIONAL_NOT_NULL_COLUMNS:
+            if column in filing and _is_null(filing[column]):
+                failures.append(f"not_null({column})")
+
+        return failures
+
+    def is_valid(self, filing: Mapping[str, Any]) -> bool:
+        """True if the filing passes every rule."""
+        return not self.check(filing)
+
+    def validate_frame(
+        self,
+        df: pd.DataFrame,
+        present: Optional[Mapping[str, Sequence[bool]]] = None,
+    ) -> pd.Series:
+        """Validate every row of a DataFrame of filings.
+
+        Args:
+            df: One row per filing
+            present: Per-column, per-row flags telling whether each filing
+                carried the field. Defaults to "every row has every column
+                of ``df``", which is the only information a DataFrame holds.
+
+        Returns:
+            Boolean Series aligned with ``df.index``
+        """
+        valid = pd.Series(True, index=df.index)
+
+        def column(name: str) -> pd.Series:
+            if name in df.columns:
+                return df[name]
+            return pd.Series(None, index=df.index, dtype=object)
+
+        def has(name: str) -> pd.Series:
+            if present is not None and name in present:
+                return pd.Series(present[name], index=df.index, dtype=bool)
+            return pd.Series(name in df.columns, index=df.index)
+
+        for name in REQUIRED_COLUMNS:
+            valid &= has(name)
+
+        nulls = {name: column(name).isna() for name in set(STRING_COLUMNS) | {"filingDate"}}
+        strings = {
+            name: column(name).map(lambda value: isinstance(value, str)).astype(bool)
+            for name in nulls
+        }
+
+        for name in STRING_COLUMNS:
+            valid &= nulls[name] | strings[name]
+
+        for name, regex in self.regexes:
+            values = column(name)
+            matches = values.map(lambda value: value is None or bool(regex.search(str(value))))
+            valid &= nulls[name] | matches.astype(bool)
+
+        valid &= nulls["form"] | column("form").isin(VALID_FORM_TYPES)
+
+        for name in NOT_NULL_COLUMNS:
+            valid &= ~column(name).isna()
+
+        content = column("content")
+        valid &= ~strings["content"] | (content.where(strings["content"], "").str.len() >= MIN_CONTENT_LENGTH)
+
+        dates = column("filingDate")
+        parsed = dates.where(strings["filingDate"], "").map(_is_filing_date)
+        valid &= nulls["filingDate"] | (strings["filingDate"] & parsed.astype(bool))
+
+        for name in OPTIONAL_NOT_NULL_COLUMNS:
+            valid &= ~has(name) | ~column(name).isna()
+
+        return valid
+
+    def validate_many(self, filings: Iterable[Mapping[str, Any]]) -> List[bool]:
+        """Validate a batch of filing dicts as one DataFrame."""
+        filings = list(filings)
+        if not filings:
+            return []
+
+        columns = list(dict.fromkeys(REQUIRED_COLUMNS + OPTIONAL_NOT_NULL_COLUMNS))
+        df = pd.DataFrame.from_records(
+            [{name: filing.get(name) for name in columns} for filing in filings],
+            columns=columns,
+        )
+        present: Dict[str, List[bool]] = {
+            name: [name in filing for filing in filings] for name in columns
+        }
+        return self.validate_frame(df, present).tolist()
+
+
+_validator: Optional[FilingValidator] = None
+
+
+def get_filing_validator() -> FilingValidator:
+    """Shared FilingValidator instance (regexes are compiled once per process)."""
+    global _validator
+    if _validator is None:
+        _validator = FilingValidator()
+    return _validator
@@ -1,5 +1,6 @@
 """Tests for financial metrics API endpoints."""
 
+import json
 import pytest
 from uuid import uuid4
 from datetime import datetime, timedelta
@@ -99,6 +100,63 @@ class TestListMetricsEndpoint:
             dates = [datetime.fromisoformat(m["metric_date"].replace('Z', '+00:00')) for m in data]
             assert dates == sorted(dates, reverse=True)
 
+    def test_list_metrics_cursor_pagination(
+        self, api_client: TestClient, sample_metrics: list[FinancialMetric]
+    ):
+        """Test walking all metrics by cursor visits each row exactly once."""
+        seen = []
+        response = api_client.get("/api/v1/metrics/?limit=1")
+
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(m["id"] for m in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = api_client.get(f"/api/v1/metrics/?limit=1&cursor={cursor}")
+
+        assert sorted(seen) == sorted(m.id for m in sample_metrics)
+
+    def test_list_metrics_invalid_cursor(self, api_client: TestClient):
+        """Test malformed cursor returns 400."""
+        response = api_client.get("/api/v1/metrics/?cursor=not-a-cursor")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_metrics_ndjson(
+        self, api_client: TestClient, sample_metrics: list[FinancialMetric]
+    ):
+        """Test NDJSON export streams every matching row."""
+        response = api_client.get("/api/v1/metrics/export?format=ndjson&ticker=duol")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == len(sample_metrics)
+        assert {r["metric_type"] for r in rows} == {m.metric_type for m in sample_metrics}
+
+    def test_export_metrics_pivot(
+        self, api_client: TestClient, sample_metrics: list[FinancialMetric]
+    ):
+        """Test pivoted export has one column per requested metric type."""
+        response = api_client.get(
+            "/api/v1/metrics/export?pivot=true&metric_type=revenue&metric_type=monthly_active_users"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["revenue"] == 150000000.0
+        assert rows[0]["monthly_active_users"] == 50000000.0
+
+    def test_export_metrics_invalid_range(self, api_client: TestClient):
+        """Test inverted date range returns 400."""
+        response = api_client.get(
+            "/api/v1/metrics/export?start_date=2024-12-31T00:00:00&end_date=2024-01-01T00:00:00"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_list_metrics_invalid_limit(self, api_client: TestClient):
         """Test invalid limit returns 422."""
         response = api_client.get("/api/v1/metrics/?limit=1000")
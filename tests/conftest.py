@@ -2,13 +2,15 @@
 
 import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator, Generator
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 from unittest.mock import Mock, patch
 from datetime import datetime
 import asyncio
@@ -42,13 +44,17 @@ def pytest_configure(config):
 # Import after path configuration
 from src.api.main import app
 from src.db.base import Base, get_db
+from src.db.session import get_db as get_async_db, get_session_factory
 from src.core.config import get_settings
 
 # Get settings instance
 settings = get_settings()
 
-# Test database URL - using SQLite for tests
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Test database - a SQLite file, so fixtures written through the sync session
+# are visible to the async session used by the v1 routers
+TEST_DATABASE_PATH = Path(tempfile.gettempdir()) / f"corporate_intel_test_{os.getpid()}.db"
+TEST_DATABASE_URL = f"sqlite:///{TEST_DATABASE_PATH}"
+ASYNC_TEST_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DATABASE_PATH}"
 
 # Create test engine
 engine = create_engine(
@@ -59,6 +65,24 @@ engine = create_engine(
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(ASYNC_TEST_DATABASE_URL, poolclass=NullPool)
+
+AsyncTestingSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_database_file() -> Generator[Path, None, None]:
+    """Remove the SQLite test database file when the session ends."""
+    yield TEST_DATABASE_PATH
+    engine.dispose()
+    for path in (TEST_DATABASE_PATH, Path(f"{TEST_DATABASE_PATH}-journal")):
+        path.unlink(missing_ok=True)
+
 
 @pytest.fixture(scope="function")
 def db_session() -> Generator[Session, None, None]:
@@ -85,7 +109,14 @@ def client(db_session: Session) -> TestClient:
         finally:
             pass
 
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+            await session.commit()
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_session_factory] = lambda: AsyncTestingSessionLocal
 
     with TestClient(app) as test_client:
         yield test_client
@@ -139,6 +170,8 @@ def override_settings():
     """Override settings for testing."""
     settings.ENVIRONMENT = "testing"
     settings.DEBUG = True
+    # A process-wide L1 cache would carry values from one test into the next
+    settings.L1_CACHE_ENABLED = False
     yield
 
 
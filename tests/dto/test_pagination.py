@@ -0,0 +1,125 @@
+"""Tests for keyset pagination cursors and cursor-aware pagination DTOs."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.dto.pagination import (
+    InvalidCursorError,
+    PageLinks,
+    PageMetadata,
+    PaginationParams,
+    decode_cursor,
+    encode_cursor,
+    next_cursor_from_items,
+    paginated_response,
+)
+
+
+class Row:
+    """Minimal ORM-like row."""
+
+    def __init__(self, id, metric_date):
+        self.id = id
+        self.metric_date = metric_date
+
+
+class TestCursorCodec:
+    """Test encode_cursor / decode_cursor."""
+
+    def test_round_trip(self):
+        """Test values survive as JSON primitives."""
+        when = datetime(2024, 3, 31, tzinfo=timezone.utc)
+        cursor = encode_cursor("metric_date", when, 42)
+
+        sort_value, row_id = decode_cursor(cursor, "metric_date")
+
+        assert sort_value == when.isoformat()
+        assert row_id == 42
+
+    def test_cursor_is_url_safe(self):
+        """Test cursors need no URL escaping."""
+        cursor = encode_cursor("ticker", "DUOL", uuid4())
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_malformed_cursor(self):
+        """Test garbage is rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor", "metric_date")
+
+    def test_cursor_for_other_sort_key(self):
+        """Test a cursor cannot be replayed against another ordering."""
+        cursor = encode_cursor("filing_date", "2024-01-01", str(uuid4()))
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "metric_date")
+
+
+class TestNextCursorFromItems:
+    """Test next_cursor_from_items."""
+
+    def test_full_page_yields_cursor(self):
+        """Test cursor points after the last row."""
+        rows = [Row(i, datetime(2024, 1, i + 1)) for i in range(3)]
+
+        cursor = next_cursor_from_items(rows, 3, "metric_date")
+
+        assert decode_cursor(cursor, "metric_date") == (rows[-1].metric_date.isoformat(), 2)
+
+    def test_short_page_is_last(self):
+        """Test a partial page has no successor."""
+        rows = [Row(1, datetime(2024, 1, 1))]
+
+        assert next_cursor_from_items(rows, 10, "metric_date") is None
+        assert next_cursor_from_items([], 10, "metric_date") is None
+
+    def test_cached_dict_rows(self):
+        """Test rows already serialized by the response cache."""
+        rows = [{"id": 7, "metric_date": "2024-01-01T00:00:00"}]
+
+        cursor = next_cursor_from_items(rows, 1, "metric_date")
+
+        assert decode_cursor(cursor, "metric_date") == ("2024-01-01T00:00:00", 7)
+
+
+class TestCursorPaginatedResponse:
+    """Test cursor handling in paginated_response and PageLinks."""
+
+    def test_next_cursor_sets_has_next(self):
+        """Test a returned cursor drives has_next and next_cursor."""
+        params = PaginationParams(limit=2)
+        response = paginated_response(["a", "b"], 10, params, next_cursor="abc")
+
+        assert response.pagination.has_next is True
+        assert response.pagination.next_cursor == "abc"
+        assert response.pagination.has_previous is False
+
+    def test_last_cursor_page(self):
+        """Test the final keyset page has no next page."""
+        params = PaginationParams(limit=2, cursor="abc")
+        response = paginated_response(["a"], 10, params)
+
+        assert response.pagination.has_next is False
+        assert response.pagination.has_previous is True
+
+    def test_links_follow_cursor(self):
+        """Test the next link carries the cursor instead of an offset."""
+        params = PaginationParams(limit=2, cursor="abc")
+        metadata = PageMetadata.from_cursor(
+            total_items=10,
+            page_size=2,
+            current_page=1,
+            has_next=True,
+            has_previous=True,
+            next_cursor="def",
+        )
+
+        links = PageLinks.generate("/api/v1/metrics", params, metadata)
+
+        assert links.self == "/api/v1/metrics?limit=2&cursor=abc"
+        assert links.next == "/api/v1/metrics?limit=2&cursor=def"
+        assert links.previous is None
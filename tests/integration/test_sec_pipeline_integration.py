@@ -14,6 +14,8 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Company, SECFiling, FinancialMetric
+from src.pipeline.sec import content_store
+from src.pipeline.sec.content_store import LocalFilingContentStore
 from src.pipeline.sec_ingestion import (
     FilingRequest,
     fetch_company_data,
@@ -26,6 +28,14 @@ from src.pipeline.sec_ingestion import (
 )
 
 
+@pytest.fixture
+def filing_store(tmp_path, monkeypatch):
+    """Process-wide filing content store writing under tmp_path."""
+    store = LocalFilingContentStore(root=str(tmp_path / "filings"))
+    monkeypatch.setattr(content_store, "_filing_content_store", store)
+    return store
+
+
 # ============================================================================
 # END-TO-END WORKFLOW TESTS
 # ============================================================================
@@ -38,7 +48,8 @@ class TestEndToEndWorkflow:
         self,
         db_session: AsyncSession,
         patch_httpx_client,
-        patch_session_factory
+        patch_session_factory,
+        filing_store
     ):
         """Test complete ingestion flow for a new company."""
         # Create filing request
@@ -73,7 +84,8 @@ class TestEndToEndWorkflow:
         filing = filing_result.scalar_one()
         assert filing.filing_type == "10-K"
         assert filing.processing_status == "pending"
-        assert len(filing.raw_text) > 100
+        assert filing.content_hash is not None
+        assert len(await filing.load_text(filing_store)) > 100
 
 
     async def test_complete_ingestion_flow_existing_company(
@@ -0,0 +1,115 @@
+"""
+Tests for statistical analysis and online statistics
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.jobs.analysis.online import RunningStats, TDigest, parse_percentile
+from src.jobs.analysis.statistical import StatisticalAnalysisJob
+from src.jobs.base import JobState
+
+
+class TestStatisticalAnalysis:
+    """Test StatisticalAnalysisJob"""
+
+    def test_numeric_fields_from_all_records(self):
+        """Test that fields missing from the first record are still analyzed"""
+        data = [
+            {"ticker": "DUOL", "revenue": 1.0},
+            {"ticker": "CHGG", "revenue": 2.0, "margin": 0.5},
+            {"ticker": "COUR", "revenue": 3.0, "margin": None, "active": True},
+        ]
+
+        result = StatisticalAnalysisJob(data=data, metrics=["count", "median", "p50"]).run()
+
+        assert result.status == JobState.COMPLETED
+        assert result.data["fields_analyzed"] == ["revenue", "margin"]
+        assert result.data["statistics"]["revenue"] == {"count": 3, "median": 2.0, "p50": 2.0}
+        assert result.data["statistics"]["margin"]["count"] == 1
+
+    def test_matches_numpy(self):
+        """Test metrics against NumPy on the same values"""
+        values = np.random.default_rng(7).normal(size=1_000)
+
+        result = StatisticalAnalysisJob(
+            data=[{"value": float(v)} for v in values],
+            metrics=["mean", "std", "var", "sum", "p95"]
+        ).run()
+
+        stats = result.data["statistics"]["value"]
+        assert stats["mean"] == pytest.approx(values.mean())
+        assert stats["std"] == pytest.approx(values.std())
+        assert stats["var"] == pytest.approx(values.var())
+        assert stats["sum"] == pytest.approx(values.sum())
+        assert stats["p95"] == pytest.approx(np.percentile(values, 95))
+
+    def test_streaming_file(self, tmp_path):
+        """Test chunked analysis of a CSV file"""
+        path = tmp_path / "values.csv"
+        values = np.random.default_rng(3).lognormal(size=20_000)
+        pd.DataFrame({"value": values, "label": "x"}).to_csv(path, index=False)
+
+        result = StatisticalAnalysisJob(
+            file_path=str(path), chunksize=3_000, metrics=["count", "mean", "std", "median", "p99"]
+        ).run()
+
+        stats = result.data["statistics"]["value"]
+        assert result.data["fields_analyzed"] == ["value"]
+        assert result.data["total_records"] == 20_000
+        assert result.data["approximate"] is True
+        assert stats["count"] == 20_000
+        assert stats["mean"] == pytest.approx(values.mean())
+        assert stats["std"] == pytest.approx(values.std())
+        assert stats["median"] == pytest.approx(np.median(values), rel=0.01)
+        assert stats["p99"] == pytest.approx(np.percentile(values, 99), rel=0.02)
+
+    def test_unknown_metric(self):
+        """Test that unknown metrics are rejected"""
+        job = StatisticalAnalysisJob(data=[{"value": 1}], metrics=["mode"])
+        job.max_retries = 0
+
+        assert job.run().status == JobState.FAILED
+
+
+class TestOnlineStatistics:
+    """Test RunningStats and TDigest"""
+
+    def test_running_stats_merge(self):
+        """Test that merged chunk moments equal whole-array moments"""
+        values = np.random.default_rng(1).normal(loc=1e6, size=10_000)
+        left, right = RunningStats(), RunningStats()
+        left.update(values[:3_000])
+        right.update(values[3_000:])
+        left.merge(right)
+
+        assert left.count == 10_000
+        assert left.mean == pytest.approx(values.mean())
+        assert left.variance() == pytest.approx(values.var())
+        assert left.std(ddof=1) == pytest.approx(values.std(ddof=1))
+        assert (left.min, left.max) == (values.min(), values.max())
+
+    def test_tdigest_bounded_and_mergeable(self):
+        """Test quantile accuracy, size and merging"""
+        values = np.random.default_rng(2).normal(size=200_000)
+        digest, other = TDigest(), TDigest()
+        for chunk in np.array_split(values[:100_000], 10):
+            digest.update(chunk)
+        other.update(values[100_000:])
+        digest.merge(other)
+
+        assert digest.count == 200_000
+        assert len(digest) <= digest.compression
+        for q in (0.01, 0.5, 0.99):
+            assert digest.quantile(q) == pytest.approx(np.quantile(values, q), abs=0.02)
+        assert digest.quantile(0.0) == values.min()
+        assert TDigest().quantile(0.5) is None
+
+    def test_parse_percentile(self):
+        """Test percentile metric names"""
+        assert parse_percentile("p95") == 95.0
+        assert parse_percentile("p99.9") == 99.9
+        assert parse_percentile("median") is None
+        with pytest.raises(ValueError):
+            parse_percentile("p101")
@@ -0,0 +1,181 @@
+"""
+Tests for streaming file ingestion and ingestion sinks
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pandas as pd
+import pytest
+
+from src.jobs.base import JobState
+from src.jobs.ingestion.file_ingestion import FileIngestionJob
+from src.jobs.ingestion.sinks import MetricsBulkSink, ParquetStagingSink, RecordSink, create_sink
+
+
+class CollectingSink(RecordSink):
+    """Sink keeping chunk sizes only"""
+
+    def __init__(self):
+        super().__init__()
+        self.sizes = []
+        self.opened = False
+        self.closed = False
+
+    def open(self):
+        self.opened = True
+
+    def write(self, chunk):
+        self.sizes.append(len(chunk))
+        self.records_written += len(chunk)
+        self.chunks_written += 1
+        return len(chunk)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def metrics_csv(tmp_path):
+    path = tmp_path / "metrics.csv"
+    frame = pd.DataFrame({
+        "ticker": ["DUOL", "CHGG", "COUR"] * 10,
+        "metric_type": ["revenue"] * 30,
+        "metric_date": ["2024-03-31"] * 30,
+        "value": [float(i) for i in range(29)] + [None],
+    })
+    frame.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def collecting_sink():
+    sink = CollectingSink()
+    with patch("src.jobs.ingestion.file_ingestion.create_sink", return_value=sink):
+        yield sink
+
+
+class TestStreamingIngestion:
+    """Test FileIngestionJob with a sink"""
+
+    def test_csv_streams_in_chunks(self, metrics_csv, collecting_sink):
+        """Test that chunks go to the sink and only a summary is returned"""
+        result = FileIngestionJob(file_path=str(metrics_csv), sink="collect", chunksize=8).run()
+
+        assert result.status == JobState.COMPLETED
+        assert collecting_sink.sizes == [8, 8, 8, 6]
+        assert collecting_sink.opened and collecting_sink.closed
+        assert "records" not in result.data
+        assert result.data["total_records"] == 30
+        assert result.data["chunks_processed"] == 4
+        assert result.data["column_stats"]["value"] == {"nulls": 1, "min": 0.0, "max": 28.0}
+        assert result.data["sink"]["records_written"] == 30
+        json.dumps(result.data)
+
+    def test_parquet_streams_record_batches(self, tmp_path, collecting_sink):
+        """Test that Parquet input is read as Arrow record batches"""
+        path = tmp_path / "metrics.parquet"
+        pd.DataFrame({"value": range(25), "unit": ["USD"] * 25}).to_parquet(path)
+
+        result = FileIngestionJob(
+            file_path=str(path), file_type="parquet", sink="collect", chunksize=10,
+            read_options={"columns": ["value"]}
+        ).run()
+
+        assert collecting_sink.sizes == [10, 10, 5]
+        assert result.data["columns"] == ["value"]
+
+    def test_json_lines_streams(self, tmp_path, collecting_sink):
+        """Test that JSON Lines input is read incrementally"""
+        path = tmp_path / "metrics.jsonl"
+        path.write_text("\n".join(json.dumps({"value": i}) for i in range(7)))
+
+        FileIngestionJob(
+            file_path=str(path), file_type="json", sink="collect", chunksize=3,
+            read_options={"lines": True}
+        ).run()
+
+        assert collecting_sink.sizes == [3, 3, 1]
+
+    def test_without_sink_returns_records(self, metrics_csv):
+        """Test that the default mode still returns the records"""
+        result = FileIngestionJob(file_path=str(metrics_csv), chunksize=8).run()
+
+        assert len(result.data["records"]) == 30
+
+    def test_timeout_override(self):
+        """Test that a timeout parameter overrides the class default"""
+        assert FileIngestionJob(file_path="x.csv", timeout=3600).timeout == 3600
+        assert FileIngestionJob(file_path="x.csv").timeout == FileIngestionJob.timeout
+
+    def test_metrics_sink_times_out_in_process(self):
+        """Test that database writes are not left running in an abandoned thread"""
+        assert FileIngestionJob(file_path="x.csv", sink="metrics").timeout_mode == "process"
+        assert FileIngestionJob(file_path="x.csv", sink="parquet").timeout_mode == "thread"
+
+
+class TestSinks:
+    """Test ingestion sinks"""
+
+    def test_parquet_staging_sink(self, tmp_path):
+        """Test that each chunk becomes a part file"""
+        directory = tmp_path / "staging"
+
+        with create_sink("parquet", directory=str(directory)) as sink:
+            sink.write(pd.DataFrame({"value": [1.0, 2.0]}))
+            sink.write(pd.DataFrame({"value": [3.0]}))
+
+        assert sorted(p.name for p in directory.iterdir()) == ["part-00000.parquet", "part-00001.parquet"]
+        assert sink.summary() == {
+            "sink": "parquet", "chunks_written": 2, "records_written": 3,
+            "directory": str(directory), "files": 2
+        }
+        assert isinstance(sink, ParquetStagingSink)
+
+    def test_unknown_sink(self):
+        """Test that unknown sink names are rejected"""
+        with pytest.raises(ValueError):
+            create_sink("s3")
+
+    def test_metrics_sink_resolves_tickers_and_skips_bad_rows(self):
+        """Test row preparation before the bulk loader"""
+        company_id = uuid4()
+        lookup = MagicMock()
+        lookup.all.return_value = [("DUOL", company_id)]
+        session = AsyncMock()
+        session.execute.return_value = lookup
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+
+        sink = MetricsBulkSink(source="backfill")
+        sink._loop = asyncio.new_event_loop()
+        sink._session_factory = session_factory
+        chunk = pd.DataFrame({
+            "ticker": ["DUOL", "DUOL", "NOPE"],
+            "metric_type": ["revenue", "revenue", "revenue"],
+            "metric_date": ["2024-03-31", "2024-06-30", "2024-03-31"],
+            "value": [1.0, None, 3.0],
+            "notes": ["ignored", "ignored", "ignored"],
+        })
+
+        with patch(
+            "src.pipeline.common.utilities.bulk_upsert_financial_metrics",
+            new_callable=AsyncMock, return_value=1
+        ) as bulk_upsert:
+            written = sink.write(chunk)
+        sink._loop.close()
+
+        rows = bulk_upsert.call_args.args[1]
+        assert written == 1
+        assert sink.records_skipped == 2
+        assert rows == [{
+            "company_id": company_id,
+            "metric_type": "revenue",
+            "metric_date": pd.Timestamp("2024-03-31", tz="UTC"),
+            "value": 1.0,
+            "period_type": "quarterly",
+            "source": "backfill",
+        }]
+        session.commit.assert_awaited_once()
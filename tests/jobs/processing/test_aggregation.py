@@ -0,0 +1,118 @@
+"""
+Tests for columnar and streaming data aggregation
+"""
+
+import pandas as pd
+import pytest
+
+from src.jobs.base import JobState
+from src.jobs.processing.aggregation import DataAggregationJob
+
+
+RECORDS = [
+    {"segment": "k12", "revenue": 10.0, "ticker": "CHGG"},
+    {"segment": "higher_ed", "revenue": 20.0, "ticker": "COUR"},
+    {"segment": "k12", "revenue": 30.0, "ticker": "DUOL"},
+    {"segment": "k12", "revenue": None, "ticker": "CHGG"},
+    {"segment": None, "revenue": 5.0},
+]
+
+AGGREGATIONS = {
+    "revenue": ["count", "sum", "avg", "min", "max", "median", "std", "p50"],
+    "ticker": "distinct",
+}
+
+
+def by_segment(records):
+    return {record["segment"]: record for record in records}
+
+
+class TestDataAggregation:
+    """Test in-memory aggregation"""
+
+    def test_groupby_aggregations(self):
+        """Test aggregations per group, skipping missing values"""
+        result = DataAggregationJob(
+            data=RECORDS, group_by=["segment"], aggregations=AGGREGATIONS
+        ).run()
+
+        assert result.status == JobState.COMPLETED
+        groups = by_segment(result.data["records"])
+        assert list(groups) == ["k12", "higher_ed", None]
+        assert groups["k12"] == {
+            "segment": "k12",
+            "revenue_count": 2,
+            "revenue_sum": 40.0,
+            "revenue_avg": 20.0,
+            "revenue_min": 10.0,
+            "revenue_max": 30.0,
+            "revenue_median": 20.0,
+            "revenue_std": 10.0,
+            "revenue_p50": 20.0,
+            "ticker_distinct": 2,
+            "_count": 3,
+        }
+        assert groups[None]["ticker_distinct"] == 0
+        assert result.data["approximate"] is False
+
+    def test_without_group_by(self):
+        """Test that all records form one group"""
+        result = DataAggregationJob(data=RECORDS, aggregations={"revenue": "sum"}).run()
+
+        assert result.data["records"] == [{"revenue_sum": 65.0, "_count": 5}]
+
+    def test_missing_field(self):
+        """Test aggregating a field no record has"""
+        result = DataAggregationJob(
+            data=RECORDS, aggregations={"units": ["count", "sum", "max"]}
+        ).run()
+
+        assert result.data["records"] == [
+            {"units_count": 0, "units_sum": 0.0, "units_max": None, "_count": 5}
+        ]
+
+    def test_unknown_aggregation(self):
+        """Test that unknown aggregations are rejected"""
+        job = DataAggregationJob(data=RECORDS, aggregations={"revenue": "mode"})
+        job.max_retries = 0
+
+        assert job.run().status == JobState.FAILED
+
+
+class TestStreamingAggregation:
+    """Test chunked aggregation from a file"""
+
+    def test_matches_in_memory(self, tmp_path):
+        """Test that exact aggregations match the in-memory path"""
+        path = tmp_path / "metrics.csv"
+        pd.DataFrame(RECORDS).to_csv(path, index=False)
+        exact = ["count", "sum", "avg", "min", "max", "std"]
+
+        streamed = DataAggregationJob(
+            file_path=str(path), chunksize=2, group_by=["segment"],
+            aggregations={"revenue": exact, "ticker": "distinct"}
+        ).run()
+        in_memory = DataAggregationJob(
+            data=RECORDS, group_by=["segment"],
+            aggregations={"revenue": exact, "ticker": "distinct"}
+        ).run()
+
+        assert streamed.data["original_count"] == 5
+        streamed_groups = by_segment(streamed.data["records"])
+        for segment, expected in by_segment(in_memory.data["records"]).items():
+            assert streamed_groups[segment] == pytest.approx(expected)
+
+    def test_percentiles_are_estimated(self, tmp_path):
+        """Test t-digest percentiles on a larger file"""
+        path = tmp_path / "values.parquet"
+        pd.DataFrame({"value": range(100_000)}).to_parquet(path)
+
+        result = DataAggregationJob(
+            file_path=str(path), file_type="parquet", chunksize=10_000,
+            aggregations={"value": ["median", "p99"]}
+        ).run()
+
+        record = result.data["records"][0]
+        assert result.data["approximate"] is True
+        assert record["value_median"] == pytest.approx(49_999.5, rel=0.01)
+        assert record["value_p99"] == pytest.approx(98_999.0, rel=0.01)
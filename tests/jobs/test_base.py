@@ -2,6 +2,7 @@
 Tests for base job framework
 """
 
+import asyncio
 import pytest
 import time
 from datetime import datetime
@@ -242,3 +243,141 @@ class TestJobResult:
         assert result_dict["data"] == {"key": "value"}
         assert result_dict["duration"] == 1.5
         assert result_dict["metadata"] == {"meta": "data"}
+
+
+class HangingJob(BaseJob):
+    """Job that hangs far longer than its timeout"""
+
+    max_retries = 0
+    timeout = 0.1
+
+    def execute(self, **kwargs):
+        time.sleep(5.0)
+        return {}
+
+
+class AsyncJob(BaseJob):
+    """Job with a coroutine execute"""
+
+    max_retries = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.cancelled = False
+
+    async def execute(self, **kwargs):
+        try:
+            await asyncio.sleep(kwargs.get("sleep", 0))
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"result": kwargs.get("value", 0) * 2}
+
+
+class TestJobExecution:
+    """Test timeout enforcement and coroutine jobs"""
+
+    def test_timeout_interrupts_execute(self):
+        """Test that a hung execute fails at the timeout, not when it returns"""
+        start = time.perf_counter()
+        result = HangingJob().run()
+
+        assert time.perf_counter() - start < 2.0
+        assert result.status == JobState.FAILED
+        assert "TimeoutError" in result.error
+
+    def test_timed_out_attempt_stops_before_retry(self):
+        """Test that a retry only starts once the abandoned attempt has stopped"""
+        class CooperativeJob(BaseJob):
+            max_retries = 1
+            retry_delay = 0.01
+            timeout = 0.1
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.running = 0
+                self.overlapped = False
+
+            def execute(self, **kwargs):
+                self.overlapped |= self.running > 0
+                self.running += 1
+                try:
+                    while True:
+                        self.check_timeout()
+                        time.sleep(0.01)
+                finally:
+                    self.running -= 1
+
+        job = CooperativeJob()
+        result = job.run()
+
+        assert result.status == JobState.FAILED
+        assert job.retry_count == 1
+        assert job.overlapped is False
+
+    def test_still_running_attempt_is_not_retried(self):
+        """Test that a job stuck past timeout_grace fails instead of retrying"""
+        class StuckJob(HangingJob):
+            max_retries = 3
+            timeout_grace = 0.1
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.attempts = 0
+
+            def execute(self, **kwargs):
+                self.attempts += 1
+                return super().execute(**kwargs)
+
+        start = time.perf_counter()
+        job = StuckJob()
+        result = job.run()
+
+        assert time.perf_counter() - start < 2.0
+        assert result.status == JobState.FAILED
+        assert "TimeoutError" in result.error
+        assert job.attempts == 1
+
+    def test_process_timeout_mode(self):
+        """Test that process mode kills execute on timeout and returns results otherwise"""
+        class ProcessHangingJob(HangingJob):
+            timeout_mode = "process"
+
+        class ProcessJob(SimpleJob):
+            timeout = 5.0
+            timeout_mode = "process"
+
+        start = time.perf_counter()
+        result = ProcessHangingJob().run()
+
+        assert time.perf_counter() - start < 2.0
+        assert "TimeoutError" in result.error
+        assert ProcessJob(value=4).run().data == {"result": 8}
+
+    def test_async_execute(self):
+        """Test that coroutine execute runs natively"""
+        result = AsyncJob(value=3).run()
+
+        assert result.status == JobState.COMPLETED
+        assert result.data == {"result": 6}
+
+    def test_async_execute_timeout_cancels(self):
+        """Test that a coroutine past its timeout is cancelled"""
+        job = AsyncJob(sleep=5.0)
+        job.timeout = 0.1
+
+        result = job.run()
+
+        assert result.status == JobState.FAILED
+        assert "TimeoutError" in result.error
+        assert job.cancelled is True
+
+    def test_run_async(self):
+        """Test running sync and coroutine jobs from an event loop"""
+        async def run_both():
+            return await SimpleJob(value=2).run_async(), await AsyncJob(value=5).run_async()
+
+        sync_result, async_result = asyncio.run(run_both())
+
+        assert sync_result.data == {"result": 4}
+        assert async_result.data == {"result": 10}
@@ -1,10 +1,12 @@
 """Tests for job retry logic and exponential backoff."""
 
+import asyncio
 import pytest
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
-from src.jobs.base import BaseJob, JobState
+from src.jobs.base import BaseJob, JobRegistry, JobState
+from src.jobs.queue import _job_from_payload, _job_payload
 
 
 class TestRetryMechanism:
@@ -439,3 +441,85 @@ class TestRetryEdgeCases:
             # retry_count=1: 1.0 * 10^0 = 1.0
             # retry_count=2: 1.0 * 10^1 = 10.0
             assert job.max_delay >= 1.0
+
+
+class TestRetryHandOff:
+    """Test retries handed to a queue instead of sleeping in the worker."""
+
+    class FlakyJob(BaseJob):
+        max_retries = 2
+        retry_delay = 30.0  # would block the test if slept
+
+        def execute(self, **kwargs):
+            if self.retry_count < 1:
+                raise ConnectionError("SEC EDGAR unavailable")
+            return {"ok": True}
+
+    def test_retry_handed_off_without_sleeping(self):
+        """Test that run returns immediately once a retry is scheduled."""
+        handler = Mock(return_value="task-2")
+        job = self.FlakyJob()
+
+        start = time.time()
+        result = job.run(retry_handler=handler)
+
+        assert time.time() - start < 1.0
+        handler.assert_called_once_with(job, 30.0)
+        assert result.status == JobState.RETRYING
+        assert "ConnectionError" in result.error
+        assert result.metadata["retry_task_id"] == "task-2"
+        assert job.retry_count == 1
+
+    def test_requeued_job_keeps_retry_count(self):
+        """Test that the re-enqueued attempt continues the retry budget."""
+        JobRegistry.clear()
+        JobRegistry.register("FlakyJob")(self.FlakyJob)
+        job = self.FlakyJob(ticker="DUOL")
+        job.run(retry_handler=Mock())
+
+        retried = _job_from_payload(_job_payload(job, "ingestion"))
+
+        assert retried.job_id == job.job_id
+        assert retried.params == {"ticker": "DUOL"}
+        assert retried.retry_count == 1
+        assert retried.run(retry_handler=Mock()).status == JobState.COMPLETED
+
+    def test_retry_handler_not_called_after_max_retries(self):
+        """Test that exhausted retries fail instead of being handed off."""
+        handler = Mock()
+
+        class AlwaysFail(self.FlakyJob):
+            def execute(self, **kwargs):
+                raise ConnectionError("down")
+
+        failing = AlwaysFail()
+        failing.retry_count = failing.max_retries
+
+        result = failing.run(retry_handler=handler)
+
+        assert result.status == JobState.FAILED
+        handler.assert_not_called()
+
+    def test_failing_retry_handler_retries_in_place(self):
+        """Test that a retry that cannot be scheduled runs in this worker."""
+        handler = Mock(side_effect=ConnectionError("broker unreachable"))
+        job = self.FlakyJob()
+
+        with patch.object(time, "sleep") as sleep:
+            result = job.run(retry_handler=handler)
+
+        handler.assert_called_once_with(job, 30.0)
+        sleep.assert_called_once_with(30.0)
+        assert result.status == JobState.COMPLETED
+        assert job.state == JobState.COMPLETED
+
+    def test_failing_retry_handler_retries_in_place_async(self):
+        """Test the same fallback from run_async."""
+        handler = Mock(side_effect=ConnectionError("broker unreachable"))
+        job = self.FlakyJob()
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            result = asyncio.run(job.run_async(retry_handler=handler))
+
+        sleep.assert_awaited_once_with(30.0)
+        assert result.status == JobState.COMPLETED
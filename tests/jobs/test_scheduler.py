@@ -8,7 +8,12 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock
 
 from src.jobs.base import BaseJob, JobRegistry
-from src.jobs.scheduler import Schedule, JobScheduler
+from src.jobs.scheduler import (
+    MISFIRE_RUN_ALL,
+    MISFIRE_SKIP,
+    Schedule,
+    JobScheduler,
+)
 from src.jobs.queue import QueueManager
 
 
@@ -245,3 +250,197 @@ class TestJobScheduler:
 
         # Verify job was enqueued
         self.mock_queue.enqueue.assert_called()
+
+
+class TestHeapScheduling:
+    """Test heap ordering, misfires, jitter and persisted state"""
+
+    def setup_method(self):
+        """Setup before each test"""
+        JobRegistry.clear()
+        JobRegistry.register()(TestJob)
+
+        self.mock_queue = Mock(spec=QueueManager)
+        self.mock_queue.enqueue = Mock(return_value="task-123")
+
+        self.scheduler = JobScheduler(self.mock_queue, dispatch_workers=1)
+
+    def teardown_method(self):
+        """Cleanup after each test"""
+        if self.scheduler.is_running():
+            self.scheduler.stop()
+
+    def _reschedule(self, schedule_id, next_run):
+        self.scheduler.get_schedule(schedule_id).next_run = next_run
+        self.scheduler.enable_schedule(schedule_id)
+
+    def _enqueued_params(self):
+        return [c.args[0].params["label"] for c in self.mock_queue.enqueue.call_args_list]
+
+    def test_due_schedules_enqueued_by_priority(self):
+        """Test that schedules due together run highest priority first"""
+        for name, priority in [("low", 1), ("high", 9), ("mid", 5)]:
+            self.scheduler.add_schedule(
+                name, "TestJob", {"label": name}, interval=timedelta(hours=1), priority=priority
+            )
+
+        self.scheduler._check_schedules()
+
+        assert self._enqueued_params() == ["high", "mid", "low"]
+        assert self.scheduler.get_schedule("high").run_count == 1
+
+    def test_schedules_not_due_are_left_alone(self):
+        """Test that only due schedules are taken off the heap"""
+        self.scheduler.add_schedule("due", "TestJob", {"label": "due"}, interval=timedelta(hours=1))
+        self.scheduler.add_schedule("later", "TestJob", {"label": "later"}, interval=timedelta(hours=1))
+        self._reschedule("later", datetime.utcnow() + timedelta(minutes=5))
+
+        self.scheduler._check_schedules()
+
+        assert self._enqueued_params() == ["due"]
+        assert 0 < self.scheduler._seconds_until_next() <= self.scheduler.max_sleep
+
+    def test_disabled_and_removed_schedules_do_not_run(self):
+        """Test that stale heap entries are ignored"""
+        self.scheduler.add_schedule("off", "TestJob", {"label": "off"}, interval=timedelta(hours=1))
+        self.scheduler.add_schedule("gone", "TestJob", {"label": "gone"}, interval=timedelta(hours=1))
+        self.scheduler.disable_schedule("off")
+        self.scheduler.remove_schedule("gone")
+
+        self.scheduler._check_schedules()
+        assert self.mock_queue.enqueue.call_count == 0
+
+        self.scheduler.enable_schedule("off")
+        self.scheduler._check_schedules()
+        assert self._enqueued_params() == ["off"]
+
+    def test_readded_schedule_ignores_old_heap_entry(self):
+        """Test that removing and re-adding an id does not revive its old due time"""
+        self.scheduler.add_schedule("s", "TestJob", {"label": "old"}, interval=timedelta(hours=1))
+        self.scheduler.remove_schedule("s")
+        # Not due for months: only the removed registration was due now
+        self.scheduler.add_schedule("s", "TestJob", {"label": "new"}, cron="0 0 1 1 *")
+
+        self.scheduler._check_schedules()
+
+        assert self.mock_queue.enqueue.call_count == 0
+
+    def test_concurrent_dispatch_keeps_priority_levels(self):
+        """Test that a priority level is enqueued only after the levels above it"""
+        scheduler = JobScheduler(self.mock_queue, dispatch_workers=4)
+        labels = [("low", 1)] * 4 + [("high", 9)] * 4
+        for i, (label, priority) in enumerate(labels):
+            scheduler.add_schedule(
+                f"{label}-{i}", "TestJob", {"label": label}, interval=timedelta(hours=1), priority=priority
+            )
+
+        scheduler._check_schedules()
+        scheduler._executor.shutdown()
+
+        assert self._enqueued_params() == ["high"] * 4 + ["low"] * 4
+
+    def test_misfire_run_once_skips_to_future(self):
+        """Test that a late run fires once and stays on its interval grid"""
+        self.scheduler.add_schedule("late", "TestJob", {"label": "late"}, interval=timedelta(hours=1))
+        missed = datetime.utcnow() - timedelta(hours=3, minutes=30)
+        self._reschedule("late", missed)
+
+        self.scheduler._check_schedules()
+
+        schedule = self.scheduler.get_schedule("late")
+        assert self.mock_queue.enqueue.call_count == 1
+        assert schedule.next_run == missed + timedelta(hours=4)
+
+    def test_misfire_run_all_catches_up(self):
+        """Test that every missed occurrence runs"""
+        self.scheduler.add_schedule(
+            "late", "TestJob", {"label": "late"},
+            interval=timedelta(hours=1), misfire_policy=MISFIRE_RUN_ALL
+        )
+        self._reschedule("late", datetime.utcnow() - timedelta(hours=3, minutes=30))
+
+        self.scheduler._check_schedules()
+
+        assert self.mock_queue.enqueue.call_count == 4
+        assert self.scheduler.get_schedule("late").next_run > datetime.utcnow()
+
+    def test_misfire_skip_beyond_grace_time(self):
+        """Test that a run later than the grace time is skipped"""
+        self.scheduler.add_schedule(
+            "late", "TestJob", {"label": "late"},
+            interval=timedelta(hours=1), misfire_policy=MISFIRE_SKIP, misfire_grace_time=60
+        )
+        self._reschedule("late", datetime.utcnow() - timedelta(minutes=10))
+
+        self.scheduler._check_schedules()
+
+        assert self.mock_queue.enqueue.call_count == 0
+        assert self.scheduler.stats["misfires_skipped"] == 1
+        assert self.scheduler.get_schedule("late").next_run > datetime.utcnow()
+
+    def test_invalid_misfire_policy(self):
+        """Test that unknown misfire policies are rejected"""
+        with pytest.raises(ValueError):
+            Schedule(job_name="test_job", job_params={}, misfire_policy="sometimes")
+
+    def test_jitter_spreads_schedules(self):
+        """Test that jitter offsets are stable and inside the window"""
+        schedule = Schedule(job_name="test_job", job_params={}, jitter=30.0)
+
+        offsets = {JobScheduler._jitter_offset(f"ticker-{i}", schedule) for i in range(100)}
+
+        assert all(0 <= offset < 30.0 for offset in offsets)
+        assert len(offsets) > 50
+        assert JobScheduler._jitter_offset("ticker-1", schedule) in offsets
+
+    def test_one_time_schedule_runs_once(self):
+        """Test that a schedule without a trigger runs a single time"""
+        self.scheduler.add_schedule("once", "TestJob", {"label": "once"})
+
+        self.scheduler._check_schedules()
+        self.scheduler._check_schedules()
+
+        assert self.mock_queue.enqueue.call_count == 1
+        assert self.scheduler.get_schedule("once").next_run is None
+
+    def test_enqueue_error_does_not_stop_other_schedules(self):
+        """Test that a failing enqueue is logged and the rest still run"""
+        self.mock_queue.enqueue.side_effect = [RuntimeError("broker down"), "task-456"]
+        self.scheduler.add_schedule("a", "TestJob", {"label": "a"}, interval=timedelta(hours=1), priority=9)
+        self.scheduler.add_schedule("b", "TestJob", {"label": "b"}, interval=timedelta(hours=1))
+
+        self.scheduler._check_schedules()
+
+        assert self.scheduler.stats["enqueue_errors"] == 1
+        assert self.scheduler.get_schedule("a").run_count == 0
+        assert self.scheduler.get_schedule("b").run_count == 1
+
+    def test_state_persisted_across_restarts(self, tmp_path):
+        """Test that run counts and next runs survive a restart"""
+        state_path = str(tmp_path / "schedules.json")
+        scheduler = JobScheduler(self.mock_queue, state_path=state_path)
+        scheduler.add_schedule("sync", "TestJob", {"label": "sync"}, interval=timedelta(hours=1))
+        scheduler._check_schedules()
+        scheduler.save_state()
+        next_run = scheduler.get_schedule("sync").next_run
+
+        restarted = JobScheduler(self.mock_queue, state_path=state_path)
+        schedule = restarted.add_schedule("sync", "TestJob", {"label": "sync"}, interval=timedelta(hours=1))
+
+        assert schedule.run_count == 1
+        assert schedule.next_run == next_run
+        assert schedule.last_run is not None
+
+    def test_thread_wakes_when_schedule_due(self):
+        """Test that the running scheduler sleeps until exactly the next due time"""
+        self.scheduler.max_sleep = 60.0
+        self.scheduler.start()
+
+        self.scheduler.add_schedule("soon", "TestJob", {"label": "soon"}, interval=timedelta(hours=1))
+        self._reschedule("soon", datetime.utcnow() + timedelta(milliseconds=200))
+
+        deadline = time.monotonic() + 2.0
+        while self.mock_queue.enqueue.call_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert self.mock_queue.enqueue.call_count == 1
@@ -0,0 +1,300 @@
+"""
+Benchmark Baselines
+Reference implementations of the code paths that the optimized modules
+replaced, plus synthetic inputs shared by test_benchmarks.py.
+
+The baselines are kept verbatim so that the benchmarks can measure the
+speedup and check that the optimized path produces the same output.
+"""
+
+import random
+import re
+from collections import defaultdict
+from typing import Any, Dict, List
+
+import numpy as np
+
+FILING_PARAGRAPHS = [
+    "We are the leading mobile learning platform globally. Our flagship app has organically "
+    "become the world's most popular way to learn languages, with 83.1 million monthly active "
+    "users as of December 31, 2023. Dr. Smith joined Acme Inc. in 2021.",
+    "The following discussion and analysis of our financial condition and results of operations "
+    "should be read in conjunction with the consolidated financial statements and related notes "
+    "included elsewhere in this Annual Report on Form 10-K.",
+    "Total revenue of $531.1 million for fiscal year 2023 increased 44% compared to the prior "
+    "year! Growth was primarily driven by paid subscribers, which reached 6.6 million.",
+    "Risk factors: our business could be adversely affected if we fail to retain users, if our "
+    "churn rate of 4.5% increases, or if we are not able to manage our growth effectively.",
+    "Gross margin of 73.2% reflects hosting costs and payment processing fees. Customer "
+    "acquisition cost remained low because the majority of new users were acquired organically.",
+    "Forward-looking statements in this report involve known and unknown risks, uncertainties "
+    "and other factors that may cause actual results to differ materially from those expressed.",
+]
+
+CHARS_PER_PAGE = 3000
+
+
+def filing_text(pages: int) -> str:
+    """Synthesize a filing of roughly ``pages`` pages from filing-style paragraphs."""
+    paragraphs = []
+    size = 0
+    while size < pages * CHARS_PER_PAGE:
+        paragraph = FILING_PARAGRAPHS[len(paragraphs) % len(FILING_PARAGRAPHS)]
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+# Metric extraction
+
+def legacy_extract(extractor, text: str) -> list:
+    """Pre-engine extract_metrics: every pattern's finditer over the full text."""
+    from src.processing.metrics_extractor import ExtractedMetric
+
+    metrics = []
+    for metric_type, patterns in extractor.metric_patterns.items():
+        for pattern, unit in patterns:
+            for match in pattern.finditer(text):
+                value = float(match.group(1).replace(",", ""))
+                if "million" in match.group(0).lower() or " M" in match.group(0):
+                    value *= 1e6
+                elif "billion" in match.group(0).lower() or " B" in match.group(0):
+                    value *= 1e9
+                start = max(0, match.start() - 100)
+                end = min(len(text), match.end() + 100)
+                context = text[start:end].strip()
+                metrics.append(ExtractedMetric(
+                    metric_type=metric_type,
+                    value=value,
+                    unit=unit,
+                    context=context,
+                    confidence=extractor._calculate_confidence(metric_type, context),
+                    period=extractor._extract_period(context),
+                ))
+    return extractor._deduplicate_metrics(metrics)
+
+
+# Text chunking
+
+class WordTokenizer:
+    """Fallback tokenizer when tiktoken is unavailable: one token per word."""
+
+    PIECES = re.compile(r"\s*\S+|\s+")
+
+    def __init__(self):
+        self.vocab = {}
+        self.inverse = {}
+
+    def encode(self, text, **kwargs):
+        ids = []
+        for piece in self.PIECES.findall(text):
+            token = self.vocab.setdefault(piece, len(self.vocab))
+            self.inverse[token] = piece
+            ids.append(token)
+        return ids
+
+    def decode(self, ids):
+        return "".join(self.inverse[i] for i in ids)
+
+    def decode_tokens_bytes(self, ids):
+        return [self.inverse[i].encode("utf-8") for i in ids]
+
+
+def legacy_chunk_text(chunker, text: str) -> list:
+    """Pre-refactor chunking: tokenizes each sentence (and overlap) separately."""
+    from src.processing.text_chunker import TextChunk
+
+    tokenizer = chunker.tokenizer
+    chunk_size = chunker.chunk_size
+    chunk_overlap = chunker.chunk_overlap
+    chunks = []
+
+    current_chunk = []
+    current_tokens = 0
+    chunk_start_idx = 0
+    chunk_index = 0
+
+    for sentence in legacy_split_sentences(text):
+        sentence_tokens = len(tokenizer.encode(sentence))
+
+        if sentence_tokens > chunk_size:
+            if current_chunk:
+                chunk_text = ' '.join(current_chunk)
+                chunks.append(TextChunk(chunk_text, chunk_start_idx,
+                                        chunk_start_idx + len(chunk_text), chunk_index,
+                                        current_tokens))
+                chunk_index += 1
+                current_chunk = []
+                current_tokens = 0
+
+            tokens = tokenizer.encode(sentence)
+            step = chunk_size - chunk_overlap
+            for i in range(0, len(tokens), step):
+                sub_chunk = tokenizer.decode(tokens[i:i + chunk_size])
+                chunks.append(TextChunk(sub_chunk, chunk_start_idx,
+                                        chunk_start_idx + len(sub_chunk), chunk_index,
+                                        len(tokenizer.encode(sub_chunk))))
+                chunk_index += 1
+                chunk_start_idx += len(sub_chunk) + 1
+            continue
+
+        if current_tokens + sentence_tokens > chunk_size and current_chunk:
+            chunk_text = ' '.join(current_chunk)
+            chunks.append(TextChunk(chunk_text, chunk_start_idx,
+                                    chunk_start_idx + len(chunk_text), chunk_index,
+                                    current_tokens))
+            chunk_index += 1
+
+            if chunk_overlap > 0:
+                overlap_sentences = []
+                overlap_tokens = 0
+                for sent in reversed(current_chunk):
+                    sent_tokens = len(tokenizer.encode(sent))
+                    if overlap_tokens + sent_tokens <= chunk_overlap:
+                        overlap_sentences.insert(0, sent)
+                        overlap_tokens += sent_tokens
+                    else:
+                        break
+                current_chunk = overlap_sentences
+                current_tokens = overlap_tokens
+            else:
+                current_chunk = []
+                current_tokens = 0
+                chunk_start_idx = chunk_start_idx + len(chunk_text) + 1
+
+        current_chunk.append(sentence)
+        current_tokens += sentence_tokens
+
+    if current_chunk:
+        chunk_text = ' '.join(current_chunk)
+        chunks.append(TextChunk(chunk_text, chunk_start_idx,
+                                chunk_start_idx + len(chunk_text), chunk_index,
+                                current_tokens))
+    return chunks
+
+
+def legacy_split_sentences(text: str) -> List[str]:
+    sentence_endings = r'[.!?]+'
+    abbreviations = {'Dr.', 'Mr.', 'Mrs.', 'Ms.', 'Prof.', 'Sr.', 'Jr.', 'Inc.', 'Corp.', 'Ltd.'}
+    parts = re.split(f'({sentence_endings})', text)
+
+    sentences = []
+    current = ""
+    for i, part in enumerate(parts):
+        current += part
+        if re.match(sentence_endings, part):
+            if i + 1 < len(parts):
+                next_part = parts[i + 1].strip()
+                last_word = current.split()[-1] if current.split() else ""
+                if last_word in abbreviations:
+                    continue
+                if next_part and next_part[0].isupper():
+                    sentences.append(current.strip())
+                    current = ""
+            else:
+                sentences.append(current.strip())
+                current = ""
+    if current.strip():
+        sentences.append(current.strip())
+    return [s for s in sentences if s]
+
+
+# Aggregation and statistics
+
+def build_records(records: int, groups: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    tickers = rng.integers(0, groups, records)
+    revenue = rng.lognormal(mean=10, sigma=1, size=records)
+    margin = rng.normal(0.2, 0.05, size=records)
+    return [
+        {"ticker": f"T{t:05d}", "revenue": float(r), "margin": float(m)}
+        for t, r, m in zip(tickers, revenue, margin)
+    ]
+
+
+def legacy_aggregate(data: List[Dict[str, Any]], group_by: List[str], aggregations: Dict[str, List[str]]):
+    """Per-record grouping and per-group Python reductions"""
+    groups = defaultdict(list)
+    for record in data:
+        groups[tuple(record.get(field) for field in group_by)].append(record)
+
+    aggregated = []
+    for key, group_records in groups.items():
+        agg_record = dict(zip(group_by, key))
+        for field, funcs in aggregations.items():
+            values = [r.get(field) for r in group_records if field in r]
+            for func in funcs:
+                if func == "sum":
+                    agg_record[f"{field}_sum"] = sum(values)
+                elif func == "avg":
+                    agg_record[f"{field}_avg"] = sum(values) / len(values)
+                elif func == "min":
+                    agg_record[f"{field}_min"] = min(values)
+                elif func == "max":
+                    agg_record[f"{field}_max"] = max(values)
+        aggregated.append(agg_record)
+    return aggregated
+
+
+def legacy_statistics(data: List[Dict[str, Any]]):
+    """One scan per numeric field and a full sort for the median"""
+    statistics = {}
+    for field in ("revenue", "margin"):
+        values = [r[field] for r in data if field in r and r[field] is not None]
+        sorted_values = sorted(values)
+        statistics[field] = {
+            "count": len(values),
+            "mean": sum(values) / len(values),
+            "median": sorted_values[len(sorted_values) // 2],
+            "std": float(np.std(values)),
+            "min": min(values),
+            "max": max(values),
+        }
+    return statistics
+
+
+# Filing validation
+
+FORMS = ["10-K", "10-Q", "8-K", "DEF 14A", "INVALID"]
+
+
+def make_filings(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Mostly valid filings with a sprinkling of format errors."""
+    rng = random.Random(seed)
+    return [
+        {
+            "accessionNumber": f"{rng.randrange(10**10):010d}-{rng.randrange(100):02d}-{i % 10**6:06d}",
+            "form": rng.choice(FORMS),
+            "filingDate": f"20{rng.randrange(10, 25)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+            "cik": str(rng.randrange(1, 10**7)),
+            "content": "Annual report content " * rng.randrange(2, 50),
+            "content_hash": f"{rng.getrandbits(256):064x}",
+            "downloaded_at": "2024-03-16T00:00:00",
+            "primaryDocument": "doc.htm",
+        }
+        for i in range(count)
+    ]
+
+
+# Vector search
+
+def legacy_search(query: np.ndarray, embeddings: np.ndarray, top_k: int) -> np.ndarray:
+    """Pre-index SemanticSearch.search: normalize everything, full argsort."""
+    query_norm = query / np.linalg.norm(query)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    similarities = np.dot(embeddings / norms, query_norm)
+    return np.argsort(similarities)[-top_k:][::-1]
+
+
+def make_embeddings(size: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    """Gaussian mixture, a rough stand-in for topic structure in document chunks."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=size)
+    return centers[labels] + 0.5 * rng.normal(size=(size, dim)).astype(np.float32)
+
+
+def recall(expected: List[np.ndarray], actual: List[np.ndarray]) -> float:
+    hits = sum(len(set(e) & set(a)) for e, a in zip(expected, actual))
+    return hits / sum(len(e) for e in expected)
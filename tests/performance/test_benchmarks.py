@@ -0,0 +1,208 @@
+"""
+Micro-benchmarks for the optimized processing paths.
+
+Each group times the optimized implementation against its baseline from
+baselines.py and checks that both agree:
+- aggregation and statistics: per-record loops vs columnar jobs
+- filing validation: compiled validator, one filing at a time vs batched
+- metric extraction: per-pattern scans vs the anchored scan engine
+- PDF extraction: serial vs page-parallel
+- scheduler: scanning every schedule vs peeking at the heap
+- text chunking: per-sentence re-encoding vs single-pass
+- vector search: full argsort vs flat and IVF indexes
+
+Run with pytest-benchmark (requirements-dev.txt):
+    pytest tests/performance/test_benchmarks.py --benchmark-group-by=group
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.jobs.analysis.statistical import StatisticalAnalysisJob  # noqa: E402
+from src.jobs.base import BaseJob, JobRegistry  # noqa: E402
+from src.jobs.processing.aggregation import DataAggregationJob  # noqa: E402
+from src.jobs.scheduler import JobScheduler  # noqa: E402
+from src.processing.metrics_extractor import EdTechMetricsExtractor  # noqa: E402
+from src.processing.vector_index import FlatIndex, IVFIndex, VectorIndex  # noqa: E402
+from src.validation.filing_validator import get_filing_validator  # noqa: E402
+from tests.performance.baselines import (  # noqa: E402
+    WordTokenizer,
+    build_records,
+    filing_text,
+    legacy_aggregate,
+    legacy_chunk_text,
+    legacy_extract,
+    legacy_search,
+    legacy_statistics,
+    make_embeddings,
+    make_filings,
+    recall,
+)
+
+pytestmark = pytest.mark.slow
+
+AGGREGATIONS = {"revenue": ["sum", "avg", "min", "max"], "margin": ["avg", "max"]}
+STATISTICS = ["count", "mean", "median", "std", "min", "max"]
+
+
+@JobRegistry.register("BenchTickerJob")
+class BenchTickerJob(BaseJob):
+    """No-op job standing in for a per-ticker refresh."""
+
+    def execute(self, **kwargs):
+        return {}
+
+
+@pytest.fixture(scope="module")
+def records():
+    return build_records(200_000, groups=1000)
+
+
+@pytest.fixture(scope="module")
+def text():
+    return filing_text(pages=100)
+
+
+@pytest.mark.benchmark(group="aggregation")
+@pytest.mark.parametrize("path", ["per-record", "columnar"])
+def test_aggregate(benchmark, records, path):
+    if path == "per-record":
+        result = benchmark(legacy_aggregate, records, ["ticker"], AGGREGATIONS)
+    else:
+        result = benchmark(
+            lambda: DataAggregationJob().execute(
+                data=records, group_by=["ticker"], aggregations=AGGREGATIONS
+            )["records"]
+        )
+
+    assert len(result) == 1000
+
+
+@pytest.mark.benchmark(group="statistics")
+@pytest.mark.parametrize("path", ["per-field", "columnar"])
+def test_statistics(benchmark, records, path):
+    if path == "per-field":
+        result = benchmark(legacy_statistics, records)
+    else:
+        result = benchmark(
+            lambda: StatisticalAnalysisJob().execute(data=records, metrics=STATISTICS)["statistics"]
+        )
+
+    assert result["revenue"]["count"] == len(records)
+    assert result["margin"]["mean"] == pytest.approx(legacy_statistics(records)["margin"]["mean"])
+
+
+@pytest.mark.benchmark(group="filing-validation")
+@pytest.mark.parametrize("path", ["single", "batch"])
+def test_filing_validation(benchmark, path):
+    filings = make_filings(10_000)
+    validator = get_filing_validator()
+
+    if path == "single":
+        result = benchmark(lambda: [validator.is_valid(filing) for filing in filings])
+    else:
+        result = benchmark(validator.validate_many, filings)
+
+    assert result == [validator.is_valid(filing) for filing in filings]
+
+
+@pytest.mark.benchmark(group="metric-extraction")
+@pytest.mark.parametrize("path", ["per-pattern", "anchored"])
+def test_metric_extraction(benchmark, text, path):
+    extractor = EdTechMetricsExtractor()
+
+    if path == "per-pattern":
+        result = benchmark(legacy_extract, extractor, text)
+    else:
+        result = benchmark(extractor.extract_metrics, text)
+
+    assert result == legacy_extract(extractor, text)
+
+
+@pytest.mark.benchmark(group="pdf-extraction")
+@pytest.mark.parametrize("workers", [1, 4])
+def test_pdf_extraction(benchmark, workers, tmp_path):
+    pytest.importorskip("pdfplumber")
+    from src.processing.pdf_extractor import PDFExtractor
+    from tests.unit.test_pdf_extractor import make_pdf
+
+    lines = [
+        f"Page {i}: revenue of {i}.5 million and {i * 1000} monthly active users"
+        for i in range(100)
+    ]
+    path = make_pdf(tmp_path / "synthetic.pdf", lines)
+    extractor = PDFExtractor(max_workers=workers, pages_per_task=16, min_parallel_pages=1)
+
+    text, metadata = benchmark.pedantic(extractor.extract, args=(path,), rounds=3)
+
+    assert metadata["num_pages"] == 100
+    assert text == PDFExtractor(max_workers=1).extract(path)[0]
+
+
+@pytest.mark.benchmark(group="scheduler-idle-tick")
+@pytest.mark.parametrize("path", ["scan", "heap"])
+def test_scheduler_idle_tick(benchmark, path):
+    scheduler = JobScheduler(MagicMock())
+    later = datetime.utcnow() + timedelta(minutes=30)
+    for i in range(10_000):
+        scheduler.add_schedule(
+            f"ticker-{i}", "BenchTickerJob", {"ticker": f"T{i}"}, interval=timedelta(hours=1)
+        )
+        scheduler.get_schedule(f"ticker-{i}").next_run = later
+        scheduler.enable_schedule(f"ticker-{i}")
+    schedules = list(scheduler.schedules.values())
+    # The first peek drops the stale entries left by rescheduling above
+    scheduler._seconds_until_next()
+
+    if path == "scan":
+        due = benchmark(lambda: [schedule for schedule in schedules if schedule.should_run()])
+        assert due == []
+    else:
+        assert benchmark(scheduler._seconds_until_next) > 0
+
+
+@pytest.mark.benchmark(group="text-chunking")
+@pytest.mark.parametrize("path", ["re-encoding", "single-pass"])
+def test_text_chunking(benchmark, text, path):
+    pytest.importorskip("tiktoken")
+    from src.processing.text_chunker import TextChunker
+
+    chunker = TextChunker(chunk_size=1000, chunk_overlap=200)
+    chunker.tokenizer = chunker.tokenizer or WordTokenizer()
+
+    if path == "re-encoding":
+        chunks = benchmark(legacy_chunk_text, chunker, text)
+    else:
+        chunks = benchmark(chunker.chunk_text, text)
+
+    assert max(chunk.token_count for chunk in chunks) <= 1000
+
+
+@pytest.mark.benchmark(group="vector-search")
+@pytest.mark.parametrize("path", ["argsort", "flat", "ivf"])
+def test_vector_search(benchmark, path):
+    embeddings = make_embeddings(50_000, 128, clusters=25)
+    rng = np.random.default_rng(1)
+    queries = embeddings[rng.choice(len(embeddings), 50, replace=False)]
+    queries = queries + 0.1 * rng.normal(size=queries.shape).astype(np.float32)
+    expected = [legacy_search(query, embeddings, 10) for query in queries]
+
+    with tempfile.TemporaryDirectory() as directory:
+        if path == "argsort":
+            search = lambda query: legacy_search(query, embeddings, 10)  # noqa: E731
+        else:
+            index_class = FlatIndex if path == "flat" else IVFIndex
+            index_class.from_embeddings(embeddings).save(directory)
+            index = VectorIndex.load(directory, mmap=True)
+            search = lambda query: index.search(query, 10)[1]  # noqa: E731
+
+        actual = benchmark(lambda: [search(query) for query in queries])
+
+    benchmark.extra_info["recall@10"] = recall(expected, actual)
+    assert recall(expected, actual) >= (1.0 if path != "ivf" else 0.8)
@@ -13,6 +13,7 @@ from src.analysis.engine import (
     SegmentOpportunityStrategy,
     CohortAnalysisStrategy
 )
+from src.repositories.metric_series import MetricSeries
 
 
 @pytest.fixture
@@ -163,6 +164,21 @@ class TestAnalysisEngine:
         # Some strategies may fail validation, so results could be empty
         assert isinstance(results, list)
 
+    def test_analyze_accepts_metric_series(self, analysis_engine):
+        """Test competitor analysis runs on a batched MetricSeries."""
+        date = datetime(2024, 3, 31)
+        series = MetricSeries.from_rows([
+            ('id-1', 'CHGG', 'revenue', date, 400.0e6, 'USD', -2.0, -5.2),
+            ('id-2', 'DUOL', 'revenue', date, 600.0e6, 'USD', 10.0, 42.9),
+        ])
+
+        result = analysis_engine.analyze(
+            'competitor_analysis', {'metrics': series, 'time_period': '2024Q1'}
+        )
+
+        assert result.results['market_shares']['DUOL'] == pytest.approx(60.0)
+        assert result.results['growth_rates'] == {'CHGG': -5.2, 'DUOL': 42.9}
+
 
 class TestCompetitorAnalysisStrategy:
     """Tests for CompetitorAnalysisStrategy."""
@@ -12,6 +12,7 @@ import pandas as pd
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.local_cache import LocalCache
 from src.services.dashboard_service import DashboardService
 
 
@@ -39,6 +40,54 @@ def service(mock_session, mock_cache):
     return service
 
 
+class TestLocalCacheTier:
+    """Tests for the process-local L1 cache in front of Redis."""
+
+    @pytest.fixture
+    def local_cache(self):
+        return LocalCache(max_entries=16, ttl=60.0)
+
+    @pytest.fixture
+    def service(self, mock_session, mock_cache, local_cache):
+        service = DashboardService(mock_session, local_cache=local_cache)
+        service.cache = mock_cache
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_skip_redis(self, service, mock_cache, local_cache):
+        """Test that a Redis hit is kept in L1 for the next read."""
+        cached_data = [{"ticker": "DUOL", "company_name": "Duolingo"}]
+        mock_cache.get.return_value = json.dumps(cached_data)
+
+        assert await service.get_company_performance() == cached_data
+        assert await service.get_company_performance() == cached_data
+
+        mock_cache.get.assert_called_once()
+        stats = local_cache.stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l2_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_populates_l1(self, service, mock_cache):
+        """Test that values written to Redis are also served from L1."""
+        await service._set_cached("dashboard:key", {"at": datetime(2024, 3, 31)})
+
+        assert await service._get_cached("dashboard:key") == {"at": "2024-03-31 00:00:00"}
+        mock_cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_publishes(self, service, mock_cache, local_cache):
+        """Test that invalidation clears L1 and notifies other processes."""
+        await service._set_cached("dashboard:key", [1])
+        mock_cache.delete = AsyncMock(return_value=1)
+        mock_cache.publish = AsyncMock(return_value=1)
+
+        assert await service.invalidate("dashboard:key") == 1
+
+        assert "dashboard:key" not in local_cache
+        mock_cache.publish.assert_awaited_once_with(local_cache.channel, '["dashboard:key"]')
+
+
 class TestGetCompanyPerformance:
     """Tests for get_company_performance method."""
 
@@ -226,35 +275,14 @@ class TestGetQuarterlyMetrics:
     @pytest.mark.asyncio
     async def test_get_revenue_trend(self, service, mock_session):
         """Test fetching quarterly revenue metrics."""
-        # Mock company query
-        mock_company = MagicMock()
-        mock_company.id = "test-uuid"
-        mock_company_result = MagicMock()
-        mock_company_result.scalar_one_or_none.return_value = mock_company
-
-        # Mock metrics query
-        mock_metric1 = MagicMock()
-        mock_metric1.metric_date = datetime.utcnow()
-        mock_metric1.value = 484.2e6
-        mock_metric1.unit = "USD"
-        mock_metric1.period_type = "quarterly"
-
-        mock_metric2 = MagicMock()
-        mock_metric2.metric_date = datetime.utcnow() - timedelta(days=90)
-        mock_metric2.value = 420.0e6
-        mock_metric2.unit = "USD"
-        mock_metric2.period_type = "quarterly"
-
+        # Batched time-series query rows, oldest first, growth computed in SQL
+        now = datetime.utcnow()
         mock_metrics_result = MagicMock()
-        mock_metrics_result.scalars.return_value.all.return_value = [
-            mock_metric1,
-            mock_metric2,
-        ]
-
-        mock_session.execute.side_effect = [
-            mock_company_result,
-            mock_metrics_result,
-        ]
+        mock_metrics_result.__iter__.return_value = iter([
+            ("test-uuid", "DUOL", "revenue", now - timedelta(days=90), 420.0e6, "USD", None, None),
+            ("test-uuid", "DUOL", "revenue", now, 484.2e6, "USD", 15.29, None),
+        ])
+        mock_session.execute.return_value = mock_metrics_result
 
         df = await service.get_quarterly_metrics("DUOL", "revenue")
 
@@ -262,6 +290,8 @@ class TestGetQuarterlyMetrics:
         assert len(df) == 2
         assert "qoq_growth" in df.columns
         assert "yoy_growth" in df.columns
+        assert df["qoq_growth"].iloc[1] == pytest.approx(15.29)
+        assert mock_session.execute.call_count == 1
 
     @pytest.mark.asyncio
     async def test_nonexistent_company_metrics(self, service, mock_session):
@@ -274,6 +304,27 @@ class TestGetQuarterlyMetrics:
 
         assert df.empty
 
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_query(self, service, mock_session):
+        """Test that many tickers and metric types share one query."""
+        date = datetime(2024, 3, 31)
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter([
+            ("id-1", "CHGG", "revenue", date, 170.0e6, "USD", -5.0, -7.0),
+            ("id-2", "DUOL", "revenue", date, 167.6e6, "USD", 10.0, 45.0),
+            ("id-2", "DUOL", "monthly_active_users", date, 97.6e6, "count", 9.0, 49.0),
+        ])
+        mock_session.execute.return_value = mock_result
+
+        df = await service.get_quarterly_metrics_batch(
+            ["DUOL", "CHGG"], ["revenue", "monthly_active_users"]
+        )
+
+        assert len(df) == 3
+        assert set(df["ticker"]) == {"DUOL", "CHGG"}
+        assert "company_id" not in df.columns
+        assert mock_session.execute.call_count == 1
+
 
 class TestGetMarketSummary:
     """Tests for get_market_summary method."""
@@ -0,0 +1,219 @@
+"""Unit tests for the SEC company directory.
+
+Tests cover:
+- bidirectional ticker/CIK lookups
+- snapshot round trip for cold starts
+- conditional GET refresh (304, 200) and serving stale data on errors
+- single-flight refresh for concurrent callers
+- which directory SEC clients use
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.config import get_settings
+from src.pipeline.sec import client as client_module
+from src.pipeline.sec.client import SECAPIClient, get_sec_client
+from src.pipeline.sec.directory import CompanyDirectory, CompanyEntry, get_company_directory
+
+COMPANY_TICKERS = {
+    "0": {"cik_str": 1364612, "ticker": "DUOL", "title": "Duolingo, Inc."},
+    "1": {"cik_str": 1364954, "ticker": "CHGG", "title": "Chegg, Inc."},
+    "2": {"cik_str": 1730168, "ticker": "AVGO", "title": "Broadcom Inc."},
+    "3": {"cik_str": 1730168, "ticker": "avgop", "title": "Broadcom Inc."},
+}
+
+
+def make_response(status_code=200, data=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data
+    response.headers = headers or {}
+    return response
+
+
+def make_client(*responses):
+    client = MagicMock()
+    client.get_company_tickers = AsyncMock(side_effect=list(responses))
+    return client
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "sec" / "company_tickers.json.gz")
+
+
+async def loaded_directory(snapshot_path, ttl=3600):
+    directory = CompanyDirectory(snapshot_path=snapshot_path, ttl=ttl)
+    client = make_client(make_response(
+        data=COMPANY_TICKERS, headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"}
+    ))
+    await directory.ensure_fresh(client)
+    return directory
+
+
+class TestLookups:
+    """Tests for directory lookups."""
+
+    async def test_both_directions(self, snapshot_path):
+        directory = await loaded_directory(snapshot_path)
+
+        assert len(directory) == 4
+        assert directory.cik_for("duol") == "0001364612"
+        assert directory.ticker_for("1364612") == "DUOL"
+        assert directory.ticker_for("0001730168") == "AVGO"
+        assert directory.tickers_for("1730168") == ("AVGO", "AVGOP")
+        assert directory.entry_for_cik("1364954") == CompanyEntry("0001364954", "CHGG", "Chegg, Inc.")
+        assert directory.cik_for("NOPE") is None
+        assert directory.ticker_for("42") is None
+
+    async def test_client_mapping_uses_directory(self, snapshot_path):
+        directory = await loaded_directory(snapshot_path)
+        client = SECAPIClient(directory=directory)
+
+        mapping = await client.get_ticker_to_cik_mapping()
+
+        assert mapping["CHGG"] == "0001364954"
+        assert mapping is directory.ticker_to_cik()
+
+
+class TestSnapshot:
+    """Tests for the on-disk snapshot."""
+
+    async def test_cold_start_without_request(self, snapshot_path):
+        await loaded_directory(snapshot_path)
+        client = make_client()
+
+        directory = await CompanyDirectory(snapshot_path=snapshot_path, ttl=3600).ensure_fresh(client)
+
+        client.get_company_tickers.assert_not_called()
+        assert directory.etag == '"v1"'
+        assert directory.ticker_for("1730168") == "AVGO"
+        assert list(directory) == [
+            CompanyEntry("0001364612", "DUOL", "Duolingo, Inc."),
+            CompanyEntry("0001364954", "CHGG", "Chegg, Inc."),
+            CompanyEntry("0001730168", "AVGO", "Broadcom Inc."),
+            CompanyEntry("0001730168", "AVGOP", "Broadcom Inc."),
+        ]
+
+    def test_unreadable_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "company_tickers.json.gz"
+        path.write_bytes(b"not gzip")
+
+        directory = CompanyDirectory(snapshot_path=str(path))
+
+        assert directory.load_snapshot() is False
+        assert not directory.loaded
+
+
+class TestRefresh:
+    """Tests for TTL refresh."""
+
+    async def test_conditional_get_not_modified(self, snapshot_path):
+        directory = await loaded_directory(snapshot_path, ttl=0)
+        fetched_at = directory.fetched_at
+        client = make_client(make_response(status_code=304))
+
+        await directory.ensure_fresh(client)
+
+        headers = client.get_company_tickers.await_args.kwargs["headers"]
+        assert headers == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Oct 2025 00:00:00 GMT",
+        }
+        assert directory.fetched_at >= fetched_at
+        assert directory.cik_for("DUOL") == "0001364612"
+
+    async def test_changed_directory_is_reindexed(self, snapshot_path):
+        directory = await loaded_directory(snapshot_path, ttl=0)
+        data = {"0": {"cik_str": 1651562, "ticker": "COUR", "title": "Coursera, Inc."}}
+        client = make_client(make_response(data=data, headers={"ETag": '"v2"'}))
+
+        await directory.ensure_fresh(client)
+
+        assert directory.cik_for("DUOL") is None
+        assert directory.cik_for("COUR") == "0001651562"
+        assert CompanyDirectory(snapshot_path=snapshot_path).load_snapshot() is True
+
+    async def test_error_serves_stale_copy(self, snapshot_path):
+        directory = await loaded_directory(snapshot_path, ttl=0)
+        client = make_client(make_response(status_code=503), make_response(status_code=304))
+
+        await directory.ensure_fresh(client)
+        await directory.ensure_fresh(client)
+
+        # The second call waits out the retry interval instead of hitting SEC
+        assert client.get_company_tickers.await_count == 1
+        assert directory.cik_for("DUOL") == "0001364612"
+
+    async def test_error_without_copy_backs_off(self, tmp_path):
+        directory = CompanyDirectory(snapshot_path="", ttl=3600)
+        client = make_client(make_response(status_code=503), make_response(data=COMPANY_TICKERS))
+
+        await directory.ensure_fresh(client)
+        await directory.ensure_fresh(client)
+
+        assert client.get_company_tickers.await_count == 1
+        assert not directory.loaded
+
+    async def test_fresh_directory_is_not_refetched(self, snapshot_path):
+        directory = await loaded_directory(snapshot_path)
+        client = make_client()
+
+        await directory.ensure_fresh(client)
+
+        client.get_company_tickers.assert_not_called()
+        assert not directory.is_stale(time.time())
+
+    async def test_concurrent_callers_share_one_fetch(self, tmp_path):
+        directory = CompanyDirectory(snapshot_path="", ttl=3600)
+
+        async def slow_get(headers):
+            await asyncio.sleep(0.01)
+            return make_response(data=COMPANY_TICKERS)
+
+        client = make_client()
+        client.get_company_tickers = AsyncMock(side_effect=slow_get)
+
+        await asyncio.gather(*(directory.ensure_fresh(client) for _ in range(10)))
+
+        assert client.get_company_tickers.await_count == 1
+        assert directory.snapshot_path is None
+        assert len(directory) == 4
+
+
+class TestClientDirectory:
+    """Tests for the directory behind SECAPIClient."""
+
+    def test_clients_do_not_share_state(self):
+        first, second = SECAPIClient(), SECAPIClient()
+
+        assert first.directory is not second.directory
+        assert first.directory.snapshot_path is None
+
+    def test_shared_client_uses_process_directory(self, monkeypatch):
+        monkeypatch.setattr(client_module, "_sec_client", None)
+
+        assert get_sec_client().directory is get_company_directory()
+
+    def test_default_snapshot_under_data_dir(self):
+        settings = get_settings()
+
+        directory = CompanyDirectory()
+
+        assert directory.snapshot_path == settings.data_path(settings.SEC_COMPANY_DIRECTORY_PATH)
+        assert directory.snapshot_path.is_absolute()
+
+    async def test_get_company_tickers_sends_validators(self):
+        client = SECAPIClient()
+        client._get = AsyncMock(return_value=make_response(status_code=304))
+
+        response = await client.get_company_tickers(headers={"If-None-Match": '"v1"'})
+
+        assert response.status_code == 304
+        client._get.assert_awaited_once_with(
+            SECAPIClient.TICKER_CIK_MAPPING_URL, headers={"If-None-Match": '"v1"'}
+        )
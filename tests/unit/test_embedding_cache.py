@@ -0,0 +1,173 @@
+"""Unit tests for the persistent embedding cache.
+
+Tests cover:
+- get/put round trips and content addressing by model
+- batch lookups preserving input positions
+- LRU eviction at the size cap, including batches larger than the cache
+- sharing one cache directory between independent instances
+- hit-rate metrics and layout validation
+- rejecting vectors whose slot was rewritten during a read
+- sharing one instance between threads
+"""
+
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.processing.embedding_cache import EmbeddingCache, _slot_tag, embedding_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path, "test-model", dimension=4, max_entries=3, dtype="float32")
+    yield cache
+    cache.close()
+
+
+def vec(value: float) -> np.ndarray:
+    return np.full(4, value, dtype=np.float32)
+
+
+class TestEmbeddingKey:
+    """Tests for embedding_key."""
+
+    def test_key_depends_on_model(self):
+        assert embedding_key("a", "text") != embedding_key("b", "text")
+        assert embedding_key("a", "text") == embedding_key("a", "text")
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_put_and_get(self, cache):
+        cache.put("hello", vec(1.0))
+
+        assert np.array_equal(cache.get("hello"), vec(1.0))
+        assert cache.get("missing") is None
+
+    def test_get_many_returns_positions(self, cache):
+        cache.put_many(["a", "b"], np.stack([vec(1.0), vec(2.0)]))
+
+        found = cache.get_many(["b", "x", "a", "b"])
+
+        assert set(found) == {0, 2, 3}
+        assert np.array_equal(found[0], vec(2.0))
+        assert np.array_equal(found[2], vec(1.0))
+
+    def test_duplicate_puts_store_once(self, cache):
+        cache.put_many(["a", "a"], np.stack([vec(1.0), vec(1.0)]))
+        cache.put("a", vec(9.0))
+
+        assert len(cache) == 1
+        assert np.array_equal(cache.get("a"), vec(1.0))
+
+    def test_lru_eviction(self, cache):
+        cache.put_many(["a", "b", "c"], np.stack([vec(1.0), vec(2.0), vec(3.0)]))
+        time.sleep(0.01)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.put("d", vec(4.0))
+
+        assert len(cache) == 3
+        assert cache.get("b") is None
+        assert np.array_equal(cache.get("a"), vec(1.0))
+        assert np.array_equal(cache.get("d"), vec(4.0))
+        assert cache.evictions == 1
+
+    def test_batch_larger_than_cache_keeps_last_entries(self, cache):
+        texts = ["a", "b", "c", "d", "e"]
+        cache.put_many(texts, np.stack([vec(float(i)) for i in range(5)]))
+
+        assert len(cache) == 3
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert np.array_equal(cache.get("e"), vec(4.0))
+        assert np.array_equal(cache.get("c"), vec(2.0))
+
+    def test_shape_validation(self, cache):
+        with pytest.raises(ValueError):
+            cache.put_many(["a"], np.ones((1, 5)))
+
+    def test_stats(self, cache):
+        cache.put("a", vec(1.0))
+        cache.get_many(["a", "b", "a", "c"])
+
+        stats = cache.stats()
+
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(0.5)
+        assert stats["entries"] == 1
+
+    def test_shared_between_instances(self, cache, tmp_path):
+        other = EmbeddingCache(tmp_path, "test-model", dimension=4, max_entries=3, dtype="float32")
+        try:
+            other.put("shared", vec(7.0))
+            assert np.array_equal(cache.get("shared"), vec(7.0))
+        finally:
+            other.close()
+
+    def test_float16_storage(self, tmp_path):
+        cache = EmbeddingCache(tmp_path, "half", dimension=4, max_entries=2)
+        try:
+            cache.put("a", np.array([0.1, 0.2, 0.3, 0.4]))
+            found = cache.get("a")
+            assert found.dtype == np.float32
+            assert np.allclose(found, [0.1, 0.2, 0.3, 0.4], atol=1e-3)
+        finally:
+            cache.close()
+
+    def test_incompatible_layout_rejected(self, cache, tmp_path):
+        with pytest.raises(ValueError):
+            EmbeddingCache(tmp_path, "test-model", dimension=8, max_entries=3, dtype="float32")
+
+    def test_rewritten_slot_is_a_miss(self, cache):
+        cache.put("a", vec(1.0))
+        slot = cache._db.execute("SELECT slot FROM entries").fetchone()[0]
+
+        # Another process evicted "a" and is writing "z" into the same slot
+        cache._tags[slot] = 0
+        assert cache.get("a") is None
+        cache._tags[slot] = _slot_tag(embedding_key("test-model", "z"))
+        assert cache.get("a") is None
+
+        cache._tags[slot] = _slot_tag(embedding_key("test-model", "a"))
+        assert np.array_equal(cache.get("a"), vec(1.0))
+
+    def test_shared_between_threads(self, cache):
+        errors = []
+
+        def worker(value):
+            try:
+                cache.put(f"text-{value}", vec(value))
+                cache.get_many([f"text-{value}", "missing"])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(value,)) for value in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) == 3
+
+    def test_cache_without_slot_tags_is_emptied(self, cache, tmp_path):
+        cache.put("a", vec(1.0))
+        cache.close()
+        db = sqlite3.connect(tmp_path / "test-model" / "index.sqlite")
+        db.execute("DELETE FROM meta WHERE name = 'format'")
+        db.commit()
+        db.close()
+
+        reopened = EmbeddingCache(tmp_path, "test-model", dimension=4, max_entries=3, dtype="float32")
+        try:
+            assert len(reopened) == 0
+            reopened.put("a", vec(2.0))
+            assert np.array_equal(reopened.get("a"), vec(2.0))
+        finally:
+            reopened.close()
@@ -0,0 +1,188 @@
+"""Unit tests for the filing content store.
+
+Tests cover:
+- compressed round trips on the local filesystem
+- deduplication of identical documents
+- reading blobs written with either codec
+- the S3-compatible backend
+- SECFiling.load_text
+- moving inline sec_filings.raw_text into the store
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from src.core.config import get_settings
+from src.db.models import Base, Company, SECFiling
+from src.pipeline.sec import content_store
+from src.pipeline.sec.content_store import (
+    FilingContentStore,
+    LocalFilingContentStore,
+    S3FilingContentStore,
+    content_hash,
+    offload_inline_text,
+)
+
+FILING_TEXT = "ITEM 7. MANAGEMENT'S DISCUSSION AND ANALYSIS – revenue grew 42% " * 2000
+
+
+class NoSuchKey(Exception):
+    code = "NoSuchKey"
+
+
+class FakeMinio:
+    """Dict-backed stand-in for minio.Minio."""
+
+    def __init__(self):
+        self.objects = {}
+        self.buckets = set()
+
+    def bucket_exists(self, bucket):
+        return bucket in self.buckets
+
+    def make_bucket(self, bucket):
+        self.buckets.add(bucket)
+
+    def stat_object(self, bucket, key):
+        if (bucket, key) not in self.objects:
+            raise NoSuchKey(key)
+
+    def put_object(self, bucket, key, data, length, content_type=None):
+        self.objects[(bucket, key)] = data.read(length)
+
+    def get_object(self, bucket, key):
+        if (bucket, key) not in self.objects:
+            raise NoSuchKey(key)
+        response = MagicMock()
+        response.read.return_value = self.objects[(bucket, key)]
+        return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalFilingContentStore(root=str(tmp_path), compression_level=3)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    """SQLite database with the companies and sec_filings tables."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'filings.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[Company.__table__, SECFiling.__table__]
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TestLocalStore:
+    """Tests for LocalFilingContentStore."""
+
+    async def test_round_trip_is_compressed(self, store, tmp_path):
+        digest = await store.put(FILING_TEXT)
+
+        assert digest == content_hash(FILING_TEXT)
+        blob = tmp_path / digest[:2] / digest
+        assert blob.stat().st_size < len(FILING_TEXT.encode("utf-8")) / 10
+        assert await store.get(digest) == FILING_TEXT
+
+    async def test_identical_documents_stored_once(self, store, tmp_path, monkeypatch):
+        digest = await store.put(FILING_TEXT)
+        writes = MagicMock()
+        monkeypatch.setattr(store, "_write", writes)
+
+        assert await store.put(FILING_TEXT) == digest
+        writes.assert_not_called()
+        assert len(list(tmp_path.rglob("*"))) == 2  # fan-out directory and one blob
+
+    async def test_missing_digest(self, store):
+        assert await store.get("0" * 64) is None
+        assert await store.exists("0" * 64) is False
+
+    async def test_zlib_blobs_stay_readable(self, store, monkeypatch):
+        monkeypatch.setattr(content_store, "ZSTD_AVAILABLE", False)
+        digest = await store.put(FILING_TEXT)
+        monkeypatch.undo()
+
+        assert await store.get(digest) == FILING_TEXT
+
+    def test_zstd_frames_are_detected(self):
+        if not content_store.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        blob = content_store.compress(b"10-K", 3)
+
+        assert blob[:4] == content_store.ZSTD_MAGIC
+        assert content_store.decompress(blob) == b"10-K"
+
+    def test_default_root_under_data_dir(self):
+        settings = get_settings()
+
+        assert LocalFilingContentStore().root == settings.data_path(settings.FILING_CONTENT_DIR)
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            FilingContentStore()
+
+
+class TestS3Store:
+    """Tests for S3FilingContentStore."""
+
+    async def test_round_trip_and_dedup(self):
+        client = FakeMinio()
+        store = S3FilingContentStore(client=client, bucket="sec-filings", compression_level=3)
+
+        digest = await store.put(FILING_TEXT)
+        await store.put(FILING_TEXT)
+
+        assert list(client.objects) == [("sec-filings", f"{digest[:2]}/{digest}")]
+        assert await store.get(digest) == FILING_TEXT
+        assert await store.get("f" * 64) is None
+
+
+class TestLoadText:
+    """Tests for SECFiling.load_text."""
+
+    async def test_reads_from_store(self, store):
+        digest = await store.put(FILING_TEXT)
+        filing = SECFiling(accession_number="0001364612-24-000003", content_hash=digest)
+
+        assert await filing.load_text(store) == FILING_TEXT
+        assert filing.raw_text is None
+
+
+class TestOffloadInlineText:
+    """Tests for offload_inline_text."""
+
+    async def test_moves_text_and_is_idempotent(self, store, session_factory):
+        texts = [f"{FILING_TEXT} {i}" for i in range(3)]
+        async with session_factory() as session:
+            company = Company(ticker="DUOL", name="Duolingo Inc.")
+            session.add(company)
+            await session.flush()
+            session.add_all([
+                SECFiling(
+                    company_id=company.id,
+                    filing_type="10-K",
+                    filing_date=datetime(2024, 3, 15),
+                    accession_number=f"0001364612-24-00000{i}",
+                    raw_text=text,
+                )
+                for i, text in enumerate(texts)
+            ])
+            await session.commit()
+
+        assert await offload_inline_text(session_factory, store, batch_size=2) == 3
+        assert await offload_inline_text(session_factory, store, batch_size=2) == 0
+
+        async with session_factory() as session:
+            result = await session.execute(select(SECFiling).order_by(SECFiling.accession_number))
+            filings = result.scalars().all()
+            assert [filing.content_hash for filing in filings] == [content_hash(t) for t in texts]
+            assert [await filing.load_text(store) for filing in filings] == texts
+            assert [await filing.awaitable_attrs.raw_text for filing in filings] == [None] * 3
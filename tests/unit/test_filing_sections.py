@@ -0,0 +1,145 @@
+"""Unit tests for the 10-K/10-Q Item section index.
+
+Tests cover:
+- HTML to text conversion
+- skipping the table of contents and cross-references
+- Part-qualified 10-Q sections and plain-text filings
+- reading one section back from the stored document
+"""
+
+from src.db.models import SECFiling
+from src.pipeline.sec.content_store import LocalFilingContentStore
+from src.pipeline.sec.sections import (
+    TEN_K_ITEMS,
+    html_to_text,
+    parse_filing_sections,
+    section_text,
+)
+
+
+def paragraphs(label: str, count: int = 5) -> str:
+    return "".join(
+        f"<p>Paragraph {k} of {label}. Results are discussed in Item&nbsp;7.</p>" for k in range(count)
+    )
+
+
+def ten_k_html() -> str:
+    toc = "".join(
+        f'<tr><td>Item {number}.</td><td><a href="#item{number}">{title}</a></td><td>{page}</td></tr>'
+        for page, (number, title) in enumerate(TEN_K_ITEMS.items(), start=3)
+    )
+    body = ""
+    for number, title in TEN_K_ITEMS.items():
+        body += f'<div id="item{number}"><p><b>ITEM {number}.&#160;&#160;{title.upper()}</b></p></div>'
+        body += paragraphs(f"item {number}")
+        if number == "4":
+            body += "<p>PART II</p>"
+    # A short line referencing an earlier Item after the real heading
+    body += "<p>Item 7</p><p>Signatures</p>"
+    return (
+        "<html><head><title>10-K</title><style>p {margin: 0}</style></head><body>"
+        '<div style="display:none"><ix:header><ix:hidden>Item 7 hidden fact</ix:hidden></ix:header></div>'
+        f"<p>PART I</p><table>{toc}</table>{body}</body></html>"
+    )
+
+
+TEN_Q_TEXT = """FORM 10-Q
+TABLE OF CONTENTS
+PART I. FINANCIAL INFORMATION
+  Item 1.  Financial Statements          3
+  Item 2.  Management's Discussion       15
+PART II. OTHER INFORMATION
+  Item 1A. Risk Factors                  27
+  Item 6.  Exhibits                      30
+
+PART I - FINANCIAL INFORMATION
+ITEM 1. FINANCIAL STATEMENTS
+Condensed consolidated balance sheets.
+ITEM 2. MANAGEMENT'S DISCUSSION AND ANALYSIS
+Bookings grew 30% year over year.
+PART II - OTHER INFORMATION
+ITEM 1A. RISK FACTORS
+There have been no material changes.
+ITEM 6. EXHIBITS
+31.1 Certification
+"""
+
+
+class TestHtmlToText:
+    """Tests for html_to_text."""
+
+    def test_blocks_cells_and_entities(self):
+        html = (
+            "<html><head><script>var x = '<p>';</script></head><body>"
+            "<div>Revenue &amp; bookings</div><table><tr><td>Q1</td><td>$1.2</td></tr></table>"
+            "<p>  spread\n   over   lines </p><!-- comment --></body></html>"
+        )
+
+        assert html_to_text(html) == "Revenue & bookings\nQ1 $1.2\nspread over lines\n"
+
+
+class TestTenK:
+    """Tests for 10-K section indexing."""
+
+    def test_body_headings_win_over_table_of_contents(self):
+        document = ten_k_html()
+
+        index = parse_filing_sections(document, "10-K")
+
+        assert index["format"] == "html"
+        assert list(index["sections"]) == [f"item_{number.lower()}" for number in TEN_K_ITEMS]
+        mdna = section_text(document, index, "mdna")
+        assert mdna.startswith("ITEM 7. MANAGEMENT'S DISCUSSION AND ANALYSIS")
+        assert "Paragraph 4 of item 7." in mdna
+        assert "item 7A" not in mdna
+        assert index["sections"]["item_7"]["title"] == TEN_K_ITEMS["7"]
+        assert index["sections"]["item_7"]["length"] == len(mdna) + 1  # trailing newline
+
+    def test_part_heading_ends_section(self):
+        document = ten_k_html()
+
+        item_4 = section_text(document, parse_filing_sections(document, "10-K/A"), "item_4")
+
+        assert item_4.endswith("Paragraph 4 of item 4. Results are discussed in Item 7.")
+
+    def test_sections_cover_a_fraction_of_the_text(self):
+        index = parse_filing_sections(ten_k_html(), "10-K")
+
+        assert index["sections"]["item_7"]["length"] < index["text_length"] / 10
+
+
+class TestTenQ:
+    """Tests for 10-Q section indexing."""
+
+    def test_plain_text_with_parts(self):
+        index = parse_filing_sections(TEN_Q_TEXT, "10-Q")
+
+        assert index["format"] == "text"
+        assert list(index["sections"]) == [
+            "part1_item_1", "part1_item_2", "part2_item_1a", "part2_item_6",
+        ]
+        assert section_text(TEN_Q_TEXT, index, "mdna") == (
+            "ITEM 2. MANAGEMENT'S DISCUSSION AND ANALYSIS\nBookings grew 30% year over year."
+        )
+        assert section_text(TEN_Q_TEXT, index, "risk_factors").endswith("no material changes.")
+        assert section_text(TEN_Q_TEXT, index, "item_7") is None
+
+    def test_forms_without_items(self):
+        assert parse_filing_sections(TEN_Q_TEXT, "8-K") is None
+
+
+class TestLoadSection:
+    """Tests for SECFiling.load_section."""
+
+    async def test_reads_section_from_store(self, tmp_path):
+        store = LocalFilingContentStore(root=str(tmp_path), compression_level=3)
+        document = ten_k_html()
+        filing = SECFiling(
+            content_hash=await store.put(document),
+            parsed_sections=parse_filing_sections(document, "10-K"),
+        )
+
+        text = await filing.load_section("risk_factors", store)
+
+        assert text.startswith("ITEM 1A. RISK FACTORS")
+        assert await filing.load_section("part2_item_6", store) is None
@@ -0,0 +1,120 @@
+"""Unit tests for the compiled SEC filing validator.
+
+Tests cover:
+- single-filing rule checks (presence, types, formats, form set, lengths)
+- null semantics matching Great Expectations map expectations
+- batch DataFrame validation agreeing with single-filing checks
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from src.validation.filing_validator import FilingValidator, get_filing_validator
+
+
+def make_filing(**overrides):
+    filing = {
+        "accessionNumber": "0001234567-89-012345",
+        "form": "10-K",
+        "filingDate": "2024-03-15",
+        "cik": "1234567890",
+        "content": "Annual report content " * 10,
+        "content_hash": "a" * 64,
+        "downloaded_at": "2024-03-16T00:00:00",
+        "primaryDocument": "doc.htm",
+    }
+    filing.update(overrides)
+    return filing
+
+
+@pytest.fixture
+def validator():
+    return FilingValidator()
+
+
+class TestCheck:
+    """Tests for single-filing validation."""
+
+    def test_valid_filing(self, validator):
+        assert validator.check(make_filing()) == []
+        assert validator.is_valid(make_filing())
+
+    def test_missing_required_field(self, validator):
+        filing = make_filing()
+        del filing["filingDate"]
+
+        assert validator.check(filing) == ["column_exists(filingDate)", "not_null(filingDate)"]
+
+    def test_missing_optional_only_checked_when_present(self, validator):
+        filing = make_filing()
+        del filing["primaryDocument"]
+
+        assert validator.is_valid(filing)
+        assert validator.check(make_filing(primaryDocument=None)) == ["not_null(primaryDocument)"]
+
+    @pytest.mark.parametrize("field,value,failure", [
+        ("accessionNumber", "INVALID", "match_regex(accessionNumber)"),
+        ("cik", "12345678901", "match_regex(cik)"),
+        ("cik", 1234567, "of_type_str(cik)"),
+        ("content_hash", "A" * 64, "match_regex(content_hash)"),
+        ("filingDate", "2024-3-15", "match_regex(filingDate)"),
+        ("filingDate", "2024-02-30", "strftime_format(filingDate)"),
+        ("form", "INVALID-FORM", "in_set(form)"),
+        ("content", "x" * 50, "length_at_least(content)"),
+        ("content", None, "not_null(content)"),
+    ])
+    def test_rule_failures(self, validator, field, value, failure):
+        assert failure in validator.check(make_filing(**{field: value}))
+
+    def test_nulls_only_fail_not_null_rules(self, validator):
+        # content_hash and downloaded_at must exist but may be null
+        assert validator.is_valid(make_filing(content_hash=None, downloaded_at=None))
+        assert validator.check(make_filing(cik=float("nan"))) == ["not_null(cik)"]
+
+    def test_shared_instance(self):
+        assert get_filing_validator() is get_filing_validator()
+
+
+class TestBatchValidation:
+    """Tests for DataFrame validation."""
+
+    VARIANTS = {
+        "accessionNumber": ["bad", None, 12, "0001234567-89-012345\n"],
+        "form": ["XX", None, 4, "4"],
+        "filingDate": ["2024-02-30", None, "2024-3-15", float("nan")],
+        "cik": ["12a", None, 123, "12345678901"],
+        "content": ["short", None, 5],
+        "content_hash": ["A" * 64, None],
+        "downloaded_at": [None],
+        "primaryDocument": [None, "x"],
+    }
+
+    def test_matches_single_checks(self, validator):
+        rng = random.Random(42)
+        filings = []
+        for _ in range(500):
+            filing = make_filing()
+            for field in list(filing):
+                roll = rng.random()
+                if roll < 0.05:
+                    del filing[field]
+                elif roll < 0.2:
+                    filing[field] = rng.choice(self.VARIANTS[field])
+            filings.append(filing)
+
+        assert validator.validate_many(filings) == [validator.is_valid(f) for f in filings]
+
+    def test_validate_frame(self, validator):
+        df = pd.DataFrame([make_filing(), make_filing(form="XX"), make_filing(content_hash=None)])
+
+        assert validator.validate_frame(df).tolist() == [True, False, True]
+
+    def test_validate_frame_missing_column(self, validator):
+        df = pd.DataFrame([make_filing()]).drop(columns=["downloaded_at"])
+
+        assert validator.validate_frame(df).tolist() == [False]
+
+    def test_empty_batch(self, validator):
+        assert validator.validate_many([]) == []
@@ -0,0 +1,176 @@
+"""Unit tests for the BM25 inverted keyword index.
+
+Tests cover:
+- tokenize: whole-token matching
+- BM25Index: scoring, IDF/length normalization, top-k, incremental updates
+- save/load round trips and adding after load
+- building from database rows into a given index
+- HybridSearch reusing its keyword index and rejecting a stale vector index
+"""
+
+import math
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.processing.keyword_index import BM25Index, build_keyword_index_from_db, tokenize
+
+
+@pytest.fixture
+def corpus():
+    return [
+        ("a", "Chegg reported subscription revenue growth in online learning."),
+        ("b", "The company said AI tutoring drove engagement."),
+        ("c", "Revenue revenue revenue from AI products."),
+        ("d", "Board of directors approved the annual budget."),
+    ]
+
+
+@pytest.fixture
+def index(corpus):
+    index = BM25Index()
+    index.add_documents(corpus)
+    return index
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_lowercases_and_splits(self):
+        assert tokenize("10-K Filing, AI!") == ["10", "k", "filing", "ai"]
+
+    def test_empty(self):
+        assert tokenize("") == []
+        assert tokenize(None) == []
+
+
+class TestBM25Index:
+    """Tests for BM25Index search."""
+
+    def test_whole_token_matching(self, index):
+        # "ai" must not match "said" in document b's text via substring
+        results = dict(index.search("ai"))
+        assert set(results) == {"b", "c"}
+
+    def test_term_frequency_ranks_higher(self, index):
+        results = index.search("revenue")
+        assert [doc_id for doc_id, _ in results] == ["c", "a"]
+
+    def test_matches_bm25_formula(self):
+        index = BM25Index(k1=1.2, b=0.75)
+        index.add_documents([("x", "alpha beta"), ("y", "beta gamma gamma")])
+
+        score = dict(index.search("alpha"))["x"]
+
+        idf = math.log(1 + (2 - 1 + 0.5) / (1 + 0.5))
+        norm = 1.2 * (1 - 0.75 + 0.75 * 2 / 2.5)
+        assert score == pytest.approx(idf * 1 * 2.2 / (1 + norm), rel=1e-5)
+
+    def test_rare_terms_weigh_more(self, index):
+        scores = dict(index.search("chegg revenue"))
+        assert scores["a"] > scores["c"]
+
+    def test_top_k_limits_results(self, index):
+        assert len(index.search("revenue ai the", top_k=2)) == 2
+
+    def test_no_match(self, index):
+        assert index.search("nonexistent") == []
+
+    def test_replace_document(self, index):
+        index.add("d", "AI AI AI")
+
+        assert len(index) == 4
+        assert index.search("ai")[0][0] == "d"
+        assert index.search("budget") == []
+
+    def test_remove_document(self, index):
+        assert index.remove("c") is True
+        assert index.remove("missing") is False
+        assert "c" not in dict(index.search("revenue"))
+        assert len(index) == 3
+
+
+class TestBM25Persistence:
+    """Tests for BM25Index save/load."""
+
+    def test_round_trip(self, index, tmp_path):
+        index.save(tmp_path / "bm25")
+        loaded = BM25Index.load(tmp_path / "bm25")
+
+        assert isinstance(loaded._frozen_docs, np.memmap)
+        assert loaded.search("revenue ai") == pytest.approx(index.search("revenue ai"))
+
+    def test_save_drops_removed(self, index, tmp_path):
+        index.remove("d")
+        index.save(tmp_path / "bm25")
+        loaded = BM25Index.load(tmp_path / "bm25")
+
+        assert len(loaded) == 3
+        assert "budget" not in loaded._frozen_terms
+
+    def test_add_after_load(self, index, tmp_path):
+        index.save(tmp_path / "bm25")
+        loaded = BM25Index.load(tmp_path / "bm25")
+        loaded.add("e", "revenue revenue revenue revenue")
+        loaded.add("a", "replaced text")
+
+        results = [doc_id for doc_id, _ in loaded.search("revenue")]
+        assert results[0] == "e"
+        assert "a" not in results
+
+
+class TestBuildFromDatabase:
+    """Tests for build_keyword_index_from_db."""
+
+    async def test_extends_given_empty_index(self):
+        async def rows():
+            yield "1", "Revenue from AI tutoring."
+
+        session = MagicMock()
+        session.stream = AsyncMock(side_effect=lambda query: rows())
+        index = BM25Index()
+
+        built = await build_keyword_index_from_db(session, include_chunks=False, index=index)
+
+        assert built is index
+        assert [doc_id for doc_id, _ in index.search("tutoring")] == ["document:1"]
+
+
+class TestHybridSearchCorpus:
+    """Tests for HybridSearch indexes across corpora."""
+
+    @pytest.fixture
+    def hybrid(self, corpus):
+        module = pytest.importorskip("src.processing.embeddings")
+        embeddings = np.eye(len(corpus), dtype=np.float32)
+        pipeline = MagicMock()
+        pipeline.embed_text.return_value = embeddings[2]
+        hybrid = module.HybridSearch(module.SemanticSearch(pipeline))
+        documents = [{"id": doc_id, "content": text} for doc_id, text in corpus]
+        hybrid.index_documents(documents, embeddings)
+        return hybrid, documents, embeddings
+
+    def test_indexed_corpus_needs_no_embeddings(self, hybrid):
+        hybrid, documents, _ = hybrid
+
+        results = hybrid.search("revenue ai", documents, None, top_k=2)
+
+        assert results[0][1]["id"] == "c"
+
+    def test_stale_vector_index_is_rejected(self, hybrid):
+        hybrid, documents, _ = hybrid
+
+        with pytest.raises(ValueError, match="different corpus"):
+            hybrid.search("revenue", list(documents[:2]), None)
+
+    def test_new_corpus_indexed_once(self, hybrid):
+        hybrid, documents, embeddings = hybrid
+        other = list(reversed(documents))
+
+        with patch.object(hybrid, "_build_keyword_index", wraps=hybrid._build_keyword_index) as build:
+            first = hybrid.search("revenue ai", other, embeddings[::-1].copy(), top_k=1)
+            hybrid.search("budget", other, embeddings[::-1].copy(), top_k=1)
+
+        assert build.call_count == 1
+        assert first[0][1]["id"] == "c"
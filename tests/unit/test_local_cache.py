@@ -0,0 +1,137 @@
+"""Unit tests for the process-local L1 cache.
+
+Tests cover:
+- hits, misses and per-entry TTL
+- LRU eviction by entry count and by byte budget
+- invalidation messages and publishing
+- hit rates and memory footprint in stats
+"""
+
+import json
+import time
+
+import pytest
+
+from src.core.local_cache import INVALIDATION_CHANNEL, LocalCache
+
+
+class FakePublisher:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+
+@pytest.fixture
+def local():
+    return LocalCache(max_entries=3, max_bytes=100, ttl=60.0)
+
+
+class TestLocalCache:
+    """Tests for LocalCache."""
+
+    def test_miss_then_hit(self, local):
+        assert local.get("k") is None
+
+        local.set("k", {"v": 1}, size=10)
+
+        assert local.get("k") == {"v": 1}
+        assert local.counters["l1_hits"] == 1
+        assert local.counters["l1_misses"] == 1
+
+    def test_entry_expires(self, local, monkeypatch):
+        local.set("k", 1, size=1, ttl=5)
+        now = time.monotonic()
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+
+        assert local.get("k") is None
+        assert local.counters["expirations"] == 1
+        assert len(local) == 0
+
+    def test_ttl_capped_by_cache_ttl(self, local, monkeypatch):
+        local.set("k", 1, size=1, ttl=3600)
+        now = time.monotonic()
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+        assert "k" not in local
+
+    def test_expired_value_not_stored(self, local):
+        assert local.set("k", 1, size=1, ttl=0) is False
+        assert "k" not in local
+
+    def test_lru_eviction_by_count(self, local):
+        for key in ("a", "b", "c"):
+            local.set(key, key, size=1)
+        local.get("a")  # "b" is now least recently used
+
+        local.set("d", "d", size=1)
+
+        assert "b" not in local
+        assert all(key in local for key in ("a", "c", "d"))
+        assert local.counters["evictions"] == 1
+
+    def test_lru_eviction_by_bytes(self, local):
+        local.set("a", "a", size=60)
+        local.set("b", "b", size=30)
+
+        local.set("c", "c", size=30)
+
+        assert "a" not in local
+        assert local.stats()["bytes"] == 60
+
+    def test_oversized_value_not_stored(self, local):
+        local.set("a", "a", size=10)
+
+        assert local.set("big", "x", size=101) is False
+        assert "a" in local
+
+    def test_replacing_entry_updates_bytes(self, local):
+        local.set("a", 1, size=40)
+        local.set("a", 2, size=10)
+
+        assert local.stats()["bytes"] == 10
+        assert local.get("a") == 2
+
+    def test_handle_message(self, local):
+        local.set("a", 1, size=1)
+        local.set("b", 2, size=1)
+
+        local.handle_message(json.dumps(["a"]).encode())
+        assert "a" not in local and "b" in local
+
+        local.handle_message(json.dumps("*"))
+        assert len(local) == 0
+
+    def test_malformed_message_ignored(self, local):
+        local.set("a", 1, size=1)
+
+        local.handle_message(b"not json")
+
+        assert "a" in local
+
+    async def test_publish_invalidation(self, local):
+        client = FakePublisher()
+        local.set("a", 1, size=1)
+
+        await local.publish_invalidation(client, [b"a", "b"])
+
+        assert "a" not in local
+        assert client.published == [(INVALIDATION_CHANNEL, json.dumps(["a", "b"]))]
+
+    def test_stats(self, local):
+        local.set("a", 1, size=7)
+        local.get("a")
+        local.get("b")
+        local.record_l2(True)
+
+        stats = local.stats()
+
+        assert stats["l1_hit_rate"] == 50.0
+        assert stats["l2_hit_rate"] == 100.0
+        assert stats["entries"] == 1
+        assert stats["bytes"] == 7
+        assert stats["listening"] is False
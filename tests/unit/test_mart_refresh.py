@@ -0,0 +1,229 @@
+"""Unit tests for the event-driven mart refresh.
+
+Tests cover:
+- dependency tracking from changed metric types to dbt models
+- change set bookkeeping
+- dbt command construction and failure handling
+- keeping claimed changes queued until a refresh succeeds
+- dashboard cache invalidation by pattern
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.core.exceptions import TransformationException
+from src.services.dashboard_service import DashboardService
+from src.services.mart_refresh import (
+    MartRefresher,
+    MetricChangeSet,
+    affected_models,
+    record_metric_changes,
+)
+
+
+@pytest.fixture
+def refresher():
+    # session_factory() and session.begin() are both async context managers
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = MagicMock()
+    return MartRefresher(
+        session_factory=session_factory,
+        project_dir="dbt",
+        profiles_dir="dbt",
+        dbt_executable="dbt",
+        timeout=5,
+    )
+
+
+class TestAffectedModels:
+    """Tests for affected_models."""
+
+    def test_mart_metric_refreshes_downstream(self):
+        names = [model.name for model in affected_models(["revenue"])]
+
+        assert names == [
+            "int_company_metrics_quarterly",
+            "mart_company_performance",
+            "mart_competitive_landscape",
+        ]
+
+    def test_unrelated_metric_refreshes_nothing(self):
+        assert affected_models(["monthly_active_users"]) == []
+
+
+class TestMetricChangeSet:
+    """Tests for MetricChangeSet."""
+
+    def test_from_rows(self):
+        company_a, company_b = uuid4(), uuid4()
+
+        changes = MetricChangeSet.from_rows([
+            {"company_id": company_a, "metric_type": "revenue"},
+            {"company_id": str(company_a), "metric_type": "revenue"},
+            {"company_id": company_a, "metric_type": "eps"},
+            {"company_id": company_b, "metric_type": "monthly_active_users"},
+        ])
+
+        assert len(changes) == 3
+        assert changes.company_ids == {company_a, company_b}
+        assert changes.metric_types == {"revenue", "eps", "monthly_active_users"}
+        assert changes.companies_with({"revenue"}) == {company_a}
+        assert (company_a, "eps") in changes.pairs()
+
+    def test_empty(self):
+        changes = MetricChangeSet()
+
+        assert not changes
+        assert changes.metric_types == set()
+
+    async def test_record_skips_empty_change_set(self):
+        session = AsyncMock()
+
+        assert await record_metric_changes(session, MetricChangeSet()) == 0
+        session.execute.assert_not_called()
+
+
+class TestMartRefresher:
+    """Tests for MartRefresher."""
+
+    def test_dbt_command(self, refresher):
+        company_id = uuid4()
+
+        command = refresher.dbt_command(["mart_company_performance"], [company_id])
+
+        assert command[:2] == ["dbt", "run"]
+        assert command[command.index("--select") + 1] == "mart_company_performance"
+        assert json.loads(command[-1]) == {"refresh_company_ids": [str(company_id)]}
+
+    async def test_run_dbt_failure_raises(self, refresher):
+        refresher.dbt_executable = sys.executable
+        # "python run ..." fails: there is no script named "run"
+        with pytest.raises(TransformationException) as exc_info:
+            await refresher.run_dbt(["mart_company_performance"], [uuid4()])
+
+        assert exc_info.value.kwargs["models"] == ["mart_company_performance"]
+
+    async def test_refresh_runs_only_mart_companies(self, refresher):
+        mart_company, other_company = uuid4(), uuid4()
+        changes = MetricChangeSet()
+        changes.add(mart_company, "revenue")
+        changes.add(other_company, "monthly_active_users")
+        refresher.run_dbt = AsyncMock()
+        refresher.invalidate_caches = AsyncMock(return_value=4)
+
+        result = await refresher.refresh(changes)
+
+        models, company_ids = refresher.run_dbt.call_args.args
+        assert models[0] == "int_company_metrics_quarterly"
+        assert company_ids == {mart_company}
+        assert result.companies == 2
+        assert result.cache_entries_invalidated == 4
+
+    async def test_metric_without_marts_skips_dbt(self, refresher):
+        changes = MetricChangeSet()
+        changes.add(uuid4(), "monthly_active_users")
+        refresher.run_dbt = AsyncMock()
+        refresher.invalidate_caches = AsyncMock(return_value=0)
+
+        result = await refresher.refresh(changes)
+
+        refresher.run_dbt.assert_not_called()
+        refresher.invalidate_caches.assert_awaited_once()
+        assert result.models == []
+
+    async def test_failed_refresh_releases_claim(self, refresher):
+        changes = MetricChangeSet()
+        changes.add(uuid4(), "revenue")
+        claimed_at = datetime.now(timezone.utc)
+        refresher._claim = AsyncMock(return_value=(changes, claimed_at))
+        refresher._release = AsyncMock()
+        refresher._complete = AsyncMock()
+        refresher.refresh = AsyncMock(side_effect=TransformationException("dbt failed"))
+
+        with pytest.raises(TransformationException):
+            await refresher.refresh_pending()
+
+        assert refresher._release.call_args.args[1] == claimed_at
+        refresher._complete.assert_not_called()
+
+    async def test_cancelled_refresh_releases_claim(self, refresher):
+        changes = MetricChangeSet()
+        changes.add(uuid4(), "revenue")
+        refresher._claim = AsyncMock(return_value=(changes, datetime.now(timezone.utc)))
+        refresher._release = AsyncMock()
+        refresher._complete = AsyncMock()
+        refresher.refresh = AsyncMock(side_effect=asyncio.CancelledError)
+
+        with pytest.raises(asyncio.CancelledError):
+            await refresher.refresh_pending()
+
+        refresher._release.assert_awaited_once()
+        refresher._complete.assert_not_called()
+
+    async def test_successful_refresh_deletes_claimed_entries(self, refresher):
+        changes = MetricChangeSet()
+        changes.add(uuid4(), "revenue")
+        claimed_at = datetime.now(timezone.utc)
+        refresher._claim = AsyncMock(return_value=(changes, claimed_at))
+        refresher._release = AsyncMock()
+        refresher._complete = AsyncMock()
+        refresher.refresh = AsyncMock(return_value="result")
+
+        assert await refresher.refresh_pending() == "result"
+
+        assert refresher._complete.call_args.args[1] == claimed_at
+        refresher._release.assert_not_called()
+
+    async def test_claim_takes_unclaimed_and_stale_entries(self, refresher):
+        company_id, claimed_at = uuid4(), datetime.now(timezone.utc)
+        session = AsyncMock()
+        session.execute.return_value = [(company_id, "revenue", claimed_at)]
+
+        changes, claim = await refresher._claim(session)
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE mart_refresh_queue SET claimed_at=now()")
+        assert "claimed_at IS NULL OR mart_refresh_queue.claimed_at <" in sql
+        assert changes.pairs() == [(company_id, "revenue")]
+        assert claim == claimed_at
+
+    async def test_empty_queue_returns_none(self, refresher):
+        refresher._claim = AsyncMock(return_value=(MetricChangeSet(), None))
+        refresher.refresh = AsyncMock()
+
+        assert await refresher.refresh_pending() is None
+        refresher.refresh.assert_not_called()
+
+
+class TestInvalidateMatching:
+    """Tests for DashboardService.invalidate_matching."""
+
+    async def test_deletes_scanned_keys(self):
+        keys = {
+            "dashboard:company_performance:*": ["dashboard:company_performance:all"],
+            "dashboard:market_summary": ["dashboard:market_summary"],
+        }
+
+        async def scan_iter(match):
+            for key in keys[match]:
+                yield key
+
+        cache = AsyncMock()
+        cache.scan_iter = scan_iter
+        cache.delete = AsyncMock(return_value=2)
+        service = DashboardService(AsyncMock())
+        service.cache = cache
+
+        removed = await service.invalidate_matching(*keys)
+
+        assert removed == 2
+        cache.delete.assert_awaited_once_with(
+            "dashboard:company_performance:all", "dashboard:market_summary"
+        )
@@ -0,0 +1,161 @@
+"""Unit tests for the columnar MetricSeries container.
+
+Tests cover:
+- building arrays from query rows, NULL values and timezone-aware dates
+- series boundaries, selection and in-memory growth
+- per-series statistics and latest values for the analysis engine
+"""
+
+import math
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.repositories.metric_series import METRIC_SERIES_COLUMNS, MetricSeries
+
+DUOL_ID = uuid4()
+CHGG_ID = uuid4()
+
+
+def quarter(year: int, month: int) -> datetime:
+    day = 31 if month in (3, 12) else 30
+    return datetime(year, month, day, tzinfo=timezone.utc)
+
+
+def sample_rows():
+    """Rows in query order: (ticker, metric type, date)."""
+    return [
+        (CHGG_ID, "CHGG", "revenue", quarter(2023, 12), 200.0, "USD", None, None),
+        (CHGG_ID, "CHGG", "revenue", quarter(2024, 3), 180.0, "USD", -10.0, -12.5),
+        (DUOL_ID, "DUOL", "gross_margin", quarter(2024, 3), 0.73, "percent", None, None),
+        (DUOL_ID, "DUOL", "revenue", quarter(2023, 9), 100.0, "USD", None, None),
+        (DUOL_ID, "DUOL", "revenue", quarter(2023, 12), 125.0, "USD", 25.0, None),
+        (DUOL_ID, "DUOL", "revenue", quarter(2024, 3), None, "USD", None, None),
+        (DUOL_ID, "DUOL", "revenue", quarter(2024, 6), 150.0, "USD", None, 45.0),
+    ]
+
+
+@pytest.fixture
+def series():
+    return MetricSeries.from_rows(sample_rows())
+
+
+class TestConstruction:
+    """Tests for building a series from rows."""
+
+    def test_column_dtypes(self, series):
+        assert len(series) == 7
+        assert series.value.dtype == np.float64
+        assert series.metric_date.dtype == np.dtype("datetime64[us]")
+        assert series.ticker.dtype == object
+
+    def test_null_values_become_nan(self, series):
+        assert math.isnan(series.value[5])
+        assert math.isnan(series.qoq_growth[0])
+
+    def test_dates_are_normalised_to_utc(self):
+        aware = datetime(2024, 3, 31, 20, tzinfo=timezone.utc)
+        row = (DUOL_ID, "DUOL", "revenue", aware, 1.0, "USD", None, None)
+
+        result = MetricSeries.from_rows([row])
+
+        assert result.metric_date[0] == np.datetime64("2024-03-31T20:00:00")
+
+    def test_empty(self):
+        empty = MetricSeries.empty()
+
+        assert len(empty) == 0
+        assert empty.statistics() == {}
+        assert empty.latest() == {}
+        assert list(empty.to_dataframe().columns) == list(METRIC_SERIES_COLUMNS)
+
+
+class TestGrouping:
+    """Tests for series boundaries and selection."""
+
+    def test_groups(self, series):
+        groups = [(ticker, metric_type, s.start, s.stop) for ticker, metric_type, s in series.groups()]
+
+        assert groups == [
+            ("CHGG", "revenue", 0, 2),
+            ("DUOL", "gross_margin", 2, 3),
+            ("DUOL", "revenue", 3, 7),
+        ]
+
+    def test_select(self, series):
+        revenue = series.select(ticker="duol", metric_type="revenue")
+
+        assert len(revenue) == 4
+        assert set(revenue.company_id) == {DUOL_ID}
+
+    def test_growth_stays_within_series(self, series):
+        growth = series.growth()
+
+        # First row of every series has no base
+        assert np.isnan(growth[[0, 2, 3]]).all()
+        assert growth[1] == pytest.approx(-10.0)
+        assert growth[4] == pytest.approx(25.0)
+        # A missing value propagates as NaN
+        assert np.isnan(growth[5]) and np.isnan(growth[6])
+
+    def test_growth_longer_than_series(self, series):
+        growth = series.growth(periods=3)
+
+        assert growth[6] == pytest.approx(50.0)
+        assert np.isnan(np.delete(growth, 6)).all()
+
+
+class TestReductions:
+    """Tests for statistics and latest values."""
+
+    def test_statistics(self, series):
+        stats = series.statistics()
+
+        duol = stats[("DUOL", "revenue")]
+        assert duol["count"] == 3
+        assert duol["min"] == 100.0
+        assert duol["max"] == 150.0
+        assert duol["avg"] == pytest.approx(125.0)
+        assert duol["std"] == pytest.approx(np.std([100.0, 125.0, 150.0]))
+        assert duol["oldest"] == 100.0
+        assert duol["latest"] == 150.0
+
+        assert stats[("CHGG", "revenue")]["avg"] == pytest.approx(190.0)
+        assert stats[("DUOL", "gross_margin")]["count"] == 1
+
+    def test_statistics_std_of_large_values(self):
+        values = [1e9 + 0.1, 1e9 + 0.2, 1e9 + 0.3]
+        rows = [
+            (DUOL_ID, "DUOL", "revenue", quarter(2023, month), value, "USD", None, None)
+            for month, value in zip((3, 6, 9), values)
+        ]
+
+        stats = MetricSeries.from_rows(rows).statistics()
+
+        assert stats[("DUOL", "revenue")]["std"] == pytest.approx(np.std(values), rel=1e-6)
+
+    def test_statistics_all_missing(self):
+        row = (DUOL_ID, "DUOL", "revenue", quarter(2024, 3), None, "USD", None, None)
+
+        stats = MetricSeries.from_rows([row]).statistics()
+
+        assert stats[("DUOL", "revenue")] == {
+            "count": 0, "min": None, "max": None, "avg": None,
+            "std": None, "latest": None, "oldest": None,
+        }
+
+    def test_latest(self, series):
+        latest = series.latest()
+
+        assert latest["CHGG"] == {
+            "revenue": 180.0,
+            "revenue_growth_qoq": -10.0,
+            "revenue_growth_yoy": -12.5,
+        }
+        assert latest["DUOL"] == {
+            "gross_margin": 0.73,
+            "revenue": 150.0,
+            "revenue_growth_yoy": 45.0,
+        }
@@ -0,0 +1,140 @@
+"""Unit tests for the streaming metrics export encoders.
+
+Tests cover:
+- NDJSON rows, datetime/UUID encoding and empty exports
+- Arrow IPC streams and Parquet files decoding back to the input rows
+- long and wide (pivoted) column schemas
+- format availability without pyarrow
+"""
+
+import io
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.services import metrics_export
+from src.services.metrics_export import ExportFormat, encode_metrics, encode_ndjson
+
+LONG_COLUMNS = ["ticker", "company_id", "metric_date", "period_type", "metric_type", "value", "unit"]
+WIDE_COLUMNS = ["ticker", "company_id", "metric_date", "period_type", "revenue", "gross_margin"]
+
+COMPANY_ID = uuid4()
+Q1 = datetime(2024, 3, 31, tzinfo=timezone.utc)
+Q2 = datetime(2024, 6, 30, tzinfo=timezone.utc)
+
+
+async def chunks_of(columns, *chunks):
+    """Async stand-in for MetricsRepository.stream_metrics."""
+    for rows in chunks:
+        yield columns, rows
+
+
+async def collect(stream) -> bytes:
+    return b"".join([part async for part in stream])
+
+
+def long_rows():
+    return [
+        ("DUOL", COMPANY_ID, Q1, "quarterly", "revenue", 150.0, "USD"),
+        ("DUOL", COMPANY_ID, Q2, "quarterly", "revenue", 170.0, "USD"),
+    ]
+
+
+class TestNDJSON:
+    """Test NDJSON encoding."""
+
+    @pytest.mark.asyncio
+    async def test_one_object_per_row(self):
+        """Test each row becomes one JSON line across chunks."""
+        rows = long_rows()
+        data = await collect(encode_ndjson(chunks_of(LONG_COLUMNS, rows[:1], rows[1:])))
+
+        lines = data.decode().splitlines()
+        assert len(lines) == 2
+        first = json.loads(lines[0])
+        assert first["ticker"] == "DUOL"
+        assert first["company_id"] == str(COMPANY_ID)
+        assert datetime.fromisoformat(first["metric_date"]) == Q1
+        assert first["value"] == 150.0
+
+    @pytest.mark.asyncio
+    async def test_empty_export(self):
+        """Test an empty result produces an empty body."""
+        data = await collect(encode_ndjson(chunks_of(LONG_COLUMNS, [])))
+
+        assert data == b""
+
+
+class TestArrowFormats:
+    """Test Arrow IPC and Parquet encoding."""
+
+    @pytest.mark.asyncio
+    async def test_arrow_stream_round_trip(self):
+        """Test record batches decode back to the streamed rows."""
+        pa = pytest.importorskip("pyarrow")
+        rows = long_rows()
+
+        data = await collect(
+            encode_metrics(chunks_of(LONG_COLUMNS, rows[:1], rows[1:]), ExportFormat.ARROW)
+        )
+
+        table = pa.ipc.open_stream(data).read_all()
+        assert table.column_names == LONG_COLUMNS
+        assert table.num_rows == 2
+        assert table.column("value").to_pylist() == [150.0, 170.0]
+        assert table.column("company_id").to_pylist() == [str(COMPANY_ID)] * 2
+
+    @pytest.mark.asyncio
+    async def test_parquet_wide_round_trip(self):
+        """Test pivoted rows become one float column per metric type."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        rows = [
+            ("DUOL", COMPANY_ID, Q1, "quarterly", 150.0, 0.72),
+            ("DUOL", COMPANY_ID, Q2, "quarterly", 170.0, None),
+        ]
+
+        data = await collect(
+            encode_metrics(chunks_of(WIDE_COLUMNS, rows), ExportFormat.PARQUET, pivot=True)
+        )
+
+        table = pq.read_table(io.BytesIO(data))
+        assert table.schema.field("gross_margin").type == pa.float64()
+        assert table.column("gross_margin").to_pylist() == [0.72, None]
+        assert table.column("metric_date").to_pylist()[1] == Q2
+
+    @pytest.mark.asyncio
+    async def test_wide_metric_named_like_key_column(self):
+        """Test a pivoted metric named unit or period_type stays a float column."""
+        pa = pytest.importorskip("pyarrow")
+        columns = WIDE_COLUMNS[:4] + ["unit", "metric_type"]
+        rows = [("DUOL", COMPANY_ID, Q1, "quarterly", 1.5, 2.5)]
+
+        data = await collect(encode_metrics(chunks_of(columns, rows), ExportFormat.ARROW, pivot=True))
+
+        table = pa.ipc.open_stream(data).read_all()
+        assert table.schema.field("unit").type == pa.float64()
+        assert table.column("metric_type").to_pylist() == [2.5]
+        assert table.column("company_id").to_pylist() == [str(COMPANY_ID)]
+
+    @pytest.mark.asyncio
+    async def test_empty_arrow_stream_keeps_schema(self):
+        """Test an empty export is still a readable stream with columns."""
+        pa = pytest.importorskip("pyarrow")
+
+        data = await collect(encode_metrics(chunks_of(WIDE_COLUMNS, []), ExportFormat.ARROW))
+
+        table = pa.ipc.open_stream(data).read_all()
+        assert table.column_names == WIDE_COLUMNS
+        assert table.num_rows == 0
+
+    def test_requires_pyarrow(self, monkeypatch):
+        """Test binary formats are refused without pyarrow."""
+        monkeypatch.setattr(metrics_export, "PYARROW_AVAILABLE", False)
+
+        assert ExportFormat.NDJSON.available
+        assert not ExportFormat.PARQUET.available
+        with pytest.raises(RuntimeError):
+            encode_metrics(chunks_of(LONG_COLUMNS, []), ExportFormat.PARQUET)
@@ -0,0 +1,120 @@
+"""Unit tests for EdTech metric extraction.
+
+Tests cover:
+- MetricScanEngine: equivalence with per-pattern finditer scans
+- extract_metrics: values, scaling, periods, confidence, deduplication
+"""
+
+import random
+
+import pytest
+
+from src.processing.metrics_extractor import (
+    METRIC_RULE_SPECS,
+    EdTechMetricsExtractor,
+    ExtractedMetric,
+)
+
+
+def legacy_extract_metrics(extractor: EdTechMetricsExtractor, text: str):
+    """Reference implementation: every pattern's finditer over the full text."""
+    metrics = []
+    for metric_type, patterns in extractor.metric_patterns.items():
+        for pattern, unit in patterns:
+            for match in pattern.finditer(text):
+                value = float(match.group(1).replace(",", ""))
+                if "million" in match.group(0).lower() or " M" in match.group(0):
+                    value *= 1e6
+                elif "billion" in match.group(0).lower() or " B" in match.group(0):
+                    value *= 1e9
+                start = max(0, match.start() - 100)
+                end = min(len(text), match.end() + 100)
+                context = text[start:end].strip()
+                metrics.append(ExtractedMetric(
+                    metric_type=metric_type,
+                    value=value,
+                    unit=unit,
+                    context=context,
+                    confidence=extractor._calculate_confidence(metric_type, context),
+                    period=extractor._extract_period(context),
+                ))
+    return extractor._deduplicate_metrics(metrics)
+
+
+SAMPLE_TEXT = """
+Duolingo reached 83.1 million monthly active users in Q4 2023, and MAUs of 88 million
+by March 2024. ARPU of $8.50 improved while CAC: $45 held steady. Net revenue retention
+of 115% and NRR 112 % were reported for fiscal year 2023. Course completion rate of 62%
+and a 58% completion rate in the prior year. The platform has 6.6 million subscribers,
+with a subscriber base of 7,000,000. Revenue of $531.1 million, or $1.2 billion in revenue
+for FY 2024. Gross margin: 73.2% versus 71% gross margin, churn rate of 4.5% excluding
+promotions and 5% churn. LTV of $1,250 and lifetime value of 900. The company said AI
+drove 12 MAUs in Mauritius. Average revenue per user: 9.75. Customer acquisition cost 30.
+"""
+
+FRAGMENTS = [
+    "revenue", "Revenue of $", "in revenue", " million", " M", " B", "billion", "MAU", "MAUs",
+    "MAUs of ", "monthly active users", "subscriber", "subscribers", "subscriber base ",
+    "churn", "churn rate", "% ", "%", "gross margin", "completion rate", "ARPU ", "LTV: ",
+    "lifetime value of ", "NRR ", "CAC", "net revenue retention ", "average revenue per user",
+    "customer acquisition cost ", " ", "  ", " ", ",", ".", "$", "Q3 2022", "FY 2021",
+    "not ", "in ", "12", "3,400", "7.5", "1,000,000", "0", "\n",
+]
+
+
+class TestScanEquivalence:
+    """The anchored engine must match per-pattern scans exactly."""
+
+    @pytest.fixture
+    def extractor(self):
+        return EdTechMetricsExtractor()
+
+    def test_sample_text(self, extractor):
+        assert extractor.extract_metrics(SAMPLE_TEXT) == legacy_extract_metrics(extractor, SAMPLE_TEXT)
+
+    def test_randomized_text(self, extractor):
+        rng = random.Random(1234)
+        for _ in range(300):
+            text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 60)))
+            assert extractor.extract_metrics(text) == legacy_extract_metrics(extractor, text), text
+
+    def test_case_fold_fallback(self, extractor):
+        # re.IGNORECASE matches these to "s"/"i"; str.lower() does not
+        text = "5 million \u017fubscribers and churn rate of 3% in F\u0130SCAL 2023, \u0131n"
+        assert extractor.extract_metrics(text) == legacy_extract_metrics(extractor, text)
+
+    def test_every_rule_has_matching_anchor(self):
+        for metric_type, regex, _, anchor, anchored_at, tail in METRIC_RULE_SPECS:
+            assert anchored_at in ("start", "end")
+            assert anchor == anchor.lower()
+            assert (tail is None) == (anchored_at == "start"), metric_type
+
+
+class TestExtractMetrics:
+    """Behavioral tests for extract_metrics."""
+
+    @pytest.fixture
+    def extractor(self):
+        return EdTechMetricsExtractor()
+
+    def test_scales_millions_and_billions(self, extractor):
+        metrics = extractor.extract_metrics("Revenue of $2.5 billion and 40 million subscribers.")
+        values = {m.metric_type: m.value for m in metrics}
+
+        assert values["revenue"] == pytest.approx(2.5e9)
+        assert values["subscriber_count"] == pytest.approx(40e6)
+
+    def test_period_and_confidence(self, extractor):
+        metrics = extractor.extract_metrics("In Q2 2024 ARPU of $7.25 was reported.")
+
+        arpu = next(m for m in metrics if m.metric_type == "average_revenue_per_user")
+        assert arpu.period == "Q2 2024"
+        assert arpu.unit == "USD"
+        assert arpu.confidence == pytest.approx(0.75)
+
+    def test_no_metrics(self, extractor):
+        assert extractor.extract_metrics("Nothing to see here.") == []
+
+    def test_duplicates_removed(self, extractor):
+        metrics = extractor.extract_metrics("5% churn. Later, 5% churn again.")
+        assert len([m for m in metrics if m.metric_type == "churn_rate"]) == 1
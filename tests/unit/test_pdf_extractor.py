@@ -0,0 +1,134 @@
+"""Unit tests for page-parallel PDF extraction.
+
+Tests cover:
+- serial and process-pool extraction producing identical text
+- page order, laziness and early termination of the page stream
+- metadata read from the same open file, or on its own
+- pypdf fallback and unreadable files
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.processing.pdf_extractor import PDFExtractor, PDFPage, extract_page_range
+
+
+def make_pdf(path, pages, title="Annual Report"):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    pages_id = 2 * len(pages) + 2
+    page_ids = []
+    for content_id in range(2, len(pages) + 2):
+        objects.append(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R"
+            b" /Resources << /Font << /F1 1 0 R >> >> >>" % (pages_id, content_id)
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects.append(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(pages)))
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+    objects.append(b"<< /Title (%s) >>" % title.encode())
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, len(objects) - 1, len(objects), xref
+    )
+    path.write_bytes(bytes(out))
+    return str(path)
+
+
+@pytest.fixture
+def report_pdf(tmp_path):
+    return make_pdf(tmp_path / "report.pdf", [f"Page {i} revenue of {i} million" for i in range(40)])
+
+
+class TestPDFExtractor:
+    """Tests for PDFExtractor."""
+
+    def test_serial_extraction(self, report_pdf):
+        text, metadata = PDFExtractor(max_workers=1).extract(report_pdf)
+
+        assert text.splitlines() == [f"Page {i} revenue of {i} million" for i in range(40)]
+        assert text.endswith("\n")
+        assert metadata["title"] == "Annual Report"
+        assert metadata["num_pages"] == 40
+
+    def test_parallel_matches_serial(self, report_pdf):
+        serial = PDFExtractor(max_workers=1).extract(report_pdf)
+        parallel = PDFExtractor(max_workers=3, pages_per_task=7, min_parallel_pages=10).extract(report_pdf)
+
+        assert parallel == serial
+
+    def test_parallel_pages_in_order(self, report_pdf):
+        extractor = PDFExtractor(max_workers=2, pages_per_task=5, min_parallel_pages=10)
+
+        numbers = [page.page_number for page in extractor.iter_pages(report_pdf)]
+
+        assert numbers == list(range(40))
+
+    def test_open_is_lazy_and_stoppable(self, report_pdf):
+        extractor = PDFExtractor(max_workers=1)
+
+        with patch("src.processing.pdf_extractor.pdfplumber.open") as plumber_open:
+            metadata, pages = extractor.open(report_pdf)
+            assert metadata["num_pages"] == 40
+            plumber_open.assert_not_called()
+
+        pages = extractor.iter_pages(report_pdf)
+        assert next(pages) == PDFPage(0, "Page 0 revenue of 0 million")
+        pages.close()
+
+    def test_read_metadata_closes_file(self, report_pdf, tmp_path):
+        handles = []
+
+        def tracking_open(*args, **kwargs):
+            handles.append(open(*args, **kwargs))
+            return handles[-1]
+
+        with patch("src.processing.pdf_extractor.open", tracking_open, create=True):
+            metadata = PDFExtractor(max_workers=1).read_metadata(report_pdf)
+
+        assert handles and all(handle.closed for handle in handles)
+        assert metadata["title"] == "Annual Report"
+        assert metadata["num_pages"] == 40
+
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+        assert PDFExtractor().read_metadata(broken) == {}
+
+    def test_small_documents_read_serially(self, tmp_path):
+        path = make_pdf(tmp_path / "short.pdf", ["Only page"])
+
+        with patch("src.processing.pdf_extractor.ProcessPoolExecutor") as pool:
+            text, _ = PDFExtractor(max_workers=4).extract(path)
+
+        pool.assert_not_called()
+        assert text == "Only page\n"
+
+    def test_pypdf_fallback(self, report_pdf):
+        with patch("src.processing.pdf_extractor.pdfplumber.open", side_effect=ValueError("bad")):
+            text, metadata = PDFExtractor(max_workers=1).extract(report_pdf)
+            pages = extract_page_range(report_pdf, 3, 5)
+
+        assert "Page 39 revenue of 39 million" in text
+        assert metadata["num_pages"] == 40
+        assert [number for number, _ in pages] == [3, 4]
+
+    def test_unreadable_file_raises(self, tmp_path):
+        path = tmp_path / "broken.pdf"
+        path.write_bytes(b"not a pdf")
+
+        with pytest.raises(Exception):
+            PDFExtractor(max_workers=1).extract(str(path))
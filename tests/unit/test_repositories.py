@@ -18,6 +18,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Company, FinancialMetric
+from src.dto.pagination import InvalidCursorError, decode_cursor, encode_cursor
 from src.repositories import (
     BaseRepository,
     CompanyRepository,
@@ -180,6 +181,82 @@ class TestBaseRepository:
         assert results[0] == sample_company
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_all_with_filters_descending(self, mock_session, sample_company):
+        """Test filtered, descending listing skips None filters."""
+        # Setup
+        repo = CompanyRepository(mock_session)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_company]
+        mock_session.execute.return_value = mock_result
+
+        # Execute
+        results = await repo.get_all(
+            limit=10, order_by="ticker", descending=True, category="k12", sector=None
+        )
+
+        # Verify
+        assert results == [sample_company]
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "companies.category = " in sql
+        assert "companies.sector" not in sql.split("WHERE", 1)[1]
+        assert "ORDER BY companies.ticker DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_cursor_uses_keyset(self, mock_session, sample_metric):
+        """Test a cursor replaces OFFSET with a (sort key, id) range predicate."""
+        # Setup
+        repo = MetricsRepository(mock_session)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_metric]
+        mock_session.execute.return_value = mock_result
+        cursor = encode_cursor("metric_date", sample_metric.metric_date, sample_metric.id)
+
+        # Execute
+        await repo.get_all(
+            limit=10, offset=500, order_by="metric_date", descending=True, cursor=cursor
+        )
+
+        # Verify
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "(financial_metrics.metric_date, financial_metrics.id) <" in sql
+        assert "ORDER BY financial_metrics.metric_date DESC, financial_metrics.id DESC" in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_foreign_cursor(self, mock_session):
+        """Test a cursor issued for another ordering is rejected."""
+        repo = MetricsRepository(mock_session)
+        cursor = encode_cursor("value", 1.0, 1)
+
+        with pytest.raises(InvalidCursorError):
+            await repo.get_all(limit=10, order_by="metric_date", cursor=cursor)
+
+    @pytest.mark.asyncio
+    async def test_get_page_returns_next_cursor(self, mock_session, sample_metric):
+        """Test get_page fetches one extra row to detect the next page."""
+        # Setup
+        repo = MetricsRepository(mock_session)
+        newer = FinancialMetric(
+            id=2,
+            company_id=sample_metric.company_id,
+            metric_date=sample_metric.metric_date + timedelta(days=91),
+            period_type="quarterly",
+            metric_type="revenue",
+            value=1.0,
+        )
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [newer, sample_metric]
+        mock_session.execute.return_value = mock_result
+
+        # Execute
+        records, cursor = await repo.get_page(limit=1, order_by="metric_date", descending=True)
+
+        # Verify
+        assert records == [newer]
+        assert decode_cursor(cursor, "metric_date") == (newer.metric_date.isoformat(), 2)
+        assert "LIMIT" in str(mock_session.execute.call_args[0][0])
+
     @pytest.mark.asyncio
     async def test_update_success(self, mock_session, sample_company):
         """Test successful record update."""
@@ -543,6 +620,45 @@ class TestCompanyRepository:
         # Verify
         assert tickers == ["DUOL", "CHGG", "COUR"]
 
+    @pytest.mark.asyncio
+    async def test_find_by_tickers(self, mock_session, sample_company):
+        """Test fetching several companies by ticker in one query."""
+        # Setup
+        repo = CompanyRepository(mock_session)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_company]
+        mock_session.execute.return_value = mock_result
+
+        # Execute
+        results = await repo.find_by_tickers(["DUOL", "MISSING"])
+
+        # Verify
+        assert results == [sample_company]
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_by_tickers_empty(self, mock_session):
+        """Test an empty ticker list does not hit the database."""
+        repo = CompanyRepository(mock_session)
+
+        assert await repo.find_by_tickers([]) == []
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ticker_or_cik_exists(self, mock_session):
+        """Test duplicate detection by ticker or CIK."""
+        # Setup
+        repo = CompanyRepository(mock_session)
+        mock_result = MagicMock()
+        mock_result.first.return_value = (uuid4(),)
+        mock_session.execute.return_value = mock_result
+
+        # Execute / Verify
+        assert await repo.ticker_or_cik_exists("DUOL", "0001364612") is True
+
+        mock_result.first.return_value = None
+        assert await repo.ticker_or_cik_exists("NEW") is False
+
     @pytest.mark.asyncio
     async def test_count_by_category(self, mock_session, sample_company):
         """Test counting companies by category."""
@@ -665,6 +781,26 @@ class TestMetricsRepository:
         # Verify
         assert result == sample_metric
 
+    @pytest.mark.asyncio
+    async def test_get_latest_values(self, mock_session):
+        """Test latest value per metric type comes from a single query."""
+        # Setup
+        repo = MetricsRepository(mock_session)
+        rows = [
+            MagicMock(metric_type="revenue", value=50000000.0),
+            MagicMock(metric_type="gross_margin", value=0.72),
+        ]
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter(rows)
+        mock_session.execute.return_value = mock_result
+
+        # Execute
+        latest = await repo.get_latest_values(uuid4())
+
+        # Verify
+        assert latest == {"revenue": 50000000.0, "gross_margin": 0.72}
+        mock_session.execute.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_all_metrics_for_company(self, mock_session, sample_metric):
         """Test getting all metrics for a company."""
@@ -766,6 +902,142 @@ class TestMetricsRepository:
         assert count == 2
         mock_session.flush.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_metrics_single_statement_per_batch(self, mock_session):
+        """Test bulk upsert sends multi-row statements, not one per metric."""
+        # Setup
+        repo = MetricsRepository(mock_session)
+        company_id = uuid4()
+        metrics_data = [
+            {
+                "company_id": company_id,
+                "metric_type": "revenue",
+                "metric_date": datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(days=i),
+                "period_type": "quarterly",
+                "value": float(i),
+            }
+            for i in range(250)
+        ]
+
+        # Execute
+        count = await repo.bulk_upsert_metrics(metrics_data, batch_size=100)
+
+        # Verify
+        assert count == 250
+        assert mock_session.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_metrics_dedupes_conflict_keys(self, mock_session):
+        """Test rows sharing a conflict key collapse to the last occurrence."""
+        # Setup
+        repo = MetricsRepository(mock_session)
+        company_id = uuid4()
+        metric_date = datetime(2024, 3, 31, tzinfo=timezone.utc)
+        metrics_data = [
+            {
+                "company_id": company_id,
+                "metric_type": "revenue",
+                "metric_date": metric_date,
+                "period_type": "quarterly",
+                "value": value,
+            }
+            for value in (1.0, 2.0, 3.0)
+        ]
+
+        # Execute
+        count = await repo.bulk_upsert_metrics(metrics_data)
+
+        # Verify
+        assert count == 1
+        stmt = mock_session.execute.call_args[0][0]
+        assert stmt.compile().params["value_m0"] == 3.0
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_metrics_respects_bind_param_limit(self):
+        """Test batches never exceed PostgreSQL's bind parameter limit."""
+        from src.repositories.metrics_repository import MAX_BIND_PARAMS
+
+        rows = [
+            {
+                "company_id": uuid4(),
+                "metric_type": "revenue",
+                "metric_date": datetime(2024, 3, 31, tzinfo=timezone.utc),
+                "period_type": "quarterly",
+                "value": 1.0,
+                "unit": "USD",
+            }
+            for _ in range(12000)
+        ]
+
+        batches = list(MetricsRepository._iter_upsert_batches(rows, batch_size=10000))
+
+        assert sum(len(batch) for batch in batches) == 12000
+        assert all(len(batch) * 6 <= MAX_BIND_PARAMS for batch in batches)
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_metrics_returning(self, mock_session, sample_metric):
+        """Test bulk upsert returns rows via RETURNING without re-selecting."""
+        # Setup
+        repo = MetricsRepository(mock_session)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_metric]
+        mock_session.execute.return_value = mock_result
+
+        # Execute
+        metrics = await repo.bulk_upsert_metrics_returning([{
+            "company_id": sample_metric.company_id,
+            "metric_type": sample_metric.metric_type,
+            "metric_date": sample_metric.metric_date,
+            "period_type": sample_metric.period_type,
+            "value": sample_metric.value,
+        }])
+
+        # Verify
+        assert metrics == [sample_metric]
+        assert mock_session.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_metrics_empty(self, mock_session):
+        """Test bulk upsert with no rows is a no-op."""
+        repo = MetricsRepository(mock_session)
+
+        count = await repo.bulk_upsert_metrics([])
+
+        assert count == 0
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_time_series_batch(self, mock_session):
+        """Test batched time series come back columnar from one query."""
+        repo = MetricsRepository(mock_session)
+        duol_id, chgg_id = uuid4(), uuid4()
+        q4 = datetime(2023, 12, 31, tzinfo=timezone.utc)
+        q1 = datetime(2024, 3, 31, tzinfo=timezone.utc)
+
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter([
+            (chgg_id, "CHGG", "revenue", q4, 200.0, "USD", None, None),
+            (chgg_id, "CHGG", "revenue", q1, 180.0, "USD", -10.0, -12.5),
+            (duol_id, "DUOL", "revenue", q4, 100.0, "USD", 8.0, 40.0),
+            (duol_id, "DUOL", "revenue", q1, 125.0, "USD", 25.0, 45.0),
+        ])
+        mock_session.execute.return_value = mock_result
+
+        series = await repo.get_time_series_batch(
+            tickers=["DUOL", "CHGG"],
+            metric_types=["revenue"],
+            periods=2,
+        )
+
+        assert mock_session.execute.call_count == 1
+        assert len(series) == 4
+        assert series.statistics()[("DUOL", "revenue")]["avg"] == pytest.approx(112.5)
+        assert series.latest()["CHGG"]["revenue_growth_yoy"] == pytest.approx(-12.5)
+
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "lag(" in sql
+        assert "row_number()" in sql
+
     @pytest.mark.asyncio
     async def test_calculate_growth_rate(self, mock_session):
         """Test calculating growth rate."""
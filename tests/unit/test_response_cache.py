@@ -0,0 +1,436 @@
+"""Unit tests for the Redis response cache.
+
+Tests cover:
+- serializers (orjson, msgpack, json) and unsupported values
+- hits, misses and request coalescing of concurrent misses
+- probabilistic early refresh
+- tag- and pattern-based invalidation
+- cache_key_wrapper keys and tag templates
+- degrading to uncached calls when Redis fails
+- the process-local L1 in front of Redis
+"""
+
+import asyncio
+import fnmatch
+import time
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core import cache as cache_module
+from src.core.cache import CacheSerializer, ResponseCache, cache_key_wrapper
+from src.core.local_cache import LocalCache
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+        self.gets = 0
+        self.fail = False
+        self.published = []
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("Redis connection failed")
+
+    async def get(self, key):
+        self._check()
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def delete(self, *keys):
+        self._check()
+        removed = 0
+        for key in keys:
+            key = key.decode() if isinstance(key, bytes) else key
+            removed += int(self.data.pop(key, None) is not None or self.sets.pop(key, None) is not None)
+        return removed
+
+    async def zadd(self, key, mapping):
+        members = self.sets.setdefault(key, {})
+        for member, score in mapping.items():
+            members[member.encode()] = score
+        return len(mapping)
+
+    async def zremrangebyscore(self, key, low, high):
+        members = self.sets.get(key, {})
+        expired = [m for m, score in members.items() if float(low) <= score <= float(high)]
+        for member in expired:
+            del members[member]
+        return len(expired)
+
+    async def zrange(self, key, start, end):
+        members = self.sets.get(key, {})
+        return sorted(members, key=members.get)
+
+    async def eval(self, script, numkeys, key, token):
+        # Compare-and-delete, as in cache._RELEASE_LOCK
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        self._check()
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    return ResponseCache(redis_client, beta=0.0, lock_timeout=1.0)
+
+
+class TestCacheSerializer:
+    """Tests for CacheSerializer."""
+
+    @pytest.mark.parametrize("name", ["orjson", "msgpack", "json"])
+    def test_round_trip(self, name):
+        serializer = CacheSerializer(name)
+        value = {"ticker": "DUOL", "values": [1, 2.5, None], "nested": {"ok": True}}
+
+        assert serializer.loads(serializer.dumps(value)) == value
+
+    @pytest.mark.parametrize("name", ["orjson", "msgpack", "json"])
+    def test_common_types_encoded(self, name):
+        serializer = CacheSerializer(name)
+        value = [UUID(int=1), date(2024, 3, 15)]
+
+        assert serializer.loads(serializer.dumps(value)) == [str(UUID(int=1)), "2024-03-15"]
+
+    def test_unsupported_type_rejected(self):
+        with pytest.raises(TypeError):
+            CacheSerializer("orjson").dumps(object())
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    async def test_miss_then_hit(self, cache):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"value": 42}
+
+        assert await cache.get_or_compute("k", compute, ttl=60) == {"value": 42}
+        assert await cache.get_or_compute("k", compute, ttl=60) == {"value": 42}
+
+        assert len(calls) == 1
+        assert cache.counters["misses"] == 1
+        assert cache.counters["hits"] == 1
+
+    async def test_concurrent_misses_coalesced(self, cache):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return [1, 2, 3]
+
+        results = await asyncio.gather(*(cache.get_or_compute("hot", compute, ttl=60) for _ in range(20)))
+
+        assert results == [[1, 2, 3]] * 20
+        assert len(calls) == 1
+        assert cache.counters["coalesced"] == 19
+
+    async def test_waits_for_other_process(self, cache, redis_client):
+        # Another worker holds the lock and publishes the value shortly
+        redis_client.data["corporate_intel:lock:k"] = b"1"
+
+        async def publish():
+            await asyncio.sleep(0.05)
+            await cache.set("k", "from-other-worker", ttl=60)
+            del redis_client.data["corporate_intel:lock:k"]
+
+        async def compute():
+            return "computed-here"
+
+        _, result = await asyncio.gather(publish(), cache.get_or_compute("k", compute, ttl=60))
+
+        assert result == "from-other-worker"
+        assert cache.counters["coalesced"] == 1
+
+    async def test_failure_propagates_to_waiters(self, cache):
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("db down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("k", compute, ttl=60) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert "k" not in cache._inflight
+
+    async def test_early_refresh_near_expiry(self, redis_client):
+        cache = ResponseCache(redis_client, beta=1.0)
+        await cache.set("k", "old", ttl=60, compute_seconds=1.0)
+
+        async def compute():
+            return "new"
+
+        # Far from expiry: served from cache
+        assert await cache.get_or_compute("k", compute, ttl=60) == "old"
+
+        # Within the compute time of expiry the refresh becomes near-certain
+        payload = cache.serializer.dumps(["old", 1e6, time.time() + 1])
+        redis_client.data["corporate_intel:k"] = payload
+        assert await cache.get_or_compute("k", compute, ttl=60) == "new"
+        assert cache.counters["early_refreshes"] == 1
+
+    async def test_tag_invalidation(self, cache, redis_client):
+        await cache.set("company:a", 1, ttl=60, tags=["company:a", "companies"])
+        await cache.set("company:b", 2, ttl=60, tags=["company:b", "companies"])
+        await cache.set("filings:x", 3, ttl=60, tags=["filings"])
+
+        assert await cache.invalidate_tags("company:a") == 1
+        assert await cache.get("company:a") is None
+        assert await cache.get("company:b") == 2
+
+        assert await cache.invalidate_tags("companies") == 1
+        assert await cache.get("company:b") is None
+        assert await cache.get("filings:x") == 3
+
+    async def test_expired_tag_members_pruned(self, cache, redis_client):
+        await cache.set("old", 1, ttl=1, tags=["companies"])
+        redis_client.sets["corporate_intel:tags:companies"][b"corporate_intel:old"] = time.time() - 1
+
+        await cache.set("new", 2, ttl=60, tags=["companies"])
+
+        assert list(redis_client.sets["corporate_intel:tags:companies"]) == [b"corporate_intel:new"]
+
+    async def test_lock_released_only_by_holder(self, cache, redis_client):
+        async def compute():
+            # Our lock expired and another worker took it meanwhile
+            redis_client.data["corporate_intel:lock:k"] = "other-worker"
+            return "value"
+
+        assert await cache.get_or_compute("k", compute, ttl=60) == "value"
+        assert redis_client.data["corporate_intel:lock:k"] == "other-worker"
+
+    async def test_lock_released_after_compute(self, cache, redis_client):
+        async def compute():
+            assert "corporate_intel:lock:k" in redis_client.data
+            return "value"
+
+        await cache.get_or_compute("k", compute, ttl=60)
+
+        assert "corporate_intel:lock:k" not in redis_client.data
+
+    async def test_redis_failure_falls_back_to_compute(self, cache, redis_client):
+        redis_client.fail = True
+
+        async def compute():
+            return "fresh"
+
+        assert await cache.get_or_compute("k", compute, ttl=60) == "fresh"
+        assert cache.counters["errors"] >= 1
+
+        # Redis is bypassed for a while instead of retried on every request
+        gets = redis_client.gets
+        assert await cache.get_or_compute("k", compute, ttl=60) == "fresh"
+        assert redis_client.gets == gets
+
+    async def test_uncacheable_value_returned(self, cache):
+        sentinel = object()
+
+        async def compute():
+            return sentinel
+
+        assert await cache.get_or_compute("k", compute, ttl=60) is sentinel
+        assert await cache.get("k") is None
+
+    def test_stats(self, cache):
+        stats = cache.stats()
+        assert stats["hit_rate"] == 0.0
+        assert stats["serializer"] == "orjson"
+
+
+class TestLocalTier:
+    """Tests for ResponseCache with a process-local L1."""
+
+    @pytest.fixture
+    def local(self):
+        return LocalCache(max_entries=10, ttl=60.0)
+
+    @pytest.fixture
+    def cache(self, redis_client, local):
+        return ResponseCache(redis_client, beta=0.0, lock_timeout=1.0, local=local)
+
+    async def test_hits_served_without_redis(self, cache, redis_client, local):
+        await cache.set("k", {"v": 1}, ttl=60)
+        gets = redis_client.gets
+
+        assert await cache.get("k") == {"v": 1}
+        assert redis_client.gets == gets
+        assert local.counters["l1_hits"] == 1
+
+    async def test_l2_hit_fills_l1(self, cache, redis_client, local):
+        await cache.set("k", [1, 2], ttl=60)
+        local.clear()
+
+        assert await cache.get("k") == [1, 2]
+        assert await cache.get("k") == [1, 2]
+        assert redis_client.gets == 1
+        assert local.counters["l2_hits"] == 1
+
+    async def test_l1_stores_decoded_value(self, cache):
+        await cache.set("k", {"day": date(2024, 3, 15)}, ttl=60)
+
+        assert await cache.get("k") == {"day": "2024-03-15"}
+
+    async def test_invalidation_reaches_l1_and_is_published(self, cache, redis_client, local):
+        await cache.set("company:a", 1, ttl=60, tags=["companies"])
+
+        await cache.invalidate_tags("companies")
+
+        assert await cache.get("company:a") is None
+        assert redis_client.published == [
+            (local.channel, '["corporate_intel:company:a"]')
+        ]
+
+    async def test_serves_l1_while_redis_down(self, cache, redis_client):
+        await cache.set("k", "v", ttl=60)
+        redis_client.fail = True
+
+        assert await cache.get("k") == "v"
+
+    def test_stats_include_l1(self, cache):
+        assert cache.stats()["l1"]["entries"] == 0
+
+    async def test_pattern_invalidation_reaches_l1(self, cache, redis_client, local, monkeypatch):
+        monkeypatch.setattr(cache_module, "get_cache", MagicMock())
+        monkeypatch.setattr(cache_module, "get_redis_client", AsyncMock(return_value=redis_client))
+        monkeypatch.setattr(cache_module, "get_local_cache", lambda: local)
+        await cache.set("company:a", 1, ttl=60)
+        await cache.set("filing:b", 2, ttl=60)
+
+        await cache_module.CacheManager().invalidate_pattern("company:*")
+
+        assert await cache.get("company:a") is None
+        assert await cache.get("filing:b") == 2
+        assert redis_client.published == [
+            (local.channel, '["corporate_intel:company:a"]')
+        ]
+
+
+class TestCacheKeyWrapper:
+    """Tests for the cache_key_wrapper decorator."""
+
+    @pytest.fixture(autouse=True)
+    def response_cache(self, cache, monkeypatch):
+        monkeypatch.setattr(cache_module, "_response_cache", cache)
+        return cache
+
+    async def test_tags_from_arguments(self, response_cache, redis_client):
+        calls = []
+
+        @cache_key_wrapper(prefix="company", expire=60, tags=["company:{company_id}"])
+        async def get_company(company_id, db=None):
+            calls.append(company_id)
+            return {"id": company_id}
+
+        assert await get_company(company_id="abc", db=object()) == {"id": "abc"}
+        assert await get_company(company_id="abc", db=object()) == {"id": "abc"}
+        assert calls == ["abc"]
+        assert "corporate_intel:company:company_id:abc" in redis_client.data
+
+        await response_cache.invalidate_tags("company:abc")
+        await get_company(company_id="abc")
+        assert calls == ["abc", "abc"]
+
+    async def test_prefix_is_a_tag(self, response_cache, redis_client):
+        @cache_key_wrapper(prefix="filings", expire=60)
+        async def list_filings(limit=10):
+            return list(range(limit))
+
+        await list_filings(limit=2)
+        await list_filings(limit=3)
+
+        assert await response_cache.invalidate_tags("filings") == 2
+
+    async def test_orm_route_hits_on_second_call(self, response_cache, redis_client):
+        from src.api.v1 import companies
+        from src.db.models import Company
+
+        company = Company(id=uuid4(), ticker="DUOL", name="Duolingo", category="direct_to_consumer")
+        repository = MagicMock()
+        repository.return_value.get_by_id = AsyncMock(return_value=company)
+
+        with patch.object(companies, "CompanyRepository", repository):
+            first = await companies.get_company(company_id=company.id, db=MagicMock())
+            second = await companies.get_company(company_id=company.id, db=MagicMock())
+
+        assert repository.return_value.get_by_id.await_count == 1
+        assert response_cache.counters["hits"] == 1
+        assert f"corporate_intel:company:company_id:{company.id}" in redis_client.data
+        assert first["ticker"] == second["ticker"] == "DUOL"
+
+    async def test_orm_page_cached_with_cursor_fields(self, response_cache):
+        from src.api.v1 import reports
+        from src.db.models import AnalysisReport
+        from src.dto.pagination import next_cursor_from_items
+
+        rows = [
+            AnalysisReport(id=uuid4(), report_type="market_trends", title=f"R{i}", created_at=datetime(2025, 1, i + 1))
+            for i in range(2)
+        ]
+        repository = MagicMock()
+        repository.return_value.get_all = AsyncMock(return_value=rows)
+
+        with patch.object(reports, "ReportRepository", repository):
+            pages = [
+                await reports._fetch_reports(report_type=None, limit=2, offset=0, cursor=None, db=MagicMock())
+                for _ in range(2)
+            ]
+
+        assert repository.return_value.get_all.await_count == 1
+        assert next_cursor_from_items(pages[0], 2, "created_at") == next_cursor_from_items(pages[1], 2, "created_at")
@@ -126,6 +126,31 @@ class TestRateLimiter:
         total_time = end - start
         assert total_time >= 0.19
 
+    @pytest.mark.asyncio
+    async def test_rate_limiter_shared_by_concurrent_callers(self):
+        """Test concurrent coroutines sharing one limiter stay within the rate."""
+        limiter = RateLimiter(calls_per_second=10)
+
+        start = asyncio.get_event_loop().time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+        end = asyncio.get_event_loop().time()
+
+        # 5 calls at 10/s need 4 full intervals even when issued concurrently
+        total_time = end - start
+        assert 0.39 <= total_time < 0.6
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_burst(self):
+        """Test burst capacity lets the first calls through without waiting."""
+        limiter = RateLimiter(calls_per_second=10, burst=3)
+
+        start = asyncio.get_event_loop().time()
+        for _ in range(3):
+            await limiter.acquire()
+        end = asyncio.get_event_loop().time()
+
+        assert (end - start) < 0.05
+
 
 # ============================================================================
 # SECAPIClient Tests
@@ -150,7 +175,7 @@ class TestSECAPIClient:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json = Mock(return_value=mock_response_data)
-            mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock(return_value=mock_response)
             MockAsyncClient.return_value = mock_client
 
             mapping = await client.get_ticker_to_cik_mapping()
@@ -179,7 +204,7 @@ class TestSECAPIClient:
             mock_client = AsyncMock()
             mock_response = AsyncMock()
             mock_response.status_code = 500
-            mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock(return_value=mock_response)
             MockAsyncClient.return_value = mock_client
 
             mapping = await client.get_ticker_to_cik_mapping()
@@ -204,7 +229,7 @@ class TestSECAPIClient:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json = Mock(return_value=mock_company_data)
-            mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock(return_value=mock_response)
             MockAsyncClient.return_value = mock_client
 
             info = await client.get_company_info("DUOL")
@@ -222,6 +247,38 @@ class TestSECAPIClient:
 
         assert info == {}
 
+    @pytest.mark.asyncio
+    async def test_get_company_submissions(self):
+        """Test submissions fetch by CIK, padded to 10 digits."""
+        client = SECAPIClient()
+
+        with patch('httpx.AsyncClient') as MockAsyncClient:
+            mock_client = AsyncMock()
+            mock_response = AsyncMock()
+            mock_response.status_code = 200
+            mock_response.json = Mock(return_value={"name": "Duolingo Inc."})
+            mock_client.get = AsyncMock(return_value=mock_response)
+            MockAsyncClient.return_value = mock_client
+
+            submissions = await client.get_company_submissions("1364612")
+
+            assert submissions == {"name": "Duolingo Inc."}
+            assert mock_client.get.call_args.args[0].endswith("/submissions/CIK0001364612.json")
+
+    @pytest.mark.asyncio
+    async def test_get_company_submissions_error_status(self):
+        """Test submissions fetch returns None on an error status."""
+        client = SECAPIClient()
+
+        with patch('httpx.AsyncClient') as MockAsyncClient:
+            mock_client = AsyncMock()
+            mock_response = AsyncMock()
+            mock_response.status_code = 404
+            mock_client.get = AsyncMock(return_value=mock_response)
+            MockAsyncClient.return_value = mock_client
+
+            assert await client.get_company_submissions("1364612") is None
+
     @pytest.mark.asyncio
     async def test_get_filings_success(self):
         """Test successful filings fetch."""
@@ -243,7 +300,7 @@ class TestSECAPIClient:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json = Mock(return_value=mock_filings_data)
-            mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock(return_value=mock_response)
             MockAsyncClient.return_value = mock_client
 
             filings = await client.get_filings("1234567890", ["10-K", "10-Q"])
@@ -273,7 +330,7 @@ class TestSECAPIClient:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.json = Mock(return_value=mock_filings_data)
-            mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock(return_value=mock_response)
             MockAsyncClient.return_value = mock_client
 
             start_date = datetime(2024, 1, 1)
@@ -298,7 +355,7 @@ class TestSECAPIClient:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.text = "Filing content here"
-            mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock(return_value=mock_response)
             MockAsyncClient.return_value = mock_client
 
             content = await client.download_filing_content(filing)
@@ -320,13 +377,36 @@ class TestSECAPIClient:
             mock_client = AsyncMock()
             mock_response = AsyncMock()
             mock_response.status_code = 404
-            mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock(return_value=mock_response)
             MockAsyncClient.return_value = mock_client
 
             content = await client.download_filing_content(filing)
 
             assert content == ""
 
+    @pytest.mark.asyncio
+    async def test_client_reuses_pooled_connection(self):
+        """Test that one HTTP client is created and reused across requests."""
+        client = SECAPIClient(rate_limiter=RateLimiter(calls_per_second=1000))
+        client._ticker_cik_cache = {"DUOL": "0001364612"}
+
+        with patch('httpx.AsyncClient') as MockAsyncClient:
+            mock_client = AsyncMock()
+            mock_client.is_closed = False
+            mock_response = AsyncMock()
+            mock_response.status_code = 200
+            mock_response.json = Mock(return_value={"filings": {"recent": {}}})
+            mock_client.get = AsyncMock(return_value=mock_response)
+            MockAsyncClient.return_value = mock_client
+
+            await client.get_company_info("DUOL")
+            await client.get_filings("0001364612", ["10-K"])
+            await client.aclose()
+
+            assert MockAsyncClient.call_count == 1
+            assert mock_client.get.await_count == 2
+            mock_client.aclose.assert_awaited_once()
+
 
 # ============================================================================
 # Prefect Task Tests
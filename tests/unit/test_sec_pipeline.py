@@ -10,12 +10,22 @@ from uuid import uuid4
 
 from src.pipeline.sec_ingestion import store_filing
 from src.db.models import Company, SECFiling
+from src.pipeline.sec import content_store
+from src.pipeline.sec.content_store import LocalFilingContentStore, content_hash
 
 
 # ============================================================================
 # FIXTURES
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def filing_store(tmp_path, monkeypatch):
+    """Process-wide filing content store writing under tmp_path."""
+    store = LocalFilingContentStore(root=str(tmp_path / "filings"))
+    monkeypatch.setattr(content_store, "_filing_content_store", store)
+    return store
+
+
 @pytest.fixture
 def mock_db_session():
     """Create a mock async database session."""
@@ -148,7 +158,7 @@ class TestFilingStorageSuccess:
             mock_db_session.commit.assert_called_once()
 
 
-    async def test_store_filing_with_valid_metadata(self, mock_db_session, sample_company, sample_filing_data):
+    async def test_store_filing_with_valid_metadata(self, mock_db_session, sample_company, sample_filing_data, filing_store):
         """Test that filing metadata is correctly stored."""
         # Mock company exists
         mock_result = Mock()
@@ -174,7 +184,9 @@ class TestFilingStorageSuccess:
             call_kwargs = MockFiling.call_args[1]
             assert call_kwargs["filing_type"] == sample_filing_data["form"]
             assert call_kwargs["accession_number"] == sample_filing_data["accessionNumber"]
-            assert call_kwargs["raw_text"] == sample_filing_data["content"]
+            assert call_kwargs["content_hash"] == content_hash(sample_filing_data["content"])
+            stored = SECFiling(content_hash=call_kwargs["content_hash"])
+            assert await stored.load_text(filing_store) == sample_filing_data["content"]
 
 
 # ============================================================================
@@ -522,7 +534,7 @@ class TestEdgeCases:
             MockFiling.assert_called_once()
 
 
-    async def test_special_characters_in_content(self, mock_db_session, sample_company):
+    async def test_special_characters_in_content(self, mock_db_session, sample_company, filing_store):
         """Test storing filing with special characters and unicode."""
         special_filing = {
             "form": "10-K",
@@ -556,7 +568,8 @@ class TestEdgeCases:
             # Verify special characters are handled
             assert result == special_filing["accessionNumber"]
             call_kwargs = MockFiling.call_args[1]
-            assert "€£¥" in call_kwargs["raw_text"]
+            stored = SECFiling(content_hash=call_kwargs["content_hash"])
+            assert await stored.load_text(filing_store) == special_filing["content"]
 
 
     async def test_amended_filing_storage(self, mock_db_session, sample_company):
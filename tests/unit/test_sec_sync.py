@@ -0,0 +1,227 @@
+"""Unit tests for incremental SEC filing sync.
+
+Tests cover:
+- splitting listed filings by high-water mark and known accession numbers
+- advancing marks only past filings that were handled
+- capping a run at the newest filings
+- the batched planning queries
+- the ingestion flow downloading only new filings
+"""
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.pipeline.sec.orchestrator import FilingRequest, sec_ingestion_flow
+from src.pipeline.sec.sync import (
+    FilingSync,
+    SyncPlan,
+    advance_marks,
+    newest_first,
+    select_new_filings,
+)
+
+
+def make_filing(accession: str, filing_date: str, form: str = "10-K") -> dict:
+    return {
+        "form": form,
+        "filingDate": filing_date,
+        "accessionNumber": accession,
+        "primaryDocument": f"{accession}.htm",
+        "cik": "1364612",
+    }
+
+
+# EDGAR lists recent filings newest first
+FILINGS = [
+    make_filing("0001-24-000004", "2024-11-05", "10-Q"),
+    make_filing("0001-24-000003", "2024-02-28"),
+    make_filing("0001-23-000002", "2023-02-27"),
+    make_filing("0001-22-000001", "2022-03-01"),
+]
+
+
+def accessions(filings):
+    return [filing["accessionNumber"] for filing in filings]
+
+
+class TestSelectNewFilings:
+    """Tests for select_new_filings."""
+
+    def test_first_sync_downloads_everything_oldest_first(self):
+        plan = select_new_filings("1364612", FILINGS, {}, set())
+
+        assert plan.cik == "0001364612"
+        assert accessions(plan.to_download) == [
+            "0001-22-000001", "0001-23-000002", "0001-24-000003", "0001-24-000004",
+        ]
+        assert plan.skipped == 0
+
+    def test_mark_and_known_filings_are_skipped(self):
+        plan = select_new_filings(
+            "1364612",
+            FILINGS,
+            {"10-K": date(2023, 2, 27)},
+            {"0001-23-000002"},
+        )
+
+        assert accessions(plan.to_download) == ["0001-24-000003", "0001-24-000004"]
+        assert accessions(plan.known) == ["0001-23-000002"]
+        assert plan.below_mark == 1
+        assert plan.skipped == 2
+
+
+class TestAdvanceMarks:
+    """Tests for advance_marks."""
+
+    def test_all_handled_moves_to_newest(self):
+        plan = select_new_filings("1364612", FILINGS, {}, set())
+
+        marks = advance_marks(plan, set(accessions(FILINGS)))
+
+        assert marks == {
+            "10-K": (date(2024, 2, 28), "0001-24-000003"),
+            "10-Q": (date(2024, 11, 5), "0001-24-000004"),
+        }
+
+    def test_failed_download_holds_mark_back(self):
+        plan = select_new_filings("1364612", FILINGS, {}, set())
+
+        marks = advance_marks(plan, {"0001-22-000001", "0001-24-000003"})
+
+        assert marks == {"10-K": (date(2022, 3, 1), "0001-22-000001")}
+
+    def test_same_day_pending_filing_keeps_its_date_open(self):
+        filings = [
+            make_filing("0001-24-000010", "2024-05-01", "8-K"),
+            make_filing("0001-24-000011", "2024-05-01", "8-K"),
+        ]
+        plan = select_new_filings("1364612", filings, {"8-K": date(2024, 4, 1)}, set())
+
+        assert advance_marks(plan, {"0001-24-000010"}) == {}
+
+    def test_mark_never_moves_backwards(self):
+        plan = SyncPlan(
+            cik="0001364612",
+            marks={"10-K": date(2024, 2, 28)},
+            known=[make_filing("0001-24-000003", "2024-02-28")],
+        )
+
+        assert advance_marks(plan, set()) == {}
+
+
+class TestNewestFirst:
+    """Tests for newest_first."""
+
+    def test_caps_at_newest_filings(self):
+        plan = select_new_filings("1364612", FILINGS, {}, set())
+
+        assert accessions(newest_first(plan.to_download, 2)) == [
+            "0001-24-000004", "0001-24-000003",
+        ]
+
+    def test_without_limit_keeps_every_filing(self):
+        assert accessions(newest_first(FILINGS[::-1])) == accessions(FILINGS)
+
+    def test_capped_older_filings_hold_mark_back(self):
+        plan = select_new_filings("1364612", FILINGS, {}, set())
+        batch = newest_first(plan.to_download, 1)
+
+        marks = advance_marks(plan, set(accessions(batch)))
+
+        assert accessions(batch) == ["0001-24-000004"]
+        assert marks == {"10-Q": (date(2024, 11, 5), "0001-24-000004")}
+
+
+class TestFilingSync:
+    """Tests for FilingSync."""
+
+    async def test_plan_uses_two_queries(self):
+        cursor_result = MagicMock()
+        cursor_result.all.return_value = [("10-K", datetime(2023, 2, 27))]
+        known_result = MagicMock()
+        known_result.scalars.return_value.all.return_value = ["0001-23-000002"]
+        session = AsyncMock()
+        session.execute.side_effect = [cursor_result, known_result]
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+
+        plan = await FilingSync(session_factory).plan("1364612", FILINGS)
+
+        assert session.execute.await_count == 2
+        assert accessions(plan.to_download) == ["0001-24-000003", "0001-24-000004"]
+        assert plan.below_mark == 1
+
+    async def test_record_without_progress_skips_database(self):
+        session_factory = MagicMock()
+        plan = SyncPlan(cik="0001364612", to_download=[make_filing("0001-24-000003", "2024-02-28")])
+
+        assert await FilingSync(session_factory).record(plan, set()) == {}
+        session_factory.assert_not_called()
+
+
+class TestIncrementalFlow:
+    """Tests for sec_ingestion_flow with sync state."""
+
+    @pytest.fixture
+    def flow_mocks(self):
+        plan = select_new_filings("1364612", FILINGS, {"10-K": date(2024, 1, 1)}, set())
+        sync = MagicMock()
+        sync.plan = AsyncMock(return_value=plan)
+        sync.record = AsyncMock(return_value={})
+
+        async def download(filing):
+            return {**filing, "content": "Annual report " * 200}
+
+        with patch(
+            "src.pipeline.sec.orchestrator.fetch_company_data",
+            new_callable=AsyncMock,
+            return_value={"cik": "1364612"},
+        ), patch(
+            "src.pipeline.sec.orchestrator.fetch_filings",
+            new_callable=AsyncMock,
+            return_value=FILINGS,
+        ), patch(
+            "src.pipeline.sec.orchestrator.FilingSync", return_value=sync
+        ), patch(
+            "src.pipeline.sec.orchestrator.download_filing", side_effect=download
+        ) as download_mock, patch(
+            "src.pipeline.sec.orchestrator.validate_filings_batch",
+            side_effect=lambda filings: [True] * len(filings),
+        ), patch(
+            "src.pipeline.sec.orchestrator.store_filing", new_callable=AsyncMock
+        ):
+            yield sync, download_mock
+
+    async def test_downloads_only_new_filings(self, flow_mocks):
+        sync, download_mock = flow_mocks
+
+        result = await sec_ingestion_flow(FilingRequest(company_ticker="DUOL"))
+
+        downloaded = [call.args[0]["accessionNumber"] for call in download_mock.call_args_list]
+        assert downloaded == ["0001-24-000004", "0001-24-000003"]
+        assert result["filings_skipped"] == 2
+        assert result["filings_stored"] == 2
+        plan, handled = sync.record.await_args.args
+        assert handled == {"0001-24-000003", "0001-24-000004"}
+
+    async def test_capped_run_downloads_newest_filings(self, flow_mocks):
+        sync, download_mock = flow_mocks
+
+        await sec_ingestion_flow(FilingRequest(company_ticker="DUOL", max_filings=1))
+
+        downloaded = [call.args[0]["accessionNumber"] for call in download_mock.call_args_list]
+        assert downloaded == ["0001-24-000004"]
+
+    async def test_full_sync_bypasses_plan(self, flow_mocks):
+        sync, download_mock = flow_mocks
+
+        result = await sec_ingestion_flow(
+            FilingRequest(company_ticker="DUOL", incremental=False, max_filings=None)
+        )
+
+        assert download_mock.call_count == 4
+        assert result["filings_skipped"] == 0
+        sync.plan.assert_not_called()
+        sync.record.assert_not_called()
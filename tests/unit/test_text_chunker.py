@@ -0,0 +1,160 @@
+"""Unit tests for token-aware text chunking.
+
+Tests cover:
+- sentence splitting (abbreviations, capitalization rules)
+- exact character spans and token budgets of chunks
+- sentence overlap between consecutive chunks
+- over-long sentences, paragraph mode, non-ASCII offsets
+- streaming iter_chunks API
+"""
+
+import re
+import types
+
+from src.processing.text_chunker import TextChunker
+
+
+class WordTokenizer:
+    """Deterministic stand-in for a tiktoken encoding: one token per word.
+
+    Like BPE encodings, leading whitespace is attached to the following token
+    and decoding the token bytes reproduces the input exactly.
+    """
+
+    PIECES = re.compile(r"\s*\S+|\s+")
+
+    def __init__(self):
+        self.vocab = {}
+        self.inverse = {}
+
+    def encode(self, text, **kwargs):
+        ids = []
+        for piece in self.PIECES.findall(text):
+            if piece not in self.vocab:
+                self.vocab[piece] = len(self.vocab)
+                self.inverse[self.vocab[piece]] = piece
+            ids.append(self.vocab[piece])
+        return ids
+
+    def decode(self, ids):
+        return "".join(self.inverse[i] for i in ids)
+
+    def decode_tokens_bytes(self, ids):
+        return [self.inverse[i].encode("utf-8") for i in ids]
+
+
+def make_chunker(**kwargs) -> TextChunker:
+    chunker = TextChunker.__new__(TextChunker)
+    chunker.chunk_size = kwargs.get("chunk_size", 20)
+    chunker.chunk_overlap = kwargs.get("chunk_overlap", 5)
+    chunker.respect_sentences = kwargs.get("respect_sentences", True)
+    chunker.tokenizer = WordTokenizer()
+    return chunker
+
+
+def make_document(sentences: int = 40) -> str:
+    return " ".join(
+        f"Sentence {i} talks about revenue and {'growth ' * (i % 4)}users." for i in range(sentences)
+    )
+
+
+class TestSentenceSplitting:
+    """Tests for sentence boundary detection."""
+
+    def test_splits_on_capitalized_next_sentence(self):
+        chunker = make_chunker()
+        assert chunker._split_sentences("First one. Second one! third stays? Yes.") == [
+            "First one.",
+            "Second one! third stays?",
+            "Yes.",
+        ]
+
+    def test_keeps_abbreviations(self):
+        chunker = make_chunker()
+        assert chunker._split_sentences("Acme Inc. Reported growth. Dr. Smith agreed.") == [
+            "Acme Inc. Reported growth.",
+            "Dr. Smith agreed.",
+        ]
+
+    def test_decimal_numbers_do_not_split(self):
+        chunker = make_chunker()
+        assert chunker._split_sentences("Revenue was 3.5 million. Margin rose.") == [
+            "Revenue was 3.5 million.",
+            "Margin rose.",
+        ]
+
+
+class TestTokenChunking:
+    """Tests for linear-time token chunking."""
+
+    def test_chunks_are_exact_source_spans(self):
+        text = make_document()
+        chunks = make_chunker().chunk_text(text)
+
+        assert len(chunks) > 1
+        for i, chunk in enumerate(chunks):
+            assert chunk.chunk_index == i
+            assert chunk.text == text[chunk.start_index:chunk.end_index]
+
+    def test_token_budget(self):
+        chunks = make_chunker(chunk_size=20).chunk_text(make_document())
+        assert all(0 < chunk.token_count <= 20 for chunk in chunks)
+
+    def test_every_sentence_covered(self):
+        chunker = make_chunker()
+        text = make_document()
+        chunks = chunker.chunk_text(text)
+
+        for start, end in chunker._sentence_spans(text):
+            assert any(c.start_index <= start and end <= c.end_index for c in chunks)
+
+    def test_consecutive_chunks_overlap(self):
+        # Sentences are 7-10 tokens, so at least one always fits the overlap
+        chunks = make_chunker(chunk_size=30, chunk_overlap=12).chunk_text(make_document())
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start_index > previous.start_index
+            assert current.start_index < previous.end_index
+
+    def test_no_overlap(self):
+        chunks = make_chunker(chunk_size=20, chunk_overlap=0).chunk_text(make_document())
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start_index >= previous.end_index
+
+    def test_long_sentence_split_into_windows(self):
+        text = "Intro. " + " ".join(f"word{i}" for i in range(50)) + ". Outro here."
+        chunks = make_chunker(chunk_size=10, chunk_overlap=2).chunk_text(text)
+
+        long_chunks = [c for c in chunks if "word" in c.text]
+        assert len(long_chunks) >= 5
+        assert all(c.token_count <= 10 for c in long_chunks)
+        assert all(c.text == text[c.start_index:c.end_index] for c in chunks)
+        assert chunks[-1].text == "Outro here."
+
+    def test_non_ascii_offsets(self):
+        text = "Café revenue grew. Naïve estimates € failed. Über growth continued. " * 5
+        chunker = make_chunker(chunk_size=8, chunk_overlap=2)
+
+        for chunk in chunker.chunk_text(text):
+            assert chunk.text == text[chunk.start_index:chunk.end_index]
+            assert chunk.text == chunk.text.strip()
+
+    def test_paragraph_mode(self):
+        text = "First paragraph here.\n\nSecond paragraph.\n\n\n\nThird one."
+        chunks = make_chunker(chunk_size=3, chunk_overlap=0, respect_sentences=False).chunk_text(text)
+
+        assert [c.text for c in chunks] == ["First paragraph here.", "Second paragraph.", "Third one."]
+
+    def test_empty_text(self):
+        assert make_chunker().chunk_text("") == []
+        assert make_chunker().chunk_text("   \n ") == []
+
+    def test_iter_chunks_is_lazy(self):
+        chunker = make_chunker()
+        text = make_document()
+
+        stream = chunker.iter_chunks(text)
+
+        assert isinstance(stream, types.GeneratorType)
+        assert [c.text for c in stream] == [c.text for c in chunker.chunk_text(text)]
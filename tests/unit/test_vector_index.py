@@ -0,0 +1,205 @@
+"""Unit tests for the semantic search vector indexes.
+
+Tests cover:
+- FlatIndex: exact top-k against brute-force cosine similarity
+- IVFIndex: training, recall, exhaustive probing
+- save/load round trips with memory-mapped vectors
+- build_index dispatch and error handling
+- SemanticSearch keeping positions aligned with the documents searched
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.processing.vector_index import (
+    FlatIndex,
+    IVFIndex,
+    VectorIndex,
+    build_index,
+    normalize_rows,
+)
+
+
+def brute_force_top_k(query: np.ndarray, embeddings: np.ndarray, top_k: int) -> np.ndarray:
+    """Reference implementation: normalize everything and fully sort."""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    similarities = (embeddings / norms) @ (query / np.linalg.norm(query))
+    return np.argsort(similarities)[-top_k:][::-1]
+
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(2000, 32)).astype(np.float32)
+
+
+class TestNormalizeRows:
+    """Tests for normalize_rows helper."""
+
+    def test_unit_norm_float32(self, embeddings):
+        rows = normalize_rows(embeddings)
+        assert rows.dtype == np.float32
+        assert np.allclose(np.linalg.norm(rows, axis=1), 1.0, atol=1e-5)
+
+    def test_zero_rows_stay_zero(self):
+        rows = normalize_rows(np.zeros((2, 4)))
+        assert not np.isnan(rows).any()
+        assert np.all(rows == 0)
+
+
+class TestFlatIndex:
+    """Tests for exact flat index."""
+
+    def test_matches_brute_force(self, embeddings):
+        index = FlatIndex.from_embeddings(embeddings)
+        query = embeddings[7] + 0.1
+
+        scores, positions = index.search(query, top_k=10)
+
+        assert list(positions) == list(brute_force_top_k(query, embeddings, 10))
+        assert np.all(np.diff(scores) <= 0)
+
+    def test_top_k_larger_than_index(self):
+        index = FlatIndex.from_embeddings(np.eye(3))
+        scores, positions = index.search(np.array([1.0, 0.0, 0.0]), top_k=10)
+
+        assert len(positions) == 3
+        assert positions[0] == 0
+        assert scores[0] == pytest.approx(1.0)
+
+    def test_add_appends_positions(self, embeddings):
+        index = FlatIndex(embeddings.shape[1])
+        index.add(embeddings[:10])
+        index.add(embeddings[10:20])
+
+        _, positions = index.search(embeddings[15], top_k=1)
+        assert len(index) == 20
+        assert positions[0] == 15
+
+    def test_dimension_mismatch(self, embeddings):
+        index = FlatIndex.from_embeddings(embeddings)
+        with pytest.raises(ValueError):
+            index.search(np.ones(5), top_k=1)
+
+    def test_save_and_mmap_load(self, embeddings, tmp_path):
+        index = FlatIndex.from_embeddings(embeddings)
+        index.save(tmp_path / "flat")
+
+        loaded = VectorIndex.load(tmp_path / "flat")
+
+        assert isinstance(loaded, FlatIndex)
+        assert isinstance(loaded.vectors, np.memmap)
+        assert list(loaded.search(embeddings[3], 5)[1]) == list(index.search(embeddings[3], 5)[1])
+
+
+class TestIVFIndex:
+    """Tests for approximate IVF index."""
+
+    def test_exhaustive_probe_is_exact(self, embeddings):
+        index = IVFIndex.from_embeddings(embeddings, nlist=16, nprobe=16)
+        query = embeddings[42]
+
+        _, positions = index.search(query, top_k=10)
+
+        assert list(positions) == list(brute_force_top_k(query, embeddings, 10))
+
+    def test_recall_with_partial_probe(self, embeddings):
+        index = IVFIndex.from_embeddings(embeddings, nlist=16, nprobe=8)
+        rng = np.random.default_rng(1)
+
+        hits = 0
+        queries = embeddings[rng.choice(len(embeddings), 20, replace=False)]
+        for query in queries:
+            expected = set(brute_force_top_k(query, embeddings, 10))
+            hits += len(expected & set(index.search(query, top_k=10)[1]))
+
+        assert hits / (10 * len(queries)) >= 0.7
+
+    def test_finds_self(self, embeddings):
+        index = IVFIndex.from_embeddings(embeddings, nlist=16, nprobe=1)
+        scores, positions = index.search(embeddings[100], top_k=1)
+
+        assert positions[0] == 100
+        assert scores[0] == pytest.approx(1.0, abs=1e-5)
+
+    def test_add_requires_training(self, embeddings):
+        index = IVFIndex(embeddings.shape[1], nlist=4)
+        with pytest.raises(ValueError):
+            index.add(embeddings)
+
+    def test_nlist_clamped_to_training_rows(self):
+        index = IVFIndex.from_embeddings(np.eye(4), nlist=10, nprobe=10)
+        assert index.nlist == 4
+        assert len(index) == 4
+
+    def test_save_and_mmap_load(self, embeddings, tmp_path):
+        index = IVFIndex.from_embeddings(embeddings, nlist=16, nprobe=4)
+        index.save(tmp_path / "ivf")
+
+        loaded = VectorIndex.load(tmp_path / "ivf")
+
+        assert isinstance(loaded, IVFIndex)
+        assert loaded.nprobe == 4
+        assert isinstance(loaded.vectors, np.memmap)
+        assert list(loaded.search(embeddings[9], 5)[1]) == list(index.search(embeddings[9], 5)[1])
+
+
+class TestBuildIndex:
+    """Tests for build_index dispatch."""
+
+    def test_build_flat(self, embeddings):
+        assert isinstance(build_index(embeddings), FlatIndex)
+
+    def test_build_ivf(self, embeddings):
+        index = build_index(embeddings, index_type="ivf", nlist=8)
+        assert isinstance(index, IVFIndex)
+        assert len(index) == len(embeddings)
+
+    def test_unknown_type(self, embeddings):
+        with pytest.raises(ValueError):
+            build_index(embeddings, index_type="hnsw")
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            VectorIndex(32)
+
+
+class TestSemanticSearchCorpus:
+    """Tests for matching SemanticSearch indexes to the documents searched."""
+
+    @pytest.fixture
+    def search(self, embeddings):
+        module = pytest.importorskip("src.processing.embeddings")
+        pipeline = MagicMock()
+        pipeline.embed_text.side_effect = lambda text: embeddings[int(text)]
+        return module.SemanticSearch(pipeline)
+
+    def test_passed_embeddings_win_over_other_index(self, search, embeddings):
+        search.build_index(embeddings)
+        other = embeddings[:10][::-1].copy()
+        documents = [{"id": i} for i in range(10)]
+
+        results = search.search("0", other, documents, top_k=1, similarity_threshold=0.99)
+
+        assert results[0][1] == {"id": 9}
+
+    def test_index_reused_for_its_own_embeddings(self, search, embeddings):
+        search.build_index(embeddings, index_type="ivf", nlist=8)
+        flat = MagicMock(side_effect=AssertionError("rebuilt a flat index"))
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("src.processing.embeddings.FlatIndex.from_embeddings", flat)
+            scores, positions = search.search_positions("7", embeddings, len(embeddings), top_k=1)
+
+        assert positions[0] == 7
+
+    def test_index_for_other_corpus_is_rejected(self, search, embeddings):
+        search.build_index(embeddings)
+
+        with pytest.raises(ValueError, match="2000 embeddings but 3 documents"):
+            search.search("0", None, [{}, {}, {}])
+        with pytest.raises(ValueError, match="Got 2000 embeddings for 3 documents"):
+            search.search("0", embeddings, [{}, {}, {}])
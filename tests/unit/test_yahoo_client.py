@@ -0,0 +1,155 @@
+"""Unit tests for the thread-pooled Yahoo Finance client.
+
+Tests cover:
+- yfinance calls running in the client's worker threads
+- per-run Ticker memoization and fresh Tickers on retry
+- concurrent company processing in YahooFinanceIngestionPipeline
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.pipeline.yahoo import orchestrator
+from src.pipeline.yahoo.client import YahooFinanceClient
+from src.pipeline.yahoo.orchestrator import YahooFinanceIngestionPipeline
+
+INCOME = pd.DataFrame({pd.Timestamp("2024-09-30"): [100.0]}, index=["Total Revenue"])
+BALANCE = pd.DataFrame({pd.Timestamp("2024-09-30"): [50.0]}, index=["Total Assets"])
+
+
+class FakeTicker:
+    """yfinance.Ticker stand-in whose properties block like HTTP requests."""
+
+    created = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.threads = []
+        FakeTicker.created.append(symbol)
+
+    def _request(self, value, delay=0.02):
+        with FakeTicker.lock:
+            FakeTicker.active += 1
+            FakeTicker.peak = max(FakeTicker.peak, FakeTicker.active)
+        self.threads.append(threading.current_thread().name)
+        time.sleep(delay)
+        with FakeTicker.lock:
+            FakeTicker.active -= 1
+        return value
+
+    @property
+    def info(self):
+        return self._request({"regularMarketPrice": 12.5, "symbol": self.symbol})
+
+    @property
+    def quarterly_income_stmt(self):
+        return self._request(INCOME)
+
+    @property
+    def quarterly_balance_sheet(self):
+        return self._request(BALANCE)
+
+
+@pytest.fixture(autouse=True)
+def breaker():
+    breaker = MagicMock()
+    breaker.call.side_effect = lambda func, *args: func(*args)
+    with patch("src.pipeline.yahoo.client.yahoo_finance_breaker", breaker):
+        yield breaker
+
+
+@pytest.fixture(autouse=True)
+def fake_ticker():
+    FakeTicker.created = []
+    FakeTicker.active = FakeTicker.peak = 0
+    with patch("yfinance.Ticker", FakeTicker):
+        yield FakeTicker
+
+
+@pytest.fixture
+async def client():
+    client = YahooFinanceClient(max_workers=4)
+    yield client
+    client.close()
+
+
+class TestThreadPool:
+    """Tests for running yfinance work off the event loop."""
+
+    async def test_calls_run_in_worker_threads(self, client):
+        info = await client.fetch_stock_info("duol")
+
+        assert info["symbol"] == "DUOL"
+        stock = client._ticker("DUOL")
+        assert stock.threads and all(name.startswith("yfinance") for name in stock.threads)
+
+    async def test_calls_go_through_circuit_breaker(self, client, breaker):
+        await client.fetch_quarterly_statements("DUOL")
+
+        assert breaker.call.call_count == 2
+
+    async def test_pool_bounds_concurrency(self, fake_ticker):
+        client = YahooFinanceClient(max_workers=2)
+        try:
+            infos = await asyncio.gather(*(client.fetch_stock_info(f"T{i}") for i in range(6)))
+        finally:
+            client.close()
+
+        assert all(infos)
+        assert fake_ticker.peak == 2
+
+
+class TestMemoization:
+    """Tests for per-run Ticker reuse."""
+
+    async def test_one_ticker_per_symbol(self, client, fake_ticker):
+        await client.fetch_stock_info("CHGG")
+        income, balance = await client.fetch_quarterly_statements("chgg")
+
+        assert fake_ticker.created == ["CHGG"]
+        assert income is INCOME
+        assert balance is BALANCE
+
+    async def test_incomplete_info_retries_with_fresh_ticker(self, client, fake_ticker):
+        responses = iter([{}, {"regularMarketPrice": 3.0}])
+
+        with patch.object(FakeTicker, "info", property(lambda self: next(responses))), \
+                patch("asyncio.sleep", new=AsyncMock()):
+            info = await client.fetch_stock_info("COUR")
+
+        assert info == {"regularMarketPrice": 3.0}
+        assert fake_ticker.created == ["COUR", "COUR"]
+
+
+class TestPipelineConcurrency:
+    """Tests for concurrent company processing."""
+
+    async def test_companies_fetched_concurrently_and_info_reused(self, client, fake_ticker):
+        companies = [{"ticker": t, "name": t} for t in ("DUOL", "CHGG", "COUR", "UDMY")]
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+        ingest = AsyncMock(return_value=3)
+        pipeline = YahooFinanceIngestionPipeline(session, client)
+
+        with patch.object(orchestrator, "EDTECH_COMPANIES", companies), \
+                patch.object(orchestrator, "upsert_company", AsyncMock()), \
+                patch.object(orchestrator, "ingest_quarterly_financials", ingest), \
+                patch.object(orchestrator, "notify_progress", AsyncMock()):
+            report = await pipeline.run()
+
+        assert report["statistics"]["companies_created"] == 4
+        assert report["statistics"]["metrics_created"] == 12
+        assert fake_ticker.peak > 1
+        assert sorted(fake_ticker.created) == ["CHGG", "COUR", "DUOL", "UDMY"]
+        for call in ingest.await_args_list:
+            assert call.kwargs["client"] is client
+            assert call.kwargs["info_data"]["symbol"] == call.args[2]
+        session.commit.assert_awaited_once()